@@ -9,12 +9,15 @@ from typing import Optional, Dict, List
 import os
 import json
 import logging
-import shutil
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from supabase_client import get_supabase_manager
-from stt_handlers import whisper_model, cached_whisper_models, clear_model_cache, clear_whisper_file_cache
+from stt_handlers import cached_whisper_models, clear_model_cache, clear_whisper_file_cache, get_whisper_model
+from model_registry import model_registry
+from transcription_cache import get_transcription_cache, remember_file_hash
+from pcm_cache import get_pcm_cache
+from upload_stream import save_upload_stream, UploadTooLargeError
 from models import (
     ExtractionsResponse, SessionsResponse, SessionDetailResponse, 
     RegisterLogsResponse, StatisticsResponse, AudioFilesResponse,
@@ -684,20 +687,25 @@ async def get_environment_status():
 async def get_model_status():
     """모델 로딩 상태 확인"""
     try:
+        registry_status = model_registry.get_status()
         model_status = {
-            "whisper_base_loaded": whisper_model is not None,
+            "whisper_base_loaded": model_registry.is_loaded("base"),
             "cached_models": list(cached_whisper_models.keys()),
             "total_cached_models": len(cached_whisper_models),
+            "memory_budget_mb": registry_status["memory_budget_mb"],
+            "resident_mb": registry_status["resident_mb"],
+            "evictions": registry_status["evictions"],
             "model_details": {}
         }
         
-        # 각 캐시된 모델의 상세 정보
-        for model_name, model in cached_whisper_models.items():
+        # 각 모델의 상세 정보 (로딩 시간, 히트 수, 상주 메모리 크기)
+        for model_name, stats in registry_status["models"].items():
+            model = cached_whisper_models.get(model_name)
             try:
                 model_status["model_details"][model_name] = {
-                    "loaded": True,
-                    "type": str(type(model)),
-                    "device": getattr(model, 'device', 'unknown')
+                    **stats,
+                    "type": str(type(model)) if model is not None else None,
+                    "device": str(getattr(model, 'device', 'unknown')) if model is not None else None
                 }
             except Exception as e:
                 model_status["model_details"][model_name] = {
@@ -735,21 +743,63 @@ async def clear_whisper_cache():
         raise HTTPException(status_code=500, detail=f"Whisper 캐시 정리 실패: {str(e)}")
 
 
+@router.get("/transcription-cache")
+async def get_transcription_cache_status():
+    """전사 결과 캐시 상태 (적중/미스 횟수, 크기) 확인"""
+    try:
+        return {
+            "status": "success",
+            "cache": get_transcription_cache().get_stats(),
+            "pcm_cache": get_pcm_cache().get_stats(),
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        logger.error(f"전사 캐시 상태 확인 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"전사 캐시 상태 확인 실패: {str(e)}")
+
+
+@router.post("/clear-transcription-cache")
+async def clear_transcription_cache():
+    """전사 결과 캐시를 비웁니다"""
+    try:
+        removed = get_transcription_cache().clear()
+        return {
+            "status": "success",
+            "message": f"전사 캐시 {removed}개 항목이 삭제되었습니다",
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        logger.error(f"전사 캐시 정리 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"전사 캐시 정리 실패: {str(e)}")
+
+
+@router.post("/clear-pcm-cache")
+async def clear_pcm_cache():
+    """디코딩된 PCM(.npy) 캐시를 비웁니다"""
+    try:
+        removed = get_pcm_cache().clear()
+        return {
+            "status": "success",
+            "message": f"PCM 캐시 {removed}개 항목이 삭제되었습니다",
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        logger.error(f"PCM 캐시 정리 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"PCM 캐시 정리 실패: {str(e)}")
+
+
 @router.post("/reload-base-model")
 async def reload_base_model():
     """기본 Whisper 모델을 다시 로딩합니다"""
-    global whisper_model
-    
     try:
         logger.info("기본 Whisper 모델 재로딩 시작...")
         
         # 기존 모델 캐시 정리
         clear_model_cache()
         
-        # 새 모델 로딩
-        import whisper
-        whisper_model = whisper.load_model("base")
-        cached_whisper_models["base"] = whisper_model
+        # 새 모델 로딩 (레지스트리 경유)
+        import asyncio
+        await asyncio.to_thread(get_whisper_model, "base")
         
         logger.info("기본 Whisper 모델 재로딩 완료")
         
@@ -795,9 +845,14 @@ async def upload_file(
         # 파일 저장 경로
         file_path = os.path.join(target_folder, file.filename)
         
-        # 파일 저장
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # 파일 저장 (청크 단위 스트리밍 + 해시 계산, 크기 제한 초과 시 중단)
+        try:
+            file_size, file_hash = await save_upload_stream(file, file_path)
+        except UploadTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        
+        # 이후 STT 처리 시 전사 캐시 조회에서 파일을 다시 읽지 않도록 해시 기록
+        remember_file_hash(file_path, file_hash)
         
         logger.info(f"파일 업로드 완료: {file_path}")
         
@@ -806,10 +861,13 @@ async def upload_file(
             "message": f"파일이 성공적으로 업로드되었습니다: {file.filename}",
             "file_path": file_path,
             "target_date": target_date,
-            "file_size": os.path.getsize(file_path),
+            "file_size": file_size,
+            "sha256": file_hash,
             "timestamp": datetime.now().isoformat()
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"파일 업로드 실패: {e}")
         raise HTTPException(status_code=500, detail=f"파일 업로드 실패: {str(e)}")
@@ -174,10 +174,15 @@ async def health_check():
     try:
         # Whisper 모델 상태 확인
         whisper_status = "not_loaded"
+        warmup_status = None
         try:
             from stt_handlers import whisper_model, cached_whisper_models
+            from model_warmup import get_model_warmup
+            warmup_status = get_model_warmup().get_status()
             if whisper_model is not None or cached_whisper_models:
                 whisper_status = "loaded"
+            if not warmup_status["ready"]:
+                whisper_status = "warming"
         except:
             whisper_status = "error"
         
@@ -204,6 +209,7 @@ async def health_check():
             "supabase_key": bool(os.getenv('SUPABASE_ANON_KEY'))
         }
         health_status["environment"] = env_check
+        health_status["ready"] = bool(warmup_status and warmup_status["ready"])
         
         return health_status
         
@@ -215,6 +221,17 @@ async def health_check():
             "timestamp": datetime.now().isoformat()
         }
     
+@app.get("/ready")
+async def readiness_check():
+    """
+    준비 상태 확인 엔드포인트 (오케스트레이션 readiness probe용)
+    사전 로딩 모델의 로딩 + 워밍업이 모두 끝나야 200, 그 전에는 503과 모델별 진행 상태 반환
+    """
+    from model_warmup import get_model_warmup
+    status = get_model_warmup().get_status()
+    status["timestamp"] = datetime.now().isoformat()
+    return JSONResponse(status_code=200 if status["ready"] else 503, content=status)
+
 @app.get("/test")
 async def test_endpoint():
     """테스트 엔드포인트"""
@@ -227,10 +244,14 @@ async def test_endpoint():
 from stt_handlers import router as stt_router
 from erp_handlers import router as erp_router
 from admin_handlers import router as admin_router
+from job_handlers import router as job_router
+from bulk_handlers import router as bulk_router
 
 app.include_router(stt_router)
 app.include_router(erp_router)
 app.include_router(admin_router)
+app.include_router(job_router)
+app.include_router(bulk_router)
 
 # 앱 시작 이벤트
 @app.on_event("startup")
@@ -238,11 +259,11 @@ async def startup_event():
     """앱 시작 시 실행되는 이벤트"""
     logger.info("🚀 STN STT 시스템 API 서버 시작 중...")
     
-    # 1. STT 모델 초기화
+    # 1. STT 모델 초기화 (Whisper 로딩/워밍업은 백그라운드에서 진행, 준비 여부는 /ready)
     try:
         from stt_handlers import initialize_models
         initialize_models()
-        logger.info("✅ STT 모델 초기화 완료")
+        logger.info("✅ STT 모델 초기화 시작 완료 (Whisper 워밍업 진행 중)")
     except Exception as e:
         logger.error(f"❌ STT 모델 초기화 실패: {e}")
     
@@ -281,6 +302,20 @@ async def startup_event():
     except Exception as e:
         logger.error(f"❌ 오늘 폴더 확인 실패: {e}")
 
+    # 4. STT 작업 큐 시작 (중단된 작업 복구)
+    try:
+        from job_handlers import start_job_queue
+        await start_job_queue()
+    except Exception as e:
+        logger.error(f"❌ STT 작업 큐 시작 실패: {e}")
+
+    # 5. 녹음 폴더 감시 시작 (새 녹음을 작업 큐에 자동 등록)
+    try:
+        from job_handlers import start_directory_watcher
+        await start_directory_watcher()
+    except Exception as e:
+        logger.error(f"❌ 녹음 폴더 감시 시작 실패: {e}")
+
     logger.info("🎉 STN STT 시스템 API 서버 시작 완료!")
 
 # 앱 종료 이벤트
@@ -297,6 +332,25 @@ async def shutdown_event():
         except Exception as e:
             logger.error(f"❌ 스케줄러 종료 실패: {e}")
     
+    # 녹음 폴더 감시 및 STT 작업 큐 종료 (실행 중 작업은 다음 시작 시 재실행)
+    try:
+        from job_handlers import stop_job_queue, stop_directory_watcher
+        await stop_directory_watcher()
+        await stop_job_queue()
+        from bulk_pipeline import get_bulk_manager
+        await get_bulk_manager().shutdown()
+        logger.info("✅ STT 작업 큐 종료 완료")
+    except Exception as e:
+        logger.error(f"❌ STT 작업 큐 종료 실패: {e}")
+    
+    # 추론 워커 풀 종료
+    try:
+        from inference_pool import shutdown_inference_pool
+        shutdown_inference_pool()
+        logger.info("✅ 추론 워커 풀 종료 완료")
+    except Exception as e:
+        logger.error(f"❌ 추론 워커 풀 종료 실패: {e}")
+    
     # 모델 캐시 정리
     try:
         from stt_handlers import clear_model_cache
@@ -0,0 +1,176 @@
+"""
+긴 통화 녹음 분할 전사
+NumPy 에너지 기반 VAD로 무음 구간에서 오디오를 나누고, 청크를 추론 워커 풀에서 병렬로
+전사한 뒤 세그먼트 시간을 원본 기준으로 보정하여 이어 붙이는 모듈
+(모델은 레지스트리에서 받은 것을 워커 복제본으로 공유하므로 청크 수만큼 모델을 따로 로딩하지 않음)
+"""
+
+import os
+import asyncio
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+# 분할 전사 설정 (config.env 또는 환경변수로 조정)
+LONG_AUDIO_MIN_SEC = float(os.getenv("STT_LONG_AUDIO_MIN_SEC", "300"))
+CHUNK_TARGET_SEC = float(os.getenv("STT_CHUNK_TARGET_SEC", "120"))
+CHUNK_MAX_SEC = float(os.getenv("STT_CHUNK_MAX_SEC", "180"))
+CHUNK_WORKERS = int(os.getenv("STT_CHUNK_WORKERS", "2"))  # 요청 하나가 추론 워커 풀에 동시에 넣는 청크 수
+
+# VAD 설정
+VAD_FRAME_MS = 30
+VAD_MIN_SILENCE_MS = 300
+VAD_THRESHOLD_DB = 10.0  # 잡음 바닥(하위 5% 에너지)보다 이만큼 큰 프레임을 음성으로 판단
+VAD_SPEECH_MARGIN_DB = 15.0  # 단, 음성 레벨(상위 10% 에너지)보다 이만큼 작은 값을 넘지 않음
+
+
+def frame_energy_db(audio: np.ndarray, frame_size: int) -> np.ndarray:
+    """프레임별 RMS 에너지(dB)"""
+    frame_count = len(audio) // frame_size
+    if frame_count == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = audio[:frame_count * frame_size].reshape(frame_count, frame_size)
+    rms = np.sqrt(np.mean(frames.astype(np.float32) ** 2, axis=1))
+    return 20.0 * np.log10(rms + 1e-10)
+
+
+def find_silences(audio: np.ndarray, sample_rate: int = SAMPLE_RATE,
+                  frame_ms: int = VAD_FRAME_MS, min_silence_ms: int = VAD_MIN_SILENCE_MS,
+                  threshold_db: float = VAD_THRESHOLD_DB) -> List[Tuple[int, int]]:
+    """무음 구간 목록 [(시작 샘플, 끝 샘플)]"""
+    frame_size = int(sample_rate * frame_ms / 1000)
+    energy = frame_energy_db(audio, frame_size)
+    if len(energy) == 0:
+        return []
+
+    # 무음이 적은 녹음에서도 음성이 무음으로 판정되지 않도록 음성 레벨 기준 상한 적용
+    noise_floor, speech_level = np.percentile(energy, [5, 90])
+    threshold = min(noise_floor + threshold_db, speech_level - VAD_SPEECH_MARGIN_DB)
+    silent = energy < threshold
+    min_frames = max(1, int(min_silence_ms / frame_ms))
+
+    # 연속 무음 프레임 구간 찾기 (경계 변화 지점 기반)
+    padded = np.concatenate(([False], silent, [False]))
+    changes = np.flatnonzero(padded[1:] != padded[:-1])
+    starts, ends = changes[0::2], changes[1::2]
+
+    return [
+        (int(start) * frame_size, int(end) * frame_size)
+        for start, end in zip(starts, ends)
+        if end - start >= min_frames
+    ]
+
+
+def plan_chunks(audio: np.ndarray, sample_rate: int = SAMPLE_RATE,
+                target_sec: float = CHUNK_TARGET_SEC, max_sec: float = CHUNK_MAX_SEC) -> List[Tuple[int, int]]:
+    """
+    무음 구간 중앙에서 자르는 청크 계획 [(시작 샘플, 끝 샘플)]
+    목표 길이 이후 첫 무음에서 자르고, 최대 길이까지 무음이 없으면 최대 길이에서 자름
+    """
+    total = len(audio)
+    target = int(target_sec * sample_rate)
+    max_len = int(max(max_sec, target_sec) * sample_rate)
+    if total <= max_len:
+        return [(0, total)]
+
+    cut_points = [(start + end) // 2 for start, end in find_silences(audio, sample_rate)]
+
+    chunks = []
+    chunk_start = 0
+    index = 0
+    while total - chunk_start > max_len:
+        # 목표 길이 이전의 절단 후보는 건너뜀
+        while index < len(cut_points) and cut_points[index] < chunk_start + target:
+            index += 1
+        if index < len(cut_points) and cut_points[index] <= chunk_start + max_len:
+            cut = cut_points[index]
+        else:
+            cut = chunk_start + max_len
+        chunks.append((chunk_start, cut))
+        chunk_start = cut
+    chunks.append((chunk_start, total))
+    return chunks
+
+
+def stitch_segments(chunk_results: List[Dict], offsets: List[float]) -> Dict:
+    """청크별 전사 결과를 원본 시간축으로 보정하여 하나의 결과로 합침"""
+    segments = []
+    texts = []
+    language = None
+    for result, offset in zip(chunk_results, offsets):
+        language = language or result.get("language")
+        text = result.get("text", "").strip()
+        if text:
+            texts.append(text)
+        for segment in result.get("segments", []):
+            stitched = dict(segment)
+            stitched["id"] = len(segments)
+            stitched["start"] = round(segment["start"] + offset, 3)
+            stitched["end"] = round(segment["end"] + offset, 3)
+            if "seek" in stitched:
+                stitched["seek"] = segment["seek"] + int(offset * 100)
+            segments.append(stitched)
+    return {"text": " ".join(texts), "segments": segments, "language": language}
+
+
+def transcribe_chunk_on_worker(model, audio: np.ndarray, options: Dict) -> Dict:
+    """추론 워커 스레드에서 청크 하나를 전사 (InferencePool 대상 함수, 스레드 전용 복제본 사용)"""
+    from inference_pool import transcribe_on_worker
+    result = transcribe_on_worker(model, audio, **options)
+    return {
+        "text": result.get("text", ""),
+        "segments": result.get("segments", []),
+        "language": result.get("language"),
+    }
+
+
+async def transcribe_long_audio(model, audio: np.ndarray, options: Dict,
+                                timeout: Optional[float] = None,
+                                on_segments: Optional[Callable[[List[Dict]], None]] = None,
+                                pool=None, max_in_flight: int = CHUNK_WORKERS) -> Dict:
+    """
+    긴 오디오를 무음 경계로 나누어 추론 워커 풀에서 병렬 전사
+    요청 하나가 대기열을 독차지하지 않도록 동시에 넣는 청크는 max_in_flight개로 제한하고,
+    대기열이 가득 차면 InferenceQueueFullError(503), 제한 시간을 넘기면 남은 청크를 취소하고 예외
+    청크 간 문맥이 끊기므로 condition_on_previous_text는 청크 내부에서만 적용됨
+    on_segments가 주어지면 청크가 끝나는 대로(완료 순서) 보정된 세그먼트를 전달
+    """
+    from inference_pool import get_inference_pool
+    pool = pool or get_inference_pool()
+    chunks = plan_chunks(audio)
+    offsets = [start / SAMPLE_RATE for start, _ in chunks]
+    in_flight = max(1, min(max_in_flight, pool.max_workers))
+    logger.info(
+        f"🔪 분할 전사 - 길이: {len(audio) / SAMPLE_RATE:.1f}초, 청크: {len(chunks)}개, "
+        f"동시 청크: {in_flight}개"
+    )
+
+    # 청크 전사에서 verbose 출력은 워커별로 섞이므로 비활성화
+    chunk_options = {**options, "verbose": False}
+    slots = asyncio.Semaphore(in_flight)
+
+    async def run_chunk(start: int, end: int, offset: float) -> Dict:
+        async with slots:
+            result = await pool.run(transcribe_chunk_on_worker, model, audio[start:end], chunk_options,
+                                    timeout=timeout)
+        if on_segments is not None:
+            on_segments(stitch_segments([result], [offset])["segments"])
+        return result
+
+    tasks = [asyncio.ensure_future(run_chunk(start, end, offset)) for (start, end), offset in zip(chunks, offsets)]
+    try:
+        results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=timeout)
+    except BaseException:
+        # 남은 청크는 대기 중이면 실행되지 않도록 취소
+        for task in tasks:
+            task.cancel()
+        raise
+
+    stitched = stitch_segments(results, offsets)
+    stitched["chunks"] = len(chunks)
+    return stitched
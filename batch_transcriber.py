@@ -0,0 +1,149 @@
+"""
+짧은 통화 녹음 일괄(batch) 전사
+여러 파일의 30초 윈도우 log-mel 스펙트로그램을 하나의 텐서로 묶어 인코더/디코더를 한 번에 실행하고,
+타임스탬프 토큰을 해석하여 model.transcribe()와 같은 형태의 파일별 세그먼트를 반환하는 모듈
+"""
+
+import os
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from audio_chunking import SAMPLE_RATE, plan_chunks
+
+logger = logging.getLogger(__name__)
+
+# 일괄 전사 설정 (config.env 또는 환경변수로 조정)
+BATCH_MAX_SEC = float(os.getenv("STT_BATCH_MAX_SEC", "60"))  # 이보다 긴 파일은 일반 전사로 처리
+BATCH_SIZE = int(os.getenv("STT_BATCH_SIZE", "16"))  # 한 번의 forward에 넣을 윈도우 수
+
+WINDOW_SEC = 30.0
+TIME_PRECISION = 0.02  # 타임스탬프 토큰 한 칸 = 20ms
+
+
+def plan_windows(audio: np.ndarray) -> List[Tuple[int, int]]:
+    """Whisper 입력 길이(30초)를 넘지 않도록 무음 경계 기준으로 윈도우 분할"""
+    return plan_chunks(audio, SAMPLE_RATE, target_sec=WINDOW_SEC - 5, max_sec=WINDOW_SEC)
+
+
+def tokens_to_segments(tokens: List[int], timestamp_begin: int, duration: float) -> List[Tuple[float, float, List[int]]]:
+    """
+    타임스탬프 토큰 시퀀스를 (시작, 끝, 텍스트 토큰) 목록으로 변환
+    <|0.00|> 텍스트 <|2.40|><|2.40|> 텍스트 <|5.00|> 형태를 구간별로 나눔
+    """
+    segments = []
+    current: List[int] = []
+    start: Optional[float] = None
+    for token in tokens:
+        if token >= timestamp_begin:
+            timestamp = (token - timestamp_begin) * TIME_PRECISION
+            if current:
+                segments.append((start if start is not None else 0.0, timestamp, current))
+                current = []
+                start = None
+            else:
+                start = timestamp
+        else:
+            current.append(token)
+    # 닫는 타임스탬프 없이 끝난 경우 윈도우 끝까지로 처리
+    if current:
+        segments.append((start if start is not None else 0.0, duration, current))
+
+    return [
+        (min(seg_start, duration), min(max(seg_end, seg_start), duration), seg_tokens)
+        for seg_start, seg_end, seg_tokens in segments
+    ]
+
+
+def _get_tokenizer(model, language: Optional[str]):
+    from whisper.tokenizer import get_tokenizer
+    try:
+        return get_tokenizer(model.is_multilingual, num_languages=model.num_languages,
+                             language=language, task="transcribe")
+    except TypeError:
+        # num_languages 인자가 없는 이전 openai-whisper 버전
+        return get_tokenizer(model.is_multilingual, language=language, task="transcribe")
+
+
+def transcribe_batch(model, audios: List[np.ndarray], language: Optional[str] = None,
+                     beam_size: Optional[int] = None, fp16: Optional[bool] = None,
+                     no_speech_threshold: Optional[float] = 0.6, logprob_threshold: Optional[float] = -1.0,
+                     batch_size: int = BATCH_SIZE, **_ignored) -> List[Dict]:
+    """
+    여러 오디오를 윈도우 단위로 묶어 일괄 디코딩하고 파일별 {text, segments, language}를 반환
+    temperature fallback은 적용하지 않으며(temperature 0 고정), 무음 윈도우는 transcribe()와 같은 기준으로 제외
+    """
+    import torch
+    import whisper
+
+    device = getattr(model, "device", torch.device("cpu"))
+    if fp16 is None or device.type == "cpu":
+        fp16 = device.type != "cpu"
+    n_mels = getattr(model.dims, "n_mels", 80)
+
+    # (파일 번호, 윈도우 시작 초, 윈도우 길이 초, 샘플)
+    windows = []
+    for file_index, audio in enumerate(audios):
+        for start, end in plan_windows(audio):
+            windows.append((file_index, start / SAMPLE_RATE, (end - start) / SAMPLE_RATE, np.array(audio[start:end])))
+
+    options = whisper.DecodingOptions(
+        task="transcribe",
+        language=language,
+        beam_size=beam_size if beam_size and beam_size > 1 else None,
+        fp16=fp16,
+        without_timestamps=False,
+    )
+
+    results: List[Dict] = [{"text": "", "segments": [], "language": language} for _ in audios]
+    tokenizers = {}
+    for batch_start in range(0, len(windows), batch_size):
+        batch = windows[batch_start:batch_start + batch_size]
+        mel = torch.stack([
+            whisper.log_mel_spectrogram(whisper.pad_or_trim(samples), n_mels)
+            for _, _, _, samples in batch
+        ]).to(device)
+        decoded = whisper.decode(model, mel, options)
+
+        for (file_index, offset, duration, _), result in zip(batch, decoded):
+            file_result = results[file_index]
+            file_result["language"] = file_result["language"] or result.language
+
+            if (no_speech_threshold is not None and result.no_speech_prob > no_speech_threshold
+                    and (logprob_threshold is None or result.avg_logprob < logprob_threshold)):
+                continue
+
+            tokenizer = tokenizers.get(result.language)
+            if tokenizer is None:
+                tokenizer = _get_tokenizer(model, result.language)
+                tokenizers[result.language] = tokenizer
+
+            for seg_start, seg_end, seg_tokens in tokens_to_segments(result.tokens, tokenizer.timestamp_begin, duration):
+                text = tokenizer.decode(seg_tokens)
+                if not text.strip():
+                    continue
+                file_result["segments"].append({
+                    "id": len(file_result["segments"]),
+                    "seek": int(offset * 100),
+                    "start": round(offset + seg_start, 3),
+                    "end": round(offset + seg_end, 3),
+                    "text": text,
+                    "tokens": seg_tokens,
+                    "temperature": result.temperature,
+                    "avg_logprob": result.avg_logprob,
+                    "compression_ratio": result.compression_ratio,
+                    "no_speech_prob": result.no_speech_prob,
+                })
+
+    for file_result in results:
+        file_result["text"] = "".join(segment["text"] for segment in file_result["segments"])
+
+    logger.info(f"📦 일괄 전사 완료 - 파일: {len(audios)}개, 윈도우: {len(windows)}개, 배치 크기: {batch_size}")
+    return results
+
+
+def transcribe_batch_on_worker(model, audios: List[np.ndarray], **options) -> List[Dict]:
+    """워커 스레드 전용 복제본으로 일괄 전사 실행 (InferencePool.run 대상 함수)"""
+    from inference_pool import get_worker_replica
+    return transcribe_batch(get_worker_replica(model), audios, **options)
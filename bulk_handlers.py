@@ -0,0 +1,139 @@
+"""
+일괄 처리 핸들러
+src_record 파일 여러 개를 STT → ERP 추출 → DB 저장 단계 파이프라인으로 처리하는 API
+"""
+
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import Dict, List, Optional
+from datetime import datetime
+import os
+import uuid
+import asyncio
+import logging
+
+from models import STTBulkRequest
+from bulk_pipeline import (
+    Stage, get_bulk_manager,
+    BULK_TRANSCRIBE_CONCURRENCY, BULK_EXTRACT_CONCURRENCY, BULK_PERSIST_CONCURRENCY
+)
+from stt_handlers import (
+    AUDIO_DIRECTORY, SUPPORTED_AUDIO_EXTENSIONS, FILE_TRANSCRIBE_OPTIONS,
+    resolve_audio_path, transcribe_stage, postprocess_stage, extract_stage, persist_stage,
+    get_postprocess_domain_data, build_stt_response, get_erp_extractor
+)
+from supabase_client import get_supabase_manager
+from priority_scheduler import SCHED_SJF, PRIORITY_BULK, probe_duration
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 라우터 생성
+router = APIRouter(prefix="/api", tags=["Bulk"])
+
+
+def _list_folder_files(folder: str) -> List[str]:
+    """src_record/<folder>의 음성 파일 목록 (src_record 기준 상대 경로)"""
+    folder_path = os.path.join(AUDIO_DIRECTORY, folder)
+    if not os.path.isdir(folder_path):
+        raise HTTPException(status_code=404, detail=f"폴더를 찾을 수 없습니다: {folder}")
+    return [
+        f"{folder}/{name}"
+        for name in sorted(os.listdir(folder_path))
+        if os.path.splitext(name)[1].lower() in SUPPORTED_AUDIO_EXTENSIONS
+    ]
+
+
+def _probe_file_duration(filename: str) -> Optional[float]:
+    """SJF 정렬용 길이 확인 (경로 오류는 전사 단계에서 해당 항목 실패로 기록되므로 여기서는 None)"""
+    try:
+        return probe_duration(resolve_audio_path(filename))
+    except HTTPException:
+        return None
+
+
+def build_stt_stages(model_name: str, language, extract_erp: bool, save_to_db: bool,
+                     erp_extractor, supabase_mgr) -> List[Stage]:
+    """STT(+후처리) → ERP 추출 → DB 저장 단계 구성"""
+    domain_data = get_postprocess_domain_data(extract_erp, erp_extractor)
+
+    async def transcribe(item: Dict):
+        item["_started"] = datetime.now()
+        # 경로 확인은 파일별로 수행 (없는 파일은 해당 항목만 실패 처리하고 나머지는 계속 진행)
+        file_path = resolve_audio_path(item["filename"])
+        result = await transcribe_stage(file_path, model_name, language, FILE_TRANSCRIBE_OPTIONS,
+                                        priority=PRIORITY_BULK)
+        item["_processed"] = await asyncio.to_thread(postprocess_stage, result, domain_data)
+
+    async def extract(item: Dict):
+        item["_erp_data"] = await asyncio.to_thread(
+            extract_stage, item["_processed"]["segments"], item["filename"], extract_erp, erp_extractor
+        )
+
+    async def persist(item: Dict):
+        processing_time = (datetime.now() - item["_started"]).total_seconds()
+        session_id, extraction_id = await asyncio.to_thread(
+            persist_stage, supabase_mgr, item["filename"], item["file_id"], model_name, language,
+            item["_processed"], item["_erp_data"], processing_time, save_to_db
+        )
+        response = build_stt_response(
+            item["_processed"], item["_erp_data"], processing_time, item["file_id"], session_id, extraction_id
+        )
+        item["session_id"] = session_id
+        item["extraction_id"] = extraction_id
+        item["processing_time"] = processing_time
+        item["result"] = response.dict()
+        # 결과 생성 후 중간 데이터는 해제
+        for key in ("_processed", "_erp_data"):
+            item.pop(key, None)
+
+    return [
+        Stage("transcribe", transcribe, BULK_TRANSCRIBE_CONCURRENCY),
+        Stage("extract", extract, BULK_EXTRACT_CONCURRENCY),
+        Stage("save", persist, BULK_PERSIST_CONCURRENCY),
+    ]
+
+
+@router.post("/stt-bulk", status_code=202)
+async def start_bulk_processing(
+    request: STTBulkRequest,
+    erp_extractor=Depends(get_erp_extractor),
+    supabase_mgr=Depends(get_supabase_manager)
+):
+    """파일 목록 또는 일자 폴더를 단계별 파이프라인으로 일괄 처리 (즉시 Run ID 반환)"""
+    filenames = list(request.filenames or [])
+    if request.folder:
+        filenames += _list_folder_files(request.folder)
+    if not filenames:
+        raise HTTPException(status_code=400, detail="처리할 파일이 없습니다. filenames 또는 folder를 지정해주세요.")
+
+    items = [
+        {"index": index, "filename": filename, "file_id": f"stt_{uuid.uuid4().hex[:8]}"}
+        for index, filename in enumerate(filenames)
+    ]
+
+    if SCHED_SJF:
+        # 등록 시점에 길이를 확인하여 짧은 녹음부터 처리 (응답의 index는 요청 순서 유지)
+        durations = await asyncio.gather(*(asyncio.to_thread(_probe_file_duration, item["filename"]) for item in items))
+        for item, duration in zip(items, durations):
+            item["duration_sec"] = round(duration, 2) if duration is not None else None
+        items.sort(key=lambda item: (item["duration_sec"] is None, item["duration_sec"] or 0.0, item["index"]))
+
+    language = None if request.language == 'auto' else request.language
+    stages = build_stt_stages(
+        request.model_name or "base", language, request.extract_erp, request.save_to_db,
+        erp_extractor, supabase_mgr
+    )
+    run = get_bulk_manager().start(items, stages)
+    return run.get_status()
+
+
+@router.get("/stt-bulk/{run_id}")
+async def get_bulk_processing_status(
+    run_id: str,
+    include_results: bool = Query(False, description="파일별 STT 결과 포함 여부")
+):
+    """일괄 처리 진행 상태 (단계별 처리량/대기, 파일별 상태) 조회"""
+    run = get_bulk_manager().get(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail=f"일괄 처리 실행을 찾을 수 없습니다: {run_id}")
+    return run.get_status(include_results=include_results)
@@ -0,0 +1,201 @@
+"""
+단계별 파이프라인 일괄 처리
+STT → ERP 추출 → DB 저장 단계를 크기 제한 큐로 연결하여, 파일 N+1 전사와 파일 N 추출,
+파일 N-1 저장이 동시에 진행되도록 하는 모듈 (처리량은 가장 느린 단계에 의해 결정됨)
+"""
+
+import os
+import time
+import uuid
+import asyncio
+import logging
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 파이프라인 설정 (config.env 또는 환경변수로 조정)
+BULK_QUEUE_SIZE = int(os.getenv("STT_BULK_QUEUE_SIZE", "4"))
+BULK_TRANSCRIBE_CONCURRENCY = int(os.getenv("STT_BULK_TRANSCRIBE_CONCURRENCY", "2"))
+BULK_EXTRACT_CONCURRENCY = int(os.getenv("STT_BULK_EXTRACT_CONCURRENCY", "4"))
+BULK_PERSIST_CONCURRENCY = int(os.getenv("STT_BULK_PERSIST_CONCURRENCY", "2"))
+BULK_MAX_RUNS = 50  # 메모리에 보관할 최근 실행 수
+
+
+class Stage:
+    """파이프라인 단계 (item을 받아 같은 item을 갱신하여 반환하는 비동기 함수)"""
+
+    def __init__(self, name: str, fn: Callable[[Dict], Awaitable[Dict]], concurrency: int = 1):
+        self.name = name
+        self.fn = fn
+        self.concurrency = max(1, concurrency)
+
+        self.processed = 0
+        self.failed = 0
+        self.active = 0
+        self.busy_seconds = 0.0
+
+    def get_stats(self) -> Dict:
+        return {
+            "concurrency": self.concurrency,
+            "active": self.active,
+            "processed": self.processed,
+            "failed": self.failed,
+            "busy_seconds": round(self.busy_seconds, 2),
+        }
+
+
+class BulkRun:
+    """일괄 처리 실행 한 건의 상태"""
+
+    def __init__(self, items: List[Dict], stages: List[Stage]):
+        self.id = f"bulk_{uuid.uuid4().hex[:10]}"
+        self.items = items
+        self.stages = stages
+        self.status = "queued"
+        self.created_at = datetime.now().isoformat()
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+        self.task: Optional[asyncio.Task] = None
+
+        for index, item in enumerate(self.items):
+            item.setdefault("index", index)
+            item["status"] = "pending"
+            item["stage"] = None
+            item["error"] = None
+
+    def get_status(self, include_results: bool = False) -> Dict:
+        files = []
+        for item in self.items:
+            entry = {key: value for key, value in item.items() if not key.startswith("_")}
+            if not include_results:
+                entry.pop("result", None)
+            files.append(entry)
+        completed = sum(1 for item in self.items if item["status"] == "completed")
+        failed = sum(1 for item in self.items if item["status"] == "failed")
+        return {
+            "run_id": self.id,
+            "status": self.status,
+            "total": len(self.items),
+            "completed": completed,
+            "failed": failed,
+            "progress": round((completed + failed) / len(self.items), 3) if self.items else 1.0,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "stages": {stage.name: stage.get_stats() for stage in self.stages},
+            "files": files,
+        }
+
+
+async def run_pipeline(run: BulkRun, queue_size: int = BULK_QUEUE_SIZE):
+    """
+    각 단계를 concurrency 개수의 워커로 실행하고 단계 사이를 크기 제한 큐로 연결
+    실패한 item은 이후 단계로 넘기지 않음
+    """
+    run.status = "running"
+    run.started_at = datetime.now().isoformat()
+    stages = run.stages
+    queues: List[asyncio.Queue] = [asyncio.Queue(maxsize=max(1, queue_size)) for _ in stages]
+    sentinel = object()
+
+    async def worker(stage_index: int):
+        stage = stages[stage_index]
+        inbox = queues[stage_index]
+        outbox = queues[stage_index + 1] if stage_index + 1 < len(stages) else None
+        while True:
+            item = await inbox.get()
+            if item is sentinel:
+                inbox.task_done()
+                break
+            item["stage"] = stage.name
+            item["status"] = "running"
+            stage.active += 1
+            start = time.perf_counter()
+            try:
+                await stage.fn(item)
+            except Exception as e:
+                stage.failed += 1
+                item["status"] = "failed"
+                item["error"] = str(getattr(e, "detail", None) or e)
+                logger.warning(f"일괄 처리 실패 - 단계: {stage.name}, 파일: {item.get('filename')}: {item['error']}")
+            else:
+                stage.processed += 1
+                if outbox is not None:
+                    item["status"] = "waiting"
+                    await outbox.put(item)
+                else:
+                    item["status"] = "completed"
+            finally:
+                stage.active -= 1
+                stage.busy_seconds += time.perf_counter() - start
+                inbox.task_done()
+
+    workers_by_stage = [
+        [asyncio.create_task(worker(i)) for _ in range(stage.concurrency)]
+        for i, stage in enumerate(stages)
+    ]
+
+    try:
+        for item in run.items:
+            await queues[0].put(item)
+        # 앞 단계부터 순서대로 종료 신호 전달 (앞 단계 워커가 모두 끝난 뒤 다음 단계 종료)
+        for stage_index, stage in enumerate(stages):
+            for _ in range(stage.concurrency):
+                await queues[stage_index].put(sentinel)
+            await asyncio.gather(*workers_by_stage[stage_index])
+        run.status = "completed"
+    except asyncio.CancelledError:
+        for workers in workers_by_stage:
+            for task in workers:
+                task.cancel()
+        run.status = "cancelled"
+        raise
+    finally:
+        run.finished_at = datetime.now().isoformat()
+        logger.info(f"일괄 처리 종료 - Run ID: {run.id}, 상태: {run.status}")
+
+
+class BulkPipelineManager:
+    """일괄 처리 실행을 시작하고 최근 실행 상태를 보관"""
+
+    def __init__(self, max_runs: int = BULK_MAX_RUNS):
+        self.max_runs = max_runs
+        self.runs: Dict[str, BulkRun] = {}
+
+    def start(self, items: List[Dict], stages: List[Stage], queue_size: int = BULK_QUEUE_SIZE) -> BulkRun:
+        run = BulkRun(items, stages)
+        self.runs[run.id] = run
+        while len(self.runs) > self.max_runs:
+            oldest = next(iter(self.runs))
+            if self.runs[oldest].status == "running":
+                break
+            self.runs.pop(oldest)
+        run.task = asyncio.create_task(run_pipeline(run, queue_size))
+        logger.info(f"일괄 처리 시작 - Run ID: {run.id}, 파일: {len(items)}개")
+        return run
+
+    def get(self, run_id: str) -> Optional[BulkRun]:
+        return self.runs.get(run_id)
+
+    async def shutdown(self):
+        for run in self.runs.values():
+            if run.task is not None and not run.task.done():
+                run.task.cancel()
+                try:
+                    await run.task
+                except (asyncio.CancelledError, Exception):
+                    pass
+
+
+# 전역 일괄 처리 매니저
+_bulk_manager: Optional[BulkPipelineManager] = None
+
+def get_bulk_manager() -> BulkPipelineManager:
+    """일괄 처리 매니저 싱글톤 인스턴스를 반환합니다"""
+    global _bulk_manager
+
+    if _bulk_manager is None:
+        _bulk_manager = BulkPipelineManager()
+
+    return _bulk_manager
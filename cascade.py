@@ -0,0 +1,172 @@
+"""
+신뢰도 기반 캐스케이드 전사
+빠른 모델의 전사 결과에서 avg_logprob / no_speech_prob / compression_ratio로 신뢰도가 낮은 세그먼트를 고르고,
+해당 오디오 구간만 큰 모델로 다시 디코딩하여 원래 결과에 병합하는 모듈
+"""
+
+import os
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from audio_chunking import SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+# 캐스케이드 설정 (config.env 또는 환경변수로 조정)
+CASCADE_MODEL = os.getenv("STT_CASCADE_MODEL", "medium")  # 저신뢰 구간 재디코딩 모델
+CASCADE_LOGPROB_THRESHOLD = float(os.getenv("STT_CASCADE_LOGPROB_THRESHOLD", "-0.7"))
+CASCADE_NO_SPEECH_THRESHOLD = float(os.getenv("STT_CASCADE_NO_SPEECH_THRESHOLD", "0.5"))
+CASCADE_COMPRESSION_THRESHOLD = float(os.getenv("STT_CASCADE_COMPRESSION_THRESHOLD", "2.2"))
+CASCADE_BEAM_SIZE = int(os.getenv("STT_CASCADE_BEAM_SIZE", "5"))
+CASCADE_FULL_RATIO = float(os.getenv("STT_CASCADE_FULL_RATIO", "0.6"))  # 저신뢰 구간 비율이 이 이상이면 전체 재전사
+
+CASCADE_PADDING_SEC = 0.5  # 재디코딩 구간 앞뒤 여유 (이웃 세그먼트를 침범하지 않는 범위에서)
+CASCADE_MERGE_GAP_SEC = 1.0  # 이 간격 이하로 붙은 저신뢰 세그먼트는 한 구간으로 재디코딩
+CASCADE_MAX_SPAN_SEC = 30.0  # Whisper 입력 길이
+
+
+def weak_reason(segment: Dict,
+                logprob_threshold: float = CASCADE_LOGPROB_THRESHOLD,
+                no_speech_threshold: float = CASCADE_NO_SPEECH_THRESHOLD,
+                compression_threshold: float = CASCADE_COMPRESSION_THRESHOLD) -> Optional[str]:
+    """저신뢰 세그먼트면 사유(low_logprob / no_speech / repetition), 아니면 None"""
+    if segment.get("compression_ratio", 0.0) > compression_threshold:
+        return "repetition"
+    if segment.get("avg_logprob", 0.0) < logprob_threshold:
+        return "low_logprob"
+    # 텍스트가 있는데 무음 확률이 높으면 환청(hallucination)일 가능성이 큼
+    if segment.get("no_speech_prob", 0.0) > no_speech_threshold and segment.get("text", "").strip():
+        return "no_speech"
+    return None
+
+
+def select_weak_spans(segments: List[Dict], duration: float,
+                      padding: float = CASCADE_PADDING_SEC,
+                      merge_gap: float = CASCADE_MERGE_GAP_SEC,
+                      max_span: float = CASCADE_MAX_SPAN_SEC, **thresholds) -> List[Dict]:
+    """
+    저신뢰 세그먼트를 인접한 것끼리 묶어 재디코딩 구간 목록 생성
+    구간 경계는 이웃한(재디코딩하지 않는) 세그먼트를 넘지 않도록 제한하여 병합 시 중복 텍스트를 막음
+    반환: [{start, end, indices, reasons}]
+    """
+    groups: List[List[int]] = []
+    reasons: Dict[int, str] = {}
+    for index, segment in enumerate(segments):
+        reason = weak_reason(segment, **thresholds)
+        if reason is None:
+            continue
+        reasons[index] = reason
+        if groups:
+            last = groups[-1]
+            previous = segments[last[-1]]
+            contiguous = last[-1] == index - 1 and segment["start"] - previous["end"] <= merge_gap
+            if contiguous and segment["end"] - segments[last[0]]["start"] + 2 * padding <= max_span:
+                last.append(index)
+                continue
+        groups.append([index])
+
+    spans = []
+    for indices in groups:
+        first, last = indices[0], indices[-1]
+        lower = segments[first - 1]["end"] if first > 0 else 0.0
+        upper = segments[last + 1]["start"] if last + 1 < len(segments) else duration
+        start = max(lower, segments[first]["start"] - padding, 0.0)
+        end = min(upper, segments[last]["end"] + padding, duration)
+        if end - start > max_span:
+            end = start + max_span
+        if end <= start:
+            continue
+        spans.append({
+            "start": round(start, 3),
+            "end": round(end, 3),
+            "indices": indices,
+            "reasons": [reasons[i] for i in indices],
+        })
+    return spans
+
+
+def merge_refined(segments: List[Dict], spans: List[Dict], span_results: List[Dict]) -> List[Dict]:
+    """재디코딩 결과로 각 구간의 세그먼트를 교체하고 id를 다시 매김"""
+    replacements = {}
+    replaced = set()
+    for span, result in zip(spans, span_results):
+        new_segments = []
+        for segment in result.get("segments", []):
+            start = min(span["start"] + segment["start"], span["end"])
+            end = min(span["start"] + segment["end"], span["end"])
+            if not segment.get("text", "").strip() or end <= start:
+                continue
+            new_segments.append({**segment, "start": round(start, 3), "end": round(end, 3), "cascade": True})
+        replacements[span["indices"][0]] = new_segments
+        replaced.update(span["indices"])
+
+    merged = []
+    for index, segment in enumerate(segments):
+        if index in replacements:
+            merged.extend(replacements[index])
+        elif index not in replaced:
+            merged.append(dict(segment))
+
+    for new_id, segment in enumerate(merged):
+        segment["id"] = new_id
+    return merged
+
+
+def refine_weak_segments(strong_model, audio: np.ndarray, result: Dict,
+                         strong_model_name: Optional[str] = None, **options) -> Dict:
+    """
+    빠른 모델 결과(result)의 저신뢰 구간만 strong_model로 재디코딩하여 병합한 결과 반환
+    저신뢰 구간이 전체 길이의 CASCADE_FULL_RATIO 이상이면 전체를 strong_model로 다시 전사
+    """
+    segments = result.get("segments", [])
+    duration = len(audio) / SAMPLE_RATE
+    spans = select_weak_spans(segments, duration)
+    weak_sec = sum(span["end"] - span["start"] for span in spans)
+    stats = {
+        "model": strong_model_name,
+        "segments": len(segments),
+        "weak_segments": sum(len(span["indices"]) for span in spans),
+        "spans": len(spans),
+        "redecoded_sec": round(weak_sec, 2),
+        "duration_sec": round(duration, 2),
+        "mode": "none",
+    }
+    if not spans:
+        return {**result, "cascade": stats}
+
+    options = {**options, "beam_size": CASCADE_BEAM_SIZE, "verbose": None, "condition_on_previous_text": False}
+    options.pop("initial_prompt", None)
+
+    if duration and weak_sec / duration >= CASCADE_FULL_RATIO:
+        stats["mode"] = "full"
+        stats["redecoded_sec"] = round(duration, 2)
+        logger.info(f"🔁 저신뢰 구간 {weak_sec:.1f}초/{duration:.1f}초 - 전체 재전사")
+        full = strong_model.transcribe(np.array(audio), **options)
+        return {**full, "cascade": stats}
+
+    span_results = []
+    for span in spans:
+        window = np.array(audio[int(span["start"] * SAMPLE_RATE):int(span["end"] * SAMPLE_RATE)])
+        first = span["indices"][0]
+        # 직전 세그먼트 텍스트를 문맥으로 제공 (장비명 등 앞 문맥 유지)
+        prompt = segments[first - 1].get("text", "").strip() if first > 0 else ""
+        span_options = {**options, "initial_prompt": prompt} if prompt else options
+        span_results.append(strong_model.transcribe(window, **span_options))
+
+    merged = merge_refined(segments, spans, span_results)
+    stats["mode"] = "spans"
+    logger.info(f"🔁 캐스케이드 재디코딩 완료 - 구간 {len(spans)}개, {weak_sec:.1f}초/{duration:.1f}초")
+    return {
+        **result,
+        "segments": merged,
+        "text": "".join(segment.get("text", "") for segment in merged),
+        "cascade": stats,
+    }
+
+
+def refine_on_worker(strong_model, audio: np.ndarray, result: Dict, **options) -> Dict:
+    """워커 스레드 전용 복제본으로 캐스케이드 재디코딩 실행 (InferencePool.run 대상 함수)"""
+    from inference_pool import get_worker_replica
+    return refine_weak_segments(get_worker_replica(strong_model), audio, result, **options)
@@ -0,0 +1,165 @@
+"""
+스테레오 채널 분리 전사
+PBX 통화 녹음처럼 상담원/고객이 서로 다른 채널에 녹음된 파일을 채널별로 따로 전사하고,
+타임스탬프 순서로 병합하여 채널 기준의 실제 화자 라벨을 붙이는 모듈 (추가 화자 분리 모델 불필요)
+"""
+
+import os
+import json
+import wave
+import logging
+import subprocess
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from pcm_cache import get_pcm_cache, SAMPLE_RATE
+from transcription_cache import get_file_hash
+
+logger = logging.getLogger(__name__)
+
+# 채널 분리 설정 (config.env 또는 환경변수로 조정)
+CHANNEL_SPLIT_ENABLED = os.getenv("STT_CHANNEL_SPLIT", "true").lower() == "true"
+CHANNEL_SPEAKER_LABELS = [
+    label.strip() for label in os.getenv("STT_CHANNEL_SPEAKERS", "Speaker_0,Speaker_1").split(",") if label.strip()
+]
+
+# 두 채널 차이가 평균 진폭의 이 비율 미만이면 같은 소리를 복제한 스테레오로 보고 mono 처리
+IDENTICAL_CHANNEL_RATIO = 0.02
+
+# 채널별 결과를 병합할 때 함께 합치는 처리 통계 키
+MERGED_STATS_KEYS = ("cascade", "silence_strip")
+
+# 파일 해시별 채널 수 (ffprobe 재실행 방지)
+_channel_counts: Dict[str, int] = {}
+_channel_counts_lock = threading.Lock()
+
+
+def probe_channels(file_path: str) -> int:
+    """오디오 채널 수 조회 (wav는 표준 라이브러리, 그 외는 ffprobe, 실패 시 1)"""
+    if file_path.lower().endswith(".wav"):
+        try:
+            with wave.open(file_path, "rb") as wav:
+                return wav.getnchannels()
+        except (wave.Error, EOFError, OSError):
+            pass
+    try:
+        output = subprocess.run(
+            ["ffprobe", "-v", "error", "-select_streams", "a:0",
+             "-show_entries", "stream=channels", "-of", "json", file_path],
+            capture_output=True, check=True, timeout=30
+        ).stdout
+        streams = json.loads(output or b"{}").get("streams", [])
+        return int(streams[0].get("channels", 1)) if streams else 1
+    except (OSError, subprocess.SubprocessError, ValueError) as e:
+        logger.debug(f"채널 수 확인 실패 (mono로 처리): {file_path}, {e}")
+        return 1
+
+
+def get_channel_count(file_path: str, file_hash: Optional[str] = None) -> int:
+    """파일 해시 기준으로 기억해 둔 채널 수 반환"""
+    file_hash = file_hash or get_file_hash(file_path)
+    with _channel_counts_lock:
+        if file_hash in _channel_counts:
+            return _channel_counts[file_hash]
+    channels = probe_channels(file_path)
+    with _channel_counts_lock:
+        _channel_counts[file_hash] = channels
+    return channels
+
+
+def decode_channels(file_path: str) -> np.ndarray:
+    """FFmpeg로 채널을 유지한 채 16kHz float32 디코딩 → (채널 수, 샘플 수) 배열"""
+    channels = probe_channels(file_path)
+    cmd = [
+        "ffmpeg", "-nostdin", "-threads", "0", "-i", file_path,
+        "-f", "s16le", "-acodec", "pcm_s16le", "-ar", str(SAMPLE_RATE), "-"
+    ]
+    output = subprocess.run(cmd, capture_output=True, check=True).stdout
+    samples = np.frombuffer(output, np.int16)
+    samples = samples[:len(samples) - len(samples) % channels]
+    return (samples.reshape(-1, channels).T.astype(np.float32) / 32768.0)
+
+
+def is_duplicated_mono(channels: np.ndarray) -> bool:
+    """모든 채널이 사실상 같은 소리인지 (mono를 복제한 스테레오) 여부"""
+    reference = channels[0]
+    level = float(np.mean(np.abs(reference))) + 1e-8
+    return all(
+        float(np.mean(np.abs(channel - reference))) < IDENTICAL_CHANNEL_RATIO * level
+        for channel in channels[1:]
+    )
+
+
+def load_channel_pcm(file_path: str, file_hash: Optional[str] = None,
+                     decoder=None) -> Optional[List[np.ndarray]]:
+    """
+    다채널 녹음이면 채널별 16kHz float32 배열 목록 반환 (PCM 캐시 경유)
+    mono이거나 채널이 복제된 스테레오면 None (일반 mono 전사 대상)
+    """
+    file_hash = file_hash or get_file_hash(file_path)
+    if get_channel_count(file_path, file_hash) < 2:
+        return None
+
+    channels = get_pcm_cache().get(file_path, file_hash, variant=".channels",
+                                   decoder=decoder or decode_channels)
+    if channels.ndim != 2 or channels.shape[0] < 2 or is_duplicated_mono(channels):
+        return None
+    return [channels[index] for index in range(channels.shape[0])]
+
+
+def channel_label(index: int) -> str:
+    if index < len(CHANNEL_SPEAKER_LABELS):
+        return CHANNEL_SPEAKER_LABELS[index]
+    return f"Speaker_{index}"
+
+
+def label_segments(segments: List[Dict], channel: int) -> List[Dict]:
+    """세그먼트에 채널/화자 라벨 부여"""
+    return [{**segment, "channel": channel, "speaker": channel_label(channel)} for segment in segments]
+
+
+def merge_channel_stats(stats_list: List[Optional[Dict]]) -> Optional[Dict]:
+    """채널별 처리 통계(cascade/silence_strip) 병합 - 숫자 값은 합산, 나머지는 채널 간 같으면 그대로 유지
+
+    채널별 원본 통계는 per_channel 목록(채널 순서, 통계가 없는 채널은 None)으로 함께 보존
+    """
+    if not any(stats_list):
+        return None
+    merged = {}
+    for stats in stats_list:
+        for key, value in (stats or {}).items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                merged[key] = round(merged.get(key, 0) + value, 2)
+            elif key not in merged:
+                merged[key] = value
+            elif merged[key] != value:
+                # 채널마다 다른 값 (예: cascade mode가 spans/none)은 채널 순서대로 나열
+                merged[key] = f"{merged[key]},{value}"
+    merged["per_channel"] = list(stats_list)
+    return merged
+
+
+def merge_channel_results(results: List[Dict]) -> Dict:
+    """채널별 전사 결과를 시작 시간 순서로 병합 (같은 시각이면 채널 순서)"""
+    segments = []
+    for channel, result in enumerate(results):
+        segments.extend(label_segments(result.get("segments", []), channel))
+    segments.sort(key=lambda segment: (segment["start"], segment["channel"]))
+    for new_id, segment in enumerate(segments):
+        segment["id"] = new_id
+
+    language = next((result.get("language") for result in results if result.get("language")), None)
+    merged = {
+        "text": "".join(segment.get("text", "") for segment in segments),
+        "segments": segments,
+        "language": language,
+        "channels": len(results),
+    }
+    # 채널별 캐스케이드/무음 제거 통계도 합쳐서 응답까지 전달
+    for stats_key in MERGED_STATS_KEYS:
+        stats = merge_channel_stats([result.get(stats_key) for result in results])
+        if stats is not None:
+            merged[stats_key] = stats
+    return merged
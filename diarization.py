@@ -0,0 +1,264 @@
+"""
+경량 CPU 화자 분리
+NumPy만으로 프레임 단위 MFCC 특징을 구하고, 인접 윈도우 간 거리로 화자 전환 지점을 찾은 뒤
+구간들을 응집형(agglomerative) 클러스터링으로 화자 수만큼 묶어 화자 구간(turn)을 만드는 모듈
+(pyannote처럼 HF 토큰이나 대형 모델이 필요 없으며, Whisper 디코딩과 동시에 실행)
+"""
+
+import os
+import time
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from audio_chunking import SAMPLE_RATE, VAD_THRESHOLD_DB, VAD_SPEECH_MARGIN_DB
+from speaker_assignment import assign_speakers
+
+logger = logging.getLogger(__name__)
+
+# 화자 분리 설정 (config.env 또는 환경변수로 조정)
+DIARIZATION_ENABLED = os.getenv("STT_DIARIZATION_ENABLED", "true").lower() == "true"
+DIARIZATION_SPEAKERS = int(os.getenv("STT_DIARIZATION_SPEAKERS", "2"))
+DIARIZATION_WINDOW_SEC = float(os.getenv("STT_DIARIZATION_WINDOW_SEC", "1.5"))  # 화자 임베딩 윈도우 길이
+DIARIZATION_STEP_SEC = float(os.getenv("STT_DIARIZATION_STEP_SEC", "0.75"))  # 윈도우 이동 간격
+DIARIZATION_CHANGE_SENSITIVITY = float(os.getenv("STT_DIARIZATION_CHANGE_SENSITIVITY", "1.0"))  # 작을수록 전환 지점을 많이 찾음
+
+# 특징 추출 설정 (16kHz 기준 32ms 프레임 / 16ms 이동)
+FRAME_SIZE = 512
+HOP_SIZE = 256
+N_MELS = 26
+N_MFCC = 13
+FRAME_BLOCK = 8192  # 한 번에 FFT하는 프레임 수 (긴 녹음에서 메모리 사용량 제한)
+SILENCE_FLOOR_DB = -60.0  # 이보다 작은 프레임은 잡음 바닥과 무관하게 무음
+MIN_SPEECH_RATIO = 0.3  # 윈도우 안의 음성 프레임 비율이 이 미만이면 임베딩 제외
+
+
+def mel_filterbank(sample_rate: int = SAMPLE_RATE, n_fft: int = FRAME_SIZE, n_mels: int = N_MELS) -> np.ndarray:
+    """삼각 mel 필터뱅크 (n_mels, n_fft // 2 + 1)"""
+    def hz_to_mel(hz):
+        return 2595.0 * np.log10(1.0 + hz / 700.0)
+
+    def mel_to_hz(mel):
+        return 700.0 * (10.0 ** (mel / 2595.0) - 1.0)
+
+    mel_points = np.linspace(hz_to_mel(60.0), hz_to_mel(sample_rate / 2), n_mels + 2)
+    bins = np.floor((n_fft + 1) * mel_to_hz(mel_points) / sample_rate).astype(int)
+    filters = np.zeros((n_mels, n_fft // 2 + 1), dtype=np.float32)
+    for m in range(1, n_mels + 1):
+        left, center, right = bins[m - 1], bins[m], bins[m + 1]
+        if center > left:
+            filters[m - 1, left:center] = (np.arange(left, center) - left) / (center - left)
+        if right > center:
+            filters[m - 1, center:right] = (right - np.arange(center, right)) / (right - center)
+    return filters
+
+
+def dct_matrix(n_mfcc: int = N_MFCC, n_mels: int = N_MELS) -> np.ndarray:
+    """직교 DCT-II 행렬 (n_mfcc, n_mels)"""
+    n = np.arange(n_mels)
+    k = np.arange(n_mfcc)[:, None]
+    matrix = np.cos(np.pi * k * (2 * n + 1) / (2 * n_mels)) * np.sqrt(2.0 / n_mels)
+    matrix[0] /= np.sqrt(2.0)
+    return matrix.astype(np.float32)
+
+
+_MEL_FILTERS = mel_filterbank()
+_DCT = dct_matrix()
+_WINDOW = np.hamming(FRAME_SIZE).astype(np.float32)
+
+
+def extract_features(audio: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    프레임별 MFCC(c1~c12)와 로그 에너지(dB) 계산
+    반환: {"mfcc": (프레임 수, N_MFCC - 1), "energy_db": (프레임 수,)}
+    """
+    audio = np.asarray(audio, dtype=np.float32)
+    frame_count = 1 + (len(audio) - FRAME_SIZE) // HOP_SIZE if len(audio) >= FRAME_SIZE else 0
+    if frame_count == 0:
+        return {"mfcc": np.zeros((0, N_MFCC - 1), dtype=np.float32), "energy_db": np.zeros(0, dtype=np.float32)}
+
+    frames_view = np.lib.stride_tricks.sliding_window_view(audio, FRAME_SIZE)[::HOP_SIZE][:frame_count]
+    mfcc = np.empty((frame_count, N_MFCC), dtype=np.float32)
+    energy_db = np.empty(frame_count, dtype=np.float32)
+    for begin in range(0, frame_count, FRAME_BLOCK):
+        frames = frames_view[begin:begin + FRAME_BLOCK]
+        energy_db[begin:begin + len(frames)] = 10.0 * np.log10(np.mean(frames ** 2, axis=1) + 1e-10)
+        power = np.abs(np.fft.rfft(frames * _WINDOW, n=FRAME_SIZE, axis=1)) ** 2
+        log_mel = np.log(power.astype(np.float32) @ _MEL_FILTERS.T + 1e-10)
+        mfcc[begin:begin + len(frames)] = log_mel @ _DCT.T
+
+    # c0(전체 음량)는 화자보다 거리/마이크 영향이 크므로 제외
+    return {"mfcc": mfcc[:, 1:], "energy_db": energy_db}
+
+
+def speech_mask(energy_db: np.ndarray, threshold_db: float = VAD_THRESHOLD_DB) -> np.ndarray:
+    """에너지 기준 음성 프레임 여부 (분할 전사 VAD와 같은 기준)"""
+    if len(energy_db) == 0:
+        return np.zeros(0, dtype=bool)
+    noise_floor, speech_level = np.percentile(energy_db, [5, 90])
+    threshold = min(noise_floor + threshold_db, speech_level - VAD_SPEECH_MARGIN_DB)
+    return energy_db > max(threshold, SILENCE_FLOOR_DB)
+
+
+def window_embeddings(mfcc: np.ndarray, speech: np.ndarray,
+                      window_sec: float = DIARIZATION_WINDOW_SEC,
+                      step_sec: float = DIARIZATION_STEP_SEC) -> Dict[str, np.ndarray]:
+    """
+    슬라이딩 윈도우별 화자 임베딩 (음성 프레임 MFCC의 평균 + 표준편차, 차원별 표준화)
+    반환: {"embeddings": (윈도우 수, 차원), "starts": 윈도우 시작 시간(초)}
+    """
+    frames_per_sec = SAMPLE_RATE / HOP_SIZE
+    window = max(1, int(round(window_sec * frames_per_sec)))
+    step = max(1, int(round(step_sec * frames_per_sec)))
+    if speech.any():
+        # 녹음 전체 평균을 빼서 채널(전화망/마이크) 특성 제거 (CMN)
+        mfcc = mfcc - mfcc[speech].mean(axis=0)
+
+    embeddings, starts = [], []
+    for begin in range(0, max(len(mfcc) - window, 0) + 1, step):
+        voiced = mfcc[begin:begin + window][speech[begin:begin + window]]
+        if len(voiced) < MIN_SPEECH_RATIO * window:
+            continue
+        embeddings.append(np.concatenate([voiced.mean(axis=0), voiced.std(axis=0)]))
+        starts.append(begin / frames_per_sec)
+
+    if not embeddings:
+        return {"embeddings": np.zeros((0, 2 * mfcc.shape[1]), dtype=np.float32), "starts": np.zeros(0)}
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    embeddings = (embeddings - embeddings.mean(axis=0)) / (embeddings.std(axis=0) + 1e-6)
+    return {"embeddings": embeddings, "starts": np.asarray(starts)}
+
+
+def cosine_distances(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    a = a / (np.linalg.norm(a, axis=-1, keepdims=True) + 1e-10)
+    b = b / (np.linalg.norm(b, axis=-1, keepdims=True) + 1e-10)
+    return 1.0 - a @ b.T
+
+
+def detect_changes(embeddings: np.ndarray, starts: np.ndarray,
+                   step_sec: float = DIARIZATION_STEP_SEC,
+                   sensitivity: float = DIARIZATION_CHANGE_SENSITIVITY) -> List[int]:
+    """
+    화자 전환 지점 = 다음 윈도우와의 거리가 국소 최대이면서 평균 거리 × sensitivity를 넘는 윈도우 인덱스 + 1
+    무음으로 윈도우가 끊긴 곳도 전환 후보로 봄 (과분할은 이후 클러스터링에서 다시 합쳐짐)
+    """
+    if len(embeddings) < 2:
+        return []
+    distances = np.sum((embeddings[1:] - embeddings[:-1]) ** 2, axis=1)
+    threshold = distances.mean() * sensitivity
+    padded = np.concatenate(([-np.inf], distances, [-np.inf]))
+    peaks = (distances >= padded[:-2]) & (distances >= padded[2:]) & (distances > threshold)
+    gaps = np.diff(starts) > step_sec * 1.5
+    return [int(i) + 1 for i in np.flatnonzero(peaks | gaps)]
+
+
+def agglomerative_cluster(embeddings: np.ndarray, weights: np.ndarray, n_clusters: int) -> np.ndarray:
+    """
+    가중 중심(centroid) 연결 방식 응집형 클러스터링 (코사인 거리)
+    가장 가까운 두 클러스터를 n_clusters개가 남을 때까지 합침, 반환: 입력별 클러스터 번호
+    """
+    count = len(embeddings)
+    labels = np.arange(count)
+    if count <= n_clusters:
+        return labels
+    centroids = embeddings.astype(np.float64).copy()
+    sizes = weights.astype(np.float64).copy()
+    active = np.ones(count, dtype=bool)
+    distances = cosine_distances(centroids, centroids)
+    np.fill_diagonal(distances, np.inf)
+
+    for _ in range(count - n_clusters):
+        a, b = np.unravel_index(np.argmin(distances), distances.shape)
+        a, b = min(a, b), max(a, b)
+        centroids[a] = (centroids[a] * sizes[a] + centroids[b] * sizes[b]) / (sizes[a] + sizes[b])
+        sizes[a] += sizes[b]
+        active[b] = False
+        labels[labels == b] = a
+        distances[b, :] = distances[:, b] = np.inf
+        row = cosine_distances(centroids[a:a + 1], centroids)[0]
+        row[~active] = np.inf
+        row[a] = np.inf
+        distances[a, :] = distances[:, a] = row
+
+    _, labels = np.unique(labels, return_inverse=True)
+    return labels
+
+
+def diarize_audio(audio: np.ndarray, n_speakers: int = DIARIZATION_SPEAKERS,
+                  sample_rate: int = SAMPLE_RATE) -> List[Dict]:
+    """
+    16kHz mono 배열의 화자 구간 목록 [{start, end, speaker}] (시간순, 같은 화자 연속 구간은 병합)
+    화자 번호는 처음 말한 순서대로 Speaker_0, Speaker_1, ...
+    음성 구간이 너무 짧으면 빈 목록
+    """
+    if sample_rate != SAMPLE_RATE:
+        raise ValueError(f"화자 분리는 {SAMPLE_RATE}Hz 오디오만 지원합니다: {sample_rate}")
+    duration = len(audio) / SAMPLE_RATE
+    features = extract_features(audio)
+    windows = window_embeddings(features["mfcc"], speech_mask(features["energy_db"]))
+    embeddings, starts = windows["embeddings"], windows["starts"]
+    if len(embeddings) == 0:
+        return []
+
+    # 전환 지점으로 나눈 동질 구간을 하나의 클러스터링 단위로 사용 (윈도우 단위보다 안정적이고 빠름)
+    bounds = [0] + detect_changes(embeddings, starts) + [len(embeddings)]
+    pieces = [(begin, end) for begin, end in zip(bounds[:-1], bounds[1:]) if end > begin]
+    piece_embeddings = np.stack([embeddings[begin:end].mean(axis=0) for begin, end in pieces])
+    piece_weights = np.array([end - begin for begin, end in pieces], dtype=np.float64)
+    labels = agglomerative_cluster(piece_embeddings, piece_weights, max(1, n_speakers))
+
+    # 처음 등장한 순서대로 화자 번호 재배정
+    order = {}
+    for label in labels:
+        order.setdefault(int(label), len(order))
+
+    # 윈도우가 겹치므로 각 윈도우는 중앙의 이동 간격(step)만큼만 대표 (구간 경계가 전환 지점 중간에 오도록)
+    margin = (DIARIZATION_WINDOW_SEC - DIARIZATION_STEP_SEC) / 2
+    turns: List[Dict] = []
+    for (begin, end), label in zip(pieces, labels):
+        start = float(starts[begin]) + margin if begin > 0 else float(starts[0])
+        stop = float(starts[end - 1]) + margin + DIARIZATION_STEP_SEC
+        if end == len(starts):
+            stop = float(starts[-1]) + DIARIZATION_WINDOW_SEC
+        speaker = f"Speaker_{order[int(label)]}"
+        if turns and turns[-1]["speaker"] == speaker and start <= turns[-1]["end"] + DIARIZATION_STEP_SEC:
+            turns[-1]["end"] = stop
+            continue
+        turns.append({"start": start, "end": stop, "speaker": speaker})
+    for turn in turns:
+        turn["start"], turn["end"] = round(turn["start"], 3), round(min(turn["end"], duration), 3)
+    return turns
+
+
+def diarize_safely(audio: np.ndarray, n_speakers: int = DIARIZATION_SPEAKERS) -> Optional[Dict]:
+    """
+    화자 분리 실행 (전사와 동시에 스레드에서 실행하는 용도, 실패해도 전사는 계속되도록 None 반환)
+    반환: {"turns": [...], "elapsed_sec": 소요 시간}
+    """
+    started = time.perf_counter()
+    try:
+        turns = diarize_audio(audio, n_speakers=n_speakers)
+    except Exception as e:
+        logger.warning(f"화자 분리 실패 (교대 라벨 사용): {e}")
+        return None
+    elapsed = time.perf_counter() - started
+    logger.info(f"🗣️ 화자 분리 완료 - 구간: {len(turns)}개, 소요: {elapsed:.2f}초 (오디오 {len(audio) / SAMPLE_RATE:.1f}초)")
+    return {"turns": turns, "elapsed_sec": round(elapsed, 3)}
+
+
+def apply_diarization(result: Dict, diarization: Optional[Dict]) -> Dict:
+    """전사 결과 세그먼트에 화자 라벨을 붙이고 화자 분리 통계 추가"""
+    if not diarization or not diarization["turns"]:
+        return result
+    turns = diarization["turns"]
+    return {
+        **result,
+        "segments": assign_speakers(result.get("segments", []), turns),
+        "diarization": {
+            "method": "numpy-mfcc",
+            "speakers": len({turn["speaker"] for turn in turns}),
+            "turns": len(turns),
+            "elapsed_sec": diarization["elapsed_sec"],
+        },
+    }
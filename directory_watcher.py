@@ -0,0 +1,248 @@
+"""
+src_record 일자 폴더 감시 → STT 작업 자동 등록
+일자 폴더(YYYY-MM-DD)에 새로 들어온 음성 파일을 inotify(watchdog 설치 시) 또는 주기적 스캔으로 감지하고,
+크기/수정 시간이 일정 시간 변하지 않아 쓰기가 끝난 파일만 STT + ERP 추출 작업 큐에 등록하는 모듈
+"""
+
+import os
+import re
+import time
+import asyncio
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 폴더 감시 설정 (config.env 또는 환경변수로 조정)
+WATCH_ENABLED = os.getenv("STT_WATCH_ENABLED", "false").lower() == "true"
+WATCH_ROOT = os.getenv("STT_WATCH_ROOT", "src_record")  # 작업 파일 경로 기준 폴더(src_record) 안이어야 함
+WATCH_MODE = os.getenv("STT_WATCH_MODE", "auto")  # auto: watchdog 설치 시 inotify, 아니면 polling
+WATCH_POLL_INTERVAL = float(os.getenv("STT_WATCH_POLL_INTERVAL", "5"))  # 스캔/쓰기 완료 확인 주기(초)
+WATCH_SETTLE_SEC = float(os.getenv("STT_WATCH_SETTLE_SEC", "10"))  # 크기/수정 시간이 이 시간 동안 그대로면 쓰기 완료
+WATCH_BACKFILL_DAYS = int(os.getenv("STT_WATCH_BACKFILL_DAYS", "1"))  # 시작 시 오늘 포함 며칠 전 폴더까지 확인
+WATCH_MODEL = os.getenv("STT_WATCH_MODEL", "base")
+WATCH_EXTRACT_ERP = os.getenv("STT_WATCH_EXTRACT_ERP", "true").lower() == "true"
+WATCH_SAVE_TO_DB = os.getenv("STT_WATCH_SAVE_TO_DB", "true").lower() == "true"
+
+WATCH_EXTENSIONS = ('.mp3', '.wav', '.m4a', '.flac')
+DAILY_FOLDER_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def daily_relative_path(root: str, path: str) -> Optional[str]:
+    """
+    감시 대상 파일이면 root 기준 상대 경로('YYYY-MM-DD/파일명'), 아니면 None
+    일자 폴더 바로 아래의 지원 확장자 파일만 대상 (숨김/임시 파일 제외)
+    """
+    relative = os.path.relpath(os.path.abspath(path), os.path.abspath(root))
+    parts = relative.replace("\\", "/").split("/")
+    if len(parts) != 2 or not DAILY_FOLDER_PATTERN.match(parts[0]):
+        return None
+    name = parts[1]
+    if name.startswith((".", "~")) or not name.lower().endswith(WATCH_EXTENSIONS):
+        return None
+    return "/".join(parts)
+
+
+def backfill_folders(days: int = WATCH_BACKFILL_DAYS, today: Optional[datetime] = None) -> List[str]:
+    """스캔할 일자 폴더 이름 목록 (오늘부터 days일 전까지, 최신순)"""
+    today = today or datetime.now()
+    return [(today - timedelta(days=offset)).strftime("%Y-%m-%d") for offset in range(max(days, 0) + 1)]
+
+
+class _EventHandler(FileSystemEventHandler):
+    """watchdog 이벤트를 쓰기 완료 대기 목록으로 전달"""
+
+    def __init__(self, watcher: "DirectoryWatcher"):
+        self.watcher = watcher
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        path = getattr(event, "dest_path", None) or event.src_path
+        self.watcher.touch(path)
+
+
+class DirectoryWatcher:
+    """
+    일자 폴더 감시기
+    감지한 파일은 (크기, 수정 시간)이 settle_sec 동안 변하지 않을 때 submit(상대 경로)로 등록
+    이미 등록한 파일은 is_known(상대 경로, 크기, 수정 시간)이 True를 돌려주어 재등록하지 않음
+    상대 경로는 base(작업이 파일을 찾는 src_record) 기준이며, root는 base 안에 있어야 함
+    submit/is_known은 DB를 사용하므로 감시 루프에서는 이벤트 루프 밖 스레드에서 호출
+    """
+
+    def __init__(self, root: str, submit: Callable[[str, int, float], None],
+                 is_known: Callable[[str, int, float], bool],
+                 mode: str = WATCH_MODE, poll_interval: float = WATCH_POLL_INTERVAL,
+                 settle_sec: float = WATCH_SETTLE_SEC, clock: Callable[[], float] = time.monotonic,
+                 base: Optional[str] = None):
+        base = base if base is not None else root
+        if os.path.commonpath([os.path.abspath(root), os.path.abspath(base)]) != os.path.abspath(base):
+            raise ValueError(
+                f"감시 폴더({root})가 녹음 기준 폴더({base}) 밖에 있습니다. "
+                f"STT_WATCH_ROOT를 {base} 또는 그 하위 폴더로 지정하세요."
+            )
+        self.root = root
+        self.base = base
+        self.submit = submit
+        self.is_known = is_known
+        self.mode = "inotify" if mode in ("auto", "inotify") and WATCHDOG_AVAILABLE else "polling"
+        if mode == "inotify" and not WATCHDOG_AVAILABLE:
+            logger.warning("⚠️ watchdog 패키지가 없어 polling 방식으로 폴더를 감시합니다 (pip install watchdog)")
+        self.poll_interval = poll_interval
+        self.settle_sec = settle_sec
+        self.clock = clock
+        # 상대 경로 → (크기, 수정 시간, 마지막 변화 감지 시각)
+        self._pending: Dict[str, Tuple[int, float, float]] = {}
+        # 이미 등록 여부를 확인한 파일 (상대 경로 → (크기, 수정 시간)), 다음 스캔에서 다시 확인하지 않음
+        self._handled: Dict[str, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+        self._observer = None
+        self._task: Optional[asyncio.Task] = None
+        self.enqueued = 0
+        self.last_enqueued: Optional[str] = None
+        self.last_scan: Optional[str] = None
+
+    def touch(self, path: str):
+        """파일 생성/변경 감지 (watchdog 스레드 또는 스캔에서 호출)"""
+        relative = daily_relative_path(self.root, path)
+        if relative is None:
+            return
+        try:
+            stat = os.stat(os.path.join(self.root, relative))
+        except OSError:
+            with self._lock:
+                self._pending.pop(relative, None)  # 삭제/이동된 파일
+            return
+        now = self.clock()
+        with self._lock:
+            if self._handled.get(relative) == (stat.st_size, stat.st_mtime):
+                return
+            previous = self._pending.get(relative)
+            if previous is None or previous[:2] != (stat.st_size, stat.st_mtime):
+                self._pending[relative] = (stat.st_size, stat.st_mtime, now)
+
+    def scan(self, folders: Optional[List[str]] = None):
+        """일자 폴더의 음성 파일을 확인 (folders가 없으면 모든 일자 폴더)"""
+        if not os.path.isdir(self.root):
+            return
+        if folders is None:
+            folders = [entry.name for entry in os.scandir(self.root)
+                       if entry.is_dir() and DAILY_FOLDER_PATTERN.match(entry.name)]
+        for folder in folders:
+            folder_path = os.path.join(self.root, folder)
+            if not os.path.isdir(folder_path):
+                continue
+            for entry in os.scandir(folder_path):
+                if entry.is_file():
+                    self.touch(entry.path)
+        self.last_scan = datetime.now().isoformat()
+
+    def collect_ready(self) -> List[Tuple[str, int, float]]:
+        """쓰기가 끝난(settle_sec 동안 변화 없는) 파일을 대기 목록에서 꺼내 반환"""
+        now = self.clock()
+        ready = []
+        with self._lock:
+            for relative, (size, mtime, changed_at) in list(self._pending.items()):
+                if size > 0 and now - changed_at >= self.settle_sec:
+                    ready.append((relative, size, mtime))
+                    del self._pending[relative]
+        return ready
+
+    def job_path(self, relative: str) -> str:
+        """root 기준 상대 경로 → 작업에 넘길 base 기준 상대 경로"""
+        path = os.path.relpath(os.path.abspath(os.path.join(self.root, relative)), os.path.abspath(self.base))
+        return path.replace("\\", "/")
+
+    def check(self):
+        """대기 파일 중 쓰기 완료된 파일을 다시 확인하고 등록"""
+        for relative, size, mtime in self.collect_ready():
+            try:
+                stat = os.stat(os.path.join(self.root, relative))
+            except OSError:
+                continue
+            if (stat.st_size, stat.st_mtime) != (size, mtime):
+                self.touch(os.path.join(self.root, relative))  # 확인 직전에 다시 쓰인 경우
+                continue
+            path = self.job_path(relative)
+            if self.is_known(path, size, mtime):
+                with self._lock:
+                    self._handled[relative] = (size, mtime)
+                continue
+            try:
+                self.submit(path, size, mtime)
+            except Exception as e:
+                logger.error(f"❌ 자동 STT 작업 등록 실패 - {path}: {e}")
+                self.touch(os.path.join(self.root, relative))  # 다음 주기에 다시 시도
+                continue
+            with self._lock:
+                self._handled[relative] = (size, mtime)
+            self.enqueued += 1
+            self.last_enqueued = path
+            logger.info(f"📥 새 녹음 자동 등록 - {path} ({size / 1024 / 1024:.1f}MB)")
+
+    def _poll(self):
+        if self.mode == "polling":
+            self.scan(backfill_folders())
+        self.check()
+
+    async def _run(self):
+        while True:
+            try:
+                # 스캔과 등록 확인(SQLite 조회/기록)은 이벤트 루프 밖에서 실행
+                await asyncio.to_thread(self._poll)
+            except Exception as e:
+                logger.error(f"❌ 폴더 감시 처리 실패: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+    async def start(self):
+        """감시 시작 (시작 전에 들어온 최근 파일도 한 번 확인)"""
+        if self._task is not None:
+            return
+        os.makedirs(self.root, exist_ok=True)
+        await asyncio.to_thread(self.scan, backfill_folders())
+        if self.mode == "inotify":
+            self._observer = Observer()
+            self._observer.schedule(_EventHandler(self), self.root, recursive=True)
+            self._observer.start()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"✅ 녹음 폴더 감시 시작 - 경로: {self.root}, 방식: {self.mode}, 쓰기 완료 대기: {self.settle_sec:g}초")
+
+    async def stop(self):
+        if self._observer is not None:
+            self._observer.stop()
+            await asyncio.to_thread(self._observer.join, 5)
+            self._observer = None
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("녹음 폴더 감시 종료")
+
+    def get_status(self) -> Dict:
+        with self._lock:
+            pending = sorted(self._pending)
+        return {
+            "enabled": self._task is not None,
+            "root": self.root,
+            "mode": self.mode,
+            "settle_sec": self.settle_sec,
+            "pending": pending,
+            "enqueued": self.enqueued,
+            "last_enqueued": self.last_enqueued,
+            "last_scan": self.last_scan,
+        }
@@ -6,6 +6,7 @@ STN 도메인 데이터 로딩, 시스템 프롬프트 생성, 검증 관련 로
 import logging
 from typing import Dict, List, Optional
 from domain_loader import load_domain
+from fuzzy_index import build_domain_indexes
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,7 @@ class DomainManager:
                 logger.info(f"   - 장비: {len(self.domain_data.get('allowed', {}).get('equipment', []))}개")
                 logger.info(f"   - 장애유형: {len(self.domain_data.get('allowed', {}).get('errors', []))}개")
                 logger.info(f"   - 요청유형: {len(self.domain_data.get('allowed', {}).get('requests', []))}개")
+                build_domain_indexes(self.domain_data)
             else:
                 logger.warning("⚠️ STN 도메인 데이터 로드 실패 - 기본 모드로 동작")
         except Exception as e:
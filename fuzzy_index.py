@@ -0,0 +1,174 @@
+"""
+유사도 매핑용 후보 인덱스
+find_best_match가 후보 전체에 SequenceMatcher를 돌리던 방식을 대신해, 도메인 로드 시 후보 목록으로
+문자 역색인(문자 → 후보, 등장 횟수, 길이순 정렬)을 만들어 두고 길이/공통 문자 수 상한으로 후보를 걸러낸 뒤
+상한이 임계값 이상인 후보만 SequenceMatcher로 확인하는 모듈 (결과와 임계값 의미는 기존 선형 탐색과 동일)
+"""
+
+import os
+import bisect
+import logging
+import threading
+from collections import Counter, OrderedDict
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 유사도 인덱스 설정 (config.env 또는 환경변수로 조정)
+FUZZY_CACHE_SIZE = int(os.getenv("STT_FUZZY_CACHE_SIZE", "1024"))  # 최근 조회 결과 기억 개수 (LRU)
+FUZZY_MAX_INDEXES = 16  # 후보 목록별 인덱스 보관 개수
+
+
+def length_window(length: int, threshold: float) -> Tuple[float, float]:
+    """
+    유사도가 threshold 이상일 수 있는 후보 길이 범위
+    ratio = 2M / (la + lb), M <= min(la, lb) 이므로 lb는 la * t / (2 - t) 이상 la * (2 - t) / t 이하
+    """
+    if threshold <= 0:
+        return 0.0, float("inf")
+    threshold = min(threshold, 1.0)
+    return length * threshold / (2.0 - threshold), length * (2.0 - threshold) / threshold
+
+
+class FuzzyIndex:
+    """
+    후보 목록 유사도 인덱스 (대소문자 무시, calculate_similarity와 같은 SequenceMatcher.ratio 기준)
+    공통 문자 수(문자별 등장 횟수의 최솟값 합)는 SequenceMatcher 일치 문자 수의 상한이므로
+    상한 유사도 = 2 * 공통 문자 수 / 길이 합이 임계값 미만인 후보는 확인하지 않아도 결과가 같음
+    """
+
+    def __init__(self, candidates: Sequence[str], cache_size: int = FUZZY_CACHE_SIZE):
+        self.candidates = list(candidates)
+        self._keys = [candidate.upper() for candidate in self.candidates]
+        self._lengths = [len(key) for key in self._keys]
+        # 문자 → (후보 길이 목록, 후보 번호 목록, 등장 횟수 목록) - 길이순 정렬
+        postings: Dict[str, List[Tuple[int, int, int]]] = {}
+        for index, key in enumerate(self._keys):
+            for char, count in Counter(key).items():
+                postings.setdefault(char, []).append((len(key), index, count))
+        self._postings: Dict[str, Tuple[List[int], List[int], List[int]]] = {}
+        for char, entries in postings.items():
+            entries.sort()
+            self._postings[char] = tuple(list(column) for column in zip(*entries))
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, float], Optional[Tuple[str, float]]]" = OrderedDict()
+        # 후처리/ERP 추출이 여러 워커 스레드에서 동시에 조회하므로 캐시와 통계는 lock으로 보호 (탐색은 lock 밖)
+        self._lock = threading.Lock()
+        # 통계
+        self.queries = 0
+        self.cache_hits = 0
+        self.verified = 0
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def best_match(self, target: str, threshold: float = 0.8) -> Optional[Tuple[str, float]]:
+        """
+        유사도가 threshold 이상인 후보 중 가장 높은 (후보, 유사도) - 동점이면 목록에서 앞선 후보
+        해당 후보가 없으면 None
+        """
+        if not target or not self.candidates:
+            return None
+        cache_key = (target, threshold)
+        with self._lock:
+            self.queries += 1
+            if cache_key in self._cache:
+                self.cache_hits += 1
+                self._cache.move_to_end(cache_key)
+                return self._cache[cache_key]
+
+        result, verified = self._search(target, threshold)
+        with self._lock:
+            self.verified += verified
+            if self.cache_size > 0:
+                self._cache[cache_key] = result
+                self._cache.move_to_end(cache_key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return result
+
+    def _search(self, target: str, threshold: float) -> Tuple[Optional[Tuple[str, float]], int]:
+        """(가장 유사한 후보 또는 None, SequenceMatcher로 확인한 후보 수)"""
+        query = target.upper()
+        query_length = len(query)
+        low, high = length_window(query_length, threshold)
+
+        # 길이 범위 안의 후보만 역색인으로 공통 문자 수 누적
+        overlaps: Dict[int, int] = {}
+        for char, query_count in Counter(query).items():
+            posting = self._postings.get(char)
+            if posting is None:
+                continue
+            lengths, indexes, counts = posting
+            begin = bisect.bisect_left(lengths, low - 1e-9)
+            end = bisect.bisect_right(lengths, high + 1e-9)
+            for position in range(begin, end):
+                index = indexes[position]
+                overlaps[index] = overlaps.get(index, 0) + min(query_count, counts[position])
+
+        bounds = []
+        for index, overlap in overlaps.items():
+            bound = 2.0 * overlap / (query_length + self._lengths[index])
+            if bound >= threshold:
+                bounds.append((-bound, index))
+        bounds.sort()
+
+        best_index, best_score = None, 0.0
+        verified = 0
+        for negative_bound, index in bounds:
+            if -negative_bound < best_score:
+                break  # 남은 후보는 상한이 현재 최고 유사도보다 낮음
+            verified += 1
+            score = SequenceMatcher(None, query, self._keys[index]).ratio()
+            if score < threshold or score <= 0.0:
+                continue
+            if score > best_score or (score == best_score and best_index is not None and index < best_index):
+                best_index, best_score = index, score
+        if best_index is None:
+            return None, verified
+        return (self.candidates[best_index], best_score), verified
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                "candidates": len(self.candidates),
+                "queries": self.queries,
+                "cache_hits": self.cache_hits,
+                "verified": self.verified,
+                "cached": len(self._cache),
+            }
+
+
+# 후보 목록별 인덱스 (id → (후보 목록, 생성 시 길이, 인덱스)), 목록 객체를 보관하므로 id가 재사용되지 않음
+_fuzzy_indexes: "OrderedDict[int, Tuple[Sequence[str], int, FuzzyIndex]]" = OrderedDict()
+_fuzzy_indexes_lock = threading.Lock()
+
+def get_fuzzy_index(candidates: Sequence[str]) -> FuzzyIndex:
+    """후보 목록의 유사도 인덱스를 반환합니다 (같은 목록 객체면 한 번만 생성, 길이가 바뀌면 다시 생성)"""
+    with _fuzzy_indexes_lock:
+        entry = _fuzzy_indexes.get(id(candidates))
+        if entry is not None and entry[0] is candidates and entry[1] == len(candidates):
+            _fuzzy_indexes.move_to_end(id(candidates))
+            return entry[2]
+
+        index = FuzzyIndex(candidates)
+        _fuzzy_indexes[id(candidates)] = (candidates, len(candidates), index)
+        _fuzzy_indexes.move_to_end(id(candidates))
+        while len(_fuzzy_indexes) > FUZZY_MAX_INDEXES:
+            _fuzzy_indexes.popitem(last=False)
+        return index
+
+
+def build_domain_indexes(domain_data: Optional[Dict]):
+    """도메인 데이터 로드 직후 장비/장애유형/요청유형 후보 인덱스를 미리 생성"""
+    if not domain_data:
+        return
+    allowed = domain_data.get("allowed", {})
+    sizes = []
+    for name in ("equipment", "errors", "requests"):
+        candidates = allowed.get(name)
+        if candidates:
+            sizes.append(f"{name} {len(get_fuzzy_index(candidates))}개")
+    if sizes:
+        logger.info(f"✅ 유사도 매핑 인덱스 생성 - {', '.join(sizes)}")
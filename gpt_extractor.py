@@ -13,6 +13,7 @@ import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from domain_loader import load_domain
+from fuzzy_index import build_domain_indexes
 from payload_schema import validate_payload, get_validation_stats
 from postprocessor import postprocess_to_codes, convert_to_legacy_erp_format, extract_requester_name, normalize_speech_terms
 
@@ -43,6 +44,7 @@ class ERPExtractor:
             logger.info(f"- 장비명: {len(self.domain_data['allowed']['equipment'])}개")
             logger.info(f"- 에러코드: {len(self.domain_data['allowed']['errors'])}개")
             logger.info(f"- 요청코드: {len(self.domain_data['allowed']['requests'])}개")
+            build_domain_indexes(self.domain_data)
         except Exception as e:
             logger.error(f"❌ STN 도메인 데이터 로딩 실패: {e}")
             self.domain_data = None
@@ -9,6 +9,8 @@ from typing import Dict, Optional
 import logging
 from dotenv import load_dotenv
 
+from summary_features import SummaryFeatures
+
 # 환경변수 로드
 load_dotenv('config.env')
 
@@ -147,25 +149,26 @@ class GPT4oSummarizer:
         """폴백: 기존 패턴 매칭 요약"""
         try:
             # 기존 _create_simple_summary 로직을 여기로 이동
-            import re
-            
             # ERP 데이터에서 주요 정보 추출
             as_support = erp_data.get("AS 및 지원", "정보 없음")
             request_org = erp_data.get("요청기관", "정보 없음")
             request_type = erp_data.get("요청유형", "정보 없음")
             location = erp_data.get("작업국소", "정보 없음")
             
+            # 키워드/숫자 구간은 한 번만 태깅하고 항목별로 재사용
+            features = SummaryFeatures(transcript)
+            
             # 1. 핵심 문장 추출 (패턴 매칭)
-            key_sentences = self._extract_key_sentences(transcript)
+            key_sentences = features.key_sentences()
             
             # 2. 요청 유형 분석
-            request_analysis = self._analyze_request_type(transcript)
+            request_analysis = features.request_type()
             
             # 3. 문제 상황 추출
-            problem_info = self._extract_problem_info(transcript)
+            problem_info = features.fallback_problem_info()
             
             # 4. 시간/장소 정보 추출
-            time_location = self._extract_time_location(transcript)
+            time_location = features.fallback_time_location()
             
             # 5. 요약 생성
             summary = f"""[요약] {request_org} {as_support} 요청
@@ -277,120 +280,6 @@ class GPT4oSummarizer:
         except Exception as e:
             logger.warning(f"패턴 매칭 요청사항 분석 실패: {e}")
             return "요청사항 분석 실패"
-    
-    def _extract_key_sentences(self, transcript: str) -> str:
-        """핵심 문장 추출 (패턴 매칭)"""
-        import re
-        
-        # 고객 요청 관련 패턴
-        request_patterns = [
-            r'[가-힣]*[가-힣]*(?:문제|장애|오류|안됨|안돼|안되|고장|이상)[가-힣]*',
-            r'[가-힣]*[가-힣]*(?:요청|부탁|해주세요|도와주세요|지원)[가-힣]*',
-            r'[가-힣]*[가-힣]*(?:급함|급해|빨리|오늘|내일)[가-힣]*'
-        ]
-        
-        sentences = transcript.split('.')
-        key_sentences = []
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) < 10:  # 너무 짧은 문장 제외
-                continue
-                
-            for pattern in request_patterns:
-                if re.search(pattern, sentence):
-                    key_sentences.append(sentence)
-                    break
-        
-        # 최대 3개 문장만 선택
-        return ' | '.join(key_sentences[:3]) if key_sentences else "핵심 문장 없음"
-    
-    def _analyze_request_type(self, transcript: str) -> str:
-        """요청 유형 분석"""
-        import re
-        
-        # 장애 관련 패턴
-        if re.search(r'(?:장애|오류|고장|이상|안됨|안돼)', transcript):
-            return "장애신고"
-        
-        # 기술지원 관련 패턴
-        if re.search(r'(?:지원|도움|해결|수리|점검)', transcript):
-            return "기술지원"
-        
-        # 문의 관련 패턴
-        if re.search(r'(?:문의|질문|확인|알려주세요)', transcript):
-            return "문의사항"
-        
-        # 긴급 관련 패턴
-        if re.search(r'(?:급함|급해|빨리|즉시)', transcript):
-            return "긴급요청"
-        
-        return "일반요청"
-    
-    def _extract_problem_info(self, transcript: str) -> str:
-        """문제 상황 정보 추출"""
-        import re
-        
-        # 장비-문제 조합 패턴
-        equipment_problems = [
-            (r'UPS.*(?:문제|장애|오류)', 'UPS 장비 문제'),
-            (r'ROAD.*(?:문제|장애|오류)', 'ROAD 장비 문제'),
-            (r'MSPP.*(?:문제|장애|오류)', 'MSPP 장비 문제'),
-            (r'스위치.*(?:문제|장애|오류)', '스위치 장비 문제'),
-            (r'라우터.*(?:문제|장애|오류)', '라우터 장비 문제')
-        ]
-        
-        for pattern, description in equipment_problems:
-            if re.search(pattern, transcript, re.IGNORECASE):
-                return description
-        
-        # 일반적인 문제 패턴
-        if re.search(r'(?:링크.*장애|네트워크.*문제)', transcript):
-            return "네트워크 링크 장애"
-        
-        if re.search(r'(?:서버.*문제|시스템.*장애)', transcript):
-            return "서버/시스템 장애"
-        
-        return "장비 문제"
-    
-    def _extract_time_location(self, transcript: str) -> str:
-        """시간/장소 정보 추출"""
-        import re
-        
-        # 시간 정보
-        time_info = []
-        time_patterns = [
-            r'(\d{1,2}시\s*\d{0,2}분?)',
-            r'(오늘|내일|어제)',
-            r'(오전|오후|저녁)'
-        ]
-        
-        for pattern in time_patterns:
-            matches = re.findall(pattern, transcript)
-            if matches:
-                time_info.extend(matches)
-        
-        # 장소 정보
-        location_info = []
-        location_patterns = [
-            r'(서울|부산|대전|대구|광주|울산|인천)',
-            r'(천안|아산|수원|성남|고양)',
-            r'(본사|지사|센터|사무소)'
-        ]
-        
-        for pattern in location_patterns:
-            matches = re.findall(pattern, transcript)
-            if matches:
-                location_info.extend(matches)
-        
-        # 정보 조합
-        info_parts = []
-        if time_info:
-            info_parts.append(f"시간: {', '.join(time_info[:2])}")
-        if location_info:
-            info_parts.append(f"장소: {', '.join(location_info[:2])}")
-        
-        return ' | '.join(info_parts) if info_parts else "시간/장소 정보 없음"
 
 
 # 전역 GPT-4o 요약기 인스턴스
@@ -0,0 +1,229 @@
+"""
+Whisper 추론 워커 풀
+STT 추론을 전용 워커 스레드에서 실행하여 FastAPI 이벤트 루프가 멈추지 않도록 하는 모듈
+"""
+
+import os
+import copy
+import queue
+import asyncio
+import logging
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 워커 풀 설정 (config.env 또는 환경변수로 조정)
+INFERENCE_WORKERS = int(os.getenv("STT_INFERENCE_WORKERS", "2"))
+INFERENCE_QUEUE_SIZE = int(os.getenv("STT_INFERENCE_QUEUE_SIZE", "16"))
+INFERENCE_TIMEOUT = float(os.getenv("STT_INFERENCE_TIMEOUT", "1800"))
+
+
+class InferenceQueueFullError(RuntimeError):
+    """추론 대기열이 가득 찬 경우"""
+
+
+class InferenceTimeoutError(TimeoutError):
+    """추론 작업이 제한 시간 내에 끝나지 않은 경우"""
+
+
+class InferencePool:
+    """고정 개수의 워커 스레드와 크기 제한 대기열을 가진 추론 실행기"""
+
+    def __init__(self, max_workers: int = INFERENCE_WORKERS,
+                 max_queue_size: int = INFERENCE_QUEUE_SIZE,
+                 default_timeout: float = INFERENCE_TIMEOUT):
+        self.max_workers = max(1, max_workers)
+        self.max_queue_size = max(1, max_queue_size)
+        self.default_timeout = default_timeout
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=self.max_queue_size)
+        self._threads = []
+        self._lock = threading.Lock()
+        self._started = False
+        self._shutdown = False
+
+        # 통계
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+        self._timed_out = 0
+        self._rejected = 0
+
+    def _ensure_started(self):
+        """첫 작업 제출 시 워커 스레드를 시작"""
+        with self._lock:
+            if self._started:
+                return
+            for i in range(self.max_workers):
+                thread = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"stt-inference-{i}",
+                    daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+            self._started = True
+            logger.info(f"✅ 추론 워커 풀 시작 - 워커: {self.max_workers}개, 대기열: {self.max_queue_size}개")
+
+    def _worker_loop(self):
+        """대기열에서 작업을 꺼내 실행하는 워커 루프"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+
+            future, fn, args, kwargs = item
+            try:
+                # 대기 중 타임아웃으로 취소된 작업은 건너뜀
+                if not future.set_running_or_notify_cancel():
+                    continue
+
+                with self._lock:
+                    self._active += 1
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as e:
+                    with self._lock:
+                        self._failed += 1
+                    future.set_exception(e)
+                else:
+                    with self._lock:
+                        self._completed += 1
+                    future.set_result(result)
+                finally:
+                    with self._lock:
+                        self._active -= 1
+            finally:
+                self._queue.task_done()
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """작업을 대기열에 넣고 concurrent Future를 반환 (대기열이 가득 차면 예외)"""
+        if self._shutdown:
+            raise RuntimeError("추론 워커 풀이 종료되었습니다.")
+
+        self._ensure_started()
+        future: Future = Future()
+        try:
+            self._queue.put_nowait((future, fn, args, kwargs))
+        except queue.Full:
+            with self._lock:
+                self._rejected += 1
+            raise InferenceQueueFullError(
+                f"추론 대기열이 가득 찼습니다 (최대 {self.max_queue_size}개). 잠시 후 다시 시도해주세요."
+            )
+        return future
+
+    async def run(self, fn: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """작업을 워커 풀에서 실행하고 결과를 await (대기 시간 포함 타임아웃 적용)"""
+        timeout = self.default_timeout if timeout is None else timeout
+        future = self.submit(fn, *args, **kwargs)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            # 대기 중이면 실행되지 않도록 취소 (이미 실행 중인 작업은 중단할 수 없음)
+            future.cancel()
+            with self._lock:
+                self._timed_out += 1
+            raise InferenceTimeoutError(f"추론 작업이 {timeout:g}초 내에 완료되지 않았습니다.")
+
+    def get_stats(self) -> Dict:
+        """워커 풀 상태 정보"""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "max_queue_size": self.max_queue_size,
+                "queued": self._queue.qsize(),
+                "active": self._active,
+                "completed": self._completed,
+                "failed": self._failed,
+                "timed_out": self._timed_out,
+                "rejected": self._rejected,
+                "default_timeout": self.default_timeout,
+            }
+
+    def shutdown(self, wait: bool = False):
+        """워커 스레드 종료"""
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            started = self._started
+
+        # 아직 시작되지 않은 작업은 취소
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[0].cancel()
+            self._queue.task_done()
+
+        if started:
+            for _ in self._threads:
+                self._queue.put(None)
+            if wait:
+                for thread in self._threads:
+                    thread.join()
+        logger.info("추론 워커 풀 종료")
+
+
+# 워커 스레드별 모델 복제본 (가중치 텐서는 원본과 공유)
+_worker_local = threading.local()
+
+def get_worker_replica(model):
+    """
+    현재 워커 스레드 전용 모델 복제본을 반환
+    Whisper 디코딩은 공유 모델에 kv-cache hook을 등록하므로 같은 인스턴스를
+    여러 스레드에서 동시에 쓰면 캐시가 섞인다. 모듈 구조만 복제하고
+    파라미터/버퍼 텐서는 원본을 그대로 공유하여 메모리 증가 없이 병렬 추론한다.
+    """
+    replicas = getattr(_worker_local, "replicas", None)
+    if replicas is None:
+        replicas = weakref.WeakKeyDictionary()
+        _worker_local.replicas = replicas
+
+    replica = replicas.get(model)
+    if replica is None:
+        parameters = list(model.parameters()) if hasattr(model, "parameters") else []
+        buffers = list(model.buffers()) if hasattr(model, "buffers") else []
+        memo = {id(tensor): tensor for tensor in parameters + buffers}
+        # int8 동적 양자화 모델의 packed 가중치도 복제하지 않고 공유 (추론 시 읽기 전용)
+        if hasattr(model, "modules"):
+            for module in model.modules():
+                packed = getattr(module, "_packed_params", None)
+                if packed is not None and not hasattr(packed, "modules"):
+                    memo[id(packed)] = packed
+        replica = copy.deepcopy(model, memo)
+        replicas[model] = replica
+        logger.info(f"워커 모델 복제본 생성 - 스레드: {threading.current_thread().name}")
+    return replica
+
+def transcribe_on_worker(model, audio, **options):
+    """워커 스레드 전용 복제본으로 transcribe 실행 (InferencePool.run 대상 함수)"""
+    return get_worker_replica(model).transcribe(audio, **options)
+
+
+# 전역 추론 워커 풀 인스턴스
+_inference_pool: Optional[InferencePool] = None
+
+def get_inference_pool() -> InferencePool:
+    """추론 워커 풀 싱글톤 인스턴스를 반환합니다"""
+    global _inference_pool
+
+    if _inference_pool is None:
+        _inference_pool = InferencePool()
+
+    return _inference_pool
+
+def shutdown_inference_pool():
+    """추론 워커 풀을 종료합니다"""
+    global _inference_pool
+
+    if _inference_pool is not None:
+        _inference_pool.shutdown()
+        _inference_pool = None
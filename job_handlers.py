@@ -0,0 +1,204 @@
+"""
+STT 비동기 작업 핸들러
+작업 등록 즉시 Job ID를 반환하고, 상태/진행률 및 결과를 조회하는 API
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+from typing import Callable, Dict, Optional
+import asyncio
+import logging
+
+from models import STTJobRequest, STTJobStatus, STTResponse
+from job_queue import JobStore, JobQueue, JOB_COMPLETED, JOB_FAILED
+from stt_handlers import (
+    run_stt_pipeline, resolve_audio_path, validate_priority, get_erp_extractor, FILE_TRANSCRIBE_OPTIONS,
+    AUDIO_DIRECTORY
+)
+from priority_scheduler import PRIORITY_INTERACTIVE, PRIORITY_BULK
+from supabase_client import get_supabase_manager
+from directory_watcher import (
+    DirectoryWatcher, WATCH_ENABLED, WATCH_ROOT, WATCH_MODEL, WATCH_EXTRACT_ERP, WATCH_SAVE_TO_DB
+)
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 라우터 생성
+router = APIRouter(prefix="/api", tags=["Jobs"])
+
+# 전역 작업 큐
+job_queue: Optional[JobQueue] = None
+# 녹음 폴더 감시기 (STT_WATCH_ENABLED=true일 때만 시작)
+directory_watcher: Optional[DirectoryWatcher] = None
+
+
+async def run_stt_job(params: Dict, progress_callback: Callable[[str, float], None]) -> Dict:
+    """작업 큐에서 호출되는 STT 파이프라인 실행 함수"""
+    file_path = resolve_audio_path(params["filename"])
+
+    try:
+        supabase_mgr = get_supabase_manager()
+    except Exception as e:
+        logger.warning(f"Supabase 연결 실패 (저장 없이 진행): {e}")
+        supabase_mgr = None
+
+    response = await run_stt_pipeline(
+        file_path,
+        params["filename"],
+        model_name=params.get("model_name") or "base",
+        language=params.get("language"),
+        extract_erp=params.get("extract_erp", True),
+        save_to_db=params.get("save_to_db", True),
+        transcribe_options=FILE_TRANSCRIBE_OPTIONS,
+        erp_extractor=get_erp_extractor(),
+        supabase_mgr=supabase_mgr,
+        long_audio=params.get("long_audio", False),
+        cascade=params.get("cascade", False),
+        diarize=params.get("enable_diarization", True),
+        strip_silence=params.get("strip_silence", False),
+        priority=params.get("priority") or PRIORITY_INTERACTIVE,
+        progress_callback=progress_callback
+    )
+    return response.dict()
+
+
+def get_job_queue() -> JobQueue:
+    """작업 큐 싱글톤 인스턴스를 반환합니다"""
+    global job_queue
+
+    if job_queue is None:
+        job_queue = JobQueue(JobStore(), run_stt_job)
+
+    return job_queue
+
+
+async def start_job_queue():
+    """작업 큐 워커 시작 (앱 startup 이벤트에서 호출)"""
+    await get_job_queue().start()
+
+
+async def stop_job_queue():
+    """작업 큐 워커 종료 (앱 shutdown 이벤트에서 호출)"""
+    if job_queue is not None:
+        await job_queue.stop()
+
+
+def submit_watched_file(path: str, size: int, mtime: float):
+    """폴더 감시로 발견한 녹음을 STT + ERP 추출 작업으로 등록"""
+    request = STTJobRequest(
+        filename=path,
+        model_name=WATCH_MODEL,
+        extract_erp=WATCH_EXTRACT_ERP,
+        save_to_db=WATCH_SAVE_TO_DB,
+        priority=PRIORITY_BULK
+    )
+    get_job_queue().submit_file(request.dict(), path, size, mtime)
+
+
+def get_directory_watcher() -> DirectoryWatcher:
+    """녹음 폴더 감시기 싱글톤 인스턴스를 반환합니다"""
+    global directory_watcher
+
+    if directory_watcher is None:
+        directory_watcher = DirectoryWatcher(
+            WATCH_ROOT,
+            submit=submit_watched_file,
+            is_known=lambda path, size, mtime: get_job_queue().store.is_file_enqueued(path, size, mtime),
+            base=AUDIO_DIRECTORY  # 작업은 src_record 기준 상대 경로로 파일을 찾음
+        )
+
+    return directory_watcher
+
+
+async def start_directory_watcher():
+    """녹음 폴더 감시 시작 (앱 startup 이벤트에서 작업 큐 시작 후 호출)"""
+    if not WATCH_ENABLED:
+        logger.info("녹음 폴더 자동 감시 비활성화 (STT_WATCH_ENABLED=false)")
+        return
+    try:
+        watcher = get_directory_watcher()
+    except ValueError as e:
+        logger.error(f"❌ 녹음 폴더 감시를 시작하지 않습니다: {e}")
+        return
+    await watcher.start()
+
+
+async def stop_directory_watcher():
+    """녹음 폴더 감시 종료 (앱 shutdown 이벤트에서 호출)"""
+    if directory_watcher is not None:
+        await directory_watcher.stop()
+
+
+def _to_job_status(job: Dict) -> STTJobStatus:
+    return STTJobStatus(
+        job_id=job["id"],
+        status=job["status"],
+        stage=job["stage"],
+        progress=job["progress"],
+        filename=job["params"].get("filename"),
+        error=job["error"],
+        attempts=job["attempts"],
+        created_at=job["created_at"],
+        started_at=job["started_at"],
+        finished_at=job["finished_at"]
+    )
+
+
+@router.post("/jobs", response_model=STTJobStatus, status_code=202)
+async def submit_stt_job(request: STTJobRequest):
+    """STT 작업 등록 (즉시 Job ID 반환)"""
+    # 존재하지 않는 파일이나 잘못된 우선순위는 등록 시점에 바로 거부
+    # API로 직접 등록한 작업은 사용자가 결과를 기다리므로 interactive가 기본 (폴더 감시/일괄 처리는 bulk)
+    resolve_audio_path(request.filename)
+    params = request.dict()
+    params["priority"] = validate_priority(request.priority or PRIORITY_INTERACTIVE)
+
+    # SQLite 기록은 이벤트 루프 밖에서 실행
+    job = await asyncio.to_thread(get_job_queue().submit, params)
+    return _to_job_status(job)
+
+
+@router.get("/jobs")
+async def list_stt_jobs(
+    status: Optional[str] = Query(None, description="작업 상태 필터"),
+    limit: int = Query(50, ge=1, le=500, description="조회 개수")
+):
+    """STT 작업 목록 조회"""
+    queue = get_job_queue()
+    jobs = queue.store.list_jobs(status=status, limit=limit)
+    return {
+        "status": "success",
+        "jobs": [_to_job_status(job) for job in jobs],
+        "total": len(jobs),
+        "queue": queue.get_stats()
+    }
+
+
+@router.get("/jobs/watcher")
+async def get_watcher_status():
+    """녹음 폴더 자동 감시 상태 조회 (쓰기 완료 대기 파일, 자동 등록 건수)"""
+    if directory_watcher is None:
+        return {"status": "success", "watcher": {"enabled": False, "root": WATCH_ROOT}}
+    return {"status": "success", "watcher": directory_watcher.get_status()}
+
+
+@router.get("/jobs/{job_id}", response_model=STTJobStatus)
+async def get_stt_job(job_id: str):
+    """STT 작업 상태/단계/진행률 조회"""
+    job = get_job_queue().store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+    return _to_job_status(job)
+
+
+@router.get("/jobs/{job_id}/result", response_model=STTResponse)
+async def get_stt_job_result(job_id: str):
+    """완료된 STT 작업 결과 조회"""
+    job = get_job_queue().store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+    if job["status"] == JOB_FAILED:
+        raise HTTPException(status_code=500, detail=f"STT 작업이 실패했습니다: {job['error']}")
+    if job["status"] != JOB_COMPLETED:
+        raise HTTPException(status_code=409, detail=f"작업이 아직 완료되지 않았습니다 (상태: {job['status']})")
+    return STTResponse(**job["result"])
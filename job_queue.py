@@ -0,0 +1,356 @@
+"""
+STT 비동기 작업 큐
+SQLite에 작업을 저장하여 서버 재시작 후에도 대기/실행 중이던 작업을 이어서 처리하는 모듈
+"""
+
+import os
+import json
+import uuid
+import asyncio
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 작업 큐 설정 (config.env 또는 환경변수로 조정)
+JOB_DB_PATH = os.getenv("STT_JOB_DB_PATH", "stt_jobs.db")
+JOB_WORKERS = int(os.getenv("STT_JOB_WORKERS", "2"))
+JOB_POLL_INTERVAL = float(os.getenv("STT_JOB_POLL_INTERVAL", "1.0"))
+JOB_MAX_ATTEMPTS = int(os.getenv("STT_JOB_MAX_ATTEMPTS", "3"))  # 중단 후 재실행 포함 최대 실행 횟수
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+
+class JobStore:
+    """SQLite 기반 작업 저장소"""
+
+    def __init__(self, db_path: str = JOB_DB_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        db_dir = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(db_dir, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS stt_jobs (
+                    id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    stage TEXT,
+                    progress REAL NOT NULL DEFAULT 0,
+                    params TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_stt_jobs_status ON stt_jobs (status, created_at)"
+            )
+            # 폴더 감시로 자동 등록한 파일 (같은 파일을 재시작 후 다시 등록하지 않도록 기록)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS watched_files (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime REAL NOT NULL,
+                    job_id TEXT,
+                    enqueued_at TEXT NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> Dict:
+        job = dict(row)
+        job["params"] = json.loads(job["params"]) if job["params"] else {}
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def create(self, params: Dict) -> Dict:
+        """새 작업 등록"""
+        job_id = f"job_{uuid.uuid4().hex[:12]}"
+        now = datetime.now().isoformat()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO stt_jobs (id, status, stage, progress, params, created_at) "
+                "VALUES (?, ?, ?, 0, ?, ?)",
+                (job_id, JOB_QUEUED, JOB_QUEUED, json.dumps(params, ensure_ascii=False), now)
+            )
+            self._conn.commit()
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """작업 조회"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM stt_jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_dict(row) if row else None
+
+    def list_jobs(self, status: Optional[str] = None, limit: int = 50) -> List[Dict]:
+        """작업 목록 (최신순)"""
+        query = "SELECT * FROM stt_jobs"
+        args: tuple = ()
+        if status:
+            query += " WHERE status = ?"
+            args = (status,)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        with self._lock:
+            rows = self._conn.execute(query, args + (limit,)).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def claim_next(self) -> Optional[Dict]:
+        """가장 오래된 대기 작업을 실행 상태로 전환하여 반환"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id FROM stt_jobs WHERE status = ? ORDER BY created_at LIMIT 1",
+                (JOB_QUEUED,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE stt_jobs SET status = ?, stage = ?, started_at = ?, attempts = attempts + 1 "
+                "WHERE id = ?",
+                (JOB_RUNNING, "starting", datetime.now().isoformat(), row["id"])
+            )
+            self._conn.commit()
+        return self.get(row["id"])
+
+    def update_progress(self, job_id: str, stage: str, progress: float):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE stt_jobs SET stage = ?, progress = ? WHERE id = ?",
+                (stage, round(progress, 3), job_id)
+            )
+            self._conn.commit()
+
+    def complete(self, job_id: str, result: Dict):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE stt_jobs SET status = ?, stage = ?, progress = 1, result = ?, error = NULL, "
+                "finished_at = ? WHERE id = ?",
+                (JOB_COMPLETED, JOB_COMPLETED, json.dumps(result, ensure_ascii=False),
+                 datetime.now().isoformat(), job_id)
+            )
+            self._conn.commit()
+
+    def fail(self, job_id: str, error: str):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE stt_jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                (JOB_FAILED, error, datetime.now().isoformat(), job_id)
+            )
+            self._conn.commit()
+
+    def is_file_enqueued(self, path: str, size: int, mtime: float) -> bool:
+        """같은 크기/수정 시간의 파일이 이미 자동 등록되었는지 여부"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM watched_files WHERE path = ? AND size = ? AND mtime = ?",
+                (path, size, mtime)
+            ).fetchone()
+        return row is not None
+
+    def create_for_file(self, params: Dict, path: str, size: int, mtime: float) -> Dict:
+        """작업 등록과 자동 등록 파일 기록을 함께 수행"""
+        job = self.create(params)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO watched_files (path, size, mtime, job_id, enqueued_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (path, size, mtime, job["id"], datetime.now().isoformat())
+            )
+            self._conn.commit()
+        return job
+
+    def requeue_interrupted(self, max_attempts: int = JOB_MAX_ATTEMPTS) -> Tuple[int, int]:
+        """
+        서버 종료로 중단된 실행 중 작업을 다시 대기 상태로 되돌림
+        이미 max_attempts번 실행된 작업은 (매번 서버를 멈추게 하는 작업일 수 있으므로) 실패 처리
+        (복구한 작업 수, 실패 처리한 작업 수) 반환
+        """
+        with self._lock:
+            failed = self._conn.execute(
+                "UPDATE stt_jobs SET status = ?, error = ?, finished_at = ? "
+                "WHERE status = ? AND attempts >= ?",
+                (JOB_FAILED, f"서버 종료로 {max_attempts}회 중단되어 더 이상 재시도하지 않습니다.",
+                 datetime.now().isoformat(), JOB_RUNNING, max_attempts)
+            ).rowcount
+            requeued = self._conn.execute(
+                "UPDATE stt_jobs SET status = ?, stage = ?, progress = 0, started_at = NULL "
+                "WHERE status = ?",
+                (JOB_QUEUED, JOB_QUEUED, JOB_RUNNING)
+            ).rowcount
+            self._conn.commit()
+            return requeued, failed
+
+    def count_by_status(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) AS count FROM stt_jobs GROUP BY status"
+            ).fetchall()
+        return {row["status"]: row["count"] for row in rows}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class _ProgressWriter:
+    """
+    작업 진행률 기록기 (report는 이벤트 루프에서 호출)
+    SQLite 기록은 스레드에서 실행하고, 기록 중 들어온 보고는 최신 값 하나로 합쳐서 다음에 기록
+    """
+
+    def __init__(self, store: JobStore, job_id: str):
+        self.store = store
+        self.job_id = job_id
+        self._latest: Optional[Tuple[str, float]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def report(self, stage: str, progress: float):
+        self._latest = (stage, progress)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush())
+
+    async def _flush(self):
+        while self._latest is not None:
+            stage, progress = self._latest
+            self._latest = None
+            try:
+                await asyncio.to_thread(self.store.update_progress, self.job_id, stage, progress)
+            except Exception as e:
+                logger.warning(f"진행률 기록 실패 - Job ID: {self.job_id}: {e}")
+
+    async def drain(self):
+        """대기 중인 진행률 기록이 끝날 때까지 대기"""
+        if self._task is not None:
+            await self._task
+
+    def cancel(self):
+        if self._task is not None:
+            self._task.cancel()
+
+
+# 작업 실행 함수: (params, progress_callback) -> 결과 dict
+JobRunner = Callable[[Dict, Callable[[str, float], None]], Awaitable[Dict]]
+
+
+class JobQueue:
+    """JobStore의 대기 작업을 asyncio 워커 태스크로 처리하는 큐"""
+
+    def __init__(self, store: JobStore, runner: JobRunner, workers: int = JOB_WORKERS,
+                 poll_interval: float = JOB_POLL_INTERVAL, max_attempts: int = JOB_MAX_ATTEMPTS):
+        self.store = store
+        self.runner = runner
+        self.workers = max(1, workers)
+        self.poll_interval = poll_interval
+        self.max_attempts = max(1, max_attempts)
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def start(self):
+        """워커 태스크 시작 (중단된 작업 복구 포함)"""
+        if self._tasks:
+            return
+        requeued, failed = await asyncio.to_thread(self.store.requeue_interrupted, self.max_attempts)
+        if requeued:
+            logger.info(f"🔁 중단된 STT 작업 {requeued}건을 대기열로 복구했습니다")
+        if failed:
+            logger.warning(f"⚠️ {self.max_attempts}회 중단된 STT 작업 {failed}건을 실패 처리했습니다")
+        self._wakeup = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        for i in range(self.workers):
+            self._tasks.append(asyncio.create_task(self._worker_loop(i)))
+        logger.info(f"✅ STT 작업 큐 시작 - 워커: {self.workers}개, DB: {self.store.db_path}")
+
+    async def stop(self):
+        """워커 태스크 종료 (실행 중이던 작업은 다음 시작 시 재실행)"""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+        logger.info("STT 작업 큐 종료")
+
+    def _notify(self):
+        """대기 중인 워커 깨우기 (폴더 감시 스레드에서 등록하는 경우도 있으므로 이벤트 루프로 전달)"""
+        if self._wakeup is not None and self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def submit(self, params: Dict) -> Dict:
+        """작업 등록 후 즉시 반환"""
+        job = self.store.create(params)
+        self._notify()
+        logger.info(f"STT 작업 등록 - Job ID: {job['id']}")
+        return job
+
+    def submit_file(self, params: Dict, path: str, size: int, mtime: float) -> Dict:
+        """폴더 감시로 발견한 파일의 작업 등록 (재등록 방지 기록 포함)"""
+        job = self.store.create_for_file(params, path, size, mtime)
+        self._notify()
+        logger.info(f"STT 작업 등록 - Job ID: {job['id']}, 파일: {path}")
+        return job
+
+    async def _wait_for_work(self):
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _worker_loop(self, index: int):
+        while True:
+            job = await asyncio.to_thread(self.store.claim_next)
+            if job is None:
+                await self._wait_for_work()
+                continue
+            await self._run_job(job)
+
+    async def _run_job(self, job: Dict):
+        job_id = job["id"]
+        logger.info(f"STT 작업 실행 시작 - Job ID: {job_id}")
+
+        progress = _ProgressWriter(self.store, job_id)
+
+        try:
+            result = await self.runner(job["params"], progress.report)
+        except asyncio.CancelledError:
+            # 종료 중 취소된 작업은 running 상태로 남겨 재시작 시 복구
+            progress.cancel()
+            raise
+        except Exception as e:
+            detail = getattr(e, "detail", None) or str(e)
+            logger.error(f"STT 작업 실패 - Job ID: {job_id}: {detail}")
+            await progress.drain()
+            await asyncio.to_thread(self.store.fail, job_id, str(detail))
+            return
+        # 남은 진행률 기록이 완료 상태를 덮어쓰지 않도록 먼저 마무리
+        await progress.drain()
+        await asyncio.to_thread(self.store.complete, job_id, result)
+        logger.info(f"STT 작업 완료 - Job ID: {job_id}")
+
+    def get_stats(self) -> Dict:
+        return {
+            "workers": self.workers,
+            "running": bool(self._tasks),
+            "db_path": self.store.db_path,
+            "jobs": self.store.count_by_status(),
+        }
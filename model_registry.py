@@ -0,0 +1,252 @@
+"""
+Whisper 모델 레지스트리
+요청 시점에 모델을 로딩하고, 메모리 예산을 넘으면 가장 오래 사용하지 않은 모델을 내리는 LRU 캐시
+"""
+
+import os
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 레지스트리 설정 (config.env 또는 환경변수로 조정)
+WHISPER_MODEL_MEMORY_BUDGET_MB = int(os.getenv("WHISPER_MODEL_MEMORY_BUDGET_MB", "4096"))
+WHISPER_PRELOAD_MODELS = [
+    name.strip() for name in os.getenv("WHISPER_PRELOAD_MODELS", "base").split(",") if name.strip()
+]
+
+# 로딩 전 예산 확보용 추정 크기 (fp32 파라미터 기준, MB)
+ESTIMATED_MODEL_SIZES_MB = {
+    "tiny": 150,
+    "base": 290,
+    "small": 970,
+    "medium": 3060,
+    "large": 6170,
+}
+
+# int8 동적 양자화 모델 이름 접미사 (예: small-int8, CPU 전용)
+QUANTIZED_SUFFIX = "-int8"
+# 선형 계층 가중치만 int8로 바뀌므로 fp32 대비 대략적인 크기 비율
+QUANTIZED_SIZE_RATIO = 0.4
+
+
+class ModelTooLargeError(RuntimeError):
+    """모델 하나가 전체 메모리 예산보다 커서 로딩할 수 없는 경우"""
+
+
+def parse_model_name(model_name: str) -> Tuple[str, bool]:
+    """'small-int8' → ('small', True), 'small' → ('small', False)"""
+    if model_name.endswith(QUANTIZED_SUFFIX):
+        return model_name[:-len(QUANTIZED_SUFFIX)], True
+    return model_name, False
+
+
+def estimated_model_size_mb(model_name: str) -> float:
+    base_name, quantized = parse_model_name(model_name)
+    size = ESTIMATED_MODEL_SIZES_MB.get(base_name, 0)
+    return size * QUANTIZED_SIZE_RATIO if quantized else size
+
+
+def quantize_whisper_model(model):
+    """
+    Whisper 모델의 선형 계층을 int8 동적 양자화 (가중치 int8, 활성값은 실행 시 양자화)
+    whisper.model.Linear는 nn.Linear 하위 클래스라 quantize_dynamic 대상에서 빠지므로
+    동일한 파라미터 구조의 nn.Linear로 바꾼 뒤 양자화
+    """
+    import torch
+
+    for module in model.modules():
+        if isinstance(module, torch.nn.Linear) and type(module) is not torch.nn.Linear:
+            module.__class__ = torch.nn.Linear
+    model.eval()
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+
+def load_whisper_model(model_name: str):
+    """openai-whisper 모델 로딩 (이름이 -int8로 끝나면 CPU에 로딩 후 int8 동적 양자화)"""
+    import whisper
+
+    base_name, quantized = parse_model_name(model_name)
+    if not quantized:
+        return whisper.load_model(base_name)
+
+    model = whisper.load_model(base_name, device="cpu")
+    model = quantize_whisper_model(model)
+    logger.info(f"🧮 int8 동적 양자화 적용 - 모델: {base_name}")
+    return model
+
+
+def _default_loader(model_name: str):
+    """설정된 STT 백엔드(STT_BACKEND)로 모델 로딩"""
+    from stt_backends import get_stt_backend
+    return get_stt_backend().load(model_name)
+
+
+def estimate_model_size(model) -> int:
+    """모델 파라미터/버퍼의 실제 메모리 크기(바이트, 양자화된 packed 가중치 포함)"""
+    estimated = getattr(model, "estimated_size_bytes", None)
+    if estimated is not None:
+        return estimated
+
+    total = 0
+    try:
+        for tensor in list(model.parameters()) + list(model.buffers()):
+            total += tensor.numel() * tensor.element_size()
+        # 동적 양자화된 선형 계층의 가중치는 parameters()에 나타나지 않으므로 별도 합산
+        for module in model.modules():
+            unpack = getattr(module, "_weight_bias", None)
+            if callable(unpack):
+                for tensor in unpack():
+                    if tensor is not None:
+                        total += tensor.numel() * tensor.element_size()
+    except Exception as e:
+        logger.warning(f"모델 크기 계산 실패: {e}")
+    return total
+
+
+class ModelRegistry:
+    """메모리 예산 기반 LRU Whisper 모델 레지스트리"""
+
+    def __init__(self, memory_budget_mb: int = WHISPER_MODEL_MEMORY_BUDGET_MB,
+                 loader: Optional[Callable] = None):
+        self.memory_budget_bytes = memory_budget_mb * 1024 * 1024
+        self.loader = loader or _default_loader
+
+        # 로딩된 모델 (앞쪽일수록 오래 사용하지 않은 모델)
+        self.models: "OrderedDict[str, object]" = OrderedDict()
+        self._stats: Dict[str, Dict] = {}
+        self._lock = threading.RLock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._evictions = 0
+
+    def _get_load_lock(self, model_name: str) -> threading.Lock:
+        with self._lock:
+            if model_name not in self._load_locks:
+                self._load_locks[model_name] = threading.Lock()
+            return self._load_locks[model_name]
+
+    def _resident_bytes(self) -> int:
+        return sum(
+            self._stats[name]["size_bytes"] for name in self.models if name in self._stats
+        )
+
+    def _evict_for(self, required_bytes: int, keep: Optional[str] = None):
+        """required_bytes 만큼 여유가 생길 때까지 LRU 모델 제거 (lock 보유 상태에서 호출)"""
+        while self.models and self._resident_bytes() + required_bytes > self.memory_budget_bytes:
+            victim = next((name for name in self.models if name != keep), None)
+            if victim is None:
+                break
+            self.models.pop(victim)
+            self._stats[victim]["loaded"] = False
+            self._evictions += 1
+            logger.info(f"♻️ 메모리 예산 초과로 모델 해제: {victim}")
+
+    def _check_fits(self, model_name: str, size_bytes: int):
+        """모델 하나가 전체 예산보다 크면 예외 (예산을 넘겨 상주시키지 않음)"""
+        if size_bytes > self.memory_budget_bytes:
+            logger.warning(
+                f"⚠️ 모델 '{model_name}' 크기({size_bytes / 1024 / 1024:.0f}MB)가 "
+                f"메모리 예산({self.memory_budget_bytes / 1024 / 1024:.0f}MB)보다 커서 로딩하지 않습니다."
+            )
+            raise ModelTooLargeError(
+                f"모델 '{model_name}' 크기({size_bytes / 1024 / 1024:.0f}MB)가 "
+                f"메모리 예산({self.memory_budget_bytes / 1024 / 1024:.0f}MB)을 초과합니다. "
+                f"WHISPER_MODEL_MEMORY_BUDGET_MB를 늘리거나 더 작은 모델(-int8)을 사용하세요."
+            )
+
+    def is_loaded(self, model_name: str) -> bool:
+        with self._lock:
+            return model_name in self.models
+
+    def get(self, model_name: str):
+        """모델을 반환 (없으면 로딩, 필요 시 LRU 모델 해제)"""
+        with self._lock:
+            if model_name in self.models:
+                self.models.move_to_end(model_name)
+                stats = self._stats[model_name]
+                stats["hits"] += 1
+                stats["last_used"] = time.time()
+                return self.models[model_name]
+
+        # 같은 모델의 동시 로딩 방지 (다른 모델 조회는 막지 않음)
+        with self._get_load_lock(model_name):
+            with self._lock:
+                if model_name in self.models:
+                    self.models.move_to_end(model_name)
+                    self._stats[model_name]["hits"] += 1
+                    self._stats[model_name]["last_used"] = time.time()
+                    return self.models[model_name]
+
+                # 로딩 전에 추정 크기만큼 미리 공간 확보 (예산보다 큰 모델은 다른 모델을 내리기 전에 거절)
+                estimated = int(estimated_model_size_mb(model_name) * 1024 * 1024)
+                self._check_fits(model_name, estimated)
+                self._evict_for(estimated)
+
+            logger.info(f"🔄 Whisper 모델 로딩: {model_name}")
+            start = time.time()
+            model = self.loader(model_name)
+            load_time = time.time() - start
+            size_bytes = estimate_model_size(model)
+
+            with self._lock:
+                self._check_fits(model_name, size_bytes)
+                self._evict_for(size_bytes, keep=model_name)
+                self.models[model_name] = model
+                previous = self._stats.get(model_name, {})
+                self._stats[model_name] = {
+                    "loaded": True,
+                    "load_time": round(load_time, 2),
+                    "load_count": previous.get("load_count", 0) + 1,
+                    "hits": previous.get("hits", 0),
+                    "size_bytes": size_bytes,
+                    "loaded_at": time.time(),
+                    "last_used": time.time(),
+                }
+            logger.info(f"✅ 모델 '{model_name}' 로딩 완료 (소요시간: {load_time:.2f}초, 크기: {size_bytes / 1024 / 1024:.0f}MB)")
+            return model
+
+    def evict(self, model_name: str) -> bool:
+        """특정 모델 해제"""
+        with self._lock:
+            if model_name not in self.models:
+                return False
+            self.models.pop(model_name)
+            self._stats[model_name]["loaded"] = False
+            return True
+
+    def clear(self):
+        """모든 모델 해제 (통계는 유지)"""
+        with self._lock:
+            for name in self.models:
+                self._stats[name]["loaded"] = False
+            self.models.clear()
+
+    def get_status(self) -> Dict:
+        """레지스트리 상태 및 모델별 통계"""
+        with self._lock:
+            models = {}
+            for name, stats in self._stats.items():
+                models[name] = {
+                    "loaded": name in self.models,
+                    "quantized": parse_model_name(name)[1],
+                    "load_time": stats["load_time"],
+                    "load_count": stats["load_count"],
+                    "hits": stats["hits"],
+                    "size_mb": round(stats["size_bytes"] / 1024 / 1024, 1),
+                    "loaded_at": stats["loaded_at"],
+                    "last_used": stats["last_used"],
+                }
+            return {
+                "memory_budget_mb": round(self.memory_budget_bytes / 1024 / 1024, 1),
+                "resident_mb": round(self._resident_bytes() / 1024 / 1024, 1),
+                "lru_order": list(self.models.keys()),
+                "evictions": self._evictions,
+                "models": models,
+            }
+
+
+# 전역 모델 레지스트리 인스턴스
+model_registry = ModelRegistry()
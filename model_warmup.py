@@ -0,0 +1,182 @@
+"""
+Whisper 모델 백그라운드 워밍업
+서버 시작을 막지 않고 사전 로딩 모델을 백그라운드 스레드에서 로딩한 뒤, 무음 더미 전사로
+추론 워커별 복제본 생성과 지연 초기화(커널/mel 필터 등)를 미리 끝내고 모델별 준비 상태를 보고하는 모듈
+"""
+
+import os
+import time
+import asyncio
+import logging
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 워밍업 설정 (config.env 또는 환경변수로 조정)
+WARMUP_ENABLED = os.getenv("STT_WARMUP_ENABLED", "true").lower() == "true"
+WARMUP_AUDIO_SEC = float(os.getenv("STT_WARMUP_AUDIO_SEC", "1"))
+READY_WAIT_TIMEOUT = float(os.getenv("STT_READY_WAIT_TIMEOUT", "300"))  # 준비 전 요청 최대 대기 시간(초)
+
+SAMPLE_RATE = 16000
+READY_POLL_INTERVAL = 0.1
+
+
+class ModelNotReadyError(RuntimeError):
+    """준비 대기 시간 안에 모델 워밍업이 끝나지 않았거나 워밍업에 실패한 경우"""
+
+
+def _default_loader(model_name: str):
+    from model_registry import model_registry
+    return model_registry.get(model_name)
+
+
+def warm_up_on_workers(model, audio_sec: float = WARMUP_AUDIO_SEC):
+    """
+    추론 워커마다 무음 더미 전사를 한 번씩 실행
+    Barrier로 모든 워커가 동시에 한 작업씩 잡도록 하여 워커별 모델 복제본이 모두 생성되게 함
+    """
+    from inference_pool import get_inference_pool, transcribe_on_worker
+
+    pool = get_inference_pool()
+    silence = np.zeros(int(SAMPLE_RATE * audio_sec), dtype=np.float32)
+    barrier = threading.Barrier(pool.max_workers)
+
+    def warm(model, audio):
+        try:
+            barrier.wait(timeout=60)
+        except threading.BrokenBarrierError:
+            pass
+        return transcribe_on_worker(model, audio, language="ko", fp16=False, verbose=None,
+                                    temperature=0.0, condition_on_previous_text=False)
+
+    futures = [pool.submit(warm, model, silence) for _ in range(pool.max_workers)]
+    for future in futures:
+        future.result()
+
+
+class ModelWarmup:
+    """사전 로딩 모델의 로딩/워밍업 진행 상태와 준비 여부를 관리"""
+
+    def __init__(self, loader: Optional[Callable] = None, warmup_fn: Optional[Callable] = None):
+        self.loader = loader or _default_loader
+        self.warmup_fn = warmup_fn or warm_up_on_workers
+        self._lock = threading.Lock()
+        self._models: Dict[str, Dict] = {}
+        self._thread: Optional[threading.Thread] = None
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+
+    def start(self, model_names: List[str], warmup: bool = WARMUP_ENABLED) -> threading.Thread:
+        """백그라운드 스레드에서 모델 로딩 + 워밍업 시작 (즉시 반환)"""
+        with self._lock:
+            for model_name in model_names:
+                self._models[model_name] = {
+                    "status": "pending",
+                    "load_seconds": None,
+                    "warmup_seconds": None,
+                    "error": None,
+                    "_event": threading.Event(),
+                }
+            self.started_at = datetime.now().isoformat()
+            self.finished_at = None
+
+        self._thread = threading.Thread(
+            target=self._run, args=(list(model_names), warmup), name="stt-model-warmup", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"🔥 모델 백그라운드 워밍업 시작 - 모델: {model_names}")
+        return self._thread
+
+    def _set(self, model_name: str, **fields):
+        with self._lock:
+            self._models[model_name].update(fields)
+
+    def _run(self, model_names: List[str], warmup: bool):
+        for model_name in model_names:
+            state = self._models[model_name]
+            try:
+                self._set(model_name, status="loading")
+                start = time.time()
+                model = self.loader(model_name)
+                self._set(model_name, load_seconds=round(time.time() - start, 2))
+
+                if warmup:
+                    self._set(model_name, status="warming")
+                    start = time.time()
+                    self.warmup_fn(model)
+                    self._set(model_name, warmup_seconds=round(time.time() - start, 2))
+
+                self._set(model_name, status="ready")
+                logger.info(f"   ✅ {model_name} 모델 준비 완료 - 로딩 {state['load_seconds']}초, "
+                            f"워밍업 {state['warmup_seconds']}초")
+            except Exception as e:
+                self._set(model_name, status="failed", error=str(e))
+                logger.error(f"   ❌ {model_name} 모델 워밍업 실패: {e}")
+            finally:
+                state["_event"].set()
+
+        self.finished_at = datetime.now().isoformat()
+        logger.info(f"🎉 모델 워밍업 종료 - 준비 상태: {self.is_ready()}")
+
+    def tracks(self, model_name: str) -> bool:
+        """워밍업 대상 모델인지 여부"""
+        return model_name in self._models
+
+    def is_ready(self, model_name: Optional[str] = None) -> bool:
+        """지정 모델(없으면 전체 워밍업 대상 모델)이 준비되었는지 여부"""
+        with self._lock:
+            if model_name is not None:
+                state = self._models.get(model_name)
+                return state is None or state["status"] == "ready"
+            return all(state["status"] == "ready" for state in self._models.values())
+
+    async def wait_until_ready(self, model_name: str, timeout: float = READY_WAIT_TIMEOUT):
+        """
+        워밍업 중인 모델이면 준비될 때까지 대기 (이벤트 루프를 막지 않도록 짧은 간격으로 확인)
+        워밍업 대상이 아닌 모델은 즉시 반환하여 기존처럼 첫 요청 시 로딩
+        """
+        state = self._models.get(model_name)
+        if state is None or state["_event"].is_set():
+            if state is not None and state["status"] == "failed":
+                raise ModelNotReadyError(f"모델 '{model_name}' 워밍업 실패: {state['error']}")
+            return
+
+        logger.info(f"⏳ 모델 준비 대기 - {model_name} ({state['status']})")
+        deadline = time.monotonic() + timeout
+        while not state["_event"].is_set():
+            if time.monotonic() >= deadline:
+                raise ModelNotReadyError(f"모델 '{model_name}'이(가) {timeout:.0f}초 안에 준비되지 않았습니다")
+            await asyncio.sleep(READY_POLL_INTERVAL)
+
+        if state["status"] == "failed":
+            raise ModelNotReadyError(f"모델 '{model_name}' 워밍업 실패: {state['error']}")
+
+    def get_status(self) -> Dict:
+        with self._lock:
+            models = {
+                name: {key: value for key, value in state.items() if not key.startswith("_")}
+                for name, state in self._models.items()
+            }
+        return {
+            "ready": all(model["status"] == "ready" for model in models.values()),
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "models": models,
+        }
+
+
+# 전역 워밍업 관리자
+_model_warmup: Optional[ModelWarmup] = None
+
+def get_model_warmup() -> ModelWarmup:
+    """모델 워밍업 관리자 싱글톤 인스턴스를 반환합니다"""
+    global _model_warmup
+
+    if _model_warmup is None:
+        _model_warmup = ModelWarmup()
+
+    return _model_warmup
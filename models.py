@@ -72,6 +72,67 @@ class STTResponse(BaseModel):
     # 하이브리드 필드 (원본 데이터 보존)
     original_transcript: Optional[str] = Field(None, description="원본 STT 텍스트")
     original_segments: Optional[List[Dict]] = Field(None, description="원본 STT 세그먼트")
+    
+    # 전사 처리 통계 (해당 옵션을 사용한 경우만)
+    cascade: Optional[Dict] = Field(None, description="캐스케이드 재디코딩 통계")
+    silence_strip: Optional[Dict] = Field(None, description="무음 제거 통계")
+    diarization: Optional[Dict] = Field(None, description="화자 분리 통계")
+
+
+class STTBatchRequest(BaseModel):
+    """짧은 통화 일괄 전사 요청 모델 (src_record 파일 기준)"""
+    filenames: List[str] = Field(..., description="src_record 기준 파일 경로 목록")
+    model_name: Optional[str] = Field("base", description="Whisper 모델명")
+    language: Optional[str] = Field(None, description="언어 코드")
+    extract_erp: Optional[bool] = Field(True, description="ERP 항목 추출 여부")
+    save_to_db: Optional[bool] = Field(True, description="DB 저장 및 ERP 자동 등록 여부")
+
+
+class STTBatchResponse(BaseModel):
+    """짧은 통화 일괄 전사 응답 모델"""
+    status: str = Field(..., description="처리 상태 (success, partial, error)")
+    results: List[STTResponse] = Field(..., description="파일별 STT 처리 결과")
+    failed: List[Dict] = Field(default_factory=list, description="처리 실패 파일 목록 (filename, error)")
+    batched_files: int = Field(0, description="일괄 전사(또는 캐시)로 처리된 파일 수")
+    processing_time: float = Field(..., description="전체 처리 시간(초)")
+
+
+class STTBulkRequest(BaseModel):
+    """단계별 파이프라인 일괄 처리 요청 모델 (filenames 또는 folder 중 하나 지정)"""
+    filenames: Optional[List[str]] = Field(None, description="src_record 기준 파일 경로 목록")
+    folder: Optional[str] = Field(None, description="src_record 하위 일자 폴더 (YYYY-MM-DD)")
+    model_name: Optional[str] = Field("base", description="Whisper 모델명")
+    language: Optional[str] = Field(None, description="언어 코드")
+    extract_erp: Optional[bool] = Field(True, description="ERP 항목 추출 여부")
+    save_to_db: Optional[bool] = Field(True, description="DB 저장 및 ERP 자동 등록 여부")
+
+
+class STTJobRequest(BaseModel):
+    """STT 비동기 작업 등록 요청 모델 (src_record 파일 기준)"""
+    filename: str = Field(..., description="src_record 기준 파일 경로")
+    model_name: Optional[str] = Field("base", description="Whisper 모델명")
+    language: Optional[str] = Field(None, description="언어 코드")
+    enable_diarization: Optional[bool] = Field(True, description="화자 분리 활성화")
+    extract_erp: Optional[bool] = Field(True, description="ERP 항목 추출 여부")
+    save_to_db: Optional[bool] = Field(True, description="DB 저장 및 ERP 자동 등록 여부")
+    long_audio: Optional[bool] = Field(False, description="긴 녹음 분할 병렬 전사 여부")
+    cascade: Optional[bool] = Field(False, description="저신뢰 구간만 큰 모델로 재디코딩하는 캐스케이드 전사 여부")
+    strip_silence: Optional[bool] = Field(False, description="긴 무음을 제거하고 전사 후 시간을 원본 기준으로 복원할지 여부")
+    priority: Optional[str] = Field("interactive", description="전사 우선순위 클래스 (interactive, bulk, background)")
+
+
+class STTJobStatus(BaseModel):
+    """STT 비동기 작업 상태 모델"""
+    job_id: str = Field(..., description="작업 ID")
+    status: str = Field(..., description="작업 상태 (queued, running, completed, failed)")
+    stage: Optional[str] = Field(None, description="현재 처리 단계 (transcribe, postprocess, extract, save)")
+    progress: float = Field(0.0, description="진행률 (0.0 ~ 1.0)")
+    filename: Optional[str] = Field(None, description="처리 대상 파일명")
+    error: Optional[str] = Field(None, description="실패 사유")
+    attempts: int = Field(0, description="실행 시도 횟수")
+    created_at: str = Field(..., description="등록 일시")
+    started_at: Optional[str] = Field(None, description="실행 시작 일시")
+    finished_at: Optional[str] = Field(None, description="종료 일시")
 
 
 class ERPExtractionRequest(BaseModel):
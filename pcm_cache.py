@@ -0,0 +1,195 @@
+"""
+디코딩된 PCM 캐시
+녹음 파일을 한 번만 FFmpeg로 16kHz mono float32로 디코딩하여 파일 해시 기준 .npy로 저장하고,
+이후에는 np.load(mmap_mode='r')로 바로 읽어 Whisper/pyannote에 배열로 전달하는 모듈
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Dict, Optional
+
+import numpy as np
+
+from transcription_cache import get_file_hash
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+# PCM 캐시 설정 (config.env 또는 환경변수로 조정)
+PCM_CACHE_ENABLED = os.getenv("STT_PCM_CACHE_ENABLED", "true").lower() == "true"
+PCM_CACHE_DIR = os.getenv("STT_PCM_CACHE_DIR", "pcm_cache")
+PCM_CACHE_MAX_MB = int(os.getenv("STT_PCM_CACHE_MAX_MB", "4096"))
+
+
+def decode_audio(file_path: str) -> np.ndarray:
+    """FFmpeg로 16kHz mono float32 디코딩 (Whisper load_audio와 동일)"""
+    import whisper
+    return whisper.load_audio(file_path, sr=SAMPLE_RATE)
+
+
+class PCMCache:
+    """파일 해시 기준 .npy PCM 캐시 (크기 초과 시 가장 오래 사용하지 않은 항목부터 삭제)"""
+
+    def __init__(self, cache_dir: str = PCM_CACHE_DIR, max_size_mb: int = PCM_CACHE_MAX_MB,
+                 enabled: bool = PCM_CACHE_ENABLED, decoder=None):
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.enabled = enabled
+        self.decoder = decoder or decode_audio
+        self._lock = threading.Lock()
+        self._decode_locks: Dict[str, threading.Lock] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._decode_seconds = 0.0
+
+        if self.enabled:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, file_hash: str) -> str:
+        return os.path.join(self.cache_dir, f"{file_hash}.npy")
+
+    def _get_decode_lock(self, file_hash: str) -> threading.Lock:
+        with self._lock:
+            if file_hash not in self._decode_locks:
+                self._decode_locks[file_hash] = threading.Lock()
+            return self._decode_locks[file_hash]
+
+    def _load(self, path: str) -> np.ndarray:
+        audio = np.load(path, mmap_mode="r")
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return audio
+
+    def get(self, file_path: str, file_hash: Optional[str] = None,
+            variant: str = "", decoder=None) -> np.ndarray:
+        """
+        녹음의 16kHz mono float32 배열 반환 (캐시가 있으면 memory-map, 없으면 디코딩 후 저장)
+        캐시가 비활성화된 경우 매번 디코딩
+        variant/decoder를 지정하면 같은 파일의 다른 디코딩 결과(예: 채널별 PCM)를 별도 항목으로 캐시
+        """
+        decoder = decoder or self.decoder
+        if not self.enabled:
+            return decoder(file_path)
+
+        file_hash = (file_hash or get_file_hash(file_path)) + variant
+        path = self._path(file_hash)
+        if os.path.exists(path):
+            with self._lock:
+                self._hits += 1
+            return self._load(path)
+
+        # 같은 파일의 동시 디코딩 방지
+        with self._get_decode_lock(file_hash):
+            if os.path.exists(path):
+                with self._lock:
+                    self._hits += 1
+                return self._load(path)
+
+            start = time.time()
+            audio = np.ascontiguousarray(decoder(file_path), dtype=np.float32)
+            elapsed = time.time() - start
+
+            tmp_path = f"{path}.{threading.get_ident()}.tmp.npy"
+            try:
+                np.save(tmp_path, audio)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                logger.warning(f"PCM 캐시 저장 실패 (디코딩 결과만 사용): {e}")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                with self._lock:
+                    self._misses += 1
+                    self._decode_seconds += elapsed
+                return audio
+
+            with self._lock:
+                self._misses += 1
+                self._decode_seconds += elapsed
+                self._evict_if_needed(keep=path)
+            logger.info(f"🎧 PCM 디코딩 캐시 저장 - {audio.shape[-1] / SAMPLE_RATE:.1f}초, 디코딩 {elapsed:.2f}초")
+        return self._load(path)
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".npy") or ".tmp" in name:
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        entries.sort(key=lambda entry: entry[2])
+        return entries
+
+    def _evict_if_needed(self, keep: Optional[str] = None):
+        """총 크기가 예산을 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (lock 보유 상태에서 호출)"""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_size_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                # 이미 memory-map 중인 배열은 삭제 후에도 유효 (POSIX), Windows에서는 실패 시 건너뜀
+                os.remove(path)
+                total -= size
+                self._evictions += 1
+            except OSError as e:
+                logger.warning(f"PCM 캐시 항목 삭제 실패: {path}, 오류: {e}")
+
+    def clear(self) -> int:
+        """모든 PCM 캐시 삭제"""
+        if not self.enabled:
+            return 0
+        removed = 0
+        with self._lock:
+            for path, _, _ in self._entries():
+                try:
+                    os.remove(path)
+                    removed += 1
+                except OSError:
+                    pass
+        logger.info(f"PCM 캐시 정리 완료 - {removed}개 항목 삭제")
+        return removed
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            entries = self._entries() if self.enabled else []
+            return {
+                "enabled": self.enabled,
+                "cache_dir": self.cache_dir,
+                "entries": len(entries),
+                "size_mb": round(sum(size for _, size, _ in entries) / 1024 / 1024, 2),
+                "max_size_mb": round(self.max_size_bytes / 1024 / 1024, 1),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "decode_seconds": round(self._decode_seconds, 2),
+            }
+
+
+# 전역 PCM 캐시 인스턴스
+_pcm_cache: Optional[PCMCache] = None
+
+def get_pcm_cache() -> PCMCache:
+    """PCM 캐시 싱글톤 인스턴스를 반환합니다"""
+    global _pcm_cache
+
+    if _pcm_cache is None:
+        _pcm_cache = PCMCache()
+
+    return _pcm_cache
+
+def load_pcm(file_path: str, file_hash: Optional[str] = None) -> np.ndarray:
+    """녹음을 16kHz mono float32 배열로 반환 (PCM 캐시 경유)"""
+    return get_pcm_cache().get(file_path, file_hash)
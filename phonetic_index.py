@@ -0,0 +1,362 @@
+"""
+한글 자모 발음 키 인덱스
+한글은 자모(초성/중성/종성)로 분해하고, 라틴 약어는 한국어 읽기(ROADM → 로드엠, STN → 에스티엔)로 바꾼 뒤
+헷갈리기 쉬운 소리(ㅐ/ㅔ, 받침 대표음, 받침 ㄴ/ㅁ/ㅇ)를 하나로 묶은 발음 키를 만들어,
+(소리 묶음은 장비명/모델명 라틴 약어 읽기에만 적용하고 한글 발화 별칭은 자모가 그대로 같아야 일치)
+도메인 데이터의 장비명/모델명마다 미리 키를 계산해 두고 세그먼트를 한 번 토큰화하면서 키 조회(O(1))로
+발화 변형(로드엔, 알오에이디엠, roadn ...)을 정식 표기로 바꾸는 모듈
+"""
+
+import re
+import logging
+from functools import lru_cache
+from itertools import product
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 한글 음절 분해 (유니코드 한글 음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성)
+HANGUL_BASE = 0xAC00
+HANGUL_END = 0xD7A3
+INITIALS = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+MEDIALS = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+FINALS = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+          "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+# 발음 키 정규화 (잘못 들리기 쉬운 소리를 같은 키로)
+MEDIAL_KEY = {"ㅐ": "ㅔ", "ㅒ": "ㅖ", "ㅙ": "ㅞ", "ㅚ": "ㅞ"}
+FINAL_KEY = {  # 받침 대표음, 비음 받침(ㄴ/ㅁ/ㅇ)은 통화 음질에서 잘 구분되지 않아 하나로 묶음
+    "ㄲ": "ㄱ", "ㅋ": "ㄱ", "ㄳ": "ㄱ", "ㄺ": "ㄱ",
+    "ㅅ": "ㄷ", "ㅆ": "ㄷ", "ㅈ": "ㄷ", "ㅊ": "ㄷ", "ㅌ": "ㄷ", "ㅎ": "ㄷ",
+    "ㅍ": "ㅂ", "ㅄ": "ㅂ", "ㄿ": "ㅂ",
+    "ㄵ": "ㄴ", "ㄶ": "ㄴ", "ㅁ": "ㄴ", "ㅇ": "ㄴ", "ㄻ": "ㄴ",
+    "ㄼ": "ㄹ", "ㄽ": "ㄹ", "ㄾ": "ㄹ", "ㅀ": "ㄹ",
+}
+
+# 라틴 문자 한국어 읽기
+LETTER_NAMES = {
+    "A": "에이", "B": "비", "C": "씨", "D": "디", "E": "이", "F": "에프", "G": "지", "H": "에이치",
+    "I": "아이", "J": "제이", "K": "케이", "L": "엘", "M": "엠", "N": "엔", "O": "오", "P": "피",
+    "Q": "큐", "R": "알", "S": "에스", "T": "티", "U": "유", "V": "브이", "W": "더블유", "X": "엑스",
+    "Y": "와이", "Z": "지",
+}
+# 글자 단위가 아니라 단어로 읽는 약어 조각 (앞에서부터 가장 긴 조각 우선)
+WORD_READINGS = {
+    "ROAD": "로드",
+    "ADVA": "아드바",
+}
+
+TOKEN_PATTERN = re.compile(r"[A-Za-z0-9]+|[가-힣]+")
+JOINABLE_GAP = re.compile(r"[\s\-/._]*")  # 여러 토큰으로 된 이름 사이에 허용하는 구분자
+LATIN_OR_DIGIT = re.compile(r"[A-Za-z]+|[0-9]+")
+# 이름 뒤에 붙는 조사 (긴 것부터 확인)
+PARTICLES = sorted(["에서", "으로", "이랑", "하고", "이요", "이", "가", "을", "를", "은", "는", "에",
+                    "로", "와", "과", "의", "도", "만", "랑", "요"], key=len, reverse=True)
+
+MIN_KEY_LENGTH = 4  # 이보다 짧은 키는 일반 단어와 겹치기 쉬워 등록하지 않음
+MAX_READINGS = 16  # 이름 하나당 읽기 조합 최대 개수
+
+
+class PhoneticHit(NamedTuple):
+    """발음 키 일치 한 건 (text[start:end] → canonical)"""
+    start: int
+    end: int
+    surface: str
+    canonical: str
+    kind: str
+
+
+def decompose(text: str) -> str:
+    """한글 음절을 자모로 분해 (그 외 문자는 그대로)"""
+    jamo = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_END:
+            offset = code - HANGUL_BASE
+            jamo.append(INITIALS[offset // 588])
+            jamo.append(MEDIALS[(offset % 588) // 28])
+            jamo.append(FINALS[offset % 28])
+        else:
+            jamo.append(char)
+    return "".join(jamo)
+
+
+def latin_readings(token: str) -> List[str]:
+    """
+    라틴 약어의 한국어 읽기 후보 (숫자는 그대로)
+    [단어 조각 우선 읽기, 글자 단위 읽기] - 'ROADM' → ['로드엠', '알오에이디엠']
+    """
+    word, spelled = [], []
+    for run in LATIN_OR_DIGIT.findall(token):
+        if run.isdigit():
+            word.append(run)
+            spelled.append(run)
+            continue
+        upper = run.upper()
+        spelled.append("".join(LETTER_NAMES[char] for char in upper))
+        position = 0
+        while position < len(upper):
+            for piece in sorted(WORD_READINGS, key=len, reverse=True):
+                if upper.startswith(piece, position):
+                    word.append(WORD_READINGS[piece])
+                    position += len(piece)
+                    break
+            else:
+                word.append(LETTER_NAMES[upper[position]])
+                position += 1
+    return list(dict.fromkeys(["".join(word), "".join(spelled)]))
+
+
+@lru_cache(maxsize=65536)
+def phonetic_key(reading: str, coarse: bool = True) -> str:
+    """
+    읽기(한글/숫자)의 발음 키
+    초성 ㅇ(소리 없음) 제거, 한글/숫자 외 문자 제거, coarse=True이면 중성/종성 정규화
+    """
+    key = []
+    for char in reading:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_END:
+            offset = code - HANGUL_BASE
+            initial = INITIALS[offset // 588]
+            medial = MEDIALS[(offset % 588) // 28]
+            final = FINALS[offset % 28]
+            if initial != "ㅇ":
+                key.append(initial)
+            key.append(MEDIAL_KEY.get(medial, medial) if coarse else medial)
+            if final:
+                key.append(FINAL_KEY.get(final, final) if coarse else final)
+        elif char.isdigit():
+            key.append(char)
+    return "".join(key)
+
+
+@lru_cache(maxsize=65536)
+def token_key(token: str, coarse: bool = True) -> str:
+    """텍스트 토큰 한 개의 발음 키 (라틴 약어는 단어 조각 우선 읽기 기준)"""
+    if token[0].isascii():
+        return phonetic_key(latin_readings(token)[0], coarse)
+    return phonetic_key(token, coarse)
+
+
+def strip_particle(token: str) -> Optional[str]:
+    """한글 토큰 끝의 조사를 뗀 어간 (조사가 없으면 None)"""
+    if token[0].isascii():
+        return None
+    for particle in PARTICLES:
+        if len(token) > len(particle) and token.endswith(particle):
+            return token[:-len(particle)]
+    return None
+
+
+def _same_token_class(a: str, b: str) -> bool:
+    """두 글자가 이어지면 같은 토큰이 되는지"""
+    return bool(TOKEN_PATTERN.fullmatch(a + b))
+
+
+def edge_tokens(text: str, position: int, count: int, before: bool) -> List[str]:
+    """position 앞(before) 또는 뒤의 토큰 최대 count개 (텍스트 전체를 토큰화하지 않고 가장자리만 확인)"""
+    size = 64
+    while True:
+        if before:
+            low = max(0, position - size)
+            tokens = TOKEN_PATTERN.findall(text, low, position)
+            if tokens and low > 0 and _same_token_class(text[low - 1], text[low]):
+                tokens = tokens[1:]  # 잘린 토큰 제외
+            if len(tokens) >= count or low == 0:
+                return tokens[-count:]
+        else:
+            high = min(len(text), position + size)
+            tokens = TOKEN_PATTERN.findall(text, position, high)
+            if tokens and high < len(text) and _same_token_class(text[high - 1], text[high]):
+                tokens = tokens[:-1]
+            if len(tokens) >= count or high == len(text):
+                return tokens[:count]
+        size *= 4
+
+
+def name_keys(name: str, coarse: bool = True) -> List[str]:
+    """정식 이름(또는 한글 발화 별칭)의 발음 키 목록 (토큰별 읽기 후보 조합)"""
+    choices = []
+    for token in TOKEN_PATTERN.findall(name):
+        choices.append(latin_readings(token) if token[0].isascii() else [token])
+    if not choices:
+        return []
+    keys = []
+    for readings in product(*choices):
+        key = phonetic_key("".join(readings), coarse)
+        if key not in keys:
+            keys.append(key)
+        if len(keys) >= MAX_READINGS:
+            break
+    return keys
+
+
+class PhoneticIndex:
+    """
+    발음 키 → 정식 이름 인덱스
+    같은 키에 다른 이름이 등록되면 먼저 등록한 이름 유지 (장비명을 모델명보다 먼저 등록)
+    소리를 묶은 키(coarse)는 라틴 약어 읽기에만 등록하고, 한글 별칭과 coarse=False로 등록한 이름은 자모가 같은 키만 등록
+    (짧은 한글 별칭을 묶으면 '에스엠', '스템' 같은 일반 발화까지 바뀌므로)
+    """
+
+    def __init__(self, min_key_length: int = MIN_KEY_LENGTH):
+        self.min_key_length = min_key_length
+        self._names: Dict[str, Tuple[str, str]] = {}  # 소리를 묶은 발음 키 → (정식 이름, kind)
+        self._exact_names: Dict[str, Tuple[str, str]] = {}  # 자모 그대로의 발음 키 → (정식 이름, kind)
+        self.max_tokens = 1
+        self.conflicts = 0
+
+    def __len__(self) -> int:
+        return len(self._names) + len(self._exact_names)
+
+    def add(self, canonical: str, kind: str = "term", aliases: Iterable[str] = (), coarse: bool = True) -> "PhoneticIndex":
+        """정식 이름과 한글 발화 별칭 등록 (coarse=False이면 정식 이름도 자모가 같은 발화만 일치)"""
+        for name in (canonical, *aliases):
+            tokens = TOKEN_PATTERN.findall(name)
+            latin = all(token[0].isascii() for token in tokens)
+            names = self._names if coarse and latin else self._exact_names
+            for key in name_keys(name, coarse=coarse and latin):
+                # 숫자만 있는 키(모델 번호 등)와 너무 짧은 키는 일반 발화와 겹치기 쉬워 제외
+                if len(key) < self.min_key_length or key.isdigit():
+                    continue
+                existing = names.get(key)
+                if existing is None:
+                    names[key] = (canonical, kind)
+                    self.max_tokens = max(self.max_tokens, len(tokens))
+                elif existing[0] != canonical:
+                    self.conflicts += 1
+                    logger.debug(f"발음 키 중복 - '{name}'({canonical})은 '{existing[0]}'에 이미 등록된 키")
+        return self
+
+    def _get(self, exact_key: str, coarse_key: str) -> Optional[Tuple[str, str]]:
+        """자모 그대로의 키 우선, 없으면 소리를 묶은 키로 조회"""
+        return self._exact_names.get(exact_key) or self._names.get(coarse_key)
+
+    def lookup(self, text: str) -> Optional[str]:
+        """단어 하나(여러 토큰 가능)의 정식 이름 (없으면 None)"""
+        tokens = TOKEN_PATTERN.findall(text)
+        if not tokens:
+            return None
+        entry = self._get("".join(token_key(token, False) for token in tokens),
+                          "".join(token_key(token) for token in tokens))
+        return entry[0] if entry else None
+
+    def resolve(self, text: str) -> Tuple[str, List[PhoneticHit]]:
+        """
+        텍스트를 한 번 토큰화하면서 발음 키가 등록된 토큰(연속 토큰 포함)을 정식 이름으로 바꾼 텍스트와 일치 목록
+        토큰마다 최대 max_tokens개 연속 토큰 키를 조회 (마지막 한글 토큰은 조사를 뗀 어간도 확인)
+        """
+        if not text or not len(self):
+            return text, []
+        tokens = [(match.start(), match.end(), match.group(0)) for match in TOKEN_PATTERN.finditer(text)]
+        keys = [token_key(token) for _, _, token in tokens]
+        exact_keys = [token_key(token, False) for _, _, token in tokens]
+        hits = []
+        index = 0
+        while index < len(tokens):
+            hit, consumed = self._match_at(text, tokens, keys, exact_keys, index)
+            if hit is None:
+                index += 1
+                continue
+            if hit.surface != hit.canonical:
+                hits.append(hit)
+            index += consumed
+        if not hits:
+            return text, hits
+
+        pieces = []
+        position = 0
+        for hit in hits:
+            pieces.append(text[position:hit.start])
+            pieces.append(hit.canonical)
+            position = hit.end
+        pieces.append(text[position:])
+        return "".join(pieces), hits
+
+    def spans_gap(self, text: str, start: int, end: int) -> bool:
+        """
+        text 전체를 변환할 때 text[start:end] 간격을 건너는 일치가 생길 수 있는지 (보수적으로 판단)
+        False면 간격 앞뒤를 따로 변환해도 전체 결과와 같음
+        """
+        if not len(self) or not JOINABLE_GAP.fullmatch(text, start, end):
+            return False
+        if start == end and 0 < start < len(text) and _same_token_class(text[start - 1], text[start]):
+            return True  # 간격 없이 붙어 있으면 토큰 자체가 합쳐짐
+        if self.max_tokens < 2:
+            return False
+        left_tokens = edge_tokens(text, start, self.max_tokens - 1, before=True)
+        right_tokens = edge_tokens(text, end, self.max_tokens - 1, before=False)
+        for coarse, names in ((True, self._names), (False, self._exact_names)):
+            left_keys = [token_key(token, coarse) for token in left_tokens]
+            right_keys = [token_key(token, coarse) for token in right_tokens]
+            for left_count in range(1, len(left_keys) + 1):
+                prefix = "".join(left_keys[-left_count:])
+                for right_count in range(1, min(len(right_keys), self.max_tokens - left_count) + 1):
+                    middle = "".join(right_keys[:right_count - 1])
+                    if prefix + middle + right_keys[right_count - 1] in names:
+                        return True
+                    stem = strip_particle(right_tokens[right_count - 1])
+                    if stem is not None and prefix + middle + phonetic_key(stem, coarse) in names:
+                        return True
+        return False
+
+    def _match_at(self, text: str, tokens, keys, exact_keys, index: int) -> Tuple[Optional[PhoneticHit], int]:
+        """index 토큰에서 시작하는 가장 긴 일치"""
+        limit = 1
+        while (limit < self.max_tokens and index + limit < len(tokens)
+               and JOINABLE_GAP.fullmatch(text, tokens[index + limit - 1][1], tokens[index + limit][0])):
+            limit += 1
+        for count in range(limit, 0, -1):
+            last = index + count - 1
+            prefix = "".join(keys[index:last])
+            exact_prefix = "".join(exact_keys[index:last])
+            start = tokens[index][0]
+            entry = self._get(exact_prefix + exact_keys[last], prefix + keys[last])
+            end = tokens[last][1]
+            if entry is None:
+                stem = strip_particle(tokens[last][2])
+                if stem is None:
+                    continue
+                entry = self._get(exact_prefix + phonetic_key(stem, False), prefix + phonetic_key(stem))
+                end = tokens[last][0] + len(stem)
+            if entry is not None:
+                return PhoneticHit(start, end, text[start:end], entry[0], entry[1]), count
+        return None, 1
+
+
+def build_domain_phonetic_index(domain_data: Optional[Dict], aliases: Optional[Dict[str, List[str]]] = None) -> PhoneticIndex:
+    """
+    도메인 데이터 발음 키 인덱스
+    장비명(kind=equipment) → 모델명(kind=model) 순으로 등록, aliases는 {정식 이름: [한글 발화 별칭]}
+    별칭 이름(회사명 STN 등)은 장비명이 아니므로 자모가 같은 발화만 변환 ('에스티엠'(STM) 등은 그대로)
+    """
+    index = PhoneticIndex()
+    aliases = aliases or {}
+    for canonical, spoken in aliases.items():
+        index.add(canonical, "alias", spoken, coarse=False)
+    if domain_data:
+        allowed = domain_data.get("allowed", {})
+        maps = domain_data.get("maps", {})
+        for name in dict.fromkeys(allowed.get("equipment", [])):
+            if str(name).strip():
+                index.add(str(name).strip(), "equipment")
+        for model in maps.get("model_to_equipment", {}):
+            if str(model).strip():
+                index.add(str(model).strip(), "model")
+    return index
+
+
+# 도메인 데이터별 발음 키 인덱스 (도메인 데이터가 다시 로드되면 새로 생성)
+_phonetic_index: Optional[Tuple[Dict, PhoneticIndex]] = None
+
+def get_phonetic_index(domain_data: Optional[Dict], aliases: Optional[Dict[str, List[str]]] = None) -> PhoneticIndex:
+    """도메인 데이터 발음 키 인덱스를 반환합니다 (같은 도메인 데이터 객체면 한 번만 생성)"""
+    global _phonetic_index
+
+    if _phonetic_index is None or _phonetic_index[0] is not domain_data:
+        index = build_domain_phonetic_index(domain_data, aliases)
+        _phonetic_index = (domain_data, index)
+        logger.info(f"✅ 장비명 발음 키 인덱스 생성 - 키: {len(index)}개, 중복 제외: {index.conflicts}개")
+
+    return _phonetic_index[1]
@@ -8,8 +8,109 @@ import logging
 from typing import Dict, List, Optional
 from difflib import SequenceMatcher
 
+from fuzzy_index import get_fuzzy_index
+from term_matcher import TermMatcher, get_domain_matcher
+from phonetic_index import get_phonetic_index
+
 logger = logging.getLogger(__name__)
 
+# 음성 매핑 테이블 (통화 초기 부정확한 음성 → 정확한 용어)
+SPEECH_MAPPINGS = {
+    "에스티엔": "STN",
+    "에스엔": "STN",
+    "스티엔": "STN",
+    "스텐": "STN",
+    "스테인": "STN",
+    "SN": "STN"
+}
+
+# 발음 키 인덱스에 함께 등록할 한글 발화 별칭 (정식 이름 → 별칭, 발음 키가 다른 오인식만)
+SPOKEN_ALIASES = {
+    "STN": [term for term, correct in SPEECH_MAPPINGS.items() if correct == "STN" and not term.isascii()],
+}
+
+# 지역명 (앞에 있을수록 우선)
+LOCATION_TERMS = [
+    "인천", "서울", "부산", "대전", "대구", "광주", "울산", "세종", "경기", "강원",
+    "충북", "충남", "전북", "전남", "경북", "경남", "제주", "천안", "아산", "수원",
+    "성남", "고양", "용인", "부천", "화성", "안산", "안양", "평택", "시흥", "김포",
+    "의정부", "광명", "하남", "오산", "이천", "안성", "의왕", "과천", "구리", "남양주",
+    "파주", "양주", "포천", "연천", "가평", "양평"
+]
+
+# 1. 기관명 패턴들 (우선순위 높음)
+INSTITUTION_PATTERNS = [
+    r'인천\s*동부선관위',
+    r'동부선관위',
+    r'선관위\s*5C',
+    r'선관위',
+    r'동부선관',
+    r'수자원공사\s*FA망',
+    r'수자원공사',
+    r'한국전력공사',
+    r'한전',
+    r'한국가스공사',
+    r'한국도로공사'
+]
+
+# 2. 일반 고객사명 패턴들
+CUSTOMER_PATTERNS = [
+    r'삼성\s*SDS',
+    r'삼성\s*전자',
+    r'LG\s*\w+',
+    r'KT\s*\w*',
+    r'SKT\s*\w*',
+    r'네이버',
+    r'카카오',
+    r'현대\s*\w+',
+    r'기아\s*\w*',
+    r'포스코',
+    r'대한항공',
+    r'아시아나',
+    r'CJ\s*\w+',
+    r'GS\s*\w+',
+    r'롯데\s*\w+'
+]
+
+# 3. 시스템명 패턴들
+SYSTEM_PATTERNS = [
+    r'해외\s*페콜망',
+    r'FA망',
+    r'백본망',
+    r'전송망',
+    r'통신망'
+]
+
+# 요청사항 문맥 분석 키워드
+REQUEST_CONTEXT_TERMS = [
+    'UPS', '소유권', '고객 건지', '저희 건지', '교체', '설치', 'KTS가 제공하는',
+    '링크 장애', '복구', '원인 파악', '알람', '성능',
+    '긴급하게', '확인 요청', '부탁드릴게요', '확인하고 싶어서',
+    '회산번호', '장비명', '서버 IP', '연락 드리겠습니다',
+    '천안 아산', '인천', 'ROADN', 'ROADM',
+    '삼성 SDS', '해외 페콜망', '선관위', '전역망원지팀', 'CTA',
+]
+
+# 장비명 직접 추출 키워드 (앞에 있을수록 우선)
+EQUIPMENT_KEYWORDS = [
+    ("UPS", "UPS"), ("ROADM", "ROADM"), ("ROADN", "ROADM"), ("MSPP", "MSPP"),
+    ("스위치", "스위치"), ("라우터", "라우터"), ("공유기", "공유기"), ("모뎀", "모뎀")
+]
+
+# 용어 매처 (모듈 로드 시 한 번만 컴파일, 호출마다 텍스트 한 번 순회)
+_speech_matcher = TermMatcher(ignore_case=True)
+for _term, _correct in SPEECH_MAPPINGS.items():
+    _speech_matcher.add(_term, "speech", _correct)
+_location_matcher = TermMatcher().extend(LOCATION_TERMS, "location")
+_customer_matcher = TermMatcher(ignore_case=True)
+for _kind, _patterns in (("institution", INSTITUTION_PATTERNS), ("customer", CUSTOMER_PATTERNS), ("system", SYSTEM_PATTERNS)):
+    for _pattern in _patterns:
+        _customer_matcher.add_pattern(_pattern, _kind)
+_context_matcher = TermMatcher().extend(REQUEST_CONTEXT_TERMS, "context")
+_equipment_keyword_matcher = TermMatcher()
+for _term, _equipment in EQUIPMENT_KEYWORDS:
+    _equipment_keyword_matcher.add(_term, "equipment", _equipment)
+
 def calculate_similarity(text1: str, text2: str) -> float:
     """두 텍스트 간의 유사도를 계산 (0.0 ~ 1.0)"""
     if not text1 or not text2:
@@ -17,22 +118,16 @@ def calculate_similarity(text1: str, text2: str) -> float:
     return SequenceMatcher(None, text1.upper(), text2.upper()).ratio()
 
 def find_best_match(target: str, candidates: List[str], threshold: float = 0.8) -> Optional[str]:
-    """후보 목록에서 가장 유사한 항목을 찾아 반환"""
+    """후보 목록에서 가장 유사한 항목을 찾아 반환 (후보 목록별 유사도 인덱스 사용, 동점이면 앞선 후보)"""
     if not target or not candidates:
         return None
     
-    best_match = None
-    best_score = 0.0
-    
-    for candidate in candidates:
-        score = calculate_similarity(target, candidate)
-        if score >= threshold and score > best_score:
-            best_match = candidate
-            best_score = score
-    
-    if best_match:
-        logger.info(f"유사도 매핑: '{target}' → '{best_match}' (유사도: {best_score:.2f})")
+    match = get_fuzzy_index(candidates).best_match(target, threshold)
+    if match is None:
+        return None
     
+    best_match, best_score = match
+    logger.info(f"유사도 매핑: '{target}' → '{best_match}' (유사도: {best_score:.2f})")
     return best_match
 
 def extract_requester_name(text: str) -> str:
@@ -133,67 +228,134 @@ def postprocess_to_codes(raw_json: dict, domain_data: dict) -> dict:
     return result
 
 def normalize_speech_terms(text: str) -> str:
-    """통화 초기 부정확한 음성을 정확한 용어로 매핑"""
+    """통화 초기 부정확한 음성을 정확한 용어로 매핑 (대소문자 구분 없이, 한 번의 순회로 치환)"""
     if not text:
         return text
     
-    # 음성 매핑 테이블
-    speech_mappings = {
-        "에스티엔": "STN",
-        "에스엔": "STN", 
-        "스티엔": "STN",
-        "스텐": "STN",
-        "스테인": "STN",
-        "SN": "STN"
-    }
-    
-    # 텍스트에서 매핑 대상 찾아서 교체
-    normalized_text = text
-    for incorrect_term, correct_term in speech_mappings.items():
-        # 대소문자 구분 없이 매핑
-        normalized_text = re.sub(
-            re.escape(incorrect_term), 
-            correct_term, 
-            normalized_text, 
-            flags=re.IGNORECASE
-        )
-        if incorrect_term in text:
-            logger.info(f"음성 매핑: '{incorrect_term}' → '{correct_term}'")
+    normalized_text, hits = _speech_matcher.replace(text)
+    for term in dict.fromkeys(hit.term for hit in hits):
+        logger.info(f"음성 매핑: '{term}' → '{SPEECH_MAPPINGS[term]}'")
     
     return normalized_text
 
+def find_domain_terms(text: str, domain_data: dict) -> list:
+    """텍스트에 나타난 도메인 용어 (장비명/모델명/장애·요청 발화 예시) 일치 목록"""
+    if not text or not domain_data:
+        return []
+    return get_domain_matcher(domain_data).find(text)
+
+def _domain_phonetic_index(domain_data: dict):
+    """도메인 데이터가 있으면 장비명 발음 키 인덱스"""
+    if domain_data and domain_data.get("allowed", {}).get("equipment"):
+        return get_phonetic_index(domain_data, SPOKEN_ALIASES)
+    return None
+
+def _resolve_spoken_terms(text: str, phonetic_index) -> str:
+    """장비명/모델명의 발화 변형(로드엔, 알오에이디엠, roadn 등)을 토큰별 키 조회로 정식 표기로 변환"""
+    if phonetic_index is None or not text:
+        return text
+    resolved_text, hits = phonetic_index.resolve(text)
+    for hit in hits:
+        logger.info(f"통합 후처리 발음 매핑: '{hit.surface}' → '{hit.canonical}'")
+    return resolved_text
+
 def comprehensive_postprocess(text: str, domain_data: dict = None) -> str:
-    """음성 정규화 + 유사도 매핑 통합 후처리"""
+    """음성 정규화 + 발음 키 매핑 통합 후처리"""
     if not text:
         return text
     
     # 1단계: 음성 정규화
     normalized_text = normalize_speech_terms(text)
     
-    # 2단계: 유사도 매핑 적용 (도메인 데이터가 있는 경우)
-    if domain_data and domain_data.get("allowed", {}).get("equipment"):
-        equipment_list = domain_data["allowed"]["equipment"]
-        
-        # 텍스트에서 장비명 패턴 찾기 (ROADN, ROADM 등)
-        equipment_patterns = [
-            r'\bROADN\b', r'\bROADM\b', r'\b로드엔\b', r'\b로드엠\b'
-        ]
-        
-        for pattern in equipment_patterns:
-            matches = re.findall(pattern, normalized_text, re.IGNORECASE)
-            for match in matches:
-                # 유사도 매핑으로 올바른 장비명 찾기
-                best_match = find_best_match(match, equipment_list, threshold=0.8)
-                if best_match:
-                    normalized_text = re.sub(
-                        re.escape(match), 
-                        best_match, 
-                        normalized_text, 
-                        flags=re.IGNORECASE
-                    )
-                    logger.info(f"통합 후처리 유사도 매핑: '{match}' → '{best_match}'")
-    
-    return normalized_text
+    # 2단계: 발음 키 매핑 적용 (도메인 데이터가 있는 경우)
+    return _resolve_spoken_terms(normalized_text, _domain_phonetic_index(domain_data))
+
+def postprocess_segments(texts: List[str], full_text: str, domain_data: dict = None) -> Dict:
+    """
+    세그먼트 단위 통합 후처리 (세그먼트마다 한 번만 후처리하고 전체 텍스트는 그 결과를 이어 붙여 생성)
+    full_text에서 세그먼트 위치를 찾아 세그먼트 사이 공백은 그대로 두고 후처리된 세그먼트를 이어 붙이며,
+    공백이 아닌 간격이나 간격을 건너는 매칭이 생길 수 있는 경계는 그 구간만 묶어서 다시 후처리
+    → transcript는 항상 comprehensive_postprocess(full_text)와 같음
+    
+    반환: texts(세그먼트별 후처리 결과), transcript(후처리된 전체 텍스트),
+          offsets(세그먼트별 transcript 안 (start, end), 묶어서 처리한 세그먼트는 묶음 전체 범위, 위치를 못 찾으면 None),
+          merged(다시 후처리한 구간 수)
+    """
+    phonetic_index = _domain_phonetic_index(domain_data)
+    normalized = [normalize_speech_terms(text) if text else text for text in texts]
+    processed = [_resolve_spoken_terms(text, phonetic_index) for text in normalized]
+    
+    # 전체 텍스트 안 세그먼트 위치와 세그먼트 사이 간격
+    spans = []
+    cursor = 0
+    for text in texts:
+        start = full_text.find(text, cursor)
+        if start < 0:
+            logger.warning("전체 텍스트에서 세그먼트 위치를 찾지 못해 전체 텍스트를 다시 후처리합니다")
+            return {"texts": processed, "transcript": comprehensive_postprocess(full_text, domain_data),
+                    "offsets": None, "merged": 1}
+        spans.append((start, start + len(text)))
+        cursor = start + len(text)
+    if not texts:
+        return {"texts": [], "transcript": comprehensive_postprocess(full_text, domain_data), "offsets": [], "merged": 0}
+    
+    # 1단계: 간격을 건너는 용어 매핑이 없는 경계는 세그먼트 정규화 결과 재사용 (= normalize_speech_terms(full_text))
+    count = len(texts)
+    gaps = [((spans[k - 1][1] if k else 0), spans[k][0]) for k in range(count)] + [(spans[-1][1], len(full_text))]
+    speech_separable = [not full_text[start:end].strip() and not _speech_matcher.spans_gap(full_text, start, end)
+                        for start, end in gaps]
+    normalized_text, offsets, gap_positions, merged = _assemble_segments(
+        full_text, spans, gaps, speech_separable, normalized, normalize_speech_terms)
+    if phonetic_index is None:
+        return {"texts": processed, "transcript": normalized_text, "offsets": offsets, "merged": merged}
+    
+    # 2단계: 정규화된 전체 텍스트에서 발음 매핑이 간격을 건너지 않는 경계만 그대로 두고 나머지는 묶어서 다시 후처리
+    separable = [speech_separable[k] and not phonetic_index.spans_gap(
+        normalized_text, gap_positions[k], gap_positions[k] + end - start) for k, (start, end) in enumerate(gaps)]
+    transcript, offsets, _, merged = _assemble_segments(
+        full_text, spans, gaps, separable, processed, lambda text: comprehensive_postprocess(text, domain_data))
+    return {"texts": processed, "transcript": transcript, "offsets": offsets, "merged": merged}
+
+
+def _assemble_segments(full_text: str, spans: List, gaps: List, separable: List[bool], segment_texts: List[str],
+                       process) -> tuple:
+    """
+    그대로 둘 수 있는 간격(separable)은 원문 그대로, 그 사이 구간은 세그먼트 결과(구간이 세그먼트 하나와 같을 때)
+    또는 process(구간 원문)로 이어 붙임
+    반환: (텍스트, 세그먼트별 (start, end), 그대로 둔 간격의 시작 위치, 다시 처리한 구간 수)
+    """
+    count = len(spans)
+    pieces = []
+    offsets = [None] * count
+    gap_positions = [None] * (count + 1)
+    length = 0
+    merged = 0
+    cluster_start, cluster_first = 0, 0
+    
+    def flush(end: int, last: int):
+        nonlocal length, merged
+        if last == cluster_first and (cluster_start, end) == spans[last]:
+            text = segment_texts[last]
+        else:
+            text = process(full_text[cluster_start:end])
+            merged += 1
+        pieces.append(text)
+        for k in range(cluster_first, last + 1):
+            offsets[k] = (length, length + len(text))
+        length += len(text)
+    
+    for k, (start, end) in enumerate(gaps):
+        if not separable[k]:
+            continue  # 간격을 앞뒤 세그먼트와 같은 구간으로 묶음
+        if k > 0:
+            flush(start, k - 1)
+        gap_positions[k] = length
+        pieces.append(full_text[start:end])
+        length += end - start
+        cluster_start, cluster_first = end, k
+    if not separable[count]:
+        flush(len(full_text), count - 1)
+    return "".join(pieces), offsets, gap_positions, merged
 
 
 def extract_datetime_from_filename(filename: str) -> tuple:
@@ -225,62 +387,12 @@ def extract_location(conversation_text: str) -> str:
     if not conversation_text:
         return "정보 없음"
     
-    # 지역명 패턴들
-    location_patterns = [
-        r'인천',
-        r'서울',
-        r'부산',
-        r'대전',
-        r'대구',
-        r'광주',
-        r'울산',
-        r'세종',
-        r'경기',
-        r'강원',
-        r'충북',
-        r'충남',
-        r'전북',
-        r'전남',
-        r'경북',
-        r'경남',
-        r'제주',
-        r'천안',
-        r'아산',
-        r'수원',
-        r'성남',
-        r'고양',
-        r'용인',
-        r'부천',
-        r'화성',
-        r'안산',
-        r'안양',
-        r'평택',
-        r'시흥',
-        r'김포',
-        r'의정부',
-        r'광명',
-        r'하남',
-        r'오산',
-        r'이천',
-        r'안성',
-        r'의왕',
-        r'과천',
-        r'구리',
-        r'남양주',
-        r'파주',
-        r'양주',
-        r'포천',
-        r'연천',
-        r'가평',
-        r'양평'
-    ]
-    
-    for pattern in location_patterns:
-        matches = re.findall(pattern, conversation_text)
-        if matches:
-            location = matches[0].strip()
-            logger.info(f"작업국소 추출: {location}")
-            return location
+    # 지역명 목록 중 가장 앞선 지역명 (LOCATION_TERMS 순서 우선)
+    hit = _location_matcher.first(conversation_text)
+    if hit:
+        location = hit.term.strip()
+        logger.info(f"작업국소 추출: {location}")
+        return location
     
     logger.warning("작업국소를 찾을 수 없습니다")
     return "정보 없음"
@@ -290,58 +402,12 @@ def extract_customer_name(conversation_text: str) -> str:
     if not conversation_text:
         return "정보 없음"
     
-    # 1. 기관명 패턴들 (우선순위 높음)
-    institution_patterns = [
-        r'인천\s*동부선관위',
-        r'동부선관위',
-        r'선관위\s*5C',
-        r'선관위',
-        r'동부선관',
-        r'수자원공사\s*FA망',
-        r'수자원공사',
-        r'한국전력공사',
-        r'한전',
-        r'한국가스공사',
-        r'한국도로공사'
-    ]
-    
-    # 2. 일반 고객사명 패턴들
-    customer_patterns = [
-        r'삼성\s*SDS',
-        r'삼성\s*전자',
-        r'LG\s*\w+',
-        r'KT\s*\w*',
-        r'SKT\s*\w*',
-        r'네이버',
-        r'카카오',
-        r'현대\s*\w+',
-        r'기아\s*\w*',
-        r'포스코',
-        r'대한항공',
-        r'아시아나',
-        r'CJ\s*\w+',
-        r'GS\s*\w+',
-        r'롯데\s*\w+'
-    ]
-    
-    # 3. 시스템명 패턴들
-    system_patterns = [
-        r'해외\s*페콜망',
-        r'FA망',
-        r'백본망',
-        r'전송망',
-        r'통신망'
-    ]
-    
-    # 우선순위에 따라 검색
-    all_patterns = institution_patterns + customer_patterns + system_patterns
-    
-    for pattern in all_patterns:
-        matches = re.findall(pattern, conversation_text, re.IGNORECASE)
-        if matches:
-            customer = matches[0].strip()
-            logger.info(f"고객사/기관명 추출: {customer}")
-            return customer
+    # 우선순위(기관명 → 고객사명 → 시스템명)에 따라 가장 앞선 패턴의 첫 일치
+    hit = _customer_matcher.first(conversation_text)
+    if hit:
+        customer = conversation_text[hit.start:hit.end].strip()
+        logger.info(f"고객사/기관명 추출: {customer}")
+        return customer
     
     logger.warning("고객사/기관명을 찾을 수 없습니다")
     return "정보 없음"
@@ -363,42 +429,43 @@ def analyze_request_context(conversation_text: str, stn_data: dict) -> str:
     if not conversation_text:
         return f"장애유형: {stn_data.get('장애유형', '정보 없음')}, 요청유형: {stn_data.get('요청유형', '정보 없음')}"
     
-    # 상세한 요청사항 분석
+    # 상세한 요청사항 분석 (키워드는 한 번의 순회로 모두 찾아 둠)
+    found = _context_matcher.terms(conversation_text)
     request_details = []
     
     # 1. UPS 관련 요청사항 (세션 100번 특화)
-    if 'UPS' in conversation_text:
-        if '소유권' in conversation_text or '고객 건지' in conversation_text or '저희 건지' in conversation_text:
+    if 'UPS' in found:
+        if '소유권' in found or '고객 건지' in found or '저희 건지' in found:
             request_details.append("UPS 소유권 확인 요청")
-        if '교체' in conversation_text:
+        if '교체' in found:
             request_details.append("UPS 교체 작업 관련")
-        if '설치' in conversation_text:
+        if '설치' in found:
             request_details.append("UPS 설치 관련 문의")
-        if 'KTS가 제공하는' in conversation_text:
+        if 'KTS가 제공하는' in found:
             request_details.append("KTS 제공 UPS 여부 확인")
     
     # 2. 장애 상황 분석
-    if '링크 장애' in conversation_text:
+    if '링크 장애' in found:
         request_details.append("해외 페콜망 링크 장애 발생")
-    if '복구' in conversation_text and '원인 파악' in conversation_text:
+    if '복구' in found and '원인 파악' in found:
         request_details.append("장애 복구 후 원인 파악 요청")
-    if '알람' in conversation_text and '성능' in conversation_text:
+    if '알람' in found and '성능' in found:
         request_details.append("성능 관련 알람 발생")
     
     # 3. 긴급성 및 처리 요청
-    if '긴급하게' in conversation_text and '확인 요청' in conversation_text:
+    if '긴급하게' in found and '확인 요청' in found:
         request_details.append("긴급 확인 및 점검 요청")
-    if '부탁드릴게요' in conversation_text:
+    if '부탁드릴게요' in found:
         request_details.append("기술 지원 요청")
-    if '확인하고 싶어서' in conversation_text:
+    if '확인하고 싶어서' in found:
         request_details.append("상황 확인 요청")
     
     # 4. 구체적인 요청 내용
-    if '회산번호' in conversation_text and '장비명' in conversation_text:
+    if '회산번호' in found and '장비명' in found:
         request_details.append("회선번호 및 장비명 확인 요청")
-    if '서버 IP' in conversation_text:
+    if '서버 IP' in found:
         request_details.append("서버 IP 정보 확인")
-    if '연락 드리겠습니다' in conversation_text:
+    if '연락 드리겠습니다' in found:
         request_details.append("후속 연락 및 조치 예정")
     
     # 5. 시간 및 위치 정보
@@ -407,9 +474,9 @@ def analyze_request_context(conversation_text: str, stn_data: dict) -> str:
     if time_matches:
         request_details.append(f"장애 발생 시간: {time_matches[0]}")
     
-    if '천안 아산' in conversation_text:
+    if '천안 아산' in found:
         request_details.append("천안 아산 지역 장애")
-    if '인천' in conversation_text:
+    if '인천' in found:
         request_details.append("인천 지역 관련")
     
     # 6. 장비 및 네트워크 정보
@@ -418,21 +485,21 @@ def analyze_request_context(conversation_text: str, stn_data: dict) -> str:
     if ip_matches:
         request_details.append(f"대상 서버 IP: {ip_matches[0]}")
     
-    if 'ROADN' in conversation_text or 'ROADM' in conversation_text:
+    if 'ROADN' in found or 'ROADM' in found:
         request_details.append("ROAD 장비 관련 이슈")
     
     # 7. 고객사 및 네트워크 정보
-    if '삼성 SDS' in conversation_text:
+    if '삼성 SDS' in found:
         request_details.append("삼성 SDS 고객사")
-    if '해외 페콜망' in conversation_text:
+    if '해외 페콜망' in found:
         request_details.append("해외 페콜망 관련")
-    if '선관위' in conversation_text:
+    if '선관위' in found:
         request_details.append("선관위 관련")
     
     # 8. 요청자 및 후속 조치
-    if '전역망원지팀' in conversation_text:
+    if '전역망원지팀' in found:
         request_details.append("전역망원지팀 요청")
-    if 'CTA' in conversation_text:
+    if 'CTA' in found:
         request_details.append("CTA 담당자 관련")
     
     # 요청사항 종합 정리
@@ -485,21 +552,10 @@ def convert_to_legacy_erp_format(stn_data: dict, conversation_text: str = "", fi
     # 장비명 추출 (GPT 우선, 실패시 패턴 매칭)
     equipment_name = stn_data.get("장비명", "정보 없음")
     if (equipment_name == "정보 없음" or equipment_name is None) and conversation_text:
-        # STT 텍스트에서 장비명 직접 추출
-        if 'UPS' in conversation_text:
-            equipment_name = "UPS"
-        elif 'ROADM' in conversation_text or 'ROADN' in conversation_text:
-            equipment_name = "ROADM"
-        elif 'MSPP' in conversation_text:
-            equipment_name = "MSPP"
-        elif '스위치' in conversation_text:
-            equipment_name = "스위치"
-        elif '라우터' in conversation_text:
-            equipment_name = "라우터"
-        elif '공유기' in conversation_text:
-            equipment_name = "공유기"
-        elif '모뎀' in conversation_text:
-            equipment_name = "모뎀"
+        # STT 텍스트에서 장비명 직접 추출 (EQUIPMENT_KEYWORDS 순서 우선)
+        hit = _equipment_keyword_matcher.first(conversation_text)
+        if hit:
+            equipment_name = hit.value
     
     return {
         "AS 및 지원": "방문기술지원" if stn_data.get("요청유형") == "RQ-ONS" else "원격기술지원",
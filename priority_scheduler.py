@@ -0,0 +1,201 @@
+"""
+STT 전사 우선순위 스케줄러
+대화형 업로드(interactive), 일괄 처리(bulk), 백그라운드 재처리(background) 요청이 같은 CPU를 두고 경쟁할 때
+클래스별 가중치에 따른 공정 분배(stride scheduling)로 전사 슬롯을 나눠 주고,
+클래스 안에서는 등록 시점에 확인한 오디오 길이 기준 짧은 작업 우선(SJF, 대기 시간 보정 포함)으로 순서를 정하는 모듈
+"""
+
+import os
+import json
+import time
+import wave
+import asyncio
+import logging
+import subprocess
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+from inference_pool import INFERENCE_WORKERS
+
+logger = logging.getLogger(__name__)
+
+# 우선순위 클래스
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BULK = "bulk"
+PRIORITY_BACKGROUND = "background"
+PRIORITY_CLASSES = (PRIORITY_INTERACTIVE, PRIORITY_BULK, PRIORITY_BACKGROUND)
+
+
+def parse_weights(value: str) -> Dict[str, float]:
+    """'interactive=8,bulk=2,background=1' 형식의 클래스별 가중치"""
+    weights = {PRIORITY_INTERACTIVE: 8.0, PRIORITY_BULK: 2.0, PRIORITY_BACKGROUND: 1.0}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        if name.strip() in weights and weight.strip():
+            weights[name.strip()] = max(float(weight), 0.01)
+    return weights
+
+
+# 스케줄러 설정 (config.env 또는 환경변수로 조정)
+SCHED_ENABLED = os.getenv("STT_SCHED_ENABLED", "true").lower() == "true"
+SCHED_SLOTS = int(os.getenv("STT_SCHED_SLOTS", str(INFERENCE_WORKERS)))  # 동시에 전사하는 파일 수
+SCHED_WEIGHTS = parse_weights(os.getenv("STT_SCHED_WEIGHTS", "interactive=8,bulk=2,background=1"))
+SCHED_SJF = os.getenv("STT_SCHED_SJF", "true").lower() == "true"  # 클래스 안에서 짧은 녹음 우선
+SCHED_AGING = float(os.getenv("STT_SCHED_AGING", "1.0"))  # 대기 1초당 오디오 길이를 이만큼(초) 짧게 취급 (긴 녹음 기아 방지)
+
+DEFAULT_DURATION_SEC = 60.0  # 길이를 알 수 없는 파일의 예상 길이
+BYTES_PER_SEC_ESTIMATE = 16000  # ffprobe 실패 시 파일 크기로 길이 추정 (128kbps 압축 기준)
+
+
+def probe_duration(file_path: str) -> Optional[float]:
+    """오디오 길이(초) 조회 (wav는 표준 라이브러리, 그 외는 ffprobe, 실패 시 파일 크기로 추정)"""
+    if file_path.lower().endswith(".wav"):
+        try:
+            with wave.open(file_path, "rb") as wav:
+                return wav.getnframes() / float(wav.getframerate())
+        except (wave.Error, EOFError, OSError, ZeroDivisionError):
+            pass
+    try:
+        output = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "json", file_path],
+            capture_output=True, check=True, timeout=30
+        ).stdout
+        return float(json.loads(output or b"{}")["format"]["duration"])
+    except (OSError, subprocess.SubprocessError, ValueError, KeyError, TypeError):
+        pass
+    try:
+        return os.path.getsize(file_path) / BYTES_PER_SEC_ESTIMATE
+    except OSError:
+        return None
+
+
+class _Ticket:
+    """슬롯 대기 중인 요청 한 건"""
+
+    def __init__(self, priority: str, duration: Optional[float], future: asyncio.Future, enqueued: float):
+        self.priority = priority
+        self.duration = duration if duration is not None else DEFAULT_DURATION_SEC
+        self.future = future
+        self.enqueued = enqueued
+
+
+class PriorityScheduler:
+    """
+    전사 슬롯 스케줄러 (이벤트 루프 안에서만 사용)
+    클래스마다 누적 pass 값을 두고, 슬롯이 비면 대기 요청이 있는 클래스 중 pass가 가장 작은 클래스에 배정한 뒤
+    pass를 (오디오 길이 / 가중치)만큼 늘림 → 부하가 계속되면 클래스별 처리 오디오 시간이 가중치 비율로 분배됨
+    """
+
+    def __init__(self, slots: int = SCHED_SLOTS, weights: Optional[Dict[str, float]] = None,
+                 sjf: bool = SCHED_SJF, aging: float = SCHED_AGING, clock=time.monotonic):
+        self.slots = max(1, slots)
+        self.weights = dict(weights or SCHED_WEIGHTS)
+        self.sjf = sjf
+        self.aging = aging
+        self.clock = clock
+        self._waiting: Dict[str, List[_Ticket]] = {name: [] for name in self.weights}
+        self._pass: Dict[str, float] = {name: 0.0 for name in self.weights}
+        self._virtual_time = 0.0
+        self._running = 0
+        # 통계
+        self._dispatched = {name: 0 for name in self.weights}
+        self._wait_total = {name: 0.0 for name in self.weights}
+        self._wait_max = {name: 0.0 for name in self.weights}
+
+    def _validate(self, priority: str) -> str:
+        if priority not in self.weights:
+            raise ValueError(f"지원하지 않는 우선순위입니다: {priority} (지원: {', '.join(self.weights)})")
+        return priority
+
+    def _pick_ticket(self, tickets: List[_Ticket], now: float) -> _Ticket:
+        if not self.sjf:
+            return tickets[0]
+        # 짧은 녹음 우선, 오래 기다린 요청은 대기 시간만큼 짧게 취급
+        return min(tickets, key=lambda ticket: (ticket.duration - self.aging * (now - ticket.enqueued), ticket.enqueued))
+
+    def _dispatch(self):
+        """빈 슬롯을 가중치 공정 분배 순서로 대기 요청에 배정"""
+        now = self.clock()
+        while self._running < self.slots:
+            candidates = [name for name, tickets in self._waiting.items() if tickets]
+            if not candidates:
+                return
+            name = min(candidates, key=lambda c: (self._pass[c], -self.weights[c]))
+            ticket = self._pick_ticket(self._waiting[name], now)
+            self._waiting[name].remove(ticket)
+            if ticket.future.done():  # 대기 중 취소된 요청
+                continue
+            self._virtual_time = self._pass[name]
+            self._pass[name] += ticket.duration / self.weights[name]
+            self._running += 1
+            waited = now - ticket.enqueued
+            self._dispatched[name] += 1
+            self._wait_total[name] += waited
+            self._wait_max[name] = max(self._wait_max[name], waited)
+            ticket.future.set_result(None)
+
+    async def acquire(self, priority: str = PRIORITY_INTERACTIVE, duration: Optional[float] = None):
+        """전사 슬롯을 받을 때까지 대기"""
+        name = self._validate(priority)
+        if not self._waiting[name]:
+            # 쉬고 있던 클래스가 그동안 쌓인 몫을 한꺼번에 쓰지 않도록 현재 가상 시간부터 시작
+            self._pass[name] = max(self._pass[name], self._virtual_time)
+        future = asyncio.get_running_loop().create_future()
+        ticket = _Ticket(name, duration, future, self.clock())
+        self._waiting[name].append(ticket)
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()  # 슬롯을 받은 직후 취소된 경우
+            elif ticket in self._waiting[name]:
+                # 대기 중 취소/타임아웃된 요청은 대기 목록에서 바로 제거 (대기 수 통계와 SJF 선택에 남지 않도록)
+                self._waiting[name].remove(ticket)
+            raise
+
+    def release(self):
+        """전사 슬롯 반납 후 다음 대기 요청 배정"""
+        self._running = max(0, self._running - 1)
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, priority: str = PRIORITY_INTERACTIVE, duration: Optional[float] = None):
+        """async with scheduler.slot(priority, duration): 전사 실행"""
+        await self.acquire(priority, duration)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def get_stats(self) -> Dict:
+        return {
+            "slots": self.slots,
+            "running": self._running,
+            "sjf": self.sjf,
+            "classes": {
+                name: {
+                    "weight": self.weights[name],
+                    "waiting": len(self._waiting[name]),
+                    "dispatched": self._dispatched[name],
+                    "avg_wait_sec": round(self._wait_total[name] / self._dispatched[name], 3)
+                    if self._dispatched[name] else 0.0,
+                    "max_wait_sec": round(self._wait_max[name], 3),
+                }
+                for name in self.weights
+            },
+        }
+
+
+# 전역 스케줄러 인스턴스
+_priority_scheduler: Optional[PriorityScheduler] = None
+
+def get_priority_scheduler() -> PriorityScheduler:
+    """우선순위 스케줄러 싱글톤 인스턴스를 반환합니다"""
+    global _priority_scheduler
+
+    if _priority_scheduler is None:
+        _priority_scheduler = PriorityScheduler()
+        logger.info(f"✅ 전사 우선순위 스케줄러 시작 - 슬롯: {_priority_scheduler.slots}개, 가중치: {_priority_scheduler.weights}")
+
+    return _priority_scheduler
@@ -0,0 +1,135 @@
+"""
+전사 전 무음 제거
+디코딩된 오디오에서 긴 무음 구간을 잘라 음성 구간만 이어 붙여 모델 입력 길이를 줄이고,
+오프셋 맵으로 전사 결과의 start/end(단어 타임스탬프 포함)를 원본 파일 시간으로 되돌리는 모듈
+"""
+
+import os
+import bisect
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from audio_chunking import find_silences, SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+# 무음 제거 설정 (config.env 또는 환경변수로 조정)
+STRIP_MIN_SILENCE_SEC = float(os.getenv("STT_STRIP_MIN_SILENCE_SEC", "1.0"))  # 이 길이 이상인 무음만 잘라냄
+STRIP_KEEP_SEC = float(os.getenv("STT_STRIP_KEEP_SEC", "0.3"))  # 잘라낸 자리에 남길 무음 길이 (발화 경계/말끝 보존)
+STRIP_MIN_RATIO = float(os.getenv("STT_STRIP_MIN_RATIO", "0.05"))  # 제거 비율이 이 미만이면 원본 그대로 전사
+
+
+class OffsetMap:
+    """
+    무음 제거 오디오 시간 → 원본 시간 변환표
+    pieces: [(제거 후 시작 초, 원본 시작 초, 길이 초)] (제거 후 시작 시간 순)
+    """
+
+    def __init__(self, pieces: List[Tuple[float, float, float]]):
+        self.pieces = pieces
+        self._starts = [piece[0] for piece in pieces]
+
+    def to_original(self, t: float, is_end: bool = False) -> float:
+        """
+        제거 후 시간 t를 원본 시간으로 변환
+        조각 경계에 정확히 걸린 끝 시간(is_end)은 다음 조각 시작이 아니라 앞 조각 끝으로 변환
+        """
+        if not self.pieces:
+            return t
+        if is_end:
+            index = max(bisect.bisect_left(self._starts, t) - 1, 0)
+        else:
+            index = max(bisect.bisect_right(self._starts, t) - 1, 0)
+        stripped_start, original_start, length = self.pieces[index]
+        return original_start + min(max(t - stripped_start, 0.0), length)
+
+    @property
+    def stripped_sec(self) -> float:
+        if not self.pieces:
+            return 0.0
+        return self.pieces[-1][0] + self.pieces[-1][2]
+
+
+def plan_speech_pieces(audio: np.ndarray, sample_rate: int = SAMPLE_RATE,
+                       min_silence_sec: float = STRIP_MIN_SILENCE_SEC,
+                       keep_sec: float = STRIP_KEEP_SEC) -> List[Tuple[int, int]]:
+    """남길 구간 목록 [(시작 샘플, 끝 샘플)] - 긴 무음은 가운데를 잘라내고 앞뒤로 keep_sec / 2씩 남김"""
+    keep = int(keep_sec * sample_rate / 2)
+    pieces = []
+    position = 0
+    for silence_start, silence_end in find_silences(audio, sample_rate, min_silence_ms=int(min_silence_sec * 1000)):
+        cut_start = silence_start + keep if silence_start > 0 else 0
+        cut_end = silence_end - keep if silence_end < len(audio) else len(audio)
+        if cut_end <= cut_start:
+            continue
+        if cut_start > position:
+            pieces.append((position, cut_start))
+        position = cut_end
+    if position < len(audio):
+        pieces.append((position, len(audio)))
+    return pieces
+
+
+def strip_silence(audio: np.ndarray, sample_rate: int = SAMPLE_RATE,
+                  min_ratio: float = STRIP_MIN_RATIO) -> Optional[Tuple[np.ndarray, OffsetMap]]:
+    """
+    긴 무음을 제거한 오디오와 오프셋 맵 반환
+    제거할 무음이 전체의 min_ratio 미만이거나 음성이 없으면 None (원본 그대로 전사)
+    """
+    pieces = plan_speech_pieces(audio, sample_rate)
+    kept = sum(end - start for start, end in pieces)
+    if not pieces or len(audio) == 0 or 1.0 - kept / len(audio) < min_ratio:
+        return None
+
+    offsets = []
+    position = 0
+    for start, end in pieces:
+        offsets.append((position / sample_rate, start / sample_rate, (end - start) / sample_rate))
+        position += end - start
+    stripped = np.concatenate([audio[start:end] for start, end in pieces])
+    return stripped, OffsetMap(offsets)
+
+
+def remap_segments(segments: List[Dict], offset_map: OffsetMap) -> List[Dict]:
+    """세그먼트(및 단어) 시간을 원본 파일 기준으로 변환한 새 목록"""
+    remapped = []
+    for segment in segments:
+        updated = {
+            **segment,
+            "start": round(offset_map.to_original(segment["start"]), 3),
+            "end": round(offset_map.to_original(segment["end"], is_end=True), 3),
+        }
+        if segment.get("words"):
+            updated["words"] = [
+                {**word,
+                 "start": round(offset_map.to_original(word["start"]), 3),
+                 "end": round(offset_map.to_original(word["end"], is_end=True), 3)}
+                for word in segment["words"]
+            ]
+        remapped.append(updated)
+    return remapped
+
+
+def remap_result(result: Dict, offset_map: OffsetMap, original_sec: float) -> Dict:
+    """전사 결과의 시간을 원본 기준으로 되돌리고 무음 제거 통계 추가"""
+    stripped_sec = offset_map.stripped_sec
+    return {
+        **result,
+        "segments": remap_segments(result.get("segments", []), offset_map),
+        "silence_strip": {
+            "original_sec": round(original_sec, 2),
+            "stripped_sec": round(stripped_sec, 2),
+            "removed_sec": round(original_sec - stripped_sec, 2),
+            "pieces": len(offset_map.pieces),
+        },
+    }
+
+
+def remapping_emitter(emit: Optional[Callable[[List[Dict]], None]],
+                      offset_map: OffsetMap) -> Optional[Callable[[List[Dict]], None]]:
+    """스트리밍 세그먼트 콜백도 원본 시간으로 전달하도록 감싸기"""
+    if emit is None:
+        return None
+    return lambda segments: emit(remap_segments(segments, offset_map))
@@ -0,0 +1,67 @@
+"""
+화자 구간 → 전사 세그먼트 화자 할당
+화자 구간(turn)과 Whisper 세그먼트를 각각 한 번씩 시작 시간으로 정렬한 뒤,
+한 번의 선형 스윕(sweep-line)으로 세그먼트마다 가장 많이 겹치는 화자를 찾는 모듈
+(Streamlit 앱의 pyannote 결과와 API 파이프라인의 NumPy 화자 분리 결과에 공통 사용)
+"""
+
+from typing import Dict, List, Optional
+
+
+def turns_from_annotation(annotation) -> List[Dict]:
+    """pyannote Annotation을 화자 구간 목록 [{start, end, speaker}]으로 변환 (itertracks는 한 번만 순회)"""
+    return [
+        {"start": float(turn.start), "end": float(turn.end), "speaker": speaker}
+        for turn, _, speaker in annotation.itertracks(yield_label=True)
+    ]
+
+
+def assign_speakers(segments: List[Dict], turns: List[Dict], default: Optional[str] = None) -> List[Dict]:
+    """
+    세그먼트마다 겹치는 시간이 가장 긴 화자를 부여한 새 세그먼트 목록 반환 (입력 순서 유지, 원본은 변경하지 않음)
+    겹치는 구간이 없으면 default 라벨, default가 None이면 시간상 가장 가까운 화자 구간의 화자
+    정렬 O((n + m) log(n + m)) + 스윕 O(n + m + 겹침 수)
+    """
+    if not turns:
+        return [dict(segment) if default is None else {**segment, "speaker": default} for segment in segments]
+
+    ordered_turns = sorted(turns, key=lambda turn: (turn["start"], turn["end"]))
+    order = sorted(range(len(segments)), key=lambda index: (segments[index]["start"], segments[index]["end"]))
+    speakers: List[Optional[str]] = [None] * len(segments)
+
+    active: List[Dict] = []  # 현재 세그먼트 시작 이후에 끝나는, 이미 시작한 화자 구간 (시작 시간 순)
+    previous: Optional[Dict] = None  # 현재 세그먼트 시작 전에 끝난 구간 중 가장 늦게 끝난 구간
+    next_turn = 0
+    for index in order:
+        start, end = segments[index]["start"], segments[index]["end"]
+        while next_turn < len(ordered_turns) and ordered_turns[next_turn]["start"] < end:
+            active.append(ordered_turns[next_turn])
+            next_turn += 1
+        # 세그먼트는 시작 시간 순이므로 이미 끝난 구간은 이후 세그먼트와도 겹치지 않음
+        still_active = []
+        for turn in active:
+            if turn["end"] > start:
+                still_active.append(turn)
+            elif previous is None or turn["end"] >= previous["end"]:
+                previous = turn
+        active = still_active
+
+        overlaps: Dict[str, float] = {}
+        for turn in active:
+            overlap = min(end, turn["end"]) - max(start, turn["start"])
+            if overlap > 0:
+                overlaps[turn["speaker"]] = overlaps.get(turn["speaker"], 0.0) + overlap
+        if overlaps:
+            speakers[index] = max(overlaps, key=overlaps.get)
+        elif default is not None:
+            speakers[index] = default
+        else:
+            center = (start + end) / 2
+            candidates = active + [previous] + ordered_turns[next_turn:next_turn + 1]
+            nearest = min(
+                (turn for turn in candidates if turn is not None),
+                key=lambda turn: min(abs(center - turn["start"]), abs(center - turn["end"]))
+            )
+            speakers[index] = nearest["speaker"]
+
+    return [{**segment, "speaker": speaker} for segment, speaker in zip(segments, speakers)]
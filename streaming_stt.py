@@ -0,0 +1,64 @@
+"""
+STT 진행 상황 스트리밍
+녹음을 30초 윈도우 단위로 전사하면서 디코딩된 세그먼트를 즉시 콜백으로 전달하고,
+파이프라인 이벤트를 Server-Sent Events(SSE) 형식으로 변환하는 모듈
+"""
+
+import json
+import logging
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from audio_chunking import SAMPLE_RATE, stitch_segments
+from batch_transcriber import plan_windows
+
+logger = logging.getLogger(__name__)
+
+# 이전 윈도우 문맥으로 넘길 최대 글자 수 (initial_prompt)
+PROMPT_CONTEXT_CHARS = 200
+
+
+def transcribe_windows(model, audio: np.ndarray,
+                       on_segments: Optional[Callable[[List[Dict]], None]] = None,
+                       condition_on_previous_text: bool = True, **options) -> Dict:
+    """
+    오디오를 무음 경계 기준 30초 윈도우로 나누어 순서대로 전사하고, 윈도우가 끝날 때마다
+    원본 시간축으로 보정된 세그먼트를 on_segments로 전달
+    condition_on_previous_text=True이면 직전 윈도우 텍스트를 initial_prompt로 넘겨 문맥 유지
+    """
+    window_results = []
+    offsets = []
+    previous_text = ""
+    for start, end in plan_windows(audio):
+        window_options = dict(options)
+        if condition_on_previous_text and previous_text:
+            window_options["initial_prompt"] = previous_text[-PROMPT_CONTEXT_CHARS:]
+        result = model.transcribe(np.array(audio[start:end]), **window_options)
+
+        offset = start / SAMPLE_RATE
+        window_results.append(result)
+        offsets.append(offset)
+        previous_text = (previous_text + result.get("text", "")).strip()
+
+        if on_segments is not None:
+            partial = stitch_segments([result], [offset])["segments"]
+            if partial:
+                try:
+                    on_segments(partial)
+                except Exception as e:
+                    logger.warning(f"세그먼트 스트리밍 콜백 실패: {e}")
+
+    return stitch_segments(window_results, offsets)
+
+
+def transcribe_windows_on_worker(model, audio: np.ndarray, **options) -> Dict:
+    """워커 스레드 전용 복제본으로 윈도우 단위 전사 실행 (InferencePool.run 대상 함수)"""
+    from inference_pool import get_worker_replica
+    return transcribe_windows(get_worker_replica(model), audio, **options)
+
+
+def format_sse(event: str, data) -> str:
+    """SSE 메시지 문자열 생성"""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
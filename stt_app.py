@@ -12,6 +12,10 @@ import torch
 import torchaudio
 import numpy as np
 from dotenv import load_dotenv
+from upload_stream import save_fileobj_stream
+from pcm_cache import load_pcm, SAMPLE_RATE as PCM_SAMPLE_RATE
+from stt_backends import get_stt_backend
+from speaker_assignment import assign_speakers, turns_from_annotation
 
 # 환경변수 자동 로드
 load_dotenv('config.env')
@@ -290,32 +294,8 @@ def load_pyannote_pipeline(hf_token=None):
         return None, None
 
 def assign_speakers_to_segments(whisper_segments, diarization_result):
-    """Whisper 세그먼트에 발화자 정보 할당"""
-    for segment in whisper_segments:
-        start_time = segment['start']
-        end_time = segment['end']
-        
-        # 해당 시간대의 발화자 찾기
-        speakers_in_segment = {}
-        
-        for turn, _, speaker in diarization_result.itertracks(yield_label=True):
-            if turn.start < end_time and turn.end > start_time:
-                # 겹치는 부분의 길이 계산
-                overlap_start = max(turn.start, start_time)
-                overlap_end = min(turn.end, end_time)
-                overlap_duration = overlap_end - overlap_start
-                
-                if overlap_duration > 0:
-                    speakers_in_segment[speaker] = speakers_in_segment.get(speaker, 0) + overlap_duration
-        
-        # 가장 많이 겹치는 발화자 할당
-        if speakers_in_segment:
-            dominant_speaker = max(speakers_in_segment, key=speakers_in_segment.get)
-            segment['speaker'] = dominant_speaker
-        else:
-            segment['speaker'] = 'UNKNOWN'
-    
-    return whisper_segments
+    """Whisper 세그먼트에 발화자 정보 할당 (선형 스윕, 겹치는 발화자가 없으면 UNKNOWN)"""
+    return assign_speakers(whisper_segments, turns_from_annotation(diarization_result), default='UNKNOWN')
 
 # 메인 컨텐츠
 col1, col2 = st.columns([1, 1])
@@ -353,22 +333,25 @@ with col2:
             
             try:
                 # 임시 파일로 저장
+                # (getvalue()로 전체 복사본을 만들지 않고 청크 단위로 기록)
                 with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-                    tmp_file.write(uploaded_file.getvalue())
                     tmp_file_path = tmp_file.name
+                _, tmp_file_hash = save_fileobj_stream(uploaded_file, tmp_file_path)
                 
                 status_text.text("🔄 Whisper 모델 로딩 중...")
                 progress_bar.progress(20)
                 
-                # Whisper 모델 로드
-                model = whisper.load_model(selected_model)
+                # STT 모델 로드 (STT_BACKEND 설정에 따라 openai-whisper 또는 faster-whisper)
+                model = get_stt_backend().load(selected_model)
                 
                 status_text.text("🎙️ 음성 변환 중...")
                 progress_bar.progress(40)
                 
                 # 음성 인식 실행
                 language_param = None if selected_language == "auto" else selected_language
-                result = model.transcribe(tmp_file_path, language=language_param)
+                # 한 번 디코딩한 16kHz PCM을 Whisper와 pyannote가 함께 사용 (FFmpeg 재실행 방지)
+                audio_pcm = load_pcm(tmp_file_path, tmp_file_hash)
+                result = model.transcribe(audio_pcm, language=language_param)
                 
                 progress_bar.progress(60)
                 
@@ -404,10 +387,14 @@ with col2:
                             try:
                                 status_text.text("🤖 AI 모델로 발화자 구분 중...")
                                 
+                                audio_input = {
+                                    "waveform": torch.from_numpy(np.array(audio_pcm)).unsqueeze(0),
+                                    "sample_rate": PCM_SAMPLE_RATE
+                                }
                                 if num_speakers:
-                                    diarization_result = pipeline(tmp_file_path, num_speakers=num_speakers)
+                                    diarization_result = pipeline(audio_input, num_speakers=num_speakers)
                                 else:
-                                    diarization_result = pipeline(tmp_file_path)
+                                    diarization_result = pipeline(audio_input)
                                 
                                 # 발화자 정보를 Whisper 세그먼트에 할당
                                 result["segments"] = assign_speakers_to_segments(result["segments"], diarization_result)
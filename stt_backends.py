@@ -0,0 +1,165 @@
+"""
+STT 엔진 백엔드
+openai-whisper와 CTranslate2 기반 faster-whisper를 같은 인터페이스로 감싸는 모듈
+백엔드가 돌려주는 모델 객체는 모두 model.transcribe(audio, **options)가 openai-whisper와 같은
+{text, segments, language} 형태를 반환하므로 추론 풀/분할 전사/ERP 파이프라인은 엔진과 무관하게 동작
+"""
+
+import os
+import logging
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# STT 엔진 설정 (config.env 또는 환경변수로 조정)
+STT_BACKEND = os.getenv("STT_BACKEND", "whisper").strip().lower()  # whisper | faster-whisper
+FASTER_WHISPER_DEVICE = os.getenv("FASTER_WHISPER_DEVICE", "cpu")
+FASTER_WHISPER_COMPUTE_TYPE = os.getenv("FASTER_WHISPER_COMPUTE_TYPE", "int8")
+FASTER_WHISPER_CPU_THREADS = int(os.getenv("FASTER_WHISPER_CPU_THREADS", "0"))  # 0이면 CTranslate2 기본값
+
+# faster-whisper 모델 사용 가능 여부 (선택적)
+try:
+    import faster_whisper
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    faster_whisper = None
+    FASTER_WHISPER_AVAILABLE = False
+
+# openai-whisper 전용 옵션 (faster-whisper에는 전달하지 않음)
+_WHISPER_ONLY_OPTIONS = {"verbose", "fp16"}
+# openai-whisper → faster-whisper 옵션 이름 변환
+_OPTION_RENAMES = {"logprob_threshold": "log_prob_threshold"}
+
+
+def to_faster_whisper_options(options: Dict) -> Dict:
+    """openai-whisper transcribe 옵션을 faster-whisper 옵션으로 변환"""
+    converted = {}
+    for key, value in options.items():
+        if key in _WHISPER_ONLY_OPTIONS:
+            continue
+        converted[_OPTION_RENAMES.get(key, key)] = value
+    # openai-whisper는 beam_size=None이 greedy 디코딩, faster-whisper 기본값은 5
+    if converted.get("beam_size") is None:
+        converted["beam_size"] = 1
+    return converted
+
+
+def segments_to_result(segments: Iterable, language: Optional[str]) -> Dict:
+    """faster-whisper Segment 목록을 openai-whisper 결과 dict로 변환"""
+    converted = []
+    for index, segment in enumerate(segments):
+        item = {
+            "id": index,
+            "seek": getattr(segment, "seek", 0),
+            "start": round(segment.start, 3),
+            "end": round(segment.end, 3),
+            "text": segment.text,
+            "tokens": list(getattr(segment, "tokens", []) or []),
+            "temperature": getattr(segment, "temperature", 0.0),
+            "avg_logprob": getattr(segment, "avg_logprob", 0.0),
+            "compression_ratio": getattr(segment, "compression_ratio", 0.0),
+            "no_speech_prob": getattr(segment, "no_speech_prob", 0.0),
+        }
+        words = getattr(segment, "words", None)
+        if words:
+            item["words"] = [
+                {"word": word.word, "start": word.start, "end": word.end, "probability": word.probability}
+                for word in words
+            ]
+        converted.append(item)
+    return {
+        "text": "".join(segment["text"] for segment in converted),
+        "segments": converted,
+        "language": language,
+    }
+
+
+class FasterWhisperModel:
+    """
+    CTranslate2 faster-whisper 모델 어댑터
+    CTranslate2 모델은 num_workers 만큼 여러 스레드에서 동시에 호출할 수 있으므로
+    워커별 복제본을 만들지 않고 같은 인스턴스를 공유 (deepcopy 시 자기 자신 반환)
+    """
+
+    backend = "faster-whisper"
+    supports_batch = False  # log-mel 일괄 디코딩(batch_transcriber)은 openai-whisper 전용
+
+    def __init__(self, model, model_name: str, estimated_size_bytes: int = 0):
+        self.model = model
+        self.model_name = model_name
+        self.estimated_size_bytes = estimated_size_bytes
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def transcribe(self, audio, **options) -> Dict:
+        segments, info = self.model.transcribe(audio, **to_faster_whisper_options(options))
+        # segments는 generator이므로 여기서 끝까지 디코딩
+        return segments_to_result(list(segments), getattr(info, "language", options.get("language")))
+
+
+class WhisperBackend:
+    """openai-whisper 백엔드 (기본값, -int8 모델은 CPU int8 동적 양자화)"""
+
+    name = "whisper"
+
+    def load(self, model_name: str):
+        from model_registry import load_whisper_model
+        return load_whisper_model(model_name)
+
+
+class FasterWhisperBackend:
+    """CTranslate2 기반 faster-whisper 백엔드 (CPU int8 연산 기본)"""
+
+    name = "faster-whisper"
+
+    def __init__(self, device: str = FASTER_WHISPER_DEVICE, compute_type: str = FASTER_WHISPER_COMPUTE_TYPE,
+                 cpu_threads: int = FASTER_WHISPER_CPU_THREADS):
+        self.device = device
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+
+    def load(self, model_name: str) -> FasterWhisperModel:
+        if not FASTER_WHISPER_AVAILABLE:
+            raise RuntimeError("faster-whisper가 설치되지 않았습니다. 설치하려면: pip install faster-whisper")
+
+        from faster_whisper.utils import download_model
+        from model_registry import parse_model_name
+        from inference_pool import INFERENCE_WORKERS
+
+        # -int8 접미사는 openai-whisper 양자화 모델 이름이므로 같은 크기의 CTranslate2 모델로 매핑
+        base_name, _ = parse_model_name(model_name)
+        model_path = download_model(base_name)
+        model = faster_whisper.WhisperModel(
+            model_path,
+            device=self.device,
+            compute_type=self.compute_type,
+            cpu_threads=self.cpu_threads,
+            num_workers=max(1, INFERENCE_WORKERS),
+        )
+        size_bytes = sum(
+            os.path.getsize(os.path.join(root, name))
+            for root, _, names in os.walk(model_path) for name in names
+        )
+        logger.info(f"⚡ faster-whisper 모델 로딩 - {base_name} (device={self.device}, compute_type={self.compute_type})")
+        return FasterWhisperModel(model, model_name, size_bytes)
+
+
+STT_BACKENDS = {
+    WhisperBackend.name: WhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend,
+}
+
+# 백엔드 인스턴스 캐시
+_backends: Dict[str, object] = {}
+
+def get_stt_backend(name: Optional[str] = None):
+    """이름(없으면 STT_BACKEND 설정)에 해당하는 STT 백엔드 인스턴스를 반환합니다"""
+    name = (name or STT_BACKEND).strip().lower()
+    if name not in STT_BACKENDS:
+        raise ValueError(f"지원하지 않는 STT 백엔드입니다: {name} (사용 가능: {list(STT_BACKENDS)})")
+
+    if name not in _backends:
+        _backends[name] = STT_BACKENDS[name]()
+
+    return _backends[name]
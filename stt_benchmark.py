@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+STT 엔진 비교 벤치마크
+같은 녹음 파일들을 openai-whisper / faster-whisper 백엔드로 각각 전사하여
+모델 로딩 시간, 전사 시간, 실시간 배율(RTF), 엔진 간 텍스트 일치율을 비교
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import difflib
+from datetime import datetime
+
+from stt_backends import get_stt_backend, STT_BACKENDS
+from pcm_cache import load_pcm, SAMPLE_RATE
+
+
+def text_similarity(a: str, b: str) -> float:
+    """공백을 제거한 문자 단위 유사도 (0~1)"""
+    return difflib.SequenceMatcher(None, "".join(a.split()), "".join(b.split())).ratio()
+
+
+def run_backend(backend_name, model_name, audios, language, options):
+    """한 백엔드로 모든 파일을 전사하고 파일별 시간/결과를 반환"""
+    backend = get_stt_backend(backend_name)
+
+    print(f"🔄 [{backend_name}] {model_name} 모델 로딩 중...")
+    start = time.perf_counter()
+    model = backend.load(model_name)
+    load_seconds = time.perf_counter() - start
+
+    files = []
+    for audio_file, audio in audios.items():
+        duration = len(audio) / SAMPLE_RATE
+        start = time.perf_counter()
+        result = model.transcribe(audio, language=language, **options)
+        elapsed = time.perf_counter() - start
+        files.append({
+            "file": audio_file,
+            "duration": round(duration, 2),
+            "seconds": round(elapsed, 2),
+            "rtf": round(elapsed / duration, 3) if duration else None,
+            "segments": len(result.get("segments", [])),
+            "text": result.get("text", "").strip(),
+        })
+        print(f"   - {os.path.basename(audio_file)}: {elapsed:.2f}초 (RTF {files[-1]['rtf']})")
+
+    total_audio = sum(item["duration"] for item in files)
+    total_seconds = sum(item["seconds"] for item in files)
+    return {
+        "backend": backend_name,
+        "model": model_name,
+        "load_seconds": round(load_seconds, 2),
+        "transcribe_seconds": round(total_seconds, 2),
+        "rtf": round(total_seconds / total_audio, 3) if total_audio else None,
+        "files": files,
+    }
+
+
+def print_summary(reports):
+    print("\n" + "=" * 70)
+    print(f"{'백엔드':<16}{'모델':<12}{'로딩(초)':>10}{'전사(초)':>10}{'RTF':>8}{'배속':>8}")
+    print("-" * 70)
+    baseline = reports[0]["transcribe_seconds"] if reports else None
+    for report in reports:
+        speedup = baseline / report["transcribe_seconds"] if baseline and report["transcribe_seconds"] else 0
+        print(f"{report['backend']:<16}{report['model']:<12}{report['load_seconds']:>10}"
+              f"{report['transcribe_seconds']:>10}{report['rtf']:>8}{speedup:>7.2f}x")
+
+    # 첫 번째 백엔드 기준 텍스트 일치율
+    if len(reports) > 1:
+        print("-" * 70)
+        base_files = reports[0]["files"]
+        for report in reports[1:]:
+            ratios = [
+                text_similarity(base["text"], other["text"])
+                for base, other in zip(base_files, report["files"])
+            ]
+            average = sum(ratios) / len(ratios) if ratios else 0
+            print(f"📝 {reports[0]['backend']} 대비 {report['backend']} 텍스트 일치율: {average:.1%}")
+    print("=" * 70)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="STT 엔진 비교 벤치마크 (openai-whisper vs faster-whisper)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python stt_benchmark.py src_record/2025-07-16/call1.mp3 src_record/2025-07-16/call2.mp3
+  python stt_benchmark.py call.wav --model medium --backends whisper faster-whisper --output bench.json
+        """
+    )
+    parser.add_argument("audio_files", nargs="+", help="비교할 오디오 파일 경로")
+    parser.add_argument("--model", "-m", default="base", help="모델 이름 (기본값: base)")
+    parser.add_argument("--backends", nargs="+", choices=list(STT_BACKENDS), default=list(STT_BACKENDS),
+                        help="비교할 백엔드 (첫 번째가 기준)")
+    parser.add_argument("--language", "-l", default="ko", help="언어 코드 (기본값: ko)")
+    parser.add_argument("--beam-size", type=int, default=1, help="빔 크기 (기본값: 1, 서버 설정과 동일)")
+    parser.add_argument("--output", "-o", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    for audio_file in args.audio_files:
+        if not os.path.exists(audio_file):
+            print(f"❌ 파일을 찾을 수 없습니다: {audio_file}")
+            return 1
+
+    # 디코딩 시간은 비교에서 제외하도록 PCM을 미리 준비 (두 엔진이 같은 배열을 사용)
+    print("🎵 오디오 디코딩 중...")
+    audios = {audio_file: load_pcm(audio_file) for audio_file in args.audio_files}
+    options = {"beam_size": args.beam_size, "condition_on_previous_text": False, "verbose": None}
+
+    reports = []
+    for backend_name in args.backends:
+        try:
+            reports.append(run_backend(backend_name, args.model, audios, args.language, options))
+        except Exception as e:
+            print(f"❌ [{backend_name}] 실행 실패: {e}")
+
+    print_summary(reports)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"created_at": datetime.now().isoformat(), "reports": reports}, f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장됨: {args.output}")
+
+    return 0 if reports else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,7 +10,7 @@ import os
 import json
 from datetime import datetime
 
-def convert_audio_to_text(audio_file, model_name="base", language=None, output_format="text"):
+def convert_audio_to_text(audio_file, model_name="base", language=None, output_format="text", backend=None):
     """
     오디오 파일을 텍스트로 변환하는 함수
     
@@ -19,13 +19,16 @@ def convert_audio_to_text(audio_file, model_name="base", language=None, output_f
         model_name (str): Whisper 모델 이름
         language (str): 언어 코드 (None이면 자동 감지)
         output_format (str): 출력 형식 ("text", "json", "both")
+        backend (str): STT 엔진 ("whisper", "faster-whisper", None이면 STT_BACKEND 설정)
     
     Returns:
         dict: 변환 결과
     """
+    from stt_backends import get_stt_backend
+    stt_backend = get_stt_backend(backend)
     
     print(f"🎙️  음성 파일 처리 중: {audio_file}")
-    print(f"📋 모델: {model_name}")
+    print(f"📋 모델: {model_name} ({stt_backend.name})")
     print(f"🌍 언어: {language if language else '자동 감지'}")
     print("-" * 50)
     
@@ -34,8 +37,8 @@ def convert_audio_to_text(audio_file, model_name="base", language=None, output_f
         raise FileNotFoundError(f"파일을 찾을 수 없습니다: {audio_file}")
     
     # 모델 로드
-    print("🔄 Whisper 모델 로딩 중...")
-    model = whisper.load_model(model_name)
+    print("🔄 STT 모델 로딩 중...")
+    model = stt_backend.load(model_name)
     
     # 음성 인식 실행
     print("🎯 음성 인식 실행 중...")
@@ -46,6 +49,45 @@ def convert_audio_to_text(audio_file, model_name="base", language=None, output_f
     
     return result
 
+def convert_audio_batch(audio_files, model_name="base", language=None, batch_size=16):
+    """
+    짧은 오디오 파일 여러 개를 일괄(batch) 전사하는 함수
+    
+    Args:
+        audio_files (list): 오디오 파일 경로 목록
+        model_name (str): Whisper 모델 이름
+        language (str): 언어 코드 (None이면 자동 감지)
+        batch_size (int): 한 번에 디코딩할 30초 윈도우 수
+    
+    Returns:
+        list: 파일별 변환 결과 (model.transcribe()와 같은 형태)
+    """
+    from batch_transcriber import transcribe_batch
+    
+    print(f"📦 일괄 처리 파일 수: {len(audio_files)}")
+    print(f"📋 모델: {model_name}")
+    print(f"🌍 언어: {language if language else '자동 감지'}")
+    print("-" * 50)
+    
+    for audio_file in audio_files:
+        if not os.path.exists(audio_file):
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {audio_file}")
+    
+    print("🔄 Whisper 모델 로딩 중...")
+    from model_registry import load_whisper_model
+    model = load_whisper_model(model_name)
+    
+    print("🎵 오디오 디코딩 중...")
+    audios = [whisper.load_audio(audio_file) for audio_file in audio_files]
+    
+    print("🎯 일괄 음성 인식 실행 중...")
+    results = transcribe_batch(model, audios, language=language, batch_size=batch_size)
+    
+    print("✅ 변환 완료!")
+    print("-" * 50)
+    
+    return results
+
 def save_results(result, audio_file, output_format):
     """
     결과를 파일로 저장하는 함수
@@ -112,16 +154,23 @@ def main():
   python stt_cli.py audio.mp3
   python stt_cli.py audio.wav --model medium --language ko
   python stt_cli.py audio.m4a --output json --save
+  python stt_cli.py call1.mp3 call2.mp3 call3.mp3 --batch --language ko
         """
     )
     
-    parser.add_argument("audio_file", help="변환할 오디오 파일 경로")
+    parser.add_argument("audio_files", nargs="+", help="변환할 오디오 파일 경로 (여러 개 지정 가능)")
     
     parser.add_argument("--model", "-m", 
-                       choices=["tiny", "base", "small", "medium", "large"],
+                       choices=["tiny", "base", "small", "medium", "large",
+                                "small-int8", "medium-int8", "large-int8"],
                        default="base",
                        help="Whisper 모델 선택 (기본값: base)")
     
+    parser.add_argument("--backend",
+                       choices=["whisper", "faster-whisper"],
+                       default=None,
+                       help="STT 엔진 선택 (기본값: STT_BACKEND 환경변수, 없으면 whisper)")
+    
     parser.add_argument("--language", "-l",
                        help="언어 코드 (예: ko, en, ja). 미지정시 자동 감지")
     
@@ -138,26 +187,47 @@ def main():
                        action="store_true",
                        help="텍스트 결과만 출력 (조용한 모드)")
     
+    parser.add_argument("--batch", "-b",
+                       action="store_true",
+                       help="짧은 통화 파일들을 일괄(batch) 전사")
+    
+    parser.add_argument("--batch-size",
+                       type=int,
+                       default=16,
+                       help="일괄 전사 시 한 번에 디코딩할 30초 윈도우 수 (기본값: 16)")
+    
     args = parser.parse_args()
     
     try:
         # 음성 변환 실행
-        result = convert_audio_to_text(
-            args.audio_file, 
-            args.model, 
-            args.language, 
-            args.output
-        )
-        
-        # 결과 출력
-        if args.quiet:
-            print(result["text"])
+        if args.batch and args.backend not in (None, "whisper"):
+            print("❌ --batch는 whisper 엔진에서만 지원됩니다")
+            return 1
+        if args.batch:
+            results = convert_audio_batch(
+                args.audio_files,
+                args.model,
+                args.language,
+                args.batch_size
+            )
         else:
-            display_results(result)
+            results = [
+                convert_audio_to_text(audio_file, args.model, args.language, args.output, args.backend)
+                for audio_file in args.audio_files
+            ]
         
-        # 파일 저장
-        if args.save:
-            save_results(result, args.audio_file, args.output)
+        for audio_file, result in zip(args.audio_files, results):
+            # 결과 출력
+            if args.quiet:
+                print(result["text"])
+            else:
+                if len(args.audio_files) > 1:
+                    print(f"\n🎧 {audio_file}")
+                display_results(result)
+            
+            # 파일 저장
+            if args.save:
+                save_results(result, audio_file, args.output)
             
     except Exception as e:
         print(f"❌ 오류가 발생했습니다: {str(e)}")
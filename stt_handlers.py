@@ -4,19 +4,40 @@ STT 처리 관련 핸들러
 """
 
 from fastapi import APIRouter, HTTPException, UploadFile, File, Depends
-from typing import Optional, Dict, List
+from fastapi.responses import StreamingResponse
+from typing import Callable, Optional, Dict, List, Tuple
 import uuid
 import os
-import tempfile
-import whisper
+import asyncio
 from datetime import datetime
+from contextlib import asynccontextmanager
 import logging
 
-from models import STTResponse, ERPData
+from models import STTResponse, ERPData, STTBatchRequest, STTBatchResponse
 from domain_manager import domain_manager
-from postprocessor import comprehensive_postprocess
+from postprocessor import postprocess_segments
+from summary_features import SummaryFeatures
 from gpt_extractor import ERPExtractor
 from supabase_client import get_supabase_manager
+from inference_pool import get_inference_pool, transcribe_on_worker, InferenceQueueFullError, InferenceTimeoutError
+from model_registry import model_registry, WHISPER_PRELOAD_MODELS, QUANTIZED_SUFFIX, parse_model_name, ModelTooLargeError
+from transcription_cache import get_transcription_cache, get_file_hash, make_cache_key, CACHED_STATS_KEYS
+from upload_stream import save_upload_to_temp, UploadTooLargeError
+from audio_chunking import transcribe_long_audio, LONG_AUDIO_MIN_SEC, SAMPLE_RATE
+from pcm_cache import load_pcm, get_pcm_cache
+from batch_transcriber import transcribe_batch_on_worker, BATCH_MAX_SEC
+from streaming_stt import transcribe_windows_on_worker, format_sse
+from model_warmup import get_model_warmup, ModelNotReadyError
+from stt_backends import STT_BACKEND
+from cascade import refine_on_worker, CASCADE_MODEL
+from channel_split import (
+    CHANNEL_SPLIT_ENABLED, get_channel_count, load_channel_pcm, label_segments, merge_channel_results
+)
+from diarization import DIARIZATION_ENABLED, diarize_safely, apply_diarization
+from silence_strip import strip_silence as strip_silence_audio, remap_result, remapping_emitter
+from priority_scheduler import (
+    SCHED_ENABLED, PRIORITY_INTERACTIVE, PRIORITY_BULK, PRIORITY_CLASSES, get_priority_scheduler, probe_duration
+)
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -27,37 +48,25 @@ router = APIRouter(prefix="/api", tags=["STT"])
 # 전역 변수
 whisper_model = None
 erp_extractor = None
-cached_whisper_models = {}
+cached_whisper_models = model_registry.models  # 레지스트리가 관리하는 로딩된 모델 (LRU 순서)
 AUDIO_DIRECTORY = "src_record"
 SUPPORTED_AUDIO_EXTENSIONS = ['.mp3', '.wav', '.m4a', '.flac']
+SUPPORTED_WHISPER_MODELS = ["base", "small", "medium", "large"]
+# CPU 전용 int8 동적 양자화 모델 (model_name에 -int8 접미사)
+SUPPORTED_QUANTIZED_MODELS = [f"{name}{QUANTIZED_SUFFIX}" for name in SUPPORTED_WHISPER_MODELS]
 
 def initialize_models():
-    """모델들을 초기화하는 함수 (안전한 단계별 초기화)"""
-    global whisper_model, erp_extractor
+    """모델들을 초기화하는 함수 (Whisper는 백그라운드 워밍업, 완료 여부는 /ready로 확인)"""
+    global erp_extractor
     
     logger.info("🚀 STT 모델 초기화 시작...")
     
-    # 1. Whisper 모델 초기화
-    logger.info("1️⃣ Whisper 모델들 로딩 중... (인터넷 연결 필요)")
+    # 1. Whisper 모델 백그라운드 로딩 + 워밍업 (나머지 모델은 첫 요청 시 레지스트리가 로딩)
+    logger.info(f"1️⃣ Whisper 사전 로딩 모델: {WHISPER_PRELOAD_MODELS} (인터넷 연결 필요)")
     try:
-        # 기본 모델들 로딩
-        model_names = ["base", "small", "medium", "large"]
-        for model_name in model_names:
-            logger.info(f"   - {model_name} 모델 로딩 중...")
-            try:
-                model = whisper.load_model(model_name)
-                cached_whisper_models[model_name] = model
-                logger.info(f"   ✅ {model_name} 모델 로딩 완료")
-            except Exception as e:
-                logger.error(f"   ❌ {model_name} 모델 로딩 실패: {e}")
-                return False
-        
-        # 기본 모델 설정
-        whisper_model = cached_whisper_models.get("base")
-        logger.info(f"✅ Whisper 모델 초기화 완료 - 기본 모델: {list(cached_whisper_models.keys())}")
-        
+        get_model_warmup().start(WHISPER_PRELOAD_MODELS)
     except Exception as e:
-        logger.error(f"❌ Whisper 모델 초기화 실패: {e}")
+        logger.error(f"❌ Whisper 모델 워밍업 시작 실패: {e}")
         return False
     
     # 2. ERP Extractor 초기화
@@ -72,23 +81,52 @@ def initialize_models():
     logger.info("🎉 STT 모델 초기화 완료!")
     return True
 
-def get_whisper_model(model_name: str = "small"):
-    """요청된 Whisper 모델을 반환"""
-    if model_name in cached_whisper_models:
-        return cached_whisper_models[model_name]
-    elif cached_whisper_models:
-        # 요청된 모델이 없으면 기본 모델 반환
-        default_model = list(cached_whisper_models.values())[0]
-        logger.warning(f"요청된 모델 '{model_name}'이 없습니다. 기본 모델을 사용합니다.")
-        return default_model
-    else:
-        raise HTTPException(status_code=500, detail="Whisper 모델이 로드되지 않았습니다.")
+def resolve_whisper_model(model_name: str = "base") -> Tuple[str, object]:
+    """
+    요청된 Whisper 모델을 (실제 사용한 모델 이름, 모델)로 반환 (레지스트리에서 로딩, 실패 시 base 모델로 폴백)
+    메모리 예산보다 큰 모델은 다른 모델로 몰래 바꾸지 않고 503으로 거절
+    """
+    global whisper_model
+    try:
+        model = model_registry.get(model_name)
+        if model_name == "base":
+            whisper_model = model
+        return model_name, model
+    except ModelTooLargeError as e:
+        logger.error(f"❌ 모델 '{model_name}' 로딩 거절: {e}")
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ 모델 '{model_name}' 로딩 실패: {e}")
+        if model_name != "base":
+            try:
+                logger.info("🔄 기본 'base' 모델로 폴백합니다...")
+                whisper_model = model_registry.get("base")
+                return "base", whisper_model
+            except Exception as base_error:
+                logger.error(f"❌ 기본 모델 로딩 실패: {base_error}")
+        raise HTTPException(status_code=500, detail=f"Whisper 모델 '{model_name}' 로딩에 실패했습니다: {str(e)}")
+
+def get_whisper_model(model_name: str = "base"):
+    """요청된 Whisper 모델을 반환 (실패 시 base 모델로 폴백)"""
+    return resolve_whisper_model(model_name)[1]
+
+async def acquire_whisper_model(model_name: str = "base") -> Tuple[str, object]:
+    """
+    서버 시작 워밍업 중인 모델이면 준비될 때까지 대기한 뒤 (실제 사용한 모델 이름, 모델) 반환
+    준비 전 요청은 실패시키지 않고 대기열처럼 기다리게 하고, 대기 시간 초과/워밍업 실패 시에만 503
+    이름이 요청과 다르면 base로 폴백된 것이므로 요청 모델 기준 전사 캐시에 저장하지 않아야 함
+    """
+    try:
+        await get_model_warmup().wait_until_ready(model_name)
+    except ModelNotReadyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "10"})
+    return await asyncio.to_thread(resolve_whisper_model, model_name)
 
 def clear_model_cache():
     """모델 캐시를 정리합니다"""
-    global whisper_model, cached_whisper_models
+    global whisper_model
     logger.info("모델 캐시 정리 중...")
-    cached_whisper_models.clear()
+    model_registry.clear()
     whisper_model = None
     logger.info("모델 캐시 정리 완료")
 
@@ -133,25 +171,26 @@ def _create_simple_summary(transcript: str, erp_data: dict) -> str:
     
     # 기존 패턴 매칭 로직 (현재 활성화)
     try:
-        import re
-        
         # ERP 데이터에서 주요 정보 추출
         as_support = erp_data.get("AS 및 지원", "정보 없음")
         request_org = erp_data.get("요청기관", "정보 없음")
         request_type = erp_data.get("요청유형", "정보 없음")
         location = erp_data.get("작업국소", "정보 없음")
         
+        # 키워드/숫자 구간은 한 번만 태깅하고 항목별로 재사용
+        features = SummaryFeatures(transcript)
+        
         # 1. 핵심 문장 추출 (패턴 매칭)
-        key_sentences = _extract_key_sentences(transcript)
+        key_sentences = features.key_sentences()
         
         # 2. 요청 유형 분석
-        request_analysis = _analyze_request_type(transcript)
+        request_analysis = features.request_type()
         
         # 3. 문제 상황 추출
-        problem_info = _extract_problem_info(transcript)
+        problem_info = features.problem_info()
         
         # 4. 시간/장소 정보 추출
-        time_location = _extract_time_location(transcript)
+        time_location = features.time_location()
         
         # 5. 요약 생성
         summary = f"""[요약] {request_org} {as_support} 요청
@@ -167,121 +206,601 @@ def _create_simple_summary(transcript: str, erp_data: dict) -> str:
         logger.warning(f"패턴 매칭 요약 생성 실패: {e}")
         return f"[요약] 요청 내용: {transcript[:100]}..."
 
-def _extract_key_sentences(transcript: str) -> str:
-    """핵심 문장 추출 (패턴 매칭)"""
-    import re
+def get_erp_extractor():
+    """ERP Extractor를 반환"""
+    global erp_extractor
+    if erp_extractor is None:
+        logger.warning("ERP Extractor가 초기화되지 않았습니다.")
+    return erp_extractor
+
+# Whisper transcribe 옵션 - 업로드 처리 (속도 우선)
+UPLOAD_TRANSCRIBE_OPTIONS = {
+    "beam_size": 1,
+    "verbose": False,  # 로그 출력 비활성화로 속도 향상
+    "no_speech_threshold": 0.6,  # 음성 없는 구간 감지 임계값 (속도 향상)
+    "logprob_threshold": -1.0,   # 로그 확률 임계값 (품질 향상)
+    "compression_ratio_threshold": 2.4,  # 압축 비율 임계값 (효율성 향상)
+    "condition_on_previous_text": False,  # 이전 텍스트 조건화 비활성화 (속도 향상)
+    "word_timestamps": False,  # 단어별 타임스탬프 비활성화 (속도 최적화)
+    "fp16": True  # FP16 사용으로 속도 향상
+}
+
+# Whisper transcribe 옵션 - src_record 파일 처리 (정확도 우선)
+FILE_TRANSCRIBE_OPTIONS = {
+    "beam_size": 1,
+    "verbose": True,
+    "no_speech_threshold": 0.6,  # 음성 없는 구간 감지 임계값 (속도 향상)
+    "logprob_threshold": -1.0,   # 로그 확률 임계값 (품질 향상)
+    "compression_ratio_threshold": 2.4,  # 압축 비율 임계값 (효율성 향상)
+    "condition_on_previous_text": True,  # 이전 텍스트 조건화 (정확도 향상)
+    "word_timestamps": False  # 단어별 타임스탬프 비활성화 (속도 최적화)
+}
+
+def resolve_audio_path(filename: str) -> str:
+    """src_record 기준 파일 경로를 검증하고 절대 경로를 반환"""
+    file_path = os.path.join(AUDIO_DIRECTORY, filename)
+    file_path = os.path.normpath(file_path)
+    file_path = os.path.abspath(file_path)
+    logger.info(f"파일 경로 확인 - 요청된 파일명: {filename}")
+    logger.info(f"파일 경로 확인 - 구성된 경로: {file_path}")
+    logger.info(f"파일 경로 확인 - 파일 존재 여부: {os.path.exists(file_path)}")
     
-    # 고객 요청 관련 패턴
-    request_patterns = [
-        r'[가-힣]*[가-힣]*(?:문제|장애|오류|안됨|안돼|안되|고장|이상)[가-힣]*',
-        r'[가-힣]*[가-힣]*(?:요청|부탁|해주세요|도와주세요|지원)[가-힣]*',
-        r'[가-힣]*[가-힣]*(?:급함|급해|빨리|오늘|내일)[가-힣]*'
-    ]
+    if not os.path.exists(file_path):
+        raise HTTPException(status_code=404, detail=f"파일을 찾을 수 없습니다: {filename} (경로: {file_path})")
     
-    sentences = transcript.split('.')
-    key_sentences = []
+    if not os.path.isfile(file_path):
+        raise HTTPException(status_code=400, detail=f"유효한 파일이 아닙니다: {filename} (경로: {file_path})")
     
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if len(sentence) < 10:  # 너무 짧은 문장 제외
-            continue
-            
-        for pattern in request_patterns:
-            if re.search(pattern, sentence):
-                key_sentences.append(sentence)
-                break
+    actual_filename = os.path.basename(filename)
+    file_extension = os.path.splitext(actual_filename)[1].lower()
+    if file_extension not in SUPPORTED_AUDIO_EXTENSIONS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(SUPPORTED_AUDIO_EXTENSIONS)}")
     
-    # 최대 3개 문장만 선택
-    return ' | '.join(key_sentences[:3]) if key_sentences else "핵심 문장 없음"
+    return file_path
+
+@asynccontextmanager
+async def transcription_slot(file_path: str, priority: str = PRIORITY_INTERACTIVE,
+                             duration_sec: Optional[float] = None):
+    """전사 슬롯 확보 (대기 등록 시점에 오디오 길이 확인, STT_SCHED_ENABLED=false이면 바로 실행)"""
+    if not SCHED_ENABLED:
+        yield
+        return
+    if duration_sec is None:
+        duration_sec = await asyncio.to_thread(probe_duration, file_path)
+    async with get_priority_scheduler().slot(priority, duration_sec):
+        yield
 
-def _analyze_request_type(transcript: str) -> str:
-    """요청 유형 분석"""
-    import re
+def validate_priority(priority: str) -> str:
+    if priority not in PRIORITY_CLASSES:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 우선순위입니다: {priority} (지원: {', '.join(PRIORITY_CLASSES)})")
+    return priority
+
+async def transcribe_stage(file_path: str, model_name: str, language: Optional[str], transcribe_options: Dict,
+                           audio_hash: Optional[str] = None, long_audio: bool = False,
+                           on_segments: Optional[Callable[[List[Dict]], None]] = None,
+                           progress_callback: Optional[Callable[[str, float], None]] = None,
+                           cascade: bool = False, diarize: bool = False, strip_silence: bool = False,
+                           priority: str = PRIORITY_INTERACTIVE) -> Dict:
+    """
+    1단계: Whisper STT (전사 캐시 조회 → 모델 조회 + 추론 워커 풀 실행)
+    long_audio=True이면 긴 녹음을 무음 경계로 나누어 추론 워커 풀에서 병렬 전사
+    on_segments가 주어지면 30초 윈도우 단위로 전사하며 디코딩된 세그먼트를 즉시 전달 (SSE 스트리밍용)
+    cascade=True이면 저신뢰 세그먼트 구간만 CASCADE_MODEL로 다시 디코딩하여 병합
+    다채널(상담원/고객 분리) 녹음은 채널별로 병렬 전사 후 시간순 병합하여 채널 기준 화자 라벨 부여
+    diarize=True이면 mono 녹음에 NumPy 화자 분리를 전사와 동시에 실행하여 세그먼트에 화자 라벨 부여
+    strip_silence=True이면 긴 무음을 잘라낸 오디오로 전사한 뒤 세그먼트 시간을 원본 기준으로 되돌림
+    priority(interactive/bulk/background)에 따라 우선순위 스케줄러에서 전사 슬롯을 배정받음
+    """
+    cascade = cascade and CASCADE_MODEL != model_name
+    channel_count = 1
+    if CHANNEL_SPLIT_ENABLED:
+        try:
+            if audio_hash is None:
+                audio_hash = await asyncio.to_thread(get_file_hash, file_path)
+            channel_count = await asyncio.to_thread(get_channel_count, file_path, audio_hash)
+        except Exception as e:
+            logger.warning(f"채널 수 확인 실패 (mono로 처리): {e}")
+    cache = get_transcription_cache()
+    cache_key = None
+    if cache.enabled:
+        try:
+            if audio_hash is None:
+                audio_hash = await asyncio.to_thread(get_file_hash, file_path)
+            # 분할 전사는 청크 경계에서 문맥이 끊겨 결과가 다를 수 있으므로 키를 구분
+            if long_audio:
+                key_options = {**transcribe_options, "long_audio": True}
+            elif on_segments is not None:
+                key_options = {**transcribe_options, "windowed": True}
+            else:
+                key_options = transcribe_options
+            if STT_BACKEND != "whisper":
+                # 엔진별 결과가 섞이지 않도록 백엔드 이름을 키에 포함 (기본 엔진은 기존 키 유지)
+                key_options = {**key_options, "backend": STT_BACKEND}
+            if cascade:
+                key_options = {**key_options, "cascade": CASCADE_MODEL}
+            if channel_count > 1:
+                key_options = {**key_options, "channel_split": True}
+            elif diarize:
+                key_options = {**key_options, "diarization": True}
+            if strip_silence:
+                key_options = {**key_options, "strip_silence": True}
+            cache_key = make_cache_key(audio_hash, model_name, language, key_options)
+            cached = await asyncio.to_thread(cache.get, cache_key)
+            if cached is not None:
+                logger.info(f"⚡ 전사 캐시 적중 - 파일: {file_path}, 모델: {model_name}")
+                if on_segments is not None:
+                    on_segments(cached.get("segments", []))
+                return cached
+        except Exception as e:
+            logger.warning(f"전사 캐시 조회 실패 (계속 진행): {e}")
     
-    # 장애 관련 패턴
-    if re.search(r'(?:장애|오류|고장|이상|안됨|안돼)', transcript):
-        return "장애신고"
+    logger.info(f"Whisper transcribe 시작 - 파일: {file_path}")
+    logger.info(f"Whisper transcribe 시작 - 언어: {language}")
     
-    # 기술지원 관련 패턴
-    if re.search(r'(?:지원|도움|해결|수리|점검)', transcript):
-        return "기술지원"
+    async def transcribe_audio(audio, emit: Optional[Callable[[List[Dict]], None]]) -> Dict:
+        """16kHz mono 배열 하나를 전사 (무음 제거 → 분할/스트리밍/일반 + 캐스케이드 → 시간 복원)"""
+        original_sec = len(audio) / SAMPLE_RATE
+        stripped = await asyncio.to_thread(strip_silence_audio, audio) if strip_silence else None
+        if stripped is not None:
+            audio, offset_map = stripped
+            emit = remapping_emitter(emit, offset_map)
+            logger.info(f"🔇 무음 제거 - {original_sec:.1f}초 → {len(audio) / SAMPLE_RATE:.1f}초")
+        
+        # 모델 로딩/워밍업 대기는 전사 슬롯 밖에서 (대기 중인 모델 때문에 다른 요청의 슬롯을 막지 않도록)
+        if not model_registry.is_loaded(model_name):
+            logger.warning(f"⚠️ 모델 '{model_name}' 로딩이 필요합니다. 다운로드로 시간이 오래 걸릴 수 있습니다.")
+        used_name, current_model = await acquire_whisper_model(model_name)
+        if used_name != model_name:
+            fallbacks.append(used_name)
+        strong_model = None
+        if cascade:
+            strong_name, strong_model = await acquire_whisper_model(CASCADE_MODEL)
+            if strong_name != CASCADE_MODEL:
+                fallbacks.append(strong_name)
+        duration = len(audio) / SAMPLE_RATE
+        
+        # 우선순위 스케줄러의 전사 슬롯은 실제 디코딩 구간에만 점유
+        async with transcription_slot(file_path, priority, duration):
+            result = None
+            if long_audio:
+                if duration >= LONG_AUDIO_MIN_SEC:
+                    # 레지스트리에서 받은 모델로 추론 워커 풀에서 청크 전사 (메모리 예산/대기열 제한 적용)
+                    result = await transcribe_long_audio(
+                        current_model,
+                        audio,
+                        {"language": language, **transcribe_options},
+                        timeout=get_inference_pool().default_timeout,
+                        on_segments=emit
+                    )
+                else:
+                    logger.info(f"녹음 길이 {duration:.1f}초 - 분할 기준({LONG_AUDIO_MIN_SEC:g}초) 미만이므로 단일 전사")
+            
+            # 추론 워커 풀에서 실행하여 이벤트 루프 차단 방지
+            if result is None and emit is not None:
+                result = await get_inference_pool().run(
+                    transcribe_windows_on_worker,
+                    current_model,
+                    audio,
+                    on_segments=emit,
+                    language=language,
+                    **transcribe_options
+                )
+            elif result is None:
+                result = await get_inference_pool().run(
+                    transcribe_on_worker,
+                    current_model,
+                    audio,
+                    language=language,
+                    **transcribe_options
+                )
+            
+            if cascade:
+                if progress_callback:
+                    progress_callback("cascade", 0.4)
+                result = await get_inference_pool().run(
+                    refine_on_worker,
+                    strong_model,
+                    audio,
+                    result,
+                    strong_model_name=CASCADE_MODEL,
+                    language=language,
+                    **transcribe_options
+                )
+        if stripped is not None:
+            result = remap_result(result, offset_map, original_sec)
+        return result
     
-    # 문의 관련 패턴
-    if re.search(r'(?:문의|질문|확인|알려주세요)', transcript):
-        return "문의사항"
+    # 요청과 다른 모델로 폴백되어 전사한 경우 (요청 모델 기준 캐시 키로 저장하면 안 됨)
+    fallbacks: List[str] = []
     
-    # 긴급 관련 패턴
-    if re.search(r'(?:급함|급해|빨리|즉시)', transcript):
-        return "긴급요청"
+    def channel_emitter(channel: int) -> Optional[Callable[[List[Dict]], None]]:
+        if on_segments is None:
+            return None
+        return lambda segments: on_segments(label_segments(segments, channel))
     
-    return "일반요청"
+    try:
+        # 디코딩된 PCM 캐시 사용 (FFmpeg 디코딩은 파일당 한 번만 수행, 이후 memory-map)
+        # 전사 슬롯은 transcribe_audio 안에서 실제 디코딩 구간에만 점유 (캐시 적중은 대기 없이 반환)
+        channels = None
+        if channel_count > 1:
+            channels = await asyncio.to_thread(load_channel_pcm, file_path, audio_hash)
+        if channels is None:
+            audio = await asyncio.to_thread(load_pcm, file_path, audio_hash)
+        if progress_callback:
+            progress_callback("transcribe", 0.05)
+        
+        if channels is not None:
+            # 채널별로 절반 길이의 오디오를 각각 다른 워커에서 동시에 전사
+            logger.info(f"🎚️ 채널 분리 전사 - 채널: {len(channels)}개")
+            channel_results = await asyncio.gather(*(
+                transcribe_audio(channel_audio, channel_emitter(index))
+                for index, channel_audio in enumerate(channels)
+            ))
+            result = merge_channel_results(list(channel_results))
+        elif diarize:
+            # 화자 분리는 같은 PCM으로 별도 스레드에서 Whisper 디코딩과 동시에 실행
+            diarization_task = asyncio.create_task(asyncio.to_thread(diarize_safely, audio))
+            result = await transcribe_audio(audio, on_segments)
+            result = apply_diarization(result, await diarization_task)
+        else:
+            result = await transcribe_audio(audio, on_segments)
+        logger.info(f"Whisper transcribe 완료 - 텍스트 길이: {len(result.get('text', ''))}")
+        if cache_key is not None and fallbacks:
+            logger.warning(f"⚠️ 폴백 모델({', '.join(fallbacks)})로 전사하여 '{model_name}' 전사 캐시에 저장하지 않습니다")
+        elif cache_key is not None:
+            await asyncio.to_thread(cache.put, cache_key, result)
+        return result
+    except HTTPException:
+        raise
+    except InferenceQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except (InferenceTimeoutError, asyncio.TimeoutError) as e:
+        logger.error(f"Whisper transcribe 타임아웃 - 파일: {file_path}")
+        raise HTTPException(status_code=504, detail=str(e) or "분할 전사가 제한 시간 내에 완료되지 않았습니다.")
+    except Exception as transcribe_error:
+        logger.error(f"Whisper transcribe 실패 - 파일: {file_path}")
+        logger.error(f"Whisper transcribe 실패 - 오류: {transcribe_error}")
+        logger.error(f"Whisper transcribe 실패 - 오류 타입: {type(transcribe_error).__name__}")
+        error_msg = str(transcribe_error)
+        if "WinError 2" in error_msg or "CreateProcess" in error_msg:
+            raise HTTPException(status_code=500, detail="FFmpeg가 설치되지 않았습니다. Whisper는 오디오 처리를 위해 FFmpeg가 필요합니다. FFmpeg를 설치한 후 다시 시도해주세요.")
+        else:
+            raise HTTPException(status_code=500, detail=f"음성 인식 처리 실패: {str(transcribe_error)}")
 
-def _extract_problem_info(transcript: str) -> str:
-    """문제 상황 정보 추출"""
-    import re
-    
-    # 장비/시스템 관련 패턴
-    equipment_patterns = [
-        r'(?:MSPP|1646SMC|공유기|라우터|스위치|서버)',
-        r'(?:장비|시스템|네트워크|회선|인터넷)'
-    ]
+async def batch_transcribe_stage(file_paths: List[str], model_name: str, language: Optional[str],
+                                 transcribe_options: Dict, priority: str = PRIORITY_BULK) -> Dict[str, Dict]:
+    """
+    1단계(일괄): 짧은 녹음들을 하나의 배치로 묶어 전사
+    {파일 경로: Whisper 결과} 반환, BATCH_MAX_SEC보다 긴 파일과 다채널 파일은 제외 (개별 전사 대상)
+    """
+    cache = get_transcription_cache()
+    key_options = {**transcribe_options, "batched": True}
+    results: Dict[str, Dict] = {}
+    pending_paths = []
+    pending_audio = []
+    pending_keys = []
     
-    # 문제 상황 패턴
-    problem_patterns = [
-        r'(?:꺼져|꺼짐|안됨|안돼|고장|이상)',
-        r'(?:느려|느림|끊어|끊김|불안정)'
-    ]
+    for file_path in file_paths:
+        audio_hash = await asyncio.to_thread(get_file_hash, file_path)
+        if CHANNEL_SPLIT_ENABLED and await asyncio.to_thread(get_channel_count, file_path, audio_hash) > 1:
+            continue  # 다채널 녹음은 채널 분리 전사 대상 (개별 전사)
+        cache_key = make_cache_key(audio_hash, model_name, language, key_options)
+        cached = await asyncio.to_thread(cache.get, cache_key) if cache.enabled else None
+        if cached is not None:
+            results[file_path] = cached
+            continue
+        # 길이는 헤더/ffprobe로 먼저 확인해 배치 대상이 아닌 긴 파일은 디코딩하지 않음
+        duration_sec = await asyncio.to_thread(probe_duration, file_path)
+        if duration_sec is not None and duration_sec > BATCH_MAX_SEC:
+            continue
+        audio = await asyncio.to_thread(load_pcm, file_path, audio_hash)
+        if len(audio) / SAMPLE_RATE > BATCH_MAX_SEC:
+            continue  # 파일 크기로 추정한 길이가 실제보다 짧았던 경우
+        pending_paths.append(file_path)
+        pending_audio.append(audio)
+        pending_keys.append(cache_key)
     
-    problems = []
+    if not pending_paths:
+        return results
     
-    for eq_pattern in equipment_patterns:
-        for prob_pattern in problem_patterns:
-            pattern = f'{eq_pattern}.*?{prob_pattern}|{prob_pattern}.*?{eq_pattern}'
-            matches = re.findall(pattern, transcript)
-            problems.extend(matches)
+    used_name, current_model = await acquire_whisper_model(model_name)
+    if not getattr(current_model, "supports_batch", True):
+        logger.info(f"STT 백엔드 '{STT_BACKEND}'는 일괄 전사를 지원하지 않아 파일별로 전사합니다")
+        return results
+    logger.info(f"📦 일괄 전사 시작 - 파일: {len(pending_paths)}개 (캐시 적중: {len(results)}개)")
+    try:
+        batch_sec = sum(len(audio) for audio in pending_audio) / SAMPLE_RATE
+        async with transcription_slot(pending_paths[0], priority, batch_sec):
+            batch_results = await get_inference_pool().run(
+                transcribe_batch_on_worker,
+                current_model,
+                pending_audio,
+                language=language,
+                **transcribe_options
+            )
+    except InferenceQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except InferenceTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        logger.error(f"일괄 전사 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"일괄 음성 인식 처리 실패: {str(e)}")
     
-    return ' | '.join(problems[:2]) if problems else "문제 정보 없음"
+    if used_name != model_name:
+        logger.warning(f"⚠️ 폴백 모델({used_name})로 전사하여 '{model_name}' 전사 캐시에 저장하지 않습니다")
+    for file_path, cache_key, result in zip(pending_paths, pending_keys, batch_results):
+        results[file_path] = result
+        if used_name == model_name:
+            await asyncio.to_thread(cache.put, cache_key, result)
+    return results
 
-def _extract_time_location(transcript: str) -> str:
-    """시간/장소 정보 추출"""
-    import re
+def postprocess_stage(result: Dict, domain_data: Optional[Dict]) -> Dict:
+    """2단계: 세그먼트 후처리 (원본 + 후처리 하이브리드, 전체 텍스트는 세그먼트 후처리 결과로 조립)"""
+    segments = []
+    original_segments = []  # 원본 세그먼트 보존
     
-    # 시간 관련 패턴
-    time_patterns = [
-        r'(?:오늘|내일|모레)',
-        r'(?:오전|오후|저녁)',
-        r'(?:[0-9]{1,2}시|[0-9]{1,2}:00)'
-    ]
+    raw_segments = result.get("segments", [])
+    original_texts = [segment["text"].strip() for segment in raw_segments]
     
-    # 장소 관련 패턴
-    location_patterns = [
-        r'(?:[0-9]+층|[0-9]+F)',
-        r'(?:서울|부산|대전|대구|광주|인천)',
-        r'(?:사무실|회의실|서버실|기계실)'
-    ]
+    # 통합 후처리 적용 (음성 정규화 + 발음 키 매핑) - 세그먼트마다 한 번만 후처리
+    processed = postprocess_segments(original_texts, result["text"], domain_data)
     
-    time_info = []
-    location_info = []
+    for i, (segment, original_text, processed_text) in enumerate(zip(raw_segments, original_texts, processed["texts"])):
+        # 세그먼트 처리 로그 출력
+        logger.info(f"세그먼트 {i+1}: 원본='{original_text}' → 후처리='{processed_text}'")
+        
+        # 원본 세그먼트 저장
+        original_segments.append({
+            "id": i,
+            "text": original_text,
+            "start": segment["start"],
+            "end": segment["end"],
+            "speaker": segment.get("speaker", f"Speaker_{i % 2}")
+        })
+        
+        # 후처리된 세그먼트 저장 (메인 사용)
+        segments.append({
+            "id": i,
+            "text": processed_text,
+            "start": segment["start"],
+            "end": segment["end"],
+            "speaker": segment.get("speaker", f"Speaker_{i % 2}")
+        })
     
-    for pattern in time_patterns:
-        matches = re.findall(pattern, transcript)
-        time_info.extend(matches)
+    if processed["merged"]:
+        logger.info(f"세그먼트 경계에 걸친 후처리 구간 {processed['merged']}개 다시 처리")
     
-    for pattern in location_patterns:
-        matches = re.findall(pattern, transcript)
-        location_info.extend(matches)
+    # 하이브리드 텍스트 (원본 + 세그먼트 후처리 결과로 조립한 전체 텍스트)
+    return {
+        "segments": segments,
+        "original_segments": original_segments,
+        "transcript": processed["transcript"],
+        "original_transcript": result["text"],
+        "segment_offsets": processed["offsets"],
+        # 전사 처리 통계는 응답까지 그대로 전달
+        **{key: result[key] for key in CACHED_STATS_KEYS if result.get(key) is not None}
+    }
+
+def get_postprocess_domain_data(extract_erp: bool, erp_extractor) -> Optional[Dict]:
+    """도메인 데이터 가져오기 (통합 후처리용)"""
+    if extract_erp and erp_extractor is not None:
+        try:
+            return domain_manager.get_domain_data()
+        except Exception as e:
+            logger.warning(f"도메인 데이터 로드 실패: {e}")
+    return None
+
+def extract_stage(segments: List[Dict], filename: str, extract_erp: bool, erp_extractor) -> Optional[ERPData]:
+    """3단계: ERP 데이터 추출 (타임아웃 처리 개선)"""
+    erp_data = None
+    if extract_erp and segments and erp_extractor is not None:
+        try:
+            logger.info("ERP 데이터 추출 중... (30초 타임아웃)")
+            erp_dict = erp_extractor.extract_from_segments(segments, filename=filename)
+            logger.info(f"추출된 ERP 딕셔너리: {erp_dict}")
+            try:
+                erp_data = ERPData(**erp_dict)
+                logger.info(f"ERP 데이터 추출 완료: {erp_dict}")
+            except Exception as validation_error:
+                logger.error(f"ERPData 모델 생성 실패: {validation_error}")
+                logger.error(f"문제가 된 데이터: {erp_dict}")
+                logger.info("ERP 추출을 건너뛰고 STT 결과만 반환합니다.")
+                erp_data = None
+        except TimeoutError as e:
+            logger.warning(f"ERP 데이터 추출 타임아웃: {e}")
+            logger.info("ERP 추출을 건너뛰고 STT 결과만 반환합니다.")
+        except Exception as e:
+            logger.warning(f"ERP 데이터 추출 실패: {e}")
+            logger.info("ERP 추출을 건너뛰고 STT 결과만 반환합니다.")
+    elif extract_erp and erp_extractor is None:
+        logger.info("⚠️ ERP Extractor가 비활성화되어 있습니다. STT 결과만 반환합니다.")
+    return erp_data
+
+def persist_stage(supabase_mgr, filename: str, file_id: str, model_name: str, language: Optional[str],
+                  processed: Dict, erp_data: Optional[ERPData], processing_time: float,
+                  save_to_db: bool) -> tuple:
+    """4단계: Supabase에 STT 세션/ERP 추출 결과 저장 (항상 저장), (session_id, extraction_id) 반환"""
+    session_id = None
+    extraction_id = None
     
-    time_str = ' | '.join(time_info[:2]) if time_info else ""
-    location_str = ' | '.join(location_info[:2]) if location_info else ""
+    if supabase_mgr:
+        try:
+            logger.info("Supabase에 STT 결과 저장 중...")
+            session = supabase_mgr.create_stt_session(
+                file_name=filename,
+                file_id=file_id,
+                model_name=model_name,
+                language=language
+            )
+            session_id = session['id']
+            supabase_mgr.update_stt_session(
+                session_id=session_id,
+                transcript=processed["transcript"],
+                original_transcript=processed["original_transcript"],
+                segments=processed["segments"],
+                original_segments=processed["original_segments"],
+                processing_time=processing_time,
+                status="completed"
+            )
+            if erp_data:
+                erp_dict = erp_data.dict(by_alias=True)
+                
+                # 전사 요약 통합 (성능 최적화 - 간단한 요약)
+                try:
+                    # 간단한 요약 생성 (GPT API 호출 없이)
+                    simple_summary = _create_simple_summary(processed["transcript"], erp_dict)
+                    erp_dict["요청 사항"] = simple_summary
+                    logger.info("간단한 요약 기반 요청사항 생성 완료")
+                except Exception as e:
+                    logger.warning(f"요약 생성 실패: {e}")
+                    # 실패 시 기본 메시지 설정
+                    erp_dict["요청 사항"] = "요약 생성 실패"
+                
+                extraction = supabase_mgr.save_erp_extraction(
+                    session_id=session_id,
+                    erp_data=erp_dict
+                )
+                extraction_id = extraction['id']
+                logger.info(f"ERP 추출 결과 저장 완료 - 추출 ID: {extraction_id}")
+            if save_to_db and extraction_id:
+                try:
+                    logger.info("ERP 시스템에 자동 등록 중...")
+                    erp_id = f"auto{uuid.uuid4().hex[:8]}"
+                    erp_response_data = {
+                        "status": "success",
+                        "erp_id": erp_id,
+                        "message": "STT 처리 중 ERP 시스템에 자동 등록되었습니다"
+                    }
+                    supabase_mgr.save_erp_register_log(
+                        extraction_id=extraction_id,
+                        erp_id=erp_id,
+                        status="success",
+                        response_data=erp_response_data
+                    )
+                    logger.info(f"ERP 자동 등록 완료 - ERP ID: {erp_id}, 추출 ID: {extraction_id}")
+                except Exception as e:
+                    logger.warning(f"ERP 자동 등록 실패 (계속 진행): {e}")
+                    try:
+                        supabase_mgr.save_erp_register_log(
+                            extraction_id=extraction_id,
+                            erp_id="",
+                            status="failed",
+                            response_data={"error": str(e)}
+                        )
+                    except:
+                        pass
+            logger.info(f"Supabase 저장 완료 - 세션 ID: {session_id}")
+        except Exception as e:
+            logger.warning(f"Supabase 저장 실패 (계속 진행): {e}")
     
-    return f"{time_str} {location_str}".strip()
+    return session_id, extraction_id
 
-def get_erp_extractor():
-    """ERP Extractor를 반환"""
-    global erp_extractor
-    if erp_extractor is None:
-        logger.warning("ERP Extractor가 초기화되지 않았습니다.")
-    return erp_extractor
+def build_stt_response(processed: Dict, erp_data: Optional[ERPData], processing_time: float, file_id: str,
+                       session_id=None, extraction_id=None) -> STTResponse:
+    """단계별 처리 결과로 STTResponse 생성"""
+    response = STTResponse(
+        status="success",
+        transcript=processed["transcript"],
+        segments=processed["segments"],
+        erp_data=erp_data,
+        processing_time=processing_time,
+        file_id=file_id,
+        original_transcript=processed["original_transcript"],
+        original_segments=processed["original_segments"],
+        cascade=processed.get("cascade"),
+        silence_strip=processed.get("silence_strip"),
+        diarization=processed.get("diarization")
+    )
+    if session_id:
+        response.session_id = session_id
+    if extraction_id:
+        response.extraction_id = extraction_id
+    return response
+
+async def run_stt_pipeline(
+    file_path: str,
+    filename: str,
+    model_name: str = "base",
+    language: Optional[str] = None,
+    extract_erp: bool = True,
+    save_to_db: bool = True,
+    transcribe_options: Optional[Dict] = None,
+    erp_extractor=None,
+    supabase_mgr=None,
+    file_id: Optional[str] = None,
+    audio_hash: Optional[str] = None,
+    long_audio: bool = False,
+    transcription: Optional[Dict] = None,
+    progress_callback=None,
+    segment_callback=None,
+    cascade: bool = False,
+    diarize: bool = False,
+    strip_silence: bool = False,
+    priority: str = PRIORITY_INTERACTIVE
+) -> STTResponse:
+    """
+    STT → 후처리 → ERP 추출 → 저장 전체 파이프라인
+    audio_hash(파일 SHA-256)를 알고 있으면 전달하여 전사 캐시 조회 시 재계산을 생략
+    long_audio=True이면 긴 녹음을 청크 단위로 병렬 전사
+    transcription(Whisper 결과)이 주어지면 전사 단계를 건너뜀 (일괄 전사용)
+    progress_callback(stage, progress)가 주어지면 단계 전환 시 호출 (작업 큐 진행률 보고용)
+    segment_callback(segments)가 주어지면 전사 중 디코딩된 세그먼트를 즉시 전달 (SSE 스트리밍용)
+    cascade=True이면 빠른 모델 결과의 저신뢰 구간만 큰 모델로 재디코딩
+    diarize=True이면 전사와 동시에 경량 화자 분리를 실행 (STT_DIARIZATION_ENABLED=false이면 무시)
+    strip_silence=True이면 긴 무음을 제거한 오디오로 전사 (세그먼트 시간은 원본 기준)
+    priority는 전사 슬롯 우선순위 클래스 (대화형 요청 interactive, 일괄 처리 bulk, 재처리 background)
+    """
+    start_time = datetime.now()
+    file_id = file_id or f"stt_{uuid.uuid4().hex[:8]}"
+    transcribe_options = transcribe_options or FILE_TRANSCRIBE_OPTIONS
+    if language == 'auto':
+        language = None
+    
+    def report(stage: str, progress: float):
+        if progress_callback:
+            try:
+                progress_callback(stage, progress)
+            except Exception as e:
+                logger.warning(f"진행률 보고 실패: {e}")
+    
+    logger.info(f"STT 처리 시작 - File ID: {file_id}, 파일경로: {file_path}")
+    logger.info(f"Whisper STT 처리 중 - 모델: {model_name}")
+    
+    # 1. 오디오 디코딩 + Whisper STT
+    if transcription is not None:
+        report("transcribe", 0.05)
+        result = transcription
+    else:
+        report("decode", 0.02)
+        result = await transcribe_stage(file_path, model_name, language, transcribe_options,
+                                       audio_hash=audio_hash, long_audio=long_audio,
+                                       on_segments=segment_callback, progress_callback=report,
+                                       cascade=cascade, diarize=diarize and DIARIZATION_ENABLED,
+                                       strip_silence=strip_silence, priority=priority)
+    
+    # 2. 세그먼트 후처리 (긴 전사는 CPU 작업이 길어지므로 이벤트 루프 밖에서 실행)
+    report("postprocess", 0.6)
+    domain_data = get_postprocess_domain_data(extract_erp, erp_extractor)
+    processed = await asyncio.to_thread(postprocess_stage, result, domain_data)
+    
+    # 3. ERP 데이터 추출 (네트워크 호출이므로 이벤트 루프 밖에서 실행)
+    report("extract", 0.7)
+    erp_data = await asyncio.to_thread(extract_stage, processed["segments"], filename, extract_erp, erp_extractor)
+    
+    # 처리 시간 계산
+    processing_time = (datetime.now() - start_time).total_seconds()
+    
+    # 4. Supabase 저장
+    report("save", 0.9)
+    session_id, extraction_id = await asyncio.to_thread(
+        persist_stage, supabase_mgr, filename, file_id, model_name, language,
+        processed, erp_data, processing_time, save_to_db
+    )
+    
+    response = build_stt_response(processed, erp_data, processing_time, file_id, session_id, extraction_id)
+    report("completed", 1.0)
+    logger.info(f"STT 처리 완료 - File ID: {file_id}, 처리시간: {processing_time:.2f}초")
+    return response
 
 @router.post("/stt-process", response_model=STTResponse)
 async def process_audio_file(
@@ -291,18 +810,17 @@ async def process_audio_file(
     enable_diarization: bool = True,
     extract_erp: bool = True,
     save_to_db: bool = True,
-    whisper_model=Depends(get_whisper_model),
+    long_audio: bool = False,
+    cascade: bool = False,
+    strip_silence: bool = False,
     erp_extractor=Depends(get_erp_extractor),
     supabase_mgr=Depends(get_supabase_manager)
 ):
-    start_time = datetime.now()
     file_id = f"stt_{uuid.uuid4().hex[:8]}"
-    if language == 'auto':
-        language = None
     
     try:
         logger.info(f"STT 처리 시작 - File ID: {file_id}, 파일명: {file.filename}")
-        logger.info(f"요청 옵션 - model_name={model_name}, language={language}, extract_erp={extract_erp}, save_to_db={save_to_db}, enable_diarization={enable_diarization}")
+        logger.info(f"요청 옵션 - model_name={model_name}, language={language}, extract_erp={extract_erp}, save_to_db={save_to_db}, enable_diarization={enable_diarization}, long_audio={long_audio}, cascade={cascade}, strip_silence={strip_silence}")
         
         # 파일 확장자 확인
         allowed_extensions = ['.mp3', '.wav', '.m4a', '.flac']
@@ -310,195 +828,31 @@ async def process_audio_file(
         if file_extension not in allowed_extensions:
             raise HTTPException(status_code=400, detail=f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(allowed_extensions)}")
         
-        # 임시 파일 생성
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+        # 임시 파일로 스트리밍 저장 (메모리에 전체를 올리지 않고, 저장하면서 해시 계산)
+        try:
+            temp_file_path, file_size, audio_hash = await save_upload_to_temp(file, suffix=file_extension)
+        except UploadTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        logger.info(f"업로드 저장 완료 - 크기: {file_size / 1024 / 1024:.1f}MB, SHA-256: {audio_hash[:12]}")
         
         try:
-            # Whisper STT 처리
-            logger.info(f"Whisper STT 처리 중 - 모델: {model_name}")
-            
-            # 모델 캐싱으로 성능 최적화
-            current_model = get_whisper_model(model_name)
-            
-            # STT 실행 (속도 최적화)
-            result = current_model.transcribe(
-                temp_file_path, 
+            return await run_stt_pipeline(
+                temp_file_path,
+                file.filename,
+                model_name=model_name,
                 language=language,
-                beam_size=1,
-                verbose=False,  # 로그 출력 비활성화로 속도 향상
-                no_speech_threshold=0.6,  # 음성 없는 구간 감지 임계값 (속도 향상)
-                logprob_threshold=-1.0,   # 로그 확률 임계값 (품질 향상)
-                compression_ratio_threshold=2.4,  # 압축 비율 임계값 (효율성 향상)
-                condition_on_previous_text=False,  # 이전 텍스트 조건화 비활성화 (속도 향상)
-                word_timestamps=False,  # 단어별 타임스탬프 비활성화 (속도 최적화)
-                fp16=True  # FP16 사용으로 속도 향상
-            )
-            
-            # 세그먼트 데이터 처리 (단순화: 원본 + 후처리)
-            segments = []
-            original_segments = []  # 원본 세그먼트 보존
-            
-            # 도메인 데이터 가져오기 (통합 후처리용)
-            domain_data = None
-            if extract_erp and erp_extractor is not None:
-                try:
-                    domain_data = domain_manager.get_domain_data()
-                except Exception as e:
-                    logger.warning(f"도메인 데이터 로드 실패: {e}")
-            
-            for i, segment in enumerate(result.get("segments", [])):
-                original_text = segment["text"].strip()
-                
-                # 통합 후처리 적용 (음성 정규화 + 유사도 매핑)
-                processed_text = comprehensive_postprocess(original_text, domain_data)
-                
-                # 세그먼트 처리 로그 출력
-                logger.info(f"세그먼트 {i+1}: 원본='{original_text}' → 후처리='{processed_text}'")
-                
-                # 원본 세그먼트 저장
-                original_segment = {
-                    "id": i,
-                    "text": original_text,
-                    "start": segment["start"],
-                    "end": segment["end"],
-                    "speaker": f"Speaker_{i % 2}"
-                }
-                original_segments.append(original_segment)
-                
-                # 후처리된 세그먼트 저장 (메인 사용)
-                segment_data = {
-                    "id": i,
-                    "text": processed_text,
-                    "start": segment["start"],
-                    "end": segment["end"],
-                    "speaker": f"Speaker_{i % 2}"
-                }
-                segments.append(segment_data)
-            
-            # ERP 데이터 추출 (타임아웃 처리 개선)
-            erp_data = None
-            if extract_erp and segments and erp_extractor is not None:
-                try:
-                    logger.info("ERP 데이터 추출 중... (30초 타임아웃)")
-                    erp_dict = erp_extractor.extract_from_segments(segments, filename=file.filename)
-                    logger.info(f"추출된 ERP 딕셔너리: {erp_dict}")
-                    try:
-                        erp_data = ERPData(**erp_dict)
-                        logger.info(f"ERP 데이터 추출 완료: {erp_dict}")
-                    except Exception as validation_error:
-                        logger.error(f"ERPData 모델 생성 실패: {validation_error}")
-                        logger.error(f"문제가 된 데이터: {erp_dict}")
-                        logger.info("ERP 추출을 건너뛰고 STT 결과만 반환합니다.")
-                        erp_data = None
-                except TimeoutError as e:
-                    logger.warning(f"ERP 데이터 추출 타임아웃: {e}")
-                    logger.info("ERP 추출을 건너뛰고 STT 결과만 반환합니다.")
-                except Exception as e:
-                    logger.warning(f"ERP 데이터 추출 실패: {e}")
-                    logger.info("ERP 추출을 건너뛰고 STT 결과만 반환합니다.")
-            elif extract_erp and erp_extractor is None:
-                logger.info("⚠️ ERP Extractor가 비활성화되어 있습니다. STT 결과만 반환합니다.")
-            
-            # 처리 시간 계산
-            processing_time = (datetime.now() - start_time).total_seconds()
-            
-            # 하이브리드 텍스트 생성 (원본 + 후처리)
-            original_text = result["text"]
-            processed_text = comprehensive_postprocess(original_text, domain_data)
-            
-            # Supabase에 STT 세션 저장 (항상 저장)
-            session_id = None
-            extraction_id = None
-            
-            if supabase_mgr:
-                try:
-                    logger.info("Supabase에 STT 결과 저장 중...")
-                    session = supabase_mgr.create_stt_session(
-                        file_name=file.filename,
-                        file_id=file_id,
-                        model_name=model_name,
-                        language=language
-                    )
-                    session_id = session['id']
-                    supabase_mgr.update_stt_session(
-                        session_id=session_id,
-                        transcript=processed_text,
-                        original_transcript=original_text,
-                        segments=segments,
-                        original_segments=original_segments,
-                        processing_time=processing_time,
-                        status="completed"
-                    )
-                    if erp_data:
-                        erp_dict = erp_data.dict(by_alias=True)
-                        
-                        # 전사 요약 통합 (성능 최적화 - 간단한 요약)
-                        try:
-                            # 간단한 요약 생성 (GPT API 호출 없이)
-                            simple_summary = _create_simple_summary(processed_text, erp_dict)
-                            erp_dict["요청 사항"] = simple_summary
-                            logger.info("간단한 요약 기반 요청사항 생성 완료")
-                        except Exception as e:
-                            logger.warning(f"요약 생성 실패: {e}")
-                            # 실패 시 기본 메시지 설정
-                            erp_dict["요청 사항"] = "요약 생성 실패"
-                        
-                        extraction = supabase_mgr.save_erp_extraction(
-                            session_id=session_id,
-                            erp_data=erp_dict
-                        )
-                        extraction_id = extraction['id']
-                        logger.info(f"ERP 추출 결과 저장 완료 - 추출 ID: {extraction_id}")
-                    if save_to_db and extraction_id:
-                        try:
-                            logger.info("ERP 시스템에 자동 등록 중...")
-                            erp_id = f"auto{uuid.uuid4().hex[:8]}"
-                            erp_response_data = {
-                                "status": "success",
-                                "erp_id": erp_id,
-                                "message": "STT 처리 중 ERP 시스템에 자동 등록되었습니다"
-                            }
-                            supabase_mgr.save_erp_register_log(
-                                extraction_id=extraction_id,
-                                erp_id=erp_id,
-                                status="success",
-                                response_data=erp_response_data
-                            )
-                            logger.info(f"ERP 자동 등록 완료 - ERP ID: {erp_id}, 추출 ID: {extraction_id}")
-                        except Exception as e:
-                            logger.warning(f"ERP 자동 등록 실패 (계속 진행): {e}")
-                            try:
-                                supabase_mgr.save_erp_register_log(
-                                    extraction_id=extraction_id,
-                                    erp_id="",
-                                    status="failed",
-                                    response_data={"error": str(e)}
-                                )
-                            except:
-                                pass
-                    logger.info(f"Supabase 저장 완료 - 세션 ID: {session_id}")
-                except Exception as e:
-                    logger.warning(f"Supabase 저장 실패 (계속 진행): {e}")
-            
-            response = STTResponse(
-                status="success",
-                transcript=processed_text,
-                segments=segments,
-                erp_data=erp_data,
-                processing_time=processing_time,
+                extract_erp=extract_erp,
+                save_to_db=save_to_db,
+                transcribe_options=UPLOAD_TRANSCRIBE_OPTIONS,
+                erp_extractor=erp_extractor,
+                supabase_mgr=supabase_mgr,
                 file_id=file_id,
-                original_transcript=original_text,
-                original_segments=original_segments
+                audio_hash=audio_hash,
+                long_audio=long_audio,
+                cascade=cascade,
+                diarize=enable_diarization,
+                strip_silence=strip_silence
             )
-            if session_id:
-                response.session_id = session_id
-            if extraction_id:
-                response.extraction_id = extraction_id
-            logger.info(f"STT 처리 완료 - File ID: {file_id}, 처리시간: {processing_time:.2f}초")
-            return response
         finally:
             if os.path.exists(temp_file_path):
                 os.unlink(temp_file_path)
@@ -516,268 +870,203 @@ async def process_audio_file_from_directory(
     enable_diarization: bool = True,
     extract_erp: bool = True,
     save_to_db: bool = True,
-    whisper_model=Depends(get_whisper_model),
+    long_audio: bool = False,
+    cascade: bool = False,
+    strip_silence: bool = False,
     erp_extractor=Depends(get_erp_extractor),
     supabase_mgr=Depends(get_supabase_manager)
 ):
-    start_time = datetime.now()
     file_id = f"stt_{uuid.uuid4().hex[:8]}"
-    if language == 'auto':
-        language = None
     
     try:
-        logger.info(f"요청 옵션 - model_name={model_name}, language={language}, extract_erp={extract_erp}, save_to_db={save_to_db}, enable_diarization={enable_diarization}")
-        file_path = os.path.join(AUDIO_DIRECTORY, filename)
-        file_path = os.path.normpath(file_path)
-        file_path = os.path.abspath(file_path)
-        logger.info(f"파일 경로 확인 - 요청된 파일명: {filename}")
-        logger.info(f"파일 경로 확인 - 구성된 경로: {file_path}")
-        logger.info(f"파일 경로 확인 - 파일 존재 여부: {os.path.exists(file_path)}")
-        
-        if not os.path.exists(file_path):
-            raise HTTPException(status_code=404, detail=f"파일을 찾을 수 없습니다: {filename} (경로: {file_path})")
-        
-        if not os.path.isfile(file_path):
-            raise HTTPException(status_code=400, detail=f"유효한 파일이 아닙니다: {filename} (경로: {file_path})")
-        
-        actual_filename = os.path.basename(filename)
-        file_extension = os.path.splitext(actual_filename)[1].lower()
-        if file_extension not in SUPPORTED_AUDIO_EXTENSIONS:
-            raise HTTPException(status_code=400, detail=f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(SUPPORTED_AUDIO_EXTENSIONS)}")
-        
-        logger.info(f"STT 처리 시작 - File ID: {file_id}, 파일경로: {file_path}")
-        logger.info(f"Whisper STT 처리 중 - 모델: {model_name}")
-        
-        if model_name in cached_whisper_models:
-            logger.info(f"캐시된 모델 사용: {model_name}")
-            current_model = cached_whisper_models[model_name]
-        elif model_name == "base" and whisper_model is not None:
-            logger.info("기본 base 모델 사용")
-            current_model = whisper_model
-            cached_whisper_models["base"] = whisper_model
-        else:
-            logger.info(f"새 모델 로딩 중: {model_name}")
-            logger.warning(f"⚠️ 모델 '{model_name}' 다운로드가 필요할 수 있습니다. 시간이 오래 걸릴 수 있습니다.")
-            try:
-                import time
-                start_loading_time = time.time()
-                current_model = whisper.load_model(model_name)
-                loading_time = time.time() - start_loading_time
-                logger.info(f"✅ 모델 '{model_name}' 로딩 완료 (소요시간: {loading_time:.2f}초)")
-                cached_whisper_models[model_name] = current_model
-            except Exception as model_error:
-                logger.error(f"❌ 모델 '{model_name}' 로딩 실패: {model_error}")
-                if model_name != "base" and whisper_model is not None:
-                    logger.info("🔄 기본 'base' 모델로 폴백합니다...")
-                    current_model = whisper_model
-                    cached_whisper_models["base"] = whisper_model
-                else:
-                    raise HTTPException(status_code=500, detail=f"Whisper 모델 '{model_name}' 로딩에 실패했습니다: {str(model_error)}")
+        logger.info(f"요청 옵션 - model_name={model_name}, language={language}, extract_erp={extract_erp}, save_to_db={save_to_db}, enable_diarization={enable_diarization}, long_audio={long_audio}, cascade={cascade}, strip_silence={strip_silence}")
+        file_path = resolve_audio_path(filename)
         
-        # STT 실행
-        logger.info(f"Whisper transcribe 시작 - 파일: {file_path}")
-        logger.info(f"Whisper transcribe 시작 - 언어: {language}")
-        try:
-            result = current_model.transcribe(
-                file_path, 
-                language=language,
-                beam_size=1,
-                verbose=True,
-                no_speech_threshold=0.6,  # 음성 없는 구간 감지 임계값 (속도 향상)
-                logprob_threshold=-1.0,   # 로그 확률 임계값 (품질 향상)
-                compression_ratio_threshold=2.4,  # 압축 비율 임계값 (효율성 향상)
-                condition_on_previous_text=True,  # 이전 텍스트 조건화 (정확도 향상)
-                word_timestamps=False  # 단어별 타임스탬프 비활성화 (속도 최적화)
-            )
-            logger.info(f"Whisper transcribe 완료 - 텍스트 길이: {len(result.get('text', ''))}")
-        except Exception as transcribe_error:
-            logger.error(f"Whisper transcribe 실패 - 파일: {file_path}")
-            logger.error(f"Whisper transcribe 실패 - 오류: {transcribe_error}")
-            logger.error(f"Whisper transcribe 실패 - 오류 타입: {type(transcribe_error).__name__}")
-            error_msg = str(transcribe_error)
-            if "WinError 2" in error_msg or "CreateProcess" in error_msg:
-                raise HTTPException(status_code=500, detail="FFmpeg가 설치되지 않았습니다. Whisper는 오디오 처리를 위해 FFmpeg가 필요합니다. FFmpeg를 설치한 후 다시 시도해주세요.")
-            else:
-                raise HTTPException(status_code=500, detail=f"음성 인식 처리 실패: {str(transcribe_error)}")
-        
-        # 세그먼트 데이터 처리 (단순화: 원본 + 후처리)
-        segments = []
-        original_segments = []  # 원본 세그먼트 보존
-        
-        # 도메인 데이터 가져오기 (통합 후처리용)
-        domain_data = None
-        if extract_erp and erp_extractor is not None:
-            try:
-                domain_data = domain_manager.get_domain_data()
-            except Exception as e:
-                logger.warning(f"도메인 데이터 로드 실패: {e}")
-        
-        for i, segment in enumerate(result.get("segments", [])):
-            original_text = segment["text"].strip()
-            processed_text = comprehensive_postprocess(original_text, domain_data)
-            
-            # 세그먼트 처리 로그 출력
-            logger.info(f"세그먼트 {i+1}: 원본='{original_text}' → 후처리='{processed_text}'")
-            
-            original_segment = {
-                "id": i,
-                "text": original_text,
-                "start": segment["start"],
-                "end": segment["end"],
-                "speaker": f"Speaker_{i % 2}"
-            }
-            original_segments.append(original_segment)
-            segment_data = {
-                "id": i,
-                "text": processed_text,
-                "start": segment["start"],
-                "end": segment["end"],
-                "speaker": f"Speaker_{i % 2}"
-            }
-            segments.append(segment_data)
-        
-        # ERP 데이터 추출 (타임아웃 처리 개선)
-        erp_data = None
-        if extract_erp and segments and erp_extractor is not None:
-            try:
-                logger.info("ERP 데이터 추출 중... (30초 타임아웃)")
-                erp_dict = erp_extractor.extract_from_segments(segments, filename=filename)
-                logger.info(f"추출된 ERP 딕셔너리: {erp_dict}")
-                try:
-                    erp_data = ERPData(**erp_dict)
-                    logger.info(f"ERP 데이터 추출 완료: {erp_dict}")
-                except Exception as validation_error:
-                    logger.error(f"ERPData 모델 생성 실패: {validation_error}")
-                    logger.error(f"문제가 된 데이터: {erp_dict}")
-                    logger.info("ERP 추출을 건너뛰고 STT 결과만 반환합니다.")
-                    erp_data = None
-            except TimeoutError as e:
-                logger.warning(f"ERP 데이터 추출 타임아웃: {e}")
-                logger.info("ERP 추출을 건너뛰고 STT 결과만 반환합니다.")
-            except Exception as e:
-                logger.warning(f"ERP 데이터 추출 실패: {e}")
-                logger.info("ERP 추출을 건너뛰고 STT 결과만 반환합니다.")
-        elif extract_erp and erp_extractor is None:
-            logger.info("⚠️ ERP Extractor가 비활성화되어 있습니다. STT 결과만 반환합니다.")
-        
-        # 처리 시간 계산
-        processing_time = (datetime.now() - start_time).total_seconds()
-        
-        # 하이브리드 텍스트 생성 (원본 + 후처리)
-        original_text = result["text"]
-        processed_text = comprehensive_postprocess(original_text, domain_data)
-        
-        # Supabase에 STT 세션 저장 (항상 저장)
-        session_id = None
-        extraction_id = None
-        
-        if supabase_mgr:
-            try:
-                logger.info("Supabase에 STT 결과 저장 중...")
-                session = supabase_mgr.create_stt_session(
-                    file_name=filename,
-                    file_id=file_id,
-                    model_name=model_name,
-                    language=language
-                )
-                session_id = session['id']
-                supabase_mgr.update_stt_session(
-                    session_id=session_id,
-                    transcript=processed_text,
-                    original_transcript=original_text,
-                    segments=segments,
-                    original_segments=original_segments,
-                    processing_time=processing_time,
-                    status="completed"
-                )
-                if erp_data:
-                    erp_dict = erp_data.dict(by_alias=True)
-                    
-                    # 전사 요약 통합 (성능 최적화 - 간단한 요약)
-                    try:
-                        # 간단한 요약 생성 (GPT API 호출 없이)
-                        simple_summary = _create_simple_summary(processed_text, erp_dict)
-                        erp_dict["요청 사항"] = simple_summary
-                        logger.info("간단한 요약 기반 요청사항 생성 완료")
-                    except Exception as e:
-                        logger.warning(f"요약 생성 실패: {e}")
-                        # 실패 시 기본 메시지 설정
-                        erp_dict["요청 사항"] = "요약 생성 실패"
-                    
-                    extraction = supabase_mgr.save_erp_extraction(
-                        session_id=session_id,
-                        erp_data=erp_dict
-                    )
-                    extraction_id = extraction['id']
-                    logger.info(f"ERP 추출 결과 저장 완료 - 추출 ID: {extraction_id}")
-                if save_to_db and extraction_id:
-                    try:
-                        logger.info("ERP 시스템에 자동 등록 중...")
-                        erp_id = f"auto{uuid.uuid4().hex[:8]}"
-                        erp_response_data = {
-                            "status": "success",
-                            "erp_id": erp_id,
-                            "message": "STT 처리 중 ERP 시스템에 자동 등록되었습니다"
-                        }
-                        supabase_mgr.save_erp_register_log(
-                            extraction_id=extraction_id,
-                            erp_id=erp_id,
-                            status="success",
-                            response_data=erp_response_data
-                        )
-                        logger.info(f"ERP 자동 등록 완료 - ERP ID: {erp_id}, 추출 ID: {extraction_id}")
-                    except Exception as e:
-                        logger.warning(f"ERP 자동 등록 실패 (계속 진행): {e}")
-                        try:
-                            supabase_mgr.save_erp_register_log(
-                                extraction_id=extraction_id,
-                                erp_id="",
-                                status="failed",
-                                response_data={"error": str(e)}
-                            )
-                        except:
-                            pass
-                logger.info(f"Supabase 저장 완료 - 세션 ID: {session_id}")
-            except Exception as e:
-                logger.warning(f"Supabase 저장 실패 (계속 진행): {e}")
-        
-        response = STTResponse(
-            status="success",
-            transcript=processed_text,
-            segments=segments,
-            erp_data=erp_data,
-            processing_time=processing_time,
+        return await run_stt_pipeline(
+            file_path,
+            filename,
+            model_name=model_name,
+            language=language,
+            extract_erp=extract_erp,
+            save_to_db=save_to_db,
+            transcribe_options=FILE_TRANSCRIBE_OPTIONS,
+            erp_extractor=erp_extractor,
+            supabase_mgr=supabase_mgr,
             file_id=file_id,
-            original_transcript=original_text,
-            original_segments=original_segments
+            long_audio=long_audio,
+            cascade=cascade,
+            diarize=enable_diarization,
+            strip_silence=strip_silence
         )
-        if session_id:
-            response.session_id = session_id
-        if extraction_id:
-            response.extraction_id = extraction_id
-        logger.info(f"STT 처리 완료 - File ID: {file_id}, 처리시간: {processing_time:.2f}초")
-        return response
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"STT 처리 실패 - File ID: {file_id}: {e}")
         raise HTTPException(status_code=500, detail=f"STT 처리 중 오류가 발생했습니다: {str(e)}")
 
+@router.get("/stt-process-file/stream")
+async def stream_audio_file_processing(
+    filename: str,
+    model_name: str = "base",
+    language: Optional[str] = None,
+    enable_diarization: bool = True,
+    extract_erp: bool = True,
+    save_to_db: bool = True,
+    long_audio: bool = False,
+    cascade: bool = False,
+    strip_silence: bool = False,
+    erp_extractor=Depends(get_erp_extractor),
+    supabase_mgr=Depends(get_supabase_manager)
+):
+    """
+    src_record 파일 STT 처리 진행 상황을 SSE로 스트리밍
+    이벤트: stage(단계/진행률), segments(디코딩된 세그먼트), result(최종 STTResponse), error
+    클라이언트 연결이 끊겨도 파이프라인은 끝까지 실행되어 결과가 저장됨
+    """
+    file_id = f"stt_{uuid.uuid4().hex[:8]}"
+    file_path = resolve_audio_path(filename)
+    language = None if language == 'auto' else language
+
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+
+    def publish(event: str, data):
+        # 추론 워커 스레드/프로세스 콜백에서도 호출되므로 이벤트 루프로 넘겨서 적재
+        loop.call_soon_threadsafe(events.put_nowait, (event, data))
+
+    def on_stage(stage: str, progress: float):
+        publish("stage", {"stage": stage, "progress": progress})
+
+    def on_segments(segments: List[Dict]):
+        publish("segments", {
+            "segments": [
+                {"start": segment.get("start"), "end": segment.get("end"), "text": segment.get("text", "").strip()}
+                for segment in segments
+            ]
+        })
+
+    async def run():
+        try:
+            response = await run_stt_pipeline(
+                file_path,
+                filename,
+                model_name=model_name,
+                language=language,
+                extract_erp=extract_erp,
+                save_to_db=save_to_db,
+                transcribe_options=FILE_TRANSCRIBE_OPTIONS,
+                erp_extractor=erp_extractor,
+                supabase_mgr=supabase_mgr,
+                file_id=file_id,
+                long_audio=long_audio,
+                cascade=cascade,
+                diarize=enable_diarization,
+                strip_silence=strip_silence,
+                progress_callback=on_stage,
+                segment_callback=on_segments
+            )
+            publish("result", response.dict())
+        except Exception as e:
+            logger.error(f"STT 스트리밍 처리 실패 - File ID: {file_id}: {e}")
+            publish("error", {"detail": str(getattr(e, "detail", None) or e)})
+
+    task = asyncio.create_task(run())
+
+    async def event_stream():
+        yield format_sse("stage", {"stage": "queued", "progress": 0.0, "file_id": file_id})
+        while True:
+            event, data = await events.get()
+            yield format_sse(event, data)
+            if event in ("result", "error"):
+                break
+        await task
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post("/stt-batch", response_model=STTBatchResponse)
+async def process_audio_batch(
+    request: STTBatchRequest,
+    erp_extractor=Depends(get_erp_extractor),
+    supabase_mgr=Depends(get_supabase_manager)
+):
+    """src_record의 짧은 통화 녹음 여러 개를 일괄 전사 후 파일별로 후처리/ERP 추출/저장"""
+    start_time = datetime.now()
+    language = None if request.language == 'auto' else request.language
+    model_name = request.model_name or "base"
+    
+    file_paths = {}
+    failed = []
+    for filename in request.filenames:
+        try:
+            file_paths[filename] = resolve_audio_path(filename)
+        except HTTPException as e:
+            failed.append({"filename": filename, "error": e.detail})
+    
+    transcriptions = await batch_transcribe_stage(
+        list(file_paths.values()), model_name, language, FILE_TRANSCRIBE_OPTIONS, priority=PRIORITY_BULK
+    )
+    
+    results = []
+    for filename, file_path in file_paths.items():
+        try:
+            results.append(await run_stt_pipeline(
+                file_path,
+                filename,
+                model_name=model_name,
+                language=language,
+                extract_erp=request.extract_erp,
+                save_to_db=request.save_to_db,
+                transcribe_options=FILE_TRANSCRIBE_OPTIONS,
+                erp_extractor=erp_extractor,
+                supabase_mgr=supabase_mgr,
+                transcription=transcriptions.get(file_path),
+                priority=PRIORITY_BULK
+            ))
+        except HTTPException as e:
+            failed.append({"filename": filename, "error": e.detail})
+        except Exception as e:
+            logger.error(f"일괄 처리 중 파일 실패 - {filename}: {e}")
+            failed.append({"filename": filename, "error": str(e)})
+    
+    return STTBatchResponse(
+        status="success" if not failed else ("partial" if results else "error"),
+        results=results,
+        failed=failed,
+        batched_files=len(transcriptions),
+        processing_time=(datetime.now() - start_time).total_seconds()
+    )
+
 @router.get("/models")
 async def get_available_models():
     """사용 가능한 Whisper 모델 목록 반환"""
     global cached_whisper_models
     
-    available_models = list(cached_whisper_models.keys())
+    available_models = list(SUPPORTED_WHISPER_MODELS)
+    loaded_models = list(cached_whisper_models.keys())
     
     return {
         "available_models": available_models,
+        "loaded_models": [name for name in loaded_models if not parse_model_name(name)[1]],
+        "quantized_models": {
+            "available_models": list(SUPPORTED_QUANTIZED_MODELS),
+            "loaded_models": [name for name in loaded_models if parse_model_name(name)[1]],
+            "description": "CPU 전용 int8 동적 양자화 모델 (선형 계층 가중치 int8, GPU 없이 medium/large 가속 및 메모리 절감)"
+        },
         "default_model": "base",
+        "backend": STT_BACKEND,
         "model_info": {
             "base": "가장 빠른 모델, 정확도 낮음",
             "small": "균형잡힌 모델, 속도와 정확도 중간",
             "medium": "정확도 높음, 속도 느림",
-            "large": "가장 정확한 모델, 속도 매우 느림"
+            "large": "가장 정확한 모델, 속도 매우 느림",
+            **{
+                f"{name}{QUANTIZED_SUFFIX}": f"{name} 모델 int8 양자화 버전 (CPU 전용)"
+                for name in SUPPORTED_WHISPER_MODELS
+            }
         }
     }
 
@@ -791,5 +1080,10 @@ async def stt_health_check():
         "whisper_model_loaded": whisper_model is not None,
         "erp_extractor_loaded": erp_extractor is not None,
         "cached_models": list(cached_whisper_models.keys()),
+        "stt_backend": STT_BACKEND,
+        "inference_pool": get_inference_pool().get_stats(),
+        "priority_scheduler": get_priority_scheduler().get_stats() if SCHED_ENABLED else None,
+        "transcription_cache": get_transcription_cache().get_stats(),
+        "pcm_cache": get_pcm_cache().get_stats(),
         "timestamp": datetime.now().isoformat()
     }
\ No newline at end of file
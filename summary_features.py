@@ -0,0 +1,325 @@
+"""
+패턴 매칭 요약용 특징 추출
+요약 항목마다 정규식(`장비.*?문제|문제.*?장비` 조합, 문장마다 키워드 정규식 3개 등)을 전체 통화 텍스트에 반복 적용하던 방식을 대신해,
+텍스트를 한 번 순회하며 장비/문제/시간/장소/요청 키워드(Aho-Corasick)와 숫자 구간을 태깅해 두고
+문장/줄 단위 동시 출현은 태깅 결과 위치만으로 찾는 모듈 (stt_handlers / gpt_summarizer 기존 요약 결과와 동일)
+"""
+
+import re
+import bisect
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from term_matcher import TermHit, TermMatcher
+
+logger = logging.getLogger(__name__)
+
+# 핵심 문장 키워드 (문장에 하나라도 있으면 핵심 문장)
+KEY_SENTENCE_TERMS = [
+    "문제", "장애", "오류", "안됨", "안돼", "안되", "고장", "이상",
+    "요청", "부탁", "해주세요", "도와주세요", "지원",
+    "급함", "급해", "빨리", "오늘", "내일",
+]
+
+# 요청 유형 키워드 (앞선 유형 우선)
+REQUEST_TYPE_TERMS = [
+    ("장애신고", ["장애", "오류", "고장", "이상", "안됨", "안돼"]),
+    ("기술지원", ["지원", "도움", "해결", "수리", "점검"]),
+    ("문의사항", ["문의", "질문", "확인", "알려주세요"]),
+    ("긴급요청", ["급함", "급해", "빨리", "즉시"]),
+]
+
+# 문제 상황 (장비 그룹 × 문제 그룹 순서로 같은 줄에서 함께 나온 구간)
+EQUIPMENT_GROUPS = [
+    ["MSPP", "1646SMC", "공유기", "라우터", "스위치", "서버"],
+    ["장비", "시스템", "네트워크", "회선", "인터넷"],
+]
+PROBLEM_GROUPS = [
+    ["꺼져", "꺼짐", "안됨", "안돼", "고장", "이상"],
+    ["느려", "느림", "끊어", "끊김", "불안정"],
+]
+
+# 시간/장소 (그룹 순서대로 모은 뒤 앞의 2개)
+TIME_GROUPS = [["오늘", "내일", "모레"], ["오전", "오후", "저녁"]]
+LOCATION_GROUPS = [["서울", "부산", "대전", "대구", "광주", "인천"], ["사무실", "회의실", "서버실", "기계실"]]
+
+# GPT-4o 요약기 폴백 요약용 (장비명은 대소문자 무시)
+FALLBACK_EQUIPMENT_PROBLEMS = [
+    ("UPS", "UPS 장비 문제"),
+    ("ROAD", "ROAD 장비 문제"),
+    ("MSPP", "MSPP 장비 문제"),
+    ("스위치", "스위치 장비 문제"),
+    ("라우터", "라우터 장비 문제"),
+]
+FALLBACK_PROBLEM_TERMS = ["문제", "장애", "오류"]
+FALLBACK_GENERAL_PROBLEMS = [
+    ([("링크", "장애"), ("네트워크", "문제")], "네트워크 링크 장애"),
+    ([("서버", "문제"), ("시스템", "장애")], "서버/시스템 장애"),
+]
+FALLBACK_TIME_GROUPS = [["오늘", "내일", "어제"], ["오전", "오후", "저녁"]]
+FALLBACK_LOCATION_GROUPS = [
+    ["서울", "부산", "대전", "대구", "광주", "울산", "인천"],
+    ["천안", "아산", "수원", "성남", "고양"],
+    ["본사", "지사", "센터", "사무소"],
+]
+
+DIGIT_RUN_PATTERN = re.compile(r"\d+")
+ASCII_DIGIT_RUN_PATTERN = re.compile(r"[0-9]+")
+FALLBACK_TIME_TAIL_PATTERN = re.compile(r"\s*\d{0,2}분?")
+IGNORE_CASE_KINDS = {"fallback_equipment"}
+
+
+def _build_summary_matcher() -> TermMatcher:
+    """요약 키워드 전체를 종류(kind)별로 등록한 매처 (같은 그룹 안 등록 순서 = 정규식 대안 순서)"""
+    matcher = TermMatcher(ignore_case=True)
+    matcher.extend(KEY_SENTENCE_TERMS, "key")
+    for request_type, terms in REQUEST_TYPE_TERMS:
+        matcher.extend(terms, f"request:{request_type}")
+    for index, terms in enumerate(EQUIPMENT_GROUPS):
+        matcher.extend(terms, f"equipment:{index}")
+    for index, terms in enumerate(PROBLEM_GROUPS):
+        matcher.extend(terms, f"problem:{index}")
+    for index, terms in enumerate(TIME_GROUPS):
+        matcher.extend(terms, f"time:{index}")
+    for index, terms in enumerate(LOCATION_GROUPS):
+        matcher.extend(terms, f"location:{index}")
+    for term, _ in FALLBACK_EQUIPMENT_PROBLEMS:
+        matcher.add(term, "fallback_equipment")
+    matcher.extend(FALLBACK_PROBLEM_TERMS, "fallback_problem")
+    for pairs, _ in FALLBACK_GENERAL_PROBLEMS:
+        for first, second in pairs:
+            matcher.add(first, f"fallback_pair:{first}")
+            matcher.add(second, f"fallback_pair:{second}")
+    for index, terms in enumerate(FALLBACK_TIME_GROUPS):
+        matcher.extend(terms, f"fallback_time:{index}")
+    for index, terms in enumerate(FALLBACK_LOCATION_GROUPS):
+        matcher.extend(terms, f"fallback_location:{index}")
+    return matcher.build()
+
+
+_summary_matcher: Optional[TermMatcher] = None
+
+def get_summary_matcher() -> TermMatcher:
+    """요약 키워드 매처 싱글톤을 반환합니다"""
+    global _summary_matcher
+    if _summary_matcher is None:
+        _summary_matcher = _build_summary_matcher()
+    return _summary_matcher
+
+
+def _findall_hits(hits: Sequence[TermHit]) -> List[TermHit]:
+    """re.findall('(?:a|b|...)')과 같은 겹치지 않는 일치 (가장 왼쪽, 같은 위치면 앞선 대안)"""
+    selected = []
+    position = 0
+    for hit in hits:
+        if hit.start >= position:
+            selected.append(hit)
+            position = hit.end
+    return selected
+
+
+class SummaryFeatures:
+    """
+    통화 텍스트 요약 특징 (생성 시 키워드/숫자 구간을 한 번만 태깅)
+    kind별 일치는 (시작 위치, 등록 순서) 순으로 정렬해 두고, 같은 줄/문장 조건은 줄바꿈/마침표 위치 이진 탐색으로 확인
+    """
+
+    def __init__(self, transcript: str):
+        self.text = transcript or ""
+        self._hits: Dict[str, List[TermHit]] = {}
+        for hit in get_summary_matcher().find_all(self.text):
+            if hit.kind not in IGNORE_CASE_KINDS and not self.text.startswith(hit.term, hit.start):
+                continue  # 대소문자 구분 키워드
+            self._hits.setdefault(hit.kind, []).append(hit)
+        for hits in self._hits.values():
+            hits.sort(key=lambda hit: (hit.start, hit.priority))
+        self._newlines = [match.start() for match in re.finditer("\n", self.text)]
+        self._digit_runs = [match.span() for match in DIGIT_RUN_PATTERN.finditer(self.text)]
+
+    def hits(self, kind: str) -> List[TermHit]:
+        return self._hits.get(kind, [])
+
+    def _line_end(self, position: int) -> int:
+        index = bisect.bisect_left(self._newlines, position)
+        return self._newlines[index] if index < len(self._newlines) else len(self.text)
+
+    def _ascii_digit_runs(self) -> List[Tuple[int, int]]:
+        """[0-9]+ 구간 (\\d+ 구간 중 ASCII 숫자만)"""
+        runs = []
+        for start, end in self._digit_runs:
+            run = self.text[start:end]
+            if run.isascii():
+                runs.append((start, end))
+            else:
+                runs.extend((start + match.start(), start + match.end()) for match in ASCII_DIGIT_RUN_PATTERN.finditer(run))
+        return runs
+
+    # ===== 문장/줄 단위 동시 출현 =====
+
+    def _next_on_line(self, hits: List[TermHit], starts: List[int], position: int, line_end: int) -> Optional[TermHit]:
+        """position 이후 같은 줄에서 가장 먼저 시작하는 일치 (같은 위치면 앞선 대안)"""
+        index = bisect.bisect_left(starts, position)
+        if index < len(hits) and hits[index].start < line_end:
+            return hits[index]
+        return None
+
+    def pair_matches(self, first_kind: str, second_kind: str) -> List[str]:
+        """
+        re.findall('A.*?B|B.*?A')과 같은 결과 (.은 줄바꿈 제외)
+        후보 시작 위치는 A/B 일치 위치뿐이므로 일치 위치를 순서대로 보면서 상대 키워드의 다음 위치만 찾음
+        """
+        first_hits, second_hits = self.hits(first_kind), self.hits(second_kind)
+        if not first_hits or not second_hits:
+            return []
+        first_starts = [hit.start for hit in first_hits]
+        second_starts = [hit.start for hit in second_hits]
+        candidates: Dict[int, List[Tuple[TermHit, List[TermHit], List[int]]]] = {}
+        for hits, other_hits, other_starts in ((first_hits, second_hits, second_starts),
+                                               (second_hits, first_hits, first_starts)):
+            for hit in hits:
+                candidates.setdefault(hit.start, []).append((hit, other_hits, other_starts))
+
+        matches = []
+        position = 0
+        for start in sorted(candidates):
+            if start < position:
+                continue
+            line_end = self._line_end(start)
+            for hit, other_hits, other_starts in candidates[start]:
+                other = self._next_on_line(other_hits, other_starts, hit.end, line_end)
+                if other is not None:
+                    matches.append(self.text[start:other.end])
+                    position = other.end
+                    break
+        return matches
+
+    def followed_on_line(self, first_kind: str, second_kind: str) -> bool:
+        """re.search('A.*B')처럼 같은 줄에서 A 뒤에 B가 나오는지"""
+        second_hits = self.hits(second_kind)
+        if not second_hits:
+            return False
+        second_starts = [hit.start for hit in second_hits]
+        for hit in self.hits(first_kind):
+            if self._next_on_line(second_hits, second_starts, hit.end, self._line_end(hit.start)) is not None:
+                return True
+        return False
+
+    # ===== stt_handlers 패턴 매칭 요약 =====
+
+    def key_sentences(self) -> str:
+        """'.'로 나눈 문장 중 10자 이상이고 핵심 키워드가 있는 문장 최대 3개"""
+        dots = [match.start() for match in re.finditer(r"\.", self.text)]
+        sentence_indexes = sorted({bisect.bisect_left(dots, hit.start) for hit in self.hits("key")})
+        key_sentences = []
+        for index in sentence_indexes:
+            start = dots[index - 1] + 1 if index else 0
+            end = dots[index] if index < len(dots) else len(self.text)
+            sentence = self.text[start:end].strip()
+            if len(sentence) < 10:  # 너무 짧은 문장 제외
+                continue
+            key_sentences.append(sentence)
+            if len(key_sentences) == 3:
+                break
+        return ' | '.join(key_sentences) if key_sentences else "핵심 문장 없음"
+
+    def request_type(self) -> str:
+        for request_type, _ in REQUEST_TYPE_TERMS:
+            if self.hits(f"request:{request_type}"):
+                return request_type
+        return "일반요청"
+
+    def problem_info(self) -> str:
+        """장비 그룹 × 문제 그룹 순서로 같은 줄 동시 출현 구간 최대 2개"""
+        problems = []
+        for equipment_index in range(len(EQUIPMENT_GROUPS)):
+            for problem_index in range(len(PROBLEM_GROUPS)):
+                problems.extend(self.pair_matches(f"equipment:{equipment_index}", f"problem:{problem_index}"))
+                if len(problems) >= 2:
+                    return ' | '.join(problems[:2])
+        return ' | '.join(problems) if problems else "문제 정보 없음"
+
+    def _clock_times(self) -> List[str]:
+        """re.findall('[0-9]{1,2}시|[0-9]{1,2}:00')과 같은 결과"""
+        times = []
+        position = 0
+        for start, end in self._ascii_digit_runs():
+            for suffix in ("시", ":00"):
+                if self.text.startswith(suffix, end):
+                    match_start = max(start, end - 2, position)
+                    if match_start < end:
+                        times.append(self.text[match_start:end + len(suffix)])
+                        position = end + len(suffix)
+                    break
+        return times
+
+    def _floors(self) -> List[str]:
+        """re.findall('[0-9]+층|[0-9]+F')과 같은 결과"""
+        return [self.text[start:end + 1] for start, end in self._ascii_digit_runs()
+                if self.text.startswith("층", end) or self.text.startswith("F", end)]
+
+    def time_location(self) -> str:
+        time_info = []
+        for index in range(len(TIME_GROUPS)):
+            time_info.extend(hit.term for hit in _findall_hits(self.hits(f"time:{index}")))
+        if len(time_info) < 2:
+            time_info.extend(self._clock_times())
+        location_info = self._floors()
+        for index in range(len(LOCATION_GROUPS)):
+            if len(location_info) >= 2:
+                break
+            location_info.extend(hit.term for hit in _findall_hits(self.hits(f"location:{index}")))
+
+        time_str = ' | '.join(time_info[:2]) if time_info else ""
+        location_str = ' | '.join(location_info[:2]) if location_info else ""
+        return f"{time_str} {location_str}".strip()
+
+    # ===== GPT-4o 요약기 폴백 요약 =====
+
+    def fallback_problem_info(self) -> str:
+        for term, description in FALLBACK_EQUIPMENT_PROBLEMS:
+            equipment_hits = [hit for hit in self.hits("fallback_equipment") if hit.term == term]
+            if equipment_hits and self._any_followed(equipment_hits, "fallback_problem"):
+                return description
+        for pairs, description in FALLBACK_GENERAL_PROBLEMS:
+            if any(self.followed_on_line(f"fallback_pair:{first}", f"fallback_pair:{second}") for first, second in pairs):
+                return description
+        return "장비 문제"
+
+    def _any_followed(self, hits: List[TermHit], second_kind: str) -> bool:
+        second_hits = self.hits(second_kind)
+        second_starts = [hit.start for hit in second_hits]
+        return any(self._next_on_line(second_hits, second_starts, hit.end, self._line_end(hit.start)) is not None
+                   for hit in hits)
+
+    def _fallback_clock_times(self) -> List[str]:
+        """re.findall('(\\d{1,2}시\\s*\\d{0,2}분?)')과 같은 결과"""
+        times = []
+        position = 0
+        for start, end in self._digit_runs:
+            if not self.text.startswith("시", end):
+                continue
+            match_start = max(start, end - 2, position)
+            if match_start >= end:
+                continue
+            position = FALLBACK_TIME_TAIL_PATTERN.match(self.text, end + 1).end()
+            times.append(self.text[match_start:position])
+        return times
+
+    def fallback_time_location(self) -> str:
+        time_info = self._fallback_clock_times()
+        for index in range(len(FALLBACK_TIME_GROUPS)):
+            if len(time_info) >= 2:
+                break
+            time_info.extend(hit.term for hit in _findall_hits(self.hits(f"fallback_time:{index}")))
+        location_info = []
+        for index in range(len(FALLBACK_LOCATION_GROUPS)):
+            if len(location_info) >= 2:
+                break
+            location_info.extend(hit.term for hit in _findall_hits(self.hits(f"fallback_location:{index}")))
+
+        info_parts = []
+        if time_info:
+            info_parts.append(f"시간: {', '.join(time_info[:2])}")
+        if location_info:
+            info_parts.append(f"장소: {', '.join(location_info[:2])}")
+        return ' | '.join(info_parts) if info_parts else "시간/장소 정보 없음"
@@ -0,0 +1,277 @@
+"""
+다중 패턴 용어 매칭 (Aho-Corasick 오토마타)
+후처리기의 음성 매핑/지역명/고객사명/요청 키워드 표와 도메인 데이터(장비명, 모델명, 장애/요청 발화 예시)를
+한 번만 오토마타로 컴파일해 두고, 텍스트를 한 번 선형 순회하면서 모든 일치 위치를 종류(kind)가 붙은 결과로 돌려주는 모듈
+(호출당 비용은 텍스트 길이 + 일치 수에 비례하고 등록된 패턴 수와는 무관)
+"""
+
+import re
+import logging
+from collections import deque
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+REGEX_META = set("\\.^$*+?{}[]|()")
+OPTIONAL_QUANTIFIERS = ("*", "?", "{")
+
+
+class TermHit(NamedTuple):
+    """일치 결과 한 건 (text[start:end]가 실제 일치한 원문)"""
+    start: int
+    end: int
+    term: str  # 등록한 용어 (정규식 패턴이면 실제 일치한 원문)
+    kind: str
+    value: Any
+    priority: int  # 등록 순서 (작을수록 우선)
+
+
+def literal_prefix(pattern: str) -> str:
+    """
+    정규식 패턴 앞쪽의 고정 문자열 (오토마타로 후보 위치를 찾는 기준)
+    'LG\\s*\\w+' → 'LG', '선관위\\s*5C' → '선관위' (뒤에 *, ?, {}가 붙은 글자는 생략 가능하므로 제외)
+    """
+    prefix = []
+    for char in pattern:
+        if char in REGEX_META:
+            if char in OPTIONAL_QUANTIFIERS and prefix:
+                prefix.pop()
+            break
+        prefix.append(char)
+    return "".join(prefix)
+
+
+def _fold(text: str, ignore_case: bool) -> str:
+    """대소문자 무시 매칭용 변환 (글자 수가 바뀌지 않도록 한 글자씩 대응)"""
+    if not ignore_case:
+        return text
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(char.lower()[:1] or char for char in text)
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class TermMatcher:
+    """
+    Aho-Corasick 다중 용어 매처
+    add()로 용어를 등록하면 첫 검색 시 goto/fail/output 표를 한 번 만들고, 이후 검색은 텍스트 한 번 순회
+    add_pattern()은 앞부분 고정 문자열로 후보 위치만 찾고 그 위치에서 정규식을 한 번 확인 (\\s*, \\w+ 등이 섞인 패턴용)
+    """
+
+    def __init__(self, ignore_case: bool = False, whole_word: bool = False):
+        self.ignore_case = ignore_case
+        self.whole_word = whole_word  # 정규식 \\b처럼 앞뒤가 단어 문자가 아닐 때만 일치
+        # (용어 또는 정규식 패턴, kind, value, 컴파일된 정규식, 오토마타 키 길이)
+        self._entries: List[Tuple[str, str, Any, Optional[re.Pattern], int]] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._delta: List[Dict[str, int]] = [{}]  # goto + 실패 링크를 거친 전이 캐시
+        self._built = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_term_length(self) -> int:
+        return max((entry[4] for entry in self._entries), default=0)
+
+    def add(self, term: str, kind: str = "term", value: Any = None) -> "TermMatcher":
+        """고정 문자열 용어 등록 (value가 없으면 용어 자체)"""
+        if not term:
+            raise ValueError("빈 문자열은 용어로 등록할 수 없습니다")
+        self._insert(term, (term, kind, term if value is None else value, None))
+        return self
+
+    def add_pattern(self, pattern: str, kind: str = "term", value: Any = None, flags: int = 0) -> "TermMatcher":
+        """정규식 패턴 등록 (특수문자가 없으면 고정 문자열로 등록)"""
+        if not any(char in REGEX_META for char in pattern):
+            return self.add(pattern, kind, value)
+        anchor = literal_prefix(pattern)
+        if not anchor:
+            raise ValueError(f"고정 문자열로 시작하지 않는 패턴은 등록할 수 없습니다: {pattern}")
+        if self.ignore_case:
+            flags |= re.IGNORECASE
+        self._insert(anchor, (pattern, kind, value, re.compile(pattern, flags)))
+        return self
+
+    def extend(self, terms: Iterable[str], kind: str = "term") -> "TermMatcher":
+        for term in terms:
+            self.add(term, kind)
+        return self
+
+    def _insert(self, key: str, entry: Tuple[str, str, Any, Optional[re.Pattern]]):
+        state = 0
+        for char in _fold(key, self.ignore_case):
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(len(self._entries))
+        self._entries.append((*entry, len(key)))
+        self._built = False
+
+    def build(self) -> "TermMatcher":
+        """실패 링크 계산 (너비 우선, 실패 상태의 출력을 합쳐 둠)"""
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+        self._delta = [dict(transitions) for transitions in self._goto]
+        self._built = True
+        return self
+
+    def find_all(self, text: str) -> List[TermHit]:
+        """겹치는 일치까지 모두 반환 (끝 위치 순)"""
+        if not self._built:
+            self.build()
+        if not text or not self._entries:
+            return []
+        delta, output, entries = self._delta, self._output, self._entries
+        hits = []
+        state = 0
+        for position, char in enumerate(_fold(text, self.ignore_case)):
+            next_state = delta[state].get(char)
+            if next_state is None:
+                next_state = self._transition(state, char)
+            state = next_state
+            if not output[state]:
+                continue
+            for index in output[state]:
+                key, kind, value, regex, length = entries[index]
+                start = position + 1 - length
+                end = position + 1
+                if regex is not None:
+                    match = regex.match(text, start)
+                    if match is None:
+                        continue
+                    end = match.end()
+                    key = match.group(0)
+                    value = key if value is None else value
+                if self.whole_word and not self._is_whole_word(text, start, end):
+                    continue
+                hits.append(TermHit(start, end, key, kind, value, index))
+        return hits
+
+    def _transition(self, state: int, char: str) -> int:
+        """실패 링크를 따라간 전이 결과를 상태별로 기억 (같은 문자가 다시 나오면 바로 전이)"""
+        target = state
+        while target and char not in self._goto[target]:
+            target = self._fail[target]
+        next_state = self._goto[target].get(char, 0)
+        self._delta[state][char] = next_state
+        return next_state
+
+    def _is_whole_word(self, text: str, start: int, end: int) -> bool:
+        if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(text[start]):
+            return False
+        if end < len(text) and _is_word_char(text[end]) and _is_word_char(text[end - 1]):
+            return False
+        return True
+
+    def spans_gap(self, text: str, start: int, end: int) -> bool:
+        """
+        text 전체를 검색할 때 text[start:end] 간격에 걸치는(빈 간격이면 start 위치를 가로지르는) 일치가 있는지
+        False면 간격 앞뒤를 따로 검색/치환해도 전체 결과와 같음 (정규식 패턴이 있으면 보수적으로 True)
+        """
+        if any(entry[3] is not None for entry in self._entries):
+            return True
+        reach = self.max_term_length - 1
+        if reach <= 0:
+            return False
+        offset = max(0, start - reach)
+        window = text[offset:end + reach]
+        start, end = start - offset, end - offset
+        for hit in self.find_all(window):
+            if (hit.start < end and hit.end > start) if end > start else hit.start < start < hit.end:
+                return True
+        return False
+
+    def find(self, text: str) -> List[TermHit]:
+        """겹치지 않는 일치만 반환 (가장 왼쪽, 같은 위치면 가장 긴 일치 우선)"""
+        selected = []
+        position = 0
+        for hit in sorted(self.find_all(text), key=lambda hit: (hit.start, -(hit.end - hit.start), hit.priority)):
+            if hit.start >= position:
+                selected.append(hit)
+                position = hit.end
+        return selected
+
+    def first(self, text: str) -> Optional[TermHit]:
+        """등록 순서가 가장 앞선 용어의 가장 왼쪽 일치 (패턴 목록을 순서대로 검사하던 방식과 같은 결과)"""
+        hits = self.find_all(text)
+        if not hits:
+            return None
+        return min(hits, key=lambda hit: (hit.priority, hit.start))
+
+    def terms(self, text: str) -> Set[str]:
+        """텍스트에 나타난 용어 집합 (`term in text`를 용어마다 반복하는 대신 사용)"""
+        return {hit.term for hit in self.find_all(text)}
+
+    def replace(self, text: str) -> Tuple[str, List[TermHit]]:
+        """겹치지 않는 일치를 value로 치환한 텍스트와 치환한 일치 목록"""
+        hits = self.find(text)
+        if not hits:
+            return text, hits
+        pieces = []
+        position = 0
+        for hit in hits:
+            pieces.append(text[position:hit.start])
+            pieces.append(str(hit.value))
+            position = hit.end
+        pieces.append(text[position:])
+        return "".join(pieces), hits
+
+
+def build_domain_matcher(domain_data: Optional[Dict]) -> TermMatcher:
+    """
+    도메인 데이터 용어 매처 (대소문자 무시)
+    kind: equipment(장비명 → 장비명), model(모델명 → 장비명), error(장애 발화 예시 → 장애 코드), request(요청 발화 예시 → 요청 코드)
+    """
+    matcher = TermMatcher(ignore_case=True)
+    if not domain_data:
+        return matcher.build()
+    allowed = domain_data.get("allowed", {})
+    maps = domain_data.get("maps", {})
+    for name in allowed.get("equipment", []):
+        if str(name).strip():
+            matcher.add(str(name).strip(), "equipment", name)
+    for kind, mapping in (("model", maps.get("model_to_equipment", {})),
+                          ("error", maps.get("error_examples_to_code", {})),
+                          ("request", maps.get("request_examples_to_code", {}))):
+        for term, code in mapping.items():
+            if str(term).strip():
+                matcher.add(str(term).strip(), kind, code)
+    return matcher.build()
+
+
+# 도메인 데이터별 매처 (도메인 데이터가 다시 로드되면 새로 생성)
+_domain_matcher: Optional[Tuple[Dict, TermMatcher]] = None
+
+def get_domain_matcher(domain_data: Optional[Dict]) -> TermMatcher:
+    """도메인 데이터 용어 매처를 반환합니다 (같은 도메인 데이터 객체면 한 번만 컴파일)"""
+    global _domain_matcher
+
+    if _domain_matcher is None or _domain_matcher[0] is not domain_data:
+        matcher = build_domain_matcher(domain_data)
+        _domain_matcher = (domain_data, matcher)
+        logger.info(f"✅ 도메인 용어 매처 생성 - 용어: {len(matcher)}개")
+
+    return _domain_matcher[1]
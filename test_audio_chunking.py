@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+긴 녹음 분할 전사 테스트 스크립트 (VAD 분할 / 시간 보정)
+"""
+
+import time
+import asyncio
+import threading
+
+import numpy as np
+
+from audio_chunking import SAMPLE_RATE, find_silences, plan_chunks, stitch_segments, transcribe_long_audio
+from inference_pool import InferencePool, InferenceQueueFullError
+
+
+def _make_call_audio(pattern):
+    """(초, 음성 여부) 목록으로 합성 오디오 생성"""
+    rng = np.random.default_rng(0)
+    parts = []
+    for seconds, voiced in pattern:
+        n = int(seconds * SAMPLE_RATE)
+        if voiced:
+            t = np.arange(n) / SAMPLE_RATE
+            parts.append(0.3 * np.sin(2 * np.pi * 220 * t) + 0.01 * rng.standard_normal(n))
+        else:
+            parts.append(0.001 * rng.standard_normal(n))
+    return np.concatenate(parts).astype(np.float32)
+
+
+def test_find_silences():
+    print("🔍 무음 구간 검출 테스트...")
+    audio = _make_call_audio([(2, True), (1, False), (2, True), (0.1, False), (2, True)])
+    silences = find_silences(audio)
+    print(f"  - 검출된 무음: {[(s / SAMPLE_RATE, e / SAMPLE_RATE) for s, e in silences]}")
+
+    # 1초 무음만 검출 (0.1초 무음은 최소 길이 미만)
+    assert len(silences) == 1
+    start, end = silences[0]
+    assert abs(start / SAMPLE_RATE - 2.0) < 0.1 and abs(end / SAMPLE_RATE - 3.0) < 0.1
+    print("✅ 무음 구간 검출 테스트 통과")
+
+
+def test_plan_chunks_cuts_at_silence():
+    print("🔍 청크 분할 계획 테스트...")
+    pattern = []
+    for _ in range(6):
+        pattern += [(9, True), (1, False)]
+    audio = _make_call_audio(pattern)
+
+    chunks = plan_chunks(audio, target_sec=15, max_sec=25)
+    print(f"  - 청크: {[(s / SAMPLE_RATE, e / SAMPLE_RATE) for s, e in chunks]}")
+
+    assert chunks[0][0] == 0 and chunks[-1][1] == len(audio)
+    for (_, prev_end), (next_start, _) in zip(chunks, chunks[1:]):
+        assert prev_end == next_start, "청크 사이에 빈 구간이 없어야 함"
+    for start, end in chunks[:-1]:
+        assert (end - start) / SAMPLE_RATE <= 25
+        # 무음 구간(매 10초 중 9~10초) 안에서 잘렸는지 확인
+        assert 9.0 <= (end / SAMPLE_RATE) % 10 <= 10.0
+    print("✅ 청크 분할 계획 테스트 통과")
+
+
+def test_plan_chunks_without_silence():
+    print("🔍 무음 없는 오디오 강제 분할 테스트...")
+    audio = _make_call_audio([(50, True)])
+    chunks = plan_chunks(audio, target_sec=15, max_sec=20)
+    assert [round((e - s) / SAMPLE_RATE) for s, e in chunks] == [20, 20, 10]
+    print("✅ 강제 분할 테스트 통과")
+
+
+def test_stitch_segments():
+    print("🔍 세그먼트 시간 보정 테스트...")
+    results = [
+        {"text": " 안녕하세요", "language": "ko", "segments": [{"id": 0, "start": 0.0, "end": 1.5, "text": "안녕하세요"}]},
+        {"text": " 장비 점검 요청", "language": "ko", "segments": [
+            {"id": 0, "start": 0.2, "end": 1.0, "text": "장비"},
+            {"id": 1, "start": 1.0, "end": 2.4, "text": "점검 요청"},
+        ]},
+    ]
+    stitched = stitch_segments(results, [0.0, 120.5])
+
+    assert stitched["text"] == "안녕하세요 장비 점검 요청"
+    assert [seg["id"] for seg in stitched["segments"]] == [0, 1, 2]
+    assert [(seg["start"], seg["end"]) for seg in stitched["segments"]] == [(0.0, 1.5), (120.7, 121.5), (121.5, 122.9)]
+    assert stitched["language"] == "ko"
+    print("✅ 세그먼트 시간 보정 테스트 통과")
+
+
+_running = {"now": 0, "peak": 0, "calls": 0}
+_running_lock = threading.Lock()
+
+
+class _StubModel:
+    """청크 길이를 텍스트로 돌려주는 가짜 모델 (동시 실행 수 기록)"""
+
+    def transcribe(self, audio, **options):
+        with _running_lock:
+            _running["now"] += 1
+            _running["calls"] += 1
+            _running["peak"] = max(_running["peak"], _running["now"])
+        time.sleep(0.05)
+        with _running_lock:
+            _running["now"] -= 1
+        seconds = len(audio) / SAMPLE_RATE
+        return {"text": f" {seconds:g}초", "language": "ko",
+                "segments": [{"id": 0, "start": 0.0, "end": seconds, "text": f"{seconds:g}초"}]}
+
+
+def test_transcribe_long_audio_on_pool():
+    print("🔍 추론 워커 풀 분할 전사 테스트...")
+    audio = np.zeros(400 * SAMPLE_RATE, dtype=np.float32)  # 무음 없음 → 180/180/40초 강제 분할
+    pool = InferencePool(max_workers=4, max_queue_size=8)
+    emitted = []
+    try:
+        result = asyncio.run(transcribe_long_audio(_StubModel(), audio, {"language": "ko"}, timeout=30,
+                                                   on_segments=emitted.extend, pool=pool, max_in_flight=2))
+    finally:
+        pool.shutdown()
+    assert result["text"] == "180초 180초 40초" and result["chunks"] == 3
+    assert [segment["start"] for segment in result["segments"]] == [0.0, 180.0, 360.0]
+    assert len(emitted) == 3
+    # 워커가 4개여도 요청 하나는 max_in_flight개까지만 동시에 실행
+    assert _running["peak"] <= 2, _running
+
+    # 대기열이 가득 찬 풀이면 503 경로(InferenceQueueFullError)로 실패
+    busy_pool = InferencePool(max_workers=1, max_queue_size=1)
+    blocker = threading.Event()
+    try:
+        busy_pool.submit(blocker.wait)
+        time.sleep(0.05)
+        busy_pool.submit(blocker.wait)
+        try:
+            asyncio.run(transcribe_long_audio(_StubModel(), audio, {}, timeout=30, pool=busy_pool))
+            assert False, "대기열이 가득 차면 예외가 발생해야 함"
+        except InferenceQueueFullError:
+            pass
+    finally:
+        blocker.set()
+        busy_pool.shutdown()
+    print("✅ 추론 워커 풀 분할 전사 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 분할 전사 테스트 시작\n")
+
+    test_find_silences()
+    test_plan_chunks_cuts_at_silence()
+    test_plan_chunks_without_silence()
+    test_stitch_segments()
+    test_transcribe_long_audio_on_pool()
+
+    print("\n🎉 모든 테스트 통과!")
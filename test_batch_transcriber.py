@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+일괄 전사 타임스탬프 해석 테스트 스크립트
+"""
+
+import numpy as np
+
+from batch_transcriber import tokens_to_segments, plan_windows, WINDOW_SEC
+from audio_chunking import SAMPLE_RATE
+
+TS = 50000  # 테스트용 timestamp_begin
+
+
+def _ts(seconds):
+    return TS + int(round(seconds / 0.02))
+
+
+def test_tokens_to_segments():
+    print("🔍 타임스탬프 토큰 해석 테스트...")
+    tokens = [_ts(0.0), 11, 12, _ts(2.4), _ts(2.4), 13, _ts(5.0), _ts(5.0), 14, 15]
+    segments = tokens_to_segments(tokens, TS, duration=7.5)
+    print(f"  - 세그먼트: {segments}")
+
+    assert [(round(s, 2), round(e, 2), t) for s, e, t in segments] == [
+        (0.0, 2.4, [11, 12]),
+        (2.4, 5.0, [13]),
+        (5.0, 7.5, [14, 15]),  # 닫는 타임스탬프가 없으면 윈도우 끝까지
+    ]
+    print("✅ 타임스탬프 토큰 해석 테스트 통과")
+
+
+def test_tokens_to_segments_clamps_to_duration():
+    print("🔍 실제 길이 초과 타임스탬프 보정 테스트...")
+    segments = tokens_to_segments([_ts(0.0), 11, _ts(29.0)], TS, duration=12.0)
+    assert segments == [(0.0, 12.0, [11])]
+    print("✅ 타임스탬프 보정 테스트 통과")
+
+
+def test_plan_windows_fit_whisper_input():
+    print("🔍 30초 윈도우 분할 테스트...")
+    audio = np.zeros(int(SAMPLE_RATE * 55), dtype=np.float32)
+    windows = plan_windows(audio)
+    assert all((end - start) / SAMPLE_RATE <= WINDOW_SEC for start, end in windows)
+    assert windows[0][0] == 0 and windows[-1][1] == len(audio)
+    print(f"  - 윈도우: {[(s / SAMPLE_RATE, e / SAMPLE_RATE) for s, e in windows]}")
+    print("✅ 윈도우 분할 테스트 통과")
+
+
+def test_batch_stage_skips_long_files_before_decoding():
+    print("🔍 일괄 전사 대상 선별 (긴 파일 디코딩 생략) 테스트...")
+    import os
+    import wave
+    import asyncio
+    import tempfile
+    import stt_handlers
+    from batch_transcriber import BATCH_MAX_SEC
+    from model_registry import ModelRegistry
+    from transcription_cache import TranscriptionCache
+
+    class _NoBatchModel:
+        supports_batch = False  # 대상 선별까지만 확인하고 배치 디코딩은 건너뜀
+
+    decoded = []
+
+    def recording_load_pcm(file_path, audio_hash=None):
+        decoded.append(os.path.basename(file_path))
+        return np.zeros(SAMPLE_RATE, dtype=np.float32)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = []
+        for name, seconds in (("short.wav", 1), ("long.wav", int(BATCH_MAX_SEC) + 5)):
+            path = os.path.join(tmp_dir, name)
+            with wave.open(path, "wb") as wav:
+                wav.setnchannels(1)
+                wav.setsampwidth(2)
+                wav.setframerate(SAMPLE_RATE)
+                wav.writeframes(b"\x00\x00" * SAMPLE_RATE * seconds)
+            paths.append(path)
+
+        cache = TranscriptionCache(os.path.join(tmp_dir, "cache"), max_size_mb=1, enabled=False)
+        patched = {
+            "model_registry": ModelRegistry(memory_budget_mb=4096, loader=lambda name: _NoBatchModel()),
+            "get_transcription_cache": lambda: cache,
+            "load_pcm": recording_load_pcm,
+            "CHANNEL_SPLIT_ENABLED": False,
+        }
+        original = {name: getattr(stt_handlers, name) for name in patched}
+        for name, value in patched.items():
+            setattr(stt_handlers, name, value)
+        try:
+            asyncio.run(stt_handlers.batch_transcribe_stage(paths, "base", "ko", {}))
+        finally:
+            for name, value in original.items():
+                setattr(stt_handlers, name, value)
+    assert decoded == ["short.wav"], f"배치 대상이 아닌 파일까지 디코딩됨: {decoded}"
+    print("✅ 일괄 전사 대상 선별 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 일괄 전사 테스트 시작\n")
+
+    test_tokens_to_segments()
+    test_tokens_to_segments_clamps_to_duration()
+    test_plan_windows_fit_whisper_input()
+    test_batch_stage_skips_long_files_before_decoding()
+
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+단계별 파이프라인 일괄 처리 테스트 스크립트
+"""
+
+import os
+import time
+import asyncio
+import tempfile
+
+from bulk_pipeline import Stage, BulkRun, run_pipeline
+
+
+def _sleep_stage(name, seconds, concurrency=1, fail_on=None):
+    async def fn(item):
+        await asyncio.sleep(seconds)
+        if fail_on and item["filename"] in fail_on:
+            raise RuntimeError(f"{name} 실패")
+        item.setdefault("trace", []).append(name)
+    return Stage(name, fn, concurrency)
+
+
+def test_stages_overlap():
+    print("🔍 단계 중첩 실행 테스트...")
+    stages = [
+        _sleep_stage("transcribe", 0.05),
+        _sleep_stage("extract", 0.05),
+        _sleep_stage("save", 0.05),
+    ]
+    run = BulkRun([{"filename": f"call_{i}.wav"} for i in range(8)], stages)
+
+    start = time.perf_counter()
+    asyncio.run(run_pipeline(run, queue_size=2))
+    elapsed = time.perf_counter() - start
+
+    status = run.get_status()
+    print(f"  - 소요시간: {elapsed:.2f}초 (순차 처리 시 약 {8 * 0.15:.2f}초)")
+    assert status["status"] == "completed" and status["completed"] == 8
+    assert all(item["trace"] == ["transcribe", "extract", "save"] for item in run.items)
+    # 가장 느린 단계 기준: 8 * 0.05 + 나머지 두 단계 0.1 ≈ 0.5초
+    assert elapsed < 8 * 0.15 * 0.7, "단계가 중첩되어야 전체 시간이 단계 합보다 짧아짐"
+    print("✅ 단계 중첩 실행 테스트 통과")
+
+
+def test_failed_items_stop_at_stage():
+    print("🔍 실패 항목 처리 테스트...")
+    stages = [
+        _sleep_stage("transcribe", 0.01, fail_on={"bad.wav"}),
+        _sleep_stage("extract", 0.01, concurrency=2),
+        _sleep_stage("save", 0.01),
+    ]
+    run = BulkRun([{"filename": "ok.wav"}, {"filename": "bad.wav"}], stages)
+    asyncio.run(run_pipeline(run))
+
+    status = run.get_status()
+    files = {entry["filename"]: entry for entry in status["files"]}
+    assert files["ok.wav"]["status"] == "completed"
+    assert files["bad.wav"]["status"] == "failed" and files["bad.wav"]["stage"] == "transcribe"
+    assert status["stages"]["extract"]["processed"] == 1
+    print(f"  - 단계별 통계: {status['stages']}")
+    print("✅ 실패 항목 처리 테스트 통과")
+
+
+def test_missing_file_fails_only_its_item():
+    print("🔍 없는 파일 항목별 실패 테스트...")
+    import bulk_handlers
+    import stt_handlers
+
+    async def fake_transcribe_stage(file_path, *args, **kwargs):
+        return {"text": "네 확인했습니다", "segments": [{"text": "네 확인했습니다", "start": 0.0, "end": 1.0}]}
+
+    original = (bulk_handlers.transcribe_stage, stt_handlers.AUDIO_DIRECTORY)
+    with tempfile.TemporaryDirectory() as audio_dir:
+        with open(os.path.join(audio_dir, "ok.wav"), "wb") as f:
+            f.write(b"RIFF")
+        bulk_handlers.transcribe_stage = fake_transcribe_stage
+        stt_handlers.AUDIO_DIRECTORY = audio_dir
+        try:
+            stages = bulk_handlers.build_stt_stages("base", "ko", False, False, None, None)[:1]
+            run = BulkRun([{"filename": "missing.wav"}, {"filename": "ok.wav"}], stages)
+            asyncio.run(run_pipeline(run))
+        finally:
+            bulk_handlers.transcribe_stage, stt_handlers.AUDIO_DIRECTORY = original
+
+    files = {entry["filename"]: entry for entry in run.get_status()["files"]}
+    assert files["missing.wav"]["status"] == "failed" and "missing.wav" in files["missing.wav"]["error"]
+    assert files["ok.wav"]["status"] == "completed"
+    assert run.items[1]["_processed"]["transcript"]
+    print("✅ 없는 파일 항목별 실패 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 일괄 처리 파이프라인 테스트 시작\n")
+
+    test_stages_overlap()
+    test_failed_items_stop_at_stage()
+    test_missing_file_fails_only_its_item()
+
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+신뢰도 기반 캐스케이드 전사 테스트 스크립트
+"""
+
+import numpy as np
+
+from cascade import weak_reason, select_weak_spans, merge_refined, refine_weak_segments
+from audio_chunking import SAMPLE_RATE
+
+
+def _segment(i, start, end, text, avg_logprob=-0.2, no_speech_prob=0.05, compression_ratio=1.3):
+    return {"id": i, "start": start, "end": end, "text": text, "avg_logprob": avg_logprob,
+            "no_speech_prob": no_speech_prob, "compression_ratio": compression_ratio}
+
+
+SEGMENTS = [
+    _segment(0, 0.0, 3.0, " 네 STN입니다"),
+    _segment(1, 3.2, 6.0, " 로드엔 장비가", avg_logprob=-1.1),
+    _segment(2, 6.4, 8.0, " 꺼졌어요", avg_logprob=-0.9),
+    _segment(3, 8.5, 12.0, " 확인해 보겠습니다"),
+    _segment(4, 20.0, 22.0, " 감사합니다 감사합니다", compression_ratio=2.8),
+]
+
+
+class StrongModel:
+    """구간 길이만큼 세그먼트 하나를 돌려주는 큰 모델 대역"""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, **options):
+        self.calls.append((len(audio) / SAMPLE_RATE, options))
+        duration = len(audio) / SAMPLE_RATE
+        text = f" 재디코딩{len(self.calls)}"
+        return {"text": text, "segments": [{"id": 0, "start": 0.0, "end": duration, "text": text}], "language": "ko"}
+
+
+def test_weak_reason():
+    print("🔍 저신뢰 판정 테스트...")
+    assert weak_reason(SEGMENTS[0]) is None
+    assert weak_reason(SEGMENTS[1]) == "low_logprob"
+    assert weak_reason(SEGMENTS[4]) == "repetition"
+    assert weak_reason(_segment(0, 0, 1, " 네", no_speech_prob=0.8)) == "no_speech"
+    assert weak_reason(_segment(0, 0, 1, " ", no_speech_prob=0.8)) is None
+    print("✅ 저신뢰 판정 테스트 통과")
+
+
+def test_spans_merge_neighbours_without_overlap():
+    print("🔍 재디코딩 구간 선택 테스트...")
+    spans = select_weak_spans(SEGMENTS, duration=25.0)
+    print(f"  - 구간: {spans}")
+    assert [span["indices"] for span in spans] == [[1, 2], [4]]
+    # 앞뒤 여유는 이웃 세그먼트(0번 끝, 3번 시작)를 넘지 않음
+    assert spans[0]["start"] == 3.0 and spans[0]["end"] == 8.5
+    assert spans[1]["start"] == 19.5 and spans[1]["end"] == 22.5
+    print("✅ 재디코딩 구간 선택 테스트 통과")
+
+
+def test_merge_refined_replaces_spans():
+    print("🔍 재디코딩 결과 병합 테스트...")
+    spans = select_weak_spans(SEGMENTS, duration=25.0)
+    span_results = [
+        {"segments": [{"start": 0.2, "end": 5.0, "text": " ROADN 장비가 꺼졌어요"}]},
+        {"segments": [{"start": 0.5, "end": 2.5, "text": " 감사합니다"}]},
+    ]
+    merged = merge_refined(SEGMENTS, spans, span_results)
+    print(f"  - 병합 결과: {[(s['id'], s['start'], s['text']) for s in merged]}")
+    assert [s["text"] for s in merged] == [" 네 STN입니다", " ROADN 장비가 꺼졌어요", " 확인해 보겠습니다", " 감사합니다"]
+    assert [s["id"] for s in merged] == [0, 1, 2, 3]
+    assert merged[1]["start"] == 3.2 and merged[1]["cascade"] is True
+    assert SEGMENTS[3]["id"] == 3  # 원본은 변경하지 않음
+    print("✅ 재디코딩 결과 병합 테스트 통과")
+
+
+def test_refine_only_decodes_weak_spans():
+    print("🔍 저신뢰 구간만 재디코딩 테스트...")
+    audio = np.zeros(int(SAMPLE_RATE * 25), dtype=np.float32)
+    fast = {"text": "".join(s["text"] for s in SEGMENTS), "segments": SEGMENTS, "language": "ko"}
+    strong = StrongModel()
+
+    refined = refine_weak_segments(strong, audio, fast, strong_model_name="medium", language="ko", verbose=True)
+    print(f"  - 통계: {refined['cascade']}")
+    assert [round(duration, 1) for duration, _ in strong.calls] == [5.5, 3.0]
+    assert strong.calls[0][1]["initial_prompt"] == "네 STN입니다"
+    assert refined["cascade"]["mode"] == "spans" and refined["cascade"]["weak_segments"] == 3
+    assert refined["text"] == " 네 STN입니다 재디코딩1 확인해 보겠습니다 재디코딩2"
+
+    # 저신뢰 구간이 대부분이면 전체 재전사
+    weak = [_segment(0, 0.0, 20.0, " 잡음", avg_logprob=-1.5)]
+    refined = refine_weak_segments(StrongModel(), audio, {"text": " 잡음", "segments": weak}, language="ko")
+    assert refined["cascade"]["mode"] == "full"
+    print("✅ 저신뢰 구간만 재디코딩 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 캐스케이드 전사 테스트 시작\n")
+
+    test_weak_reason()
+    test_spans_merge_neighbours_without_overlap()
+    test_merge_refined_replaces_spans()
+    test_refine_only_decodes_weak_spans()
+
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+스테레오 채널 분리 전사 테스트 스크립트
+"""
+
+import os
+import wave
+import tempfile
+
+import numpy as np
+
+import pcm_cache
+from pcm_cache import PCMCache, SAMPLE_RATE
+from channel_split import (
+    probe_channels, is_duplicated_mono, load_channel_pcm, merge_channel_results, CHANNEL_SPEAKER_LABELS
+)
+
+
+def _write_wav(path, channels):
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(np.zeros(SAMPLE_RATE * channels, dtype=np.int16).tobytes())
+
+
+def test_probe_channels_wav():
+    print("🔍 wav 채널 수 확인 테스트...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        stereo = os.path.join(tmp_dir, "stereo.wav")
+        mono = os.path.join(tmp_dir, "mono.wav")
+        _write_wav(stereo, 2)
+        _write_wav(mono, 1)
+        assert probe_channels(stereo) == 2
+        assert probe_channels(mono) == 1
+    print("✅ wav 채널 수 확인 테스트 통과")
+
+
+def test_duplicated_mono_detection():
+    print("🔍 복제 스테레오 감지 테스트...")
+    rng = np.random.default_rng(0)
+    voice = rng.normal(0, 0.1, SAMPLE_RATE).astype(np.float32)
+    other = rng.normal(0, 0.1, SAMPLE_RATE).astype(np.float32)
+    assert is_duplicated_mono(np.stack([voice, voice]))
+    assert not is_duplicated_mono(np.stack([voice, other]))
+    print("✅ 복제 스테레오 감지 테스트 통과")
+
+
+def test_load_channel_pcm_splits_and_caches():
+    print("🔍 채널별 PCM 로딩 테스트...")
+    rng = np.random.default_rng(1)
+    decoded = np.stack([rng.normal(0, 0.1, SAMPLE_RATE), rng.normal(0, 0.1, SAMPLE_RATE)]).astype(np.float32)
+    calls = []
+
+    def fake_decoder(path):
+        calls.append(path)
+        return decoded
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        previous = pcm_cache._pcm_cache
+        pcm_cache._pcm_cache = PCMCache(os.path.join(tmp_dir, "pcm"), max_size_mb=16, enabled=True)
+        try:
+            path = os.path.join(tmp_dir, "call.wav")
+            _write_wav(path, 2)
+            first = load_channel_pcm(path, "hash-stereo", decoder=fake_decoder)
+            second = load_channel_pcm(path, "hash-stereo", decoder=fake_decoder)
+            assert len(first) == 2 and len(calls) == 1
+            assert np.allclose(np.asarray(second[1]), decoded[1])
+
+            mono_path = os.path.join(tmp_dir, "mono.wav")
+            _write_wav(mono_path, 1)
+            assert load_channel_pcm(mono_path, "hash-mono", decoder=fake_decoder) is None
+        finally:
+            pcm_cache._pcm_cache = previous
+    print("✅ 채널별 PCM 로딩 테스트 통과")
+
+
+def test_merge_channel_results_by_time():
+    print("🔍 채널 결과 시간순 병합 테스트...")
+    agent = {"language": "ko", "segments": [
+        {"id": 0, "start": 0.0, "end": 2.0, "text": " 네 STN입니다"},
+        {"id": 1, "start": 5.0, "end": 7.0, "text": " 확인해 보겠습니다"},
+    ]}
+    customer = {"language": "ko", "segments": [
+        {"id": 0, "start": 2.5, "end": 4.5, "text": " 장비가 꺼졌어요"},
+    ]}
+    merged = merge_channel_results([agent, customer])
+    print(f"  - 병합 결과: {[(s['id'], s['speaker'], s['text']) for s in merged['segments']]}")
+    assert [s["text"] for s in merged["segments"]] == [" 네 STN입니다", " 장비가 꺼졌어요", " 확인해 보겠습니다"]
+    assert [s["speaker"] for s in merged["segments"]] == [CHANNEL_SPEAKER_LABELS[0], CHANNEL_SPEAKER_LABELS[1], CHANNEL_SPEAKER_LABELS[0]]
+    assert [s["id"] for s in merged["segments"]] == [0, 1, 2]
+    assert merged["channels"] == 2 and merged["language"] == "ko"
+    assert "cascade" not in merged and "silence_strip" not in merged
+
+    # 한 채널에만 통계가 있어도 채널 순서대로 보존
+    agent["silence_strip"] = {"original_sec": 30.0, "removed_sec": 4.0, "pieces": 2}
+    merged = merge_channel_results([agent, customer])
+    assert merged["silence_strip"]["removed_sec"] == 4.0
+    assert merged["silence_strip"]["per_channel"] == [agent["silence_strip"], None]
+    print("✅ 채널 결과 시간순 병합 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 채널 분리 전사 테스트 시작\n")
+
+    test_probe_channels_wav()
+    test_duplicated_mono_detection()
+    test_load_channel_pcm_splits_and_caches()
+    test_merge_channel_results_by_time()
+
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+NumPy 경량 화자 분리 테스트 스크립트
+"""
+
+import time
+
+import numpy as np
+
+from audio_chunking import SAMPLE_RATE
+from diarization import (
+    DIARIZATION_STEP_SEC, extract_features, agglomerative_cluster, diarize_audio, apply_diarization
+)
+
+
+def _voice(rng, f0, seconds, brightness):
+    """기본 주파수/배음 감쇠가 다른 합성 음성 (화자 대역)"""
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    wave = sum(
+        brightness ** k * np.sin(2 * np.pi * f0 * k * t + rng.uniform(0, 2 * np.pi))
+        for k in range(1, 20) if f0 * k < 7000
+    ) * (1 + 0.5 * np.sin(2 * np.pi * 3 * t))
+    return (0.1 * wave / np.abs(wave).max() + rng.normal(0, 0.003, len(t))).astype(np.float32)
+
+
+def _conversation(seed=0, turns=8):
+    """두 화자가 번갈아 말하는 합성 통화 + 정답 구간 [(시작, 끝, 화자)]"""
+    rng = np.random.default_rng(seed)
+    parts, truth, position = [], [], 0.0
+    for index in range(turns):
+        speaker = index % 2
+        seconds = rng.uniform(2.0, 5.0)
+        parts.append(_voice(rng, 110 if speaker == 0 else 230, seconds, 0.6 if speaker == 0 else 0.9))
+        truth.append((position, position + seconds, speaker))
+        parts.append(rng.normal(0, 0.001, int(SAMPLE_RATE * 0.4)).astype(np.float32))
+        position += seconds + 0.4
+    return np.concatenate(parts), truth
+
+
+def test_features_shape():
+    print("🔍 MFCC 특징 추출 테스트...")
+    features = extract_features(np.zeros(SAMPLE_RATE, dtype=np.float32))
+    assert features["mfcc"].shape == (61, 12)
+    assert features["energy_db"].shape == (61,)
+    assert extract_features(np.zeros(100, dtype=np.float32))["mfcc"].shape == (0, 12)
+    print("✅ MFCC 특징 추출 테스트 통과")
+
+
+def test_agglomerative_cluster():
+    print("🔍 응집형 클러스터링 테스트...")
+    points = np.array([[1.0, 0.0], [0.9, 0.1], [0.0, 1.0], [0.1, 0.95], [0.95, 0.05]])
+    labels = agglomerative_cluster(points, np.ones(len(points)), 2)
+    print(f"  - 라벨: {labels.tolist()}")
+    assert labels[0] == labels[1] == labels[4]
+    assert labels[2] == labels[3] != labels[0]
+    print("✅ 응집형 클러스터링 테스트 통과")
+
+
+def test_diarize_two_speakers():
+    print("🔍 두 화자 합성 통화 화자 분리 테스트...")
+    audio, truth = _conversation()
+    started = time.perf_counter()
+    turns = diarize_audio(audio)
+    print(f"  - 소요: {time.perf_counter() - started:.3f}초, 구간: {[(t['start'], t['end'], t['speaker']) for t in turns]}")
+    assert len(turns) == len(truth)
+    assert [turn["speaker"] for turn in turns] == [f"Speaker_{speaker}" for _, _, speaker in truth]
+    # 화자 전환 경계는 발화 사이 무음 부근 (윈도우 이동 간격 오차 이내)
+    for turn, (_, end, _), (next_start, _, _) in zip(turns, truth, truth[1:]):
+        assert end - DIARIZATION_STEP_SEC <= turn["end"] <= next_start + DIARIZATION_STEP_SEC
+
+    # 무음만 있으면 화자 구간 없음
+    assert diarize_audio(np.zeros(SAMPLE_RATE * 5, dtype=np.float32)) == []
+    print("✅ 두 화자 합성 통화 화자 분리 테스트 통과")
+
+
+def test_apply_diarization():
+    print("🔍 화자 분리 결과 적용 테스트...")
+    turns = [
+        {"start": 0.0, "end": 4.0, "speaker": "Speaker_0"},
+        {"start": 4.0, "end": 9.0, "speaker": "Speaker_1"},
+    ]
+    segments = [
+        {"id": 0, "start": 0.5, "end": 3.5, "text": " 네 STN입니다"},
+        {"id": 1, "start": 3.0, "end": 8.0, "text": " 장비가 꺼졌어요"},
+        {"id": 2, "start": 9.5, "end": 10.0, "text": " 네"},
+    ]
+    result = apply_diarization({"text": "", "segments": segments}, {"turns": turns, "elapsed_sec": 0.01})
+    assert [s["speaker"] for s in result["segments"]] == ["Speaker_0", "Speaker_1", "Speaker_1"]
+    assert result["diarization"]["speakers"] == 2
+    assert apply_diarization({"segments": segments}, None) == {"segments": segments}
+    print("✅ 화자 분리 결과 적용 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 경량 화자 분리 테스트 시작\n")
+
+    test_features_shape()
+    test_agglomerative_cluster()
+    test_diarize_two_speakers()
+    test_apply_diarization()
+
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+녹음 폴더 감시 → STT 작업 자동 등록 테스트 스크립트
+"""
+
+import os
+import asyncio
+import tempfile
+import threading
+from datetime import datetime
+
+from directory_watcher import DirectoryWatcher, daily_relative_path, backfill_folders
+from job_queue import JobStore, JobQueue
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_daily_relative_path():
+    print("🔍 감시 대상 경로 판별 테스트...")
+    root = os.path.join("tmp", "src_record")
+    assert daily_relative_path(root, os.path.join(root, "2025-01-15", "call.mp3")) == "2025-01-15/call.mp3"
+    assert daily_relative_path(root, os.path.join(root, "2025-01-15", "call.txt")) is None
+    assert daily_relative_path(root, os.path.join(root, "2025-01-15", ".call.wav")) is None
+    assert daily_relative_path(root, os.path.join(root, "misc", "call.wav")) is None
+    assert daily_relative_path(root, os.path.join(root, "call.wav")) is None
+    assert backfill_folders(1, datetime(2025, 3, 1)) == ["2025-03-01", "2025-02-28"]
+    print("✅ 감시 대상 경로 판별 테스트 통과")
+
+
+def test_debounce_and_enqueue_once():
+    print("🔍 쓰기 완료 대기 및 중복 등록 방지 테스트...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = os.path.join(tmp_dir, "src_record")
+        folder = os.path.join(root, "2025-01-15")
+        os.makedirs(folder)
+        store = JobStore(os.path.join(tmp_dir, "jobs.db"))
+        submitted = []
+
+        def submit(path, size, mtime):
+            submitted.append(path)
+            store.create_for_file({"filename": path}, path, size, mtime)
+
+        clock = FakeClock()
+        watcher = DirectoryWatcher(root, submit, store.is_file_enqueued, mode="polling", settle_sec=10, clock=clock)
+        path = os.path.join(folder, "call.wav")
+
+        # 쓰기 중: 크기가 계속 바뀌면 등록하지 않음
+        with open(path, "wb") as f:
+            f.write(b"\0" * 1000)
+        watcher.scan()
+        clock.now = 8
+        with open(path, "ab") as f:
+            f.write(b"\0" * 1000)
+        watcher.scan()
+        clock.now = 15
+        watcher.check()
+        assert submitted == [], "쓰기 중인 파일이 등록됨"
+
+        # 마지막 변화 후 settle_sec 경과 → 한 번만 등록
+        clock.now = 19
+        watcher.scan()
+        watcher.check()
+        assert submitted == ["2025-01-15/call.wav"]
+        clock.now = 40
+        watcher.scan()
+        watcher.check()
+        assert submitted == ["2025-01-15/call.wav"]
+
+        # 재시작 후에도 같은 파일은 다시 등록하지 않음
+        restarted = DirectoryWatcher(root, submit, store.is_file_enqueued, mode="polling", settle_sec=10, clock=clock)
+        restarted.scan()
+        clock.now = 60
+        restarted.check()
+        assert submitted == ["2025-01-15/call.wav"]
+        assert store.count_by_status() == {"queued": 1}
+        print(f"  - 상태: {watcher.get_status()}")
+        store.close()
+    print("✅ 쓰기 완료 대기 및 중복 등록 방지 테스트 통과")
+
+
+def test_paths_relative_to_audio_directory():
+    print("🔍 녹음 기준 폴더 상대 경로 테스트...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        base = os.path.join(tmp_dir, "src_record")
+        root = os.path.join(base, "incoming")
+        os.makedirs(os.path.join(root, "2025-01-15"))
+        with open(os.path.join(root, "2025-01-15", "call.wav"), "wb") as f:
+            f.write(b"\0" * 100)
+
+        submitted = []
+        clock = FakeClock()
+        watcher = DirectoryWatcher(root, lambda path, size, mtime: submitted.append(path),
+                                   lambda path, size, mtime: False, mode="polling", settle_sec=1,
+                                   clock=clock, base=base)
+        watcher.scan()
+        clock.now = 5
+        watcher.check()
+        # 작업은 src_record 기준으로 파일을 찾으므로 감시 하위 폴더까지 포함한 경로로 등록
+        assert submitted == ["incoming/2025-01-15/call.wav"]
+        assert os.path.isfile(os.path.join(base, submitted[0]))
+
+        # 녹음 기준 폴더 밖을 감시하도록 설정하면 거절
+        try:
+            DirectoryWatcher(os.path.join(tmp_dir, "elsewhere"), submitted.append, lambda *args: False, base=base)
+            assert False, "src_record 밖의 감시 폴더는 거절해야 함"
+        except ValueError:
+            pass
+    print("✅ 녹음 기준 폴더 상대 경로 테스트 통과")
+
+
+def test_registration_runs_off_event_loop():
+    print("🔍 이벤트 루프 밖 등록 테스트...")
+
+    async def runner(params, progress_callback):
+        return {"transcript": params["filename"]}
+
+    async def scenario(tmp_dir):
+        root = os.path.join(tmp_dir, "src_record")
+        today = backfill_folders(0)[0]
+        os.makedirs(os.path.join(root, today))
+        with open(os.path.join(root, today, "call.wav"), "wb") as f:
+            f.write(b"\0" * 100)
+
+        store = JobStore(os.path.join(tmp_dir, "jobs.db"))
+        queue = JobQueue(store, runner, workers=1, poll_interval=30)  # 폴링이 아닌 등록 알림으로 깨어나야 함
+        await queue.start()
+        db_threads = []
+
+        def is_known(path, size, mtime):
+            db_threads.append(threading.current_thread())
+            return store.is_file_enqueued(path, size, mtime)
+
+        def submit(path, size, mtime):
+            db_threads.append(threading.current_thread())
+            queue.submit_file({"filename": path}, path, size, mtime)
+
+        watcher = DirectoryWatcher(root, submit, is_known, mode="polling", poll_interval=0.02, settle_sec=0)
+        await watcher.start()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 5
+        while store.count_by_status().get("completed") != 1:
+            assert loop.time() < deadline, f"작업이 처리되지 않음: {store.count_by_status()}"
+            await asyncio.sleep(0.02)
+        await watcher.stop()
+        await queue.stop()
+        store.close()
+
+        assert db_threads and threading.main_thread() not in db_threads, "등록 확인/기록은 이벤트 루프 밖에서 실행되어야 함"
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        asyncio.run(scenario(tmp_dir))
+    print("✅ 이벤트 루프 밖 등록 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 녹음 폴더 감시 테스트 시작\n")
+
+    test_daily_relative_path()
+    test_debounce_and_enqueue_once()
+    test_paths_relative_to_audio_directory()
+    test_registration_runs_off_event_loop()
+
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+유사도 매핑 인덱스 테스트 스크립트
+기존 find_best_match 선형 탐색(후보 전체 SequenceMatcher)과 결과가 같은지 비교하고 후보 1만 개 기준 속도 측정
+"""
+
+import sys
+import time
+import random
+import logging
+import threading
+
+from postprocessor import calculate_similarity, find_best_match
+from fuzzy_index import FuzzyIndex, get_fuzzy_index, length_window
+
+ALPHABET = "ABCDEMNOPRSTUW0123456789-"
+KOREAN = ["로드", "스위치", "라우터", "모뎀", "전송", "장비", "광", "단국", "중계기"]
+
+
+def linear_best_match(target, candidates, threshold=0.8):
+    """기존 find_best_match 선형 탐색"""
+    best_match, best_score = None, 0.0
+    for candidate in candidates:
+        score = calculate_similarity(target, candidate)
+        if score >= threshold and score > best_score:
+            best_match, best_score = candidate, score
+    return best_match
+
+
+def random_name(rng):
+    if rng.random() < 0.3:
+        return rng.choice(KOREAN) + "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 4)))
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(3, 12)))
+
+
+def mutate(rng, name):
+    """오인식 흉내: 글자 치환/삭제/삽입/대소문자 변경"""
+    chars = list(name)
+    for _ in range(rng.randint(0, 2)):
+        operation = rng.random()
+        position = rng.randrange(len(chars) + 1)
+        if operation < 0.4 and position < len(chars):
+            chars[position] = rng.choice(ALPHABET)
+        elif operation < 0.7 and position < len(chars) and len(chars) > 1:
+            del chars[position]
+        else:
+            chars.insert(position, rng.choice(ALPHABET))
+    text = "".join(chars)
+    return text.lower() if rng.random() < 0.3 else text
+
+
+def make_queries(rng, candidates, count):
+    return [mutate(rng, rng.choice(candidates)) if rng.random() < 0.8 else random_name(rng) for _ in range(count)]
+
+
+def test_length_window():
+    print("🔍 후보 길이 범위 테스트...")
+    low, high = length_window(10, 0.8)
+    assert abs(low - 10 * 0.8 / 1.2) < 1e-9 and abs(high - 10 * 1.2 / 0.8) < 1e-9
+    assert length_window(5, 0.0) == (0.0, float("inf"))
+    print("✅ 후보 길이 범위 테스트 통과")
+
+
+def test_matches_linear_scan():
+    print("🔍 선형 탐색 결과 일치 테스트...")
+    rng = random.Random(0)
+    for round_index in range(8):
+        candidates = [random_name(rng) for _ in range(rng.randint(1, 200))]
+        candidates += rng.sample(candidates, min(5, len(candidates)))  # 중복 후보 (동점 시 앞선 후보)
+        index = FuzzyIndex(candidates)
+        for target in make_queries(rng, candidates, 30):
+            for threshold in (0.5, 0.8, 0.95, 1.0):
+                expected = linear_best_match(target, candidates, threshold)
+                match = index.best_match(target, threshold)
+                assert (match[0] if match else None) == expected, (target, threshold, match, expected)
+                if match:
+                    assert match[1] == calculate_similarity(target, match[0])
+    print("✅ 선형 탐색 결과 일치 테스트 통과")
+
+
+def test_find_best_match_uses_cached_index():
+    print("🔍 후보 목록별 인덱스 재사용 / LRU 테스트...")
+    logging.disable(logging.WARNING)
+    candidates = ["ROADM", "MSPP", "스위치", "라우터"]
+    assert find_best_match("ROADN", candidates) == "ROADM"
+    assert find_best_match("roadm", candidates) == "ROADM"
+    assert find_best_match("XYZ", candidates) is None
+    assert find_best_match("", candidates) is None
+    index = get_fuzzy_index(candidates)
+    assert get_fuzzy_index(candidates) is index
+    before = index.cache_hits
+    assert find_best_match("ROADN", candidates) == "ROADM"
+    assert index.cache_hits == before + 1
+    candidates.append("ROADN")  # 목록이 바뀌면 인덱스 다시 생성
+    assert get_fuzzy_index(candidates) is not index
+    assert find_best_match("ROADN", candidates) == "ROADN"
+    logging.disable(logging.NOTSET)
+    print("✅ 후보 목록별 인덱스 재사용 / LRU 테스트 통과")
+
+
+def test_concurrent_best_match():
+    print("🔍 여러 스레드 동시 조회 테스트...")
+    rng = random.Random(3)
+    candidates = list({random_name(rng): None for _ in range(300)})
+    targets = make_queries(rng, candidates, 40)
+    expected = {target: linear_best_match(target, candidates) for target in targets}
+    # 캐시를 작게 잡아 조회마다 추가/제거가 계속 일어나도록 함
+    index = FuzzyIndex(candidates, cache_size=8)
+    candidate_lists = [list(candidates[:50 + offset]) for offset in range(24)]  # 인덱스 보관 개수(16)보다 많은 목록
+    errors = []
+    barrier = threading.Barrier(8)
+
+    def worker(seed):
+        local = random.Random(seed)
+        barrier.wait()
+        try:
+            for _ in range(1500):
+                target = local.choice(targets)
+                match = index.best_match(target)
+                assert (match[0] if match else None) == expected[target], target
+                get_fuzzy_index(local.choice(candidate_lists))
+        except Exception as e:
+            errors.append(repr(e))
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = index.get_stats()
+    print(f"  - 통계: {stats}")
+    assert not errors, errors[:3]
+    assert stats["queries"] == 8 * 1500 and stats["cached"] <= 8
+    print("✅ 여러 스레드 동시 조회 테스트 통과")
+
+
+def benchmark(count: int = 10000, queries: int = 200):
+    """후보 count개에서 선형 탐색과 인덱스 탐색 시간 비교 (LRU 캐시 제외)"""
+    rng = random.Random(1)
+    unique = {}
+    while len(unique) < count:
+        unique.setdefault(random_name(rng), None)
+    candidates = list(unique)
+    targets = make_queries(rng, candidates, queries)
+
+    started = time.perf_counter()
+    expected = [linear_best_match(target, candidates) for target in targets]
+    linear_sec = time.perf_counter() - started
+
+    started = time.perf_counter()
+    index = FuzzyIndex(candidates, cache_size=0)
+    build_sec = time.perf_counter() - started
+    started = time.perf_counter()
+    actual = [index.best_match(target) for target in targets]
+    index_sec = time.perf_counter() - started
+
+    assert [match[0] if match else None for match in actual] == expected
+    print(f"📊 후보 {len(candidates)}개, 조회 {queries}회: 선형 탐색 {linear_sec * 1000:.0f}ms → "
+          f"인덱스 {index_sec * 1000:.0f}ms (×{linear_sec / max(index_sec, 1e-9):.0f}, "
+          f"인덱스 생성 {build_sec * 1000:.0f}ms, 조회당 확인 후보 {index.verified / queries:.1f}개)")
+
+
+if __name__ == "__main__":
+    test_length_window()
+    test_matches_linear_scan()
+    test_find_best_match_uses_cached_index()
+    test_concurrent_best_match()
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+추론 워커 풀 테스트 스크립트
+대기열 초과(503) / 타임아웃(504) 처리와 워커별 모델 복제본의 가중치 공유를 스텁 모델로 확인
+"""
+
+import time
+import asyncio
+import threading
+
+from inference_pool import (
+    InferencePool, InferenceQueueFullError, InferenceTimeoutError,
+    get_worker_replica, transcribe_on_worker
+)
+
+
+class _StubTensor:
+    """가중치 텐서 대역 (복제되면 다른 객체가 됨)"""
+
+    def __init__(self, name):
+        self.name = name
+        self.values = [0.0] * 4
+
+
+class _StubModel:
+    """parameters()/buffers()를 제공하는 Whisper 모델 대역"""
+
+    def __init__(self):
+        self.weight = _StubTensor("weight")
+        self.bias = _StubTensor("bias")
+        self.mel_filters = _StubTensor("mel_filters")
+        self.hooks = []  # 디코딩 중 등록되는 kv-cache hook 대역 (복제본마다 분리되어야 함)
+
+    def parameters(self):
+        return iter([self.weight, self.bias])
+
+    def buffers(self):
+        return iter([self.mel_filters])
+
+    def transcribe(self, audio, **options):
+        self.hooks.append(threading.current_thread().name)
+        return {"text": audio, "model": id(self), "hooks": len(self.hooks)}
+
+
+def _wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "조건 대기 시간 초과"
+        time.sleep(0.005)
+
+
+def test_queue_full_raises():
+    print("🔍 대기열 초과 테스트...")
+    pool = InferencePool(max_workers=1, max_queue_size=1, default_timeout=5)
+    release = threading.Event()
+    try:
+        running = pool.submit(release.wait)
+        _wait_until(lambda: pool.get_stats()["active"] == 1)
+        queued = pool.submit(lambda: "queued")
+        try:
+            pool.submit(lambda: "rejected")
+            assert False, "대기열이 가득 차면 InferenceQueueFullError(503)가 발생해야 함"
+        except InferenceQueueFullError:
+            pass
+        release.set()
+        assert running.result(timeout=2) is True
+        assert queued.result(timeout=2) == "queued"
+        stats = pool.get_stats()
+        assert stats["rejected"] == 1 and stats["completed"] == 2
+    finally:
+        release.set()
+        pool.shutdown(wait=True)
+    print("✅ 대기열 초과 테스트 통과")
+
+
+def test_timeout_cancels_job():
+    print("🔍 타임아웃 취소 테스트...")
+    pool = InferencePool(max_workers=1, max_queue_size=4, default_timeout=5)
+    release = threading.Event()
+    executed = []
+    try:
+        blocker = pool.submit(release.wait)
+        _wait_until(lambda: pool.get_stats()["active"] == 1)
+
+        async def run_with_timeout():
+            await pool.run(executed.append, "late", timeout=0.05)
+
+        try:
+            asyncio.run(run_with_timeout())
+            assert False, "제한 시간을 넘기면 InferenceTimeoutError(504)가 발생해야 함"
+        except InferenceTimeoutError:
+            pass
+        assert isinstance(InferenceTimeoutError(), TimeoutError)
+
+        # 대기 중에 타임아웃된 작업은 취소되어 워커가 비어도 실행되지 않음
+        release.set()
+        blocker.result(timeout=2)
+        _wait_until(lambda: pool.get_stats()["queued"] == 0 and pool.get_stats()["active"] == 0)
+        assert executed == [], f"취소된 작업이 실행됨: {executed}"
+        stats = pool.get_stats()
+        assert stats["timed_out"] == 1 and stats["completed"] == 1
+    finally:
+        release.set()
+        pool.shutdown(wait=True)
+    print("✅ 타임아웃 취소 테스트 통과")
+
+
+def test_worker_replica_shares_tensors():
+    print("🔍 워커 복제본 가중치 공유 테스트...")
+    model = _StubModel()
+    pool = InferencePool(max_workers=2, max_queue_size=4, default_timeout=5)
+    try:
+        barrier = threading.Barrier(2)
+
+        def replica_on_worker():
+            barrier.wait(timeout=2)  # 두 워커가 각각 하나씩 실행하도록 동기화
+            return get_worker_replica(model)
+
+        futures = [pool.submit(replica_on_worker) for _ in range(2)]
+        replicas = [future.result(timeout=2) for future in futures]
+        first, second = replicas
+        assert first is not second and first is not model and second is not model
+        for replica in replicas:
+            # 파라미터/버퍼 텐서는 복사하지 않고 원본 객체를 그대로 공유
+            assert replica.weight is model.weight
+            assert replica.bias is model.bias
+            assert replica.mel_filters is model.mel_filters
+            # 디코딩 상태(hook 목록)는 복제본마다 별도
+            assert replica.hooks is not model.hooks
+
+        # 같은 워커에서는 복제본을 재사용
+        again = pool.submit(lambda: (get_worker_replica(model), get_worker_replica(model))).result(timeout=2)
+        assert again[0] is again[1] and again[0] in replicas
+
+        result = asyncio.run(pool.run(transcribe_on_worker, model, "안녕하세요"))
+        assert result["text"] == "안녕하세요" and result["model"] != id(model)
+        assert model.hooks == []
+    finally:
+        pool.shutdown(wait=True)
+    print("✅ 워커 복제본 가중치 공유 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 추론 워커 풀 테스트 시작\n")
+
+    test_queue_full_raises()
+    test_timeout_cancels_job()
+    test_worker_replica_shares_tensors()
+
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+STT 비동기 작업 큐 테스트 스크립트
+"""
+
+import os
+import asyncio
+import tempfile
+import threading
+
+from job_queue import JobStore, JobQueue, JOB_QUEUED, JOB_RUNNING, JOB_COMPLETED, JOB_FAILED
+
+
+async def _fake_runner(params, progress_callback):
+    progress_callback("transcribe", 0.5)
+    await asyncio.sleep(0.01)
+    if params.get("fail"):
+        raise RuntimeError("처리 실패")
+    return {"transcript": params["filename"]}
+
+
+async def _wait_until_done(store, job_ids, timeout=5.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        jobs = [store.get(job_id) for job_id in job_ids]
+        if all(job["status"] in (JOB_COMPLETED, JOB_FAILED) for job in jobs):
+            return jobs
+        await asyncio.sleep(0.02)
+    raise AssertionError("작업이 제한 시간 내에 끝나지 않았습니다")
+
+
+def test_job_queue_runs_jobs():
+    print("🔍 작업 큐 실행 테스트...")
+
+    async def scenario():
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = JobStore(os.path.join(tmp_dir, "jobs.db"))
+            queue = JobQueue(store, _fake_runner, workers=2, poll_interval=0.05)
+            await queue.start()
+            ok = queue.submit({"filename": "a.wav"})
+            bad = queue.submit({"filename": "b.wav", "fail": True})
+            assert ok["status"] == JOB_QUEUED
+
+            ok_job, bad_job = await _wait_until_done(store, [ok["id"], bad["id"]])
+            await queue.stop()
+            store.close()
+
+            assert ok_job["status"] == JOB_COMPLETED
+            assert ok_job["progress"] == 1
+            assert ok_job["result"] == {"transcript": "a.wav"}
+            assert bad_job["status"] == JOB_FAILED
+            assert "처리 실패" in bad_job["error"]
+            print(f"  - 완료: {ok_job['id']}, 실패: {bad_job['id']} ({bad_job['error']})")
+
+    asyncio.run(scenario())
+    print("✅ 작업 큐 실행 테스트 통과")
+
+
+def test_job_queue_recovers_after_restart():
+    print("🔍 서버 재시작 후 작업 복구 테스트...")
+
+    async def scenario():
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "jobs.db")
+
+            # 실행 도중 서버가 종료된 상황 재현
+            store = JobStore(db_path)
+            job = store.create({"filename": "long.wav"})
+            store.claim_next()
+            assert store.get(job["id"])["status"] == JOB_RUNNING
+            store.close()
+
+            restarted = JobStore(db_path)
+            queue = JobQueue(restarted, _fake_runner, workers=1, poll_interval=0.05)
+            await queue.start()
+            recovered, = await _wait_until_done(restarted, [job["id"]])
+            await queue.stop()
+            restarted.close()
+
+            assert recovered["status"] == JOB_COMPLETED
+            assert recovered["attempts"] == 2
+            print(f"  - 복구된 작업: {recovered['id']} (시도 {recovered['attempts']}회)")
+
+    asyncio.run(scenario())
+    print("✅ 작업 복구 테스트 통과")
+
+
+def test_progress_written_off_loop_and_coalesced():
+    print("🔍 진행률 기록 (이벤트 루프 밖 / 합치기) 테스트...")
+
+    async def chatty_runner(params, progress_callback):
+        for tick in range(200):
+            progress_callback("transcribe", tick / 200)
+            if tick % 50 == 0:
+                await asyncio.sleep(0.01)
+        return {"transcript": params["filename"]}
+
+    async def scenario():
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = JobStore(os.path.join(tmp_dir, "jobs.db"))
+            writes = []
+            original_update = store.update_progress
+
+            def recording_update(job_id, stage, progress):
+                writes.append((threading.current_thread() is threading.main_thread(), progress))
+                original_update(job_id, stage, progress)
+
+            store.update_progress = recording_update
+            queue = JobQueue(store, chatty_runner, workers=1, poll_interval=0.05)
+            await queue.start()
+            job = queue.submit({"filename": "a.wav"})
+            done, = await _wait_until_done(store, [job["id"]])
+            await queue.stop()
+            store.close()
+
+            print(f"  - 진행률 보고 200회 → DB 기록 {len(writes)}회")
+            assert done["status"] == JOB_COMPLETED and done["progress"] == 1 and done["stage"] == JOB_COMPLETED
+            assert writes and len(writes) < 20
+            assert not any(on_loop for on_loop, _ in writes), "SQLite 기록은 이벤트 루프 스레드 밖에서 실행되어야 함"
+            assert writes[-1][1] == 199 / 200
+
+    asyncio.run(scenario())
+    print("✅ 진행률 기록 테스트 통과")
+
+
+def test_requeue_stops_after_max_attempts():
+    print("🔍 최대 재시도 횟수 테스트...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = JobStore(os.path.join(tmp_dir, "jobs.db"))
+        crashing = store.create({"filename": "crash.wav"})
+        fresh = store.create({"filename": "fresh.wav"})
+
+        # 실행 중 서버가 세 번 종료된 작업
+        for attempt in range(3):
+            store.claim_next()
+            if attempt < 2:
+                assert store.requeue_interrupted(max_attempts=3) == (1, 0)
+        store.claim_next()  # fresh.wav 실행 중 종료 (1회)
+
+        assert store.requeue_interrupted(max_attempts=3) == (1, 1)
+        crashed = store.get(crashing["id"])
+        assert crashed["status"] == JOB_FAILED and crashed["attempts"] == 3 and "3회" in crashed["error"]
+        assert store.get(fresh["id"])["status"] == JOB_QUEUED
+        store.close()
+    print("✅ 최대 재시도 횟수 테스트 통과")
+
+
+def test_api_submission_priority_and_off_loop_insert():
+    print("🔍 API 작업 등록 우선순위 / 이벤트 루프 밖 기록 테스트...")
+    import stt_handlers
+    import job_handlers
+    from models import STTJobRequest
+    from priority_scheduler import PRIORITY_INTERACTIVE, PRIORITY_BULK
+
+    async def scenario(store):
+        inserts = []
+        original_create = store.create
+
+        def recording_create(params):
+            inserts.append(threading.current_thread() is threading.main_thread())
+            return original_create(params)
+
+        store.create = recording_create
+        default = await job_handlers.submit_stt_job(STTJobRequest(filename="call.wav"))
+        bulk = await job_handlers.submit_stt_job(STTJobRequest(filename="call.wav", priority=PRIORITY_BULK))
+        assert inserts == [False, False], "SQLite 기록은 이벤트 루프 스레드 밖에서 실행되어야 함"
+        return default, bulk
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        open(os.path.join(tmp_dir, "call.wav"), "wb").close()
+        store = JobStore(os.path.join(tmp_dir, "jobs.db"))
+        original_directory, original_queue = stt_handlers.AUDIO_DIRECTORY, job_handlers.job_queue
+        stt_handlers.AUDIO_DIRECTORY = tmp_dir
+        job_handlers.job_queue = JobQueue(store, _fake_runner)
+        try:
+            default, bulk = asyncio.run(scenario(store))
+        finally:
+            stt_handlers.AUDIO_DIRECTORY, job_handlers.job_queue = original_directory, original_queue
+        assert store.get(default.job_id)["params"]["priority"] == PRIORITY_INTERACTIVE
+        assert store.get(bulk.job_id)["params"]["priority"] == PRIORITY_BULK
+        store.close()
+    print("✅ API 작업 등록 우선순위 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 STT 작업 큐 테스트 시작\n")
+
+    test_job_queue_runs_jobs()
+    test_job_queue_recovers_after_restart()
+    test_progress_written_off_loop_and_coalesced()
+    test_requeue_stops_after_max_attempts()
+    test_api_submission_priority_and_off_loop_insert()
+
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Whisper 모델 레지스트리 테스트 스크립트
+크기를 보고하는 가짜 로더로 LRU 해제 순서, 메모리 예산, 동시 로딩 중복 제거, 적중 통계 확인
+"""
+
+import time
+import threading
+
+from model_registry import ModelRegistry, ModelTooLargeError
+
+MB = 1024 * 1024
+
+
+class _FakeModel:
+    """estimated_size_bytes로 크기를 보고하는 모델 대역"""
+
+    def __init__(self, name, size_mb):
+        self.name = name
+        self.estimated_size_bytes = int(size_mb * MB)
+
+
+def _fake_loader(sizes_mb, loaded=None, delay=0.0):
+    def loader(name):
+        if loaded is not None:
+            loaded.append(name)
+        if delay:
+            time.sleep(delay)
+        return _FakeModel(name, sizes_mb[name])
+    return loader
+
+
+def test_lru_eviction_order():
+    print("🔍 LRU 해제 순서 테스트...")
+    registry = ModelRegistry(memory_budget_mb=300, loader=_fake_loader({"a": 100, "b": 100, "c": 100, "d": 100}))
+    registry.get("a")
+    registry.get("b")
+    registry.get("c")
+    registry.get("a")  # a를 최근 사용으로 갱신 → 가장 오래된 모델은 b
+    assert registry.get_status()["lru_order"] == ["b", "c", "a"]
+
+    registry.get("d")
+    status = registry.get_status()
+    assert status["lru_order"] == ["c", "a", "d"], status["lru_order"]
+    assert not registry.is_loaded("b") and status["evictions"] == 1
+    assert status["models"]["b"]["loaded"] is False
+    print("✅ LRU 해제 순서 테스트 통과")
+
+
+def test_budget_enforcement():
+    print("🔍 메모리 예산 테스트...")
+    loaded = []
+    registry = ModelRegistry(
+        memory_budget_mb=500,
+        loader=_fake_loader({"a": 200, "b": 200, "c": 100, "big": 450, "huge": 600}, loaded)
+    )
+    registry.get("a")
+    registry.get("b")
+    registry.get("c")
+    assert registry.get_status()["resident_mb"] == 500
+
+    # 새 모델이 들어갈 때까지만 오래된 모델부터 해제
+    registry.get("big")
+    status = registry.get_status()
+    assert status["lru_order"] == ["big"] and status["resident_mb"] == 450 and status["evictions"] == 3
+
+    # 전체 예산보다 큰 모델은 거절하고 상주 모델은 그대로 유지
+    try:
+        registry.get("huge")
+        assert False, "예산보다 큰 모델은 ModelTooLargeError가 발생해야 함"
+    except ModelTooLargeError:
+        pass
+    status = registry.get_status()
+    assert status["lru_order"] == ["big"] and status["resident_mb"] <= 500
+    assert "huge" not in status["models"]
+    print(f"  - 로딩 순서: {loaded}")
+    print("✅ 메모리 예산 테스트 통과")
+
+
+def test_oversized_estimate_refused_before_loading():
+    print("🔍 추정 크기 초과 모델 사전 거절 테스트...")
+    loaded = []
+    registry = ModelRegistry(memory_budget_mb=1000, loader=_fake_loader({"base": 290, "large": 6170}, loaded))
+    registry.get("base")
+    try:
+        registry.get("large")
+        assert False, "추정 크기가 예산보다 크면 로딩 전에 거절해야 함"
+    except ModelTooLargeError:
+        pass
+    assert loaded == ["base"] and registry.is_loaded("base")
+    print("✅ 추정 크기 초과 모델 사전 거절 테스트 통과")
+
+
+def test_concurrent_loads_deduplicated():
+    print("🔍 동시 로딩 중복 제거 테스트...")
+    loaded = []
+    registry = ModelRegistry(memory_budget_mb=1000, loader=_fake_loader({"a": 100, "b": 100}, loaded, delay=0.1))
+    results = []
+    barrier = threading.Barrier(8)
+
+    def request(name):
+        barrier.wait()
+        results.append(registry.get(name))
+
+    threads = [threading.Thread(target=request, args=("a" if i < 6 else "b",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(loaded) == ["a", "b"], loaded
+    assert len({id(model) for model in results if model.name == "a"}) == 1
+    status = registry.get_status()["models"]
+    assert status["a"]["load_count"] == 1 and status["a"]["hits"] == 5
+    assert status["b"]["load_count"] == 1 and status["b"]["hits"] == 1
+    print("✅ 동시 로딩 중복 제거 테스트 통과")
+
+
+def test_hit_miss_stats():
+    print("🔍 적중/로딩 통계 테스트...")
+    loaded = []
+    registry = ModelRegistry(memory_budget_mb=200, loader=_fake_loader({"a": 150, "b": 150}, loaded))
+    registry.get("a")
+    registry.get("a")
+    registry.get("a")
+    registry.get("b")  # a 해제
+    registry.get("a")  # 다시 로딩 (미스)
+
+    models = registry.get_status()["models"]
+    print(f"  - 상태: {models}")
+    assert loaded == ["a", "b", "a"]
+    assert models["a"]["hits"] == 2 and models["a"]["load_count"] == 2 and models["a"]["loaded"] is True
+    assert models["b"]["hits"] == 0 and models["b"]["load_count"] == 1 and models["b"]["loaded"] is False
+    assert models["a"]["size_mb"] == 150.0
+    print("✅ 적중/로딩 통계 테스트 통과")
+
+
+def test_oversized_model_not_swapped_for_base():
+    print("🔍 예산 초과 모델 요청 거절 (base 폴백 없음) 테스트...")
+    import stt_handlers
+    from fastapi import HTTPException
+
+    loaded = []
+    original = stt_handlers.model_registry
+    stt_handlers.model_registry = ModelRegistry(memory_budget_mb=4096,
+                                                loader=_fake_loader({"base": 290, "large": 6170}, loaded))
+    try:
+        stt_handlers.get_whisper_model("large")
+        assert False, "예산보다 큰 모델 요청은 base로 바꾸지 않고 실패해야 함"
+    except HTTPException as e:
+        assert e.status_code == 503 and "4096MB" in e.detail, e.detail
+    finally:
+        stt_handlers.model_registry = original
+    assert loaded == [], f"다른 모델로 폴백됨: {loaded}"
+    print("✅ 예산 초과 모델 요청 거절 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 모델 레지스트리 테스트 시작\n")
+
+    test_lru_eviction_order()
+    test_budget_enforcement()
+    test_oversized_estimate_refused_before_loading()
+    test_concurrent_loads_deduplicated()
+    test_hit_miss_stats()
+    test_oversized_model_not_swapped_for_base()
+
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+모델 백그라운드 워밍업 / 준비 상태 테스트 스크립트
+"""
+
+import time
+import asyncio
+import threading
+
+from model_warmup import ModelWarmup, ModelNotReadyError, warm_up_on_workers
+from inference_pool import get_inference_pool
+
+
+# 워커별 복제본(deepcopy)에서 실행되므로 호출 스레드는 모듈 전역에 기록
+_warmup_threads = set()
+_warmup_lock = threading.Lock()
+
+
+class FakeModel:
+    def transcribe(self, audio, **options):
+        with _warmup_lock:
+            _warmup_threads.add(threading.current_thread().name)
+        return {"text": "", "segments": [], "language": options.get("language")}
+
+
+def test_requests_wait_until_ready():
+    print("🔍 준비 전 요청 대기 테스트...")
+    release = threading.Event()
+    warmed = []
+
+    def slow_warmup(model):
+        release.wait(5)
+        warmed.append(model)
+
+    warmup = ModelWarmup(loader=lambda name: f"model-{name}", warmup_fn=slow_warmup)
+    warmup.start(["base"])
+    assert not warmup.is_ready()
+    assert warmup.get_status()["models"]["base"]["status"] in ("loading", "warming")
+
+    async def request():
+        start = time.time()
+        await warmup.wait_until_ready("base", timeout=5)
+        return time.time() - start
+
+    async def scenario():
+        task = asyncio.create_task(request())
+        await asyncio.sleep(0.3)
+        assert not task.done()  # 워밍업이 끝날 때까지 실패하지 않고 대기
+        release.set()
+        return await task
+
+    waited = asyncio.run(scenario())
+    print(f"  - 대기 시간: {waited:.2f}초, 상태: {warmup.get_status()}")
+    assert waited >= 0.3
+    assert warmup.is_ready() and warmed == ["model-base"]
+    assert warmup.get_status()["models"]["base"]["warmup_seconds"] is not None
+    # 워밍업 대상이 아닌 모델은 바로 통과
+    asyncio.run(warmup.wait_until_ready("small", timeout=0))
+    print("✅ 준비 전 요청 대기 테스트 통과")
+
+
+def test_failed_and_timeout():
+    print("🔍 워밍업 실패/대기 시간 초과 테스트...")
+
+    def broken_loader(name):
+        raise RuntimeError("다운로드 실패")
+
+    warmup = ModelWarmup(loader=broken_loader, warmup_fn=lambda model: None)
+    warmup.start(["base"]).join(5)
+    assert warmup.get_status()["models"]["base"]["status"] == "failed"
+    try:
+        asyncio.run(warmup.wait_until_ready("base", timeout=1))
+        raise AssertionError("실패한 모델은 ModelNotReadyError여야 함")
+    except ModelNotReadyError:
+        pass
+
+    blocker = threading.Event()
+    warmup = ModelWarmup(loader=lambda name: blocker.wait(5), warmup_fn=lambda model: None)
+    warmup.start(["base"])
+    try:
+        asyncio.run(warmup.wait_until_ready("base", timeout=0.2))
+        raise AssertionError("대기 시간 초과 시 ModelNotReadyError여야 함")
+    except ModelNotReadyError:
+        pass
+    finally:
+        blocker.set()
+    print("✅ 워밍업 실패/대기 시간 초과 테스트 통과")
+
+
+def test_warm_up_runs_on_every_worker():
+    print("🔍 워커별 더미 전사 테스트...")
+    _warmup_threads.clear()
+    warm_up_on_workers(FakeModel(), audio_sec=0.1)
+    pool = get_inference_pool()
+    print(f"  - 워커 수: {pool.max_workers}, 실행 스레드: {sorted(_warmup_threads)}")
+    assert len(_warmup_threads) == pool.max_workers
+    print("✅ 워커별 더미 전사 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 모델 워밍업 테스트 시작\n")
+
+    test_requests_wait_until_ready()
+    test_failed_and_timeout()
+    test_warm_up_runs_on_every_worker()
+
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+디코딩 PCM 캐시 테스트 스크립트
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+from pcm_cache import PCMCache, SAMPLE_RATE
+
+
+def test_pcm_cache_decodes_once():
+    print("🔍 PCM 캐시 1회 디코딩 테스트...")
+    decode_calls = []
+
+    def fake_decoder(file_path):
+        decode_calls.append(file_path)
+        return np.linspace(-1, 1, SAMPLE_RATE * 2, dtype=np.float32)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        audio_path = os.path.join(tmp_dir, "call.m4a")
+        with open(audio_path, "wb") as f:
+            f.write(os.urandom(2048))
+
+        cache = PCMCache(os.path.join(tmp_dir, "pcm"), max_size_mb=16, enabled=True, decoder=fake_decoder)
+        first = cache.get(audio_path)
+        second = cache.get(audio_path)
+
+        assert len(decode_calls) == 1, "같은 파일은 한 번만 디코딩해야 함"
+        assert isinstance(second, np.memmap), "캐시된 PCM은 memory-map으로 읽어야 함"
+        assert second.dtype == np.float32 and second.shape == (SAMPLE_RATE * 2,)
+        assert np.array_equal(np.asarray(first), np.asarray(second))
+
+        stats = cache.get_stats()
+        print(f"  - 통계: {stats}")
+        assert stats["hits"] == 1 and stats["misses"] == 1 and stats["entries"] == 1
+    print("✅ PCM 캐시 테스트 통과")
+
+
+def test_pcm_cache_eviction():
+    print("🔍 PCM 캐시 크기 제한 테스트...")
+
+    def fake_decoder(file_path):
+        return np.zeros(SAMPLE_RATE * 10, dtype=np.float32)  # 약 640KB
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = PCMCache(os.path.join(tmp_dir, "pcm"), max_size_mb=1, enabled=True, decoder=fake_decoder)
+        for i in range(3):
+            audio_path = os.path.join(tmp_dir, f"call_{i}.wav")
+            with open(audio_path, "wb") as f:
+                f.write(str(i).encode() * 100)
+            cache.get(audio_path)
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 1 and stats["evictions"] == 2, stats
+    print("✅ PCM 캐시 크기 제한 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 PCM 캐시 테스트 시작\n")
+
+    test_pcm_cache_decodes_once()
+    test_pcm_cache_eviction()
+
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+한글 자모 발음 키 인덱스 테스트 스크립트
+"""
+
+import logging
+
+from phonetic_index import (
+    PhoneticIndex, decompose, latin_readings, phonetic_key, name_keys, strip_particle,
+    build_domain_phonetic_index
+)
+from postprocessor import comprehensive_postprocess, SPOKEN_ALIASES
+
+DOMAIN_DATA = {
+    "allowed": {"equipment": ["IP/MPLS", "OTN", "ROADM", "ROADM", "MSPP", "PTN", "ADVA", "Server"],
+                "errors": [], "requests": []},
+    "maps": {"model_to_equipment": {"1830PSS-32": "ROADM", "ALM": "ADVA ALM", "100G": "ROADM", "7705 SAR-8": "IP/MPLS",
+                                    "1646SM": "MSPP"}},
+}
+
+
+def test_jamo_and_readings():
+    print("🔍 자모 분해 / 라틴 약어 읽기 테스트...")
+    assert decompose("로드엠") == "ㄹㅗㄷㅡㅇㅔㅁ"
+    assert decompose("A1") == "A1"
+    assert latin_readings("ROADM") == ["로드엠", "알오에이디엠"]
+    assert latin_readings("STN") == ["에스티엔"]
+    assert latin_readings("1830PSS") == ["1830피에스에스"]
+    # 초성 ㅇ 제거, ㅐ/ㅔ 통합, 비음 받침 통합
+    assert phonetic_key("엠") == phonetic_key("앰") == phonetic_key("엔") == phonetic_key("엥")
+    assert phonetic_key("로드엔") == phonetic_key("로드엠")
+    assert phonetic_key("로드엠") != phonetic_key("로도엠")
+    assert name_keys("IP/MPLS") == [phonetic_key("아이피엠피엘에스")]
+    assert strip_particle("로드엠에서") == "로드엠"
+    assert strip_particle("로드엠") is None and strip_particle("ROADM") is None
+    print("✅ 자모 분해 / 라틴 약어 읽기 테스트 통과")
+
+
+def test_resolve_spoken_variants():
+    print("🔍 발화 변형 → 정식 표기 변환 테스트...")
+    index = build_domain_phonetic_index(DOMAIN_DATA, {"STN": ["에스티엔", "스티엔"]})
+    cases = {
+        "로드엔이 다운됐어요": "ROADM이 다운됐어요",
+        "roadn 장비 알람": "ROADM 장비 알람",
+        "알오에이디엠에서 알람이": "ROADM에서 알람이",
+        "아이피 엠피엘에스 장비": "IP/MPLS 장비",
+        "오티엔하고 피티엠": "OTN하고 PTN",
+        "1830PSS 32 카드": "1830PSS-32 카드",
+        "아드바 장비, 에이엘엠 알람": "ADVA 장비, ALM 알람",
+        "스티엔 기술지원 에스 티 엔": "STN 기술지원 STN",
+        "ROADM MSPP 그대로": "ROADM MSPP 그대로",
+    }
+    for spoken, expected in cases.items():
+        resolved, hits = index.resolve(spoken)
+        assert resolved == expected, (spoken, resolved)
+    # 정식 표기와 같은 토큰은 일치 목록에 넣지 않음
+    assert index.resolve("ROADM 장비")[1] == []
+    assert index.lookup("로드엠") == "ROADM" and index.lookup("마이크") is None
+    print("✅ 발화 변형 → 정식 표기 변환 테스트 통과")
+
+
+def test_no_false_positives():
+    print("🔍 일반 대화 오변환 방지 테스트...")
+    index = build_domain_phonetic_index(DOMAIN_DATA)
+    sentences = [
+        "네 안녕하세요 전역망원지팀 김철수입니다.",
+        "서버 IP 좀 확인 부탁드립니다",
+        "어제 저녁 9시 30분쯤 링크 장애가 있었고 100 정도 손실이 났어요",
+        "엠 그러니까 엔 이건 아니고요",
+    ]
+    for sentence in sentences:
+        assert index.resolve(sentence) == (sentence, []), sentence
+    # 한글 별칭(STN)은 자모가 같을 때만 변환 - 소리가 비슷한 일반 발화/다른 약어(SM, STM)는 그대로
+    index = build_domain_phonetic_index(DOMAIN_DATA, SPOKEN_ALIASES)
+    for sentence in ["에스엠 장비 확인", "스탠 확인해 주세요", "스템이 문제", "에스티엠 쪽"]:
+        assert index.resolve(sentence) == (sentence, []), sentence
+    assert index.resolve("스텐 쪽 에스엔")[0] == "STN 쪽 STN"
+    assert index.resolve("1646 에스엠 카드")[0] == "1646SM 카드"  # 모델명 전체일 때만 변환
+    # 너무 짧은 키/숫자만 있는 키는 등록하지 않음
+    short = PhoneticIndex().add("M").add("7705")
+    assert len(short) == 0
+    print("✅ 일반 대화 오변환 방지 테스트 통과")
+
+
+def test_comprehensive_postprocess():
+    print("🔍 통합 후처리 발음 매핑 테스트...")
+    logging.disable(logging.WARNING)
+    text = "에스티엔 기술지원팀인데요 로드엔이 또 죽었어요"
+    assert comprehensive_postprocess(text, DOMAIN_DATA) == "STN 기술지원팀인데요 ROADM이 또 죽었어요"
+    assert comprehensive_postprocess(text, None) == "STN 기술지원팀인데요 로드엔이 또 죽었어요"
+    for sentence in ["에스엠 장비 확인", "스탠 확인해 주세요", "스템이 문제", "에스티엠 쪽"]:
+        assert comprehensive_postprocess(sentence, DOMAIN_DATA) == sentence, sentence
+    logging.disable(logging.NOTSET)
+    print("✅ 통합 후처리 발음 매핑 테스트 통과")
+
+
+if __name__ == "__main__":
+    test_jamo_and_readings()
+    test_resolve_spoken_variants()
+    test_no_false_positives()
+    test_comprehensive_postprocess()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+전사 우선순위 스케줄러 테스트 스크립트
+"""
+
+import asyncio
+
+from priority_scheduler import (
+    PriorityScheduler, parse_weights, PRIORITY_INTERACTIVE, PRIORITY_BULK, PRIORITY_BACKGROUND
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+async def _run_requests(scheduler, requests, order, work=0.01):
+    """requests: [(이름, 우선순위, 길이)] - 슬롯을 받은 순서를 order에 기록"""
+    async def job(name, priority, duration):
+        async with scheduler.slot(priority, duration):
+            order.append(name)
+            await asyncio.sleep(work)
+
+    # 슬롯을 먼저 점유한 뒤 나머지를 등록하여 대기열에서의 순서만 비교
+    blocker = asyncio.Event()
+
+    async def hold():
+        async with scheduler.slot(PRIORITY_BACKGROUND, 1.0):
+            await blocker.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    tasks = [asyncio.create_task(job(*request)) for request in requests]
+    await asyncio.sleep(0)
+    blocker.set()
+    await asyncio.gather(holder, *tasks)
+
+
+def test_parse_weights():
+    print("🔍 가중치 설정 파싱 테스트...")
+    weights = parse_weights("interactive=10,bulk=3,unknown=5")
+    assert weights == {PRIORITY_INTERACTIVE: 10.0, PRIORITY_BULK: 3.0, PRIORITY_BACKGROUND: 1.0}
+    print("✅ 가중치 설정 파싱 테스트 통과")
+
+
+def test_interactive_jumps_bulk_backlog():
+    print("🔍 일괄 처리 대기열 중 대화형 요청 우선 배정 테스트...")
+    scheduler = PriorityScheduler(slots=1, sjf=False)
+    order = []
+    requests = [(f"bulk{i}", PRIORITY_BULK, 60.0) for i in range(10)] + [("upload", PRIORITY_INTERACTIVE, 60.0)]
+    asyncio.run(_run_requests(scheduler, requests, order))
+    print(f"  - 처리 순서: {order}")
+    # 일괄 처리 10건 뒤에 도착했지만 첫 번째 일괄 작업 다음 안에 처리됨
+    assert order.index("upload") <= 1
+    stats = scheduler.get_stats()
+    assert stats["classes"][PRIORITY_BULK]["dispatched"] == 10 and stats["running"] == 0
+    print("✅ 일괄 처리 대기열 중 대화형 요청 우선 배정 테스트 통과")
+
+
+def test_weighted_fair_share():
+    print("🔍 가중치 공정 분배 테스트...")
+    scheduler = PriorityScheduler(slots=1, weights={PRIORITY_INTERACTIVE: 3.0, PRIORITY_BULK: 1.0, PRIORITY_BACKGROUND: 1.0},
+                                  sjf=False)
+    order = []
+    requests = [(f"i{i}", PRIORITY_INTERACTIVE, 10.0) for i in range(12)] + [(f"b{i}", PRIORITY_BULK, 10.0) for i in range(12)]
+    asyncio.run(_run_requests(scheduler, requests, order, work=0))
+    first = order[:16]
+    interactive = sum(1 for name in first if name.startswith("i"))
+    print(f"  - 처음 16건 중 대화형: {interactive}건, 순서: {first}")
+    # 둘 다 대기 중이면 3:1 비율로 배정 (일괄 처리도 굶지 않음)
+    assert interactive == 12 and sum(1 for name in first if name.startswith("b")) == 4
+    print("✅ 가중치 공정 분배 테스트 통과")
+
+
+def test_shortest_job_first_with_aging():
+    print("🔍 클래스 내 짧은 작업 우선 + 대기 보정 테스트...")
+    clock = FakeClock()
+    scheduler = PriorityScheduler(slots=1, sjf=True, aging=1.0, clock=clock)
+    order = []
+
+    async def scenario():
+        blocker = asyncio.Event()
+
+        async def hold():
+            async with scheduler.slot(PRIORITY_BULK, 1.0):
+                await blocker.wait()
+
+        async def job(name, duration):
+            async with scheduler.slot(PRIORITY_BULK, duration):
+                order.append(name)
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        tasks = [asyncio.create_task(job("long", 600.0))]
+        await asyncio.sleep(0)
+        clock.now = 10.0
+        tasks += [asyncio.create_task(job(name, duration)) for name, duration in [("mid", 120.0), ("short", 30.0)]]
+        await asyncio.sleep(0)
+        blocker.set()
+        await asyncio.gather(holder, *tasks)
+
+    asyncio.run(scenario())
+    assert order == ["short", "mid", "long"], order
+
+    # 오래 기다린 긴 녹음은 대기 시간만큼 짧게 취급되어 결국 먼저 처리됨
+    clock.now = 0.0
+    order.clear()
+
+    async def aged():
+        blocker = asyncio.Event()
+
+        async def hold():
+            async with scheduler.slot(PRIORITY_BULK, 1.0):
+                await blocker.wait()
+
+        async def job(name, duration):
+            async with scheduler.slot(PRIORITY_BULK, duration):
+                order.append(name)
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        tasks = [asyncio.create_task(job("long", 600.0))]
+        await asyncio.sleep(0)
+        clock.now = 1000.0
+        tasks.append(asyncio.create_task(job("short", 30.0)))
+        await asyncio.sleep(0)
+        blocker.set()
+        await asyncio.gather(holder, *tasks)
+
+    asyncio.run(aged())
+    assert order == ["long", "short"], order
+    print("✅ 클래스 내 짧은 작업 우선 + 대기 보정 테스트 통과")
+
+
+def test_cancelled_waiter_releases_nothing():
+    print("🔍 대기 중 취소 처리 테스트...")
+    scheduler = PriorityScheduler(slots=1)
+
+    async def scenario():
+        await scheduler.acquire(PRIORITY_BULK, 10.0)
+        waiter = asyncio.create_task(scheduler.acquire(PRIORITY_INTERACTIVE, 10.0))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        # 취소/타임아웃된 요청은 대기 목록에서 바로 빠짐
+        try:
+            await asyncio.wait_for(scheduler.acquire(PRIORITY_INTERACTIVE, 5.0), timeout=0.01)
+            assert False, "슬롯이 없으면 타임아웃되어야 함"
+        except asyncio.TimeoutError:
+            pass
+        assert scheduler.get_stats()["classes"][PRIORITY_INTERACTIVE]["waiting"] == 0
+        assert scheduler._waiting[PRIORITY_INTERACTIVE] == []
+        scheduler.release()
+        assert scheduler.get_stats()["running"] == 0
+        # 취소된 대기 요청은 건너뛰고 다음 요청이 바로 슬롯을 받음
+        await asyncio.wait_for(scheduler.acquire(PRIORITY_BULK, 10.0), timeout=1)
+        assert scheduler.get_stats()["running"] == 1
+
+    asyncio.run(scenario())
+    print("✅ 대기 중 취소 처리 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 전사 우선순위 스케줄러 테스트 시작\n")
+
+    test_parse_weights()
+    test_interactive_jumps_bulk_backlog()
+    test_weighted_fair_share()
+    test_shortest_job_first_with_aging()
+    test_cancelled_waiter_releases_nothing()
+
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+int8 양자화 모델 이름 해석 / 레지스트리 테스트 스크립트
+"""
+
+from model_registry import (
+    ModelRegistry, parse_model_name, estimated_model_size_mb, quantize_whisper_model,
+    ESTIMATED_MODEL_SIZES_MB
+)
+
+
+def test_parse_model_name():
+    print("🔍 모델 이름 해석 테스트...")
+    assert parse_model_name("small-int8") == ("small", True)
+    assert parse_model_name("medium") == ("medium", False)
+    assert estimated_model_size_mb("medium-int8") < ESTIMATED_MODEL_SIZES_MB["medium"]
+    assert estimated_model_size_mb("large") == ESTIMATED_MODEL_SIZES_MB["large"]
+    print("✅ 모델 이름 해석 테스트 통과")
+
+
+def test_registry_keeps_quantized_separate():
+    print("🔍 양자화 모델 별도 캐시 테스트...")
+    loaded = []
+
+    def loader(name):
+        loaded.append(name)
+        return object()
+
+    registry = ModelRegistry(memory_budget_mb=4096, loader=loader)
+    fp32 = registry.get("small")
+    int8 = registry.get("small-int8")
+    assert fp32 is not int8 and loaded == ["small", "small-int8"]
+
+    models = registry.get_status()["models"]
+    print(f"  - 상태: {models}")
+    assert models["small"]["quantized"] is False
+    assert models["small-int8"]["quantized"] is True
+    print("✅ 양자화 모델 별도 캐시 테스트 통과")
+
+
+def test_quantize_replaces_linear_layers():
+    print("🔍 선형 계층 int8 양자화 테스트...")
+    try:
+        import torch
+    except ImportError:
+        print("  - torch가 설치되지 않아 건너뜀")
+        return
+
+    class CustomLinear(torch.nn.Linear):
+        """whisper.model.Linear처럼 nn.Linear를 상속한 계층"""
+
+    model = torch.nn.Sequential(CustomLinear(16, 8), torch.nn.GELU(), torch.nn.Linear(8, 4))
+    x = torch.randn(2, 16)
+    expected = model(x)
+    quantized = quantize_whisper_model(model)
+
+    names = [type(module).__name__ for module in quantized.modules()]
+    print(f"  - 모듈: {names}")
+    assert not any(type(module) in (torch.nn.Linear, CustomLinear) for module in quantized.modules())
+    assert torch.allclose(quantized(x), expected, atol=0.1)
+    print("✅ 선형 계층 int8 양자화 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 int8 양자화 모델 테스트 시작\n")
+
+    test_parse_model_name()
+    test_registry_keeps_quantized_separate()
+    test_quantize_replaces_linear_layers()
+
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+세그먼트 단위 후처리 엔진 테스트 스크립트
+세그먼트별 후처리 + 전체 텍스트 재후처리(기존 2회 처리)와 결과가 같은지 골든 코퍼스/임의 코퍼스로 비교
+"""
+
+import sys
+import time
+import random
+import logging
+
+from postprocessor import comprehensive_postprocess, postprocess_segments
+from stt_handlers import postprocess_stage, build_stt_response
+from channel_split import merge_channel_results
+
+DOMAIN_DATA = {
+    "allowed": {"equipment": ["IP/MPLS", "OTN", "ROADM", "MSPP", "PTN", "ADVA", "Server"],
+                "errors": [], "requests": []},
+    "maps": {"model_to_equipment": {"1830PSS-32": "ROADM", "ALM": "ADVA ALM", "7705 SAR-8": "IP/MPLS"}},
+}
+
+# 골든 코퍼스: Whisper 형식 세그먼트 텍스트 목록 (앞 공백 포함, 전체 텍스트 = 세그먼트 텍스트 연결)
+GOLDEN_CORPUS = [
+    [" 네 안녕하세요 에스티엔 기술지원팀입니다.", " 로드엔이 또 다운됐어요", " 확인 부탁드립니다."],
+    [" 아이피", " 엠피엘에스 장비에서 알람이 올라옵니다"],  # 여러 토큰 장비명이 세그먼트 경계에 걸침
+    [" 에스", "티엔 맞으시죠?", " 네 맞습니다"],  # 공백 없이 이어진 세그먼트
+    [" 알오에이디엠", "", " 카드 교체 건입니다"],  # 빈 세그먼트
+    [" 1830PSS", " 32 카드가 불량이에요", " sn 말고 SNMP 트랩이요"],
+    ["", " 스텐 쪽 담당자분", " 연결해 주세요"],
+    [" 오티엔하고 피티엠 둘 다", " 장애입니다"],
+    [" 로드", " .", " 엔이 다운"],  # 토큰 없는 세그먼트를 사이에 두고 장비명이 이어짐
+]
+
+
+def legacy_stage_texts(texts, full_text, domain_data):
+    """기존 방식: 세그먼트마다 후처리 + 전체 텍스트 한 번 더 후처리"""
+    return [comprehensive_postprocess(text.strip(), domain_data) for text in texts], \
+        comprehensive_postprocess(full_text, domain_data)
+
+
+def check(raw_texts, full_text, domain_data):
+    stripped = [text.strip() for text in raw_texts]
+    expected_texts, expected_transcript = legacy_stage_texts(raw_texts, full_text, domain_data)
+    result = postprocess_segments(stripped, full_text, domain_data)
+    assert result["texts"] == expected_texts, (raw_texts, result["texts"], expected_texts)
+    assert result["transcript"] == expected_transcript, (full_text, result["transcript"], expected_transcript)
+    if result["offsets"] is not None:
+        # 세그먼트 위치는 순서대로, 따로 처리한 세그먼트는 후처리 결과 그대로
+        previous_end = 0
+        for text, (start, end) in zip(result["texts"], result["offsets"]):
+            assert previous_end <= end and start <= end
+            assert result["offsets"].count((start, end)) > 1 or result["transcript"][start:end] == text \
+                or result["merged"]
+            previous_end = end
+    return result
+
+
+def test_golden_corpus():
+    print("🔍 골든 코퍼스 결과 일치 테스트...")
+    logging.disable(logging.WARNING)
+    for domain_data in (DOMAIN_DATA, None):
+        for raw_texts in GOLDEN_CORPUS:
+            check(raw_texts, "".join(raw_texts), domain_data)
+            # 전체 텍스트가 세그먼트 연결과 다른 경우 (앞뒤 공백, 청크 병합 시 공백 연결, 세그먼트에 없는 텍스트)
+            check(raw_texts, "  " + " ".join(text.strip() for text in raw_texts) + " ", domain_data)
+            check(raw_texts, "에스" + "".join(raw_texts) + " 티엔", domain_data)
+    # 세그먼트를 전체 텍스트에서 찾지 못하면 전체 텍스트를 후처리
+    result = check([" 로드엔"], " 로드 엔", DOMAIN_DATA)
+    assert result["offsets"] is None
+    logging.disable(logging.NOTSET)
+    print("✅ 골든 코퍼스 결과 일치 테스트 통과")
+
+
+def test_postprocess_stage():
+    print("🔍 postprocess_stage 출력 테스트...")
+    logging.disable(logging.WARNING)
+    raw_texts = GOLDEN_CORPUS[0]
+    result = {
+        "text": "".join(raw_texts),
+        "segments": [{"text": text, "start": float(i), "end": i + 1.0} for i, text in enumerate(raw_texts)],
+    }
+    processed = postprocess_stage(result, DOMAIN_DATA)
+    assert processed["transcript"] == comprehensive_postprocess(result["text"], DOMAIN_DATA)
+    assert processed["original_transcript"] == result["text"]
+    assert [segment["text"] for segment in processed["segments"]] == [
+        "네 안녕하세요 STN 기술지원팀입니다.", "ROADM이 또 다운됐어요", "확인 부탁드립니다."]
+    assert [segment["text"] for segment in processed["original_segments"]] == [text.strip() for text in raw_texts]
+    for segment, (start, end) in zip(processed["segments"], processed["segment_offsets"]):
+        assert processed["transcript"][start:end] == segment["text"]
+    # 전사 처리 통계는 응답까지 전달
+    assert "cascade" not in processed
+    cascade_stats = {"mode": "spans", "spans": 1}
+    processed = postprocess_stage({**result, "cascade": cascade_stats}, DOMAIN_DATA)
+    response = build_stt_response(processed, None, 1.0, "stt_test")
+    assert response.cascade == cascade_stats and response.silence_strip is None
+    # 스테레오: 채널별 통계는 합산되어 병합 결과와 응답에 남음
+    channel_results = [
+        {**result, "cascade": {"model": "medium", "mode": "spans", "spans": 1, "redecoded_sec": 2.5},
+         "silence_strip": {"original_sec": 60.0, "removed_sec": 12.0, "pieces": 3}},
+        {**result, "cascade": {"model": "medium", "mode": "none", "spans": 0, "redecoded_sec": 0.0},
+         "silence_strip": {"original_sec": 60.0, "removed_sec": 20.5, "pieces": 2}},
+    ]
+    processed = postprocess_stage(merge_channel_results(channel_results), DOMAIN_DATA)
+    response = build_stt_response(processed, None, 1.0, "stt_test")
+    assert response.cascade["spans"] == 1 and response.cascade["redecoded_sec"] == 2.5
+    assert response.cascade["model"] == "medium" and response.cascade["mode"] == "spans,none"
+    assert response.silence_strip["removed_sec"] == 32.5 and response.silence_strip["pieces"] == 5
+    assert response.silence_strip["per_channel"] == [r["silence_strip"] for r in channel_results]
+    logging.disable(logging.NOTSET)
+    print("✅ postprocess_stage 출력 테스트 통과")
+
+
+FRAGMENTS = ["에스", "티엔", "에스티엔", "스텐", "SN", "로드", "엔이", "로드엠", "ROADN", "아이피", "엠피엘에스",
+             "오티엔", "1830PSS", "32", "에이엘엠", "네", "확인", "장비", "알람이", "입니다", ".", ",", "-", "/"]
+
+
+def random_segments(rng, count):
+    segments = []
+    for _ in range(count):
+        words = [rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 4))]
+        joiner = rng.choice([" ", "", " "])
+        segments.append(rng.choice([" ", "", "  "]) + joiner.join(words))
+    return segments
+
+
+def test_random_corpus():
+    print("🔍 임의 코퍼스 결과 일치 테스트...")
+    logging.disable(logging.WARNING)
+    rng = random.Random(0)
+    for _ in range(1500):
+        raw_texts = random_segments(rng, rng.randint(0, 6))
+        check(raw_texts, "".join(raw_texts), rng.choice([DOMAIN_DATA, None]))
+    logging.disable(logging.NOTSET)
+    print("✅ 임의 코퍼스 결과 일치 테스트 통과")
+
+
+def benchmark(segments: int = 600):
+    """30분 통화 규모 세그먼트에서 기존 2회 처리와 세그먼트 1회 처리 시간 비교"""
+    logging.disable(logging.WARNING)
+    rng = random.Random(1)
+    raw_texts = [" " + " ".join(rng.choice(FRAGMENTS) for _ in range(12)) for _ in range(segments)]
+    full_text = "".join(raw_texts)
+    stripped = [text.strip() for text in raw_texts]
+    comprehensive_postprocess(full_text, DOMAIN_DATA)  # 인덱스 생성 제외
+
+    started = time.perf_counter()
+    legacy_stage_texts(raw_texts, full_text, DOMAIN_DATA)
+    legacy_sec = time.perf_counter() - started
+    started = time.perf_counter()
+    result = postprocess_segments(stripped, full_text, DOMAIN_DATA)
+    engine_sec = time.perf_counter() - started
+    logging.disable(logging.NOTSET)
+    print(f"📊 세그먼트 {segments}개: 2회 처리 {legacy_sec * 1000:.1f}ms → 세그먼트 1회 처리 {engine_sec * 1000:.1f}ms "
+          f"(다시 처리한 경계 구간 {result['merged']}개)")
+
+
+if __name__ == "__main__":
+    test_golden_corpus()
+    test_postprocess_stage()
+    test_random_corpus()
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 600)
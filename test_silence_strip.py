@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+전사 전 무음 제거 및 타임스탬프 복원 테스트 스크립트
+"""
+
+import numpy as np
+
+from audio_chunking import SAMPLE_RATE
+from silence_strip import OffsetMap, strip_silence, remap_result, STRIP_KEEP_SEC
+
+
+def _tone(seconds, rng):
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return (0.2 * np.sin(2 * np.pi * 220 * t) + rng.normal(0, 0.01, len(t))).astype(np.float32)
+
+
+def _silence(seconds, rng):
+    return rng.normal(0, 0.0005, int(SAMPLE_RATE * seconds)).astype(np.float32)
+
+
+def test_offset_map_boundaries():
+    print("🔍 오프셋 맵 변환 테스트...")
+    offsets = OffsetMap([(0.0, 2.0, 3.0), (3.0, 10.0, 2.0)])
+    assert offsets.to_original(0.0) == 2.0
+    assert offsets.to_original(1.5) == 3.5
+    assert offsets.to_original(3.0) == 10.0  # 시작 시간은 다음 조각 시작
+    assert offsets.to_original(3.0, is_end=True) == 5.0  # 끝 시간은 앞 조각 끝
+    assert offsets.to_original(4.5) == 11.5
+    assert offsets.to_original(9.0, is_end=True) == 12.0  # 마지막 조각 끝을 넘지 않음
+    assert offsets.stripped_sec == 5.0
+    print("✅ 오프셋 맵 변환 테스트 통과")
+
+
+def test_strip_long_silences():
+    print("🔍 긴 무음 제거 테스트...")
+    rng = np.random.default_rng(0)
+    audio = np.concatenate([_silence(3, rng), _tone(4, rng), _silence(20, rng), _tone(5, rng), _silence(0.5, rng), _tone(2, rng)])
+    stripped, offsets = strip_silence(audio)
+    stripped_sec = len(stripped) / SAMPLE_RATE
+    print(f"  - {len(audio) / SAMPLE_RATE:.1f}초 → {stripped_sec:.1f}초, 조각: {offsets.pieces}")
+    # 앞쪽 3초와 중간 20초 무음은 발화 앞뒤 여유(STRIP_KEEP_SEC / 2)만 남기고 제거, 0.5초 쉼은 유지
+    assert abs(stripped_sec - (11.5 + 1.5 * STRIP_KEEP_SEC)) < 0.1
+    assert len(offsets.pieces) == 2
+    assert abs(offsets.to_original(STRIP_KEEP_SEC / 2) - 3.0) < 0.05
+    # 두 번째 발화 시작은 원본 27초 부근으로 복원
+    assert abs(offsets.to_original(offsets.pieces[1][0] + STRIP_KEEP_SEC / 2) - 27.0) < 0.05
+
+    # 무음이 거의 없으면 원본 그대로 전사
+    assert strip_silence(_tone(10, rng)) is None
+    print("✅ 긴 무음 제거 테스트 통과")
+
+
+def test_remap_result_segments_and_words():
+    print("🔍 전사 결과 시간 복원 테스트...")
+    offsets = OffsetMap([(0.0, 3.0, 4.0), (4.0, 26.8, 5.0)])
+    result = {"text": " 네 확인", "segments": [
+        {"id": 0, "start": 0.2, "end": 4.0, "text": " 네",
+         "words": [{"word": " 네", "start": 0.2, "end": 0.6}]},
+        {"id": 1, "start": 4.0, "end": 8.5, "text": " 확인"},
+    ]}
+    remapped = remap_result(result, offsets, original_sec=32.0)
+    assert [(s["start"], s["end"]) for s in remapped["segments"]] == [(3.2, 7.0), (26.8, 31.3)]
+    assert remapped["segments"][0]["words"][0]["start"] == 3.2
+    assert remapped["silence_strip"]["removed_sec"] == 23.0
+    assert result["segments"][1]["start"] == 4.0  # 원본은 변경하지 않음
+    print("✅ 전사 결과 시간 복원 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 무음 제거 테스트 시작\n")
+
+    test_offset_map_boundaries()
+    test_strip_long_silences()
+    test_remap_result_segments_and_words()
+
+    print("\n🎉 모든 테스트 통과!")
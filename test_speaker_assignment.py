@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+화자 구간 → 세그먼트 화자 할당 (선형 스윕) 테스트 및 마이크로 벤치마크 스크립트
+"""
+
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from speaker_assignment import assign_speakers, turns_from_annotation
+
+
+def naive_assign(segments, turns, default=None):
+    """기존 방식 (세그먼트마다 모든 화자 구간 순회, O(세그먼트 수 × 구간 수)) - 결과 비교 기준"""
+    turns = sorted(turns, key=lambda turn: (turn["start"], turn["end"]))
+    labeled = []
+    for segment in segments:
+        overlaps = {}
+        for turn in turns:
+            overlap = min(segment["end"], turn["end"]) - max(segment["start"], turn["start"])
+            if overlap > 0:
+                overlaps[turn["speaker"]] = overlaps.get(turn["speaker"], 0.0) + overlap
+        if overlaps:
+            speaker = max(overlaps, key=overlaps.get)
+        elif default is not None:
+            speaker = default
+        else:
+            center = (segment["start"] + segment["end"]) / 2
+            speaker = min(turns, key=lambda turn: min(abs(center - turn["start"]), abs(center - turn["end"])))["speaker"]
+        labeled.append({**segment, "speaker": speaker})
+    return labeled
+
+
+def synthetic_call(duration_sec, seed=0):
+    """무작위 길이의 화자 구간(일부 겹침 포함)과 Whisper 세그먼트 생성"""
+    rng = np.random.default_rng(seed)
+    turns, position, speaker = [], 0.0, 0
+    while position < duration_sec:
+        length = float(rng.uniform(0.3, 4.0))
+        turns.append({"start": round(position, 3), "end": round(position + length, 3), "speaker": f"Speaker_{speaker}"})
+        # 가끔 말이 겹치도록 다음 구간을 앞당김
+        position += length + float(rng.uniform(-0.3, 1.0))
+        speaker = 1 - speaker if rng.random() < 0.8 else speaker
+    segments, position = [], 0.0
+    while position < duration_sec:
+        length = float(rng.uniform(1.0, 8.0))
+        segments.append({"id": len(segments), "start": round(position, 3), "end": round(position + length, 3), "text": " 네"})
+        position += length + float(rng.uniform(0.0, 1.5))
+    return segments, turns
+
+
+def test_dominant_overlap_and_fallback():
+    print("🔍 최대 겹침 화자 할당 테스트...")
+    turns = [
+        {"start": 4.0, "end": 9.0, "speaker": "Speaker_1"},
+        {"start": 0.0, "end": 4.0, "speaker": "Speaker_0"},
+    ]
+    segments = [
+        {"id": 0, "start": 3.0, "end": 8.0, "text": " 장비가 꺼졌어요"},
+        {"id": 1, "start": 0.5, "end": 3.5, "text": " 네 STN입니다"},
+        {"id": 2, "start": 9.5, "end": 10.0, "text": " 네"},
+    ]
+    labeled = assign_speakers(segments, turns)
+    assert [s["speaker"] for s in labeled] == ["Speaker_1", "Speaker_0", "Speaker_1"]
+    assert [s["id"] for s in labeled] == [0, 1, 2]  # 입력 순서 유지
+    assert "speaker" not in segments[0]  # 원본은 변경하지 않음
+    assert assign_speakers(segments, turns, default="UNKNOWN")[2]["speaker"] == "UNKNOWN"
+    assert assign_speakers(segments, [], default="UNKNOWN")[0]["speaker"] == "UNKNOWN"
+    print("✅ 최대 겹침 화자 할당 테스트 통과")
+
+
+def test_pyannote_annotation_conversion():
+    print("🔍 pyannote 결과 변환 테스트...")
+    Turn = namedtuple("Turn", "start end")
+
+    class FakeAnnotation:
+        def __init__(self):
+            self.calls = 0
+
+        def itertracks(self, yield_label=False):
+            self.calls += 1
+            yield Turn(0.0, 2.0), "A", "SPEAKER_00"
+            yield Turn(2.0, 5.0), "B", "SPEAKER_01"
+
+    annotation = FakeAnnotation()
+    turns = turns_from_annotation(annotation)
+    assert turns == [
+        {"start": 0.0, "end": 2.0, "speaker": "SPEAKER_00"},
+        {"start": 2.0, "end": 5.0, "speaker": "SPEAKER_01"},
+    ]
+    assert annotation.calls == 1
+    print("✅ pyannote 결과 변환 테스트 통과")
+
+
+def test_sweep_matches_naive():
+    print("🔍 기존 방식과 결과 일치 테스트...")
+    for seed in range(5):
+        segments, turns = synthetic_call(600, seed=seed)
+        for default in (None, "UNKNOWN"):
+            assert assign_speakers(segments, turns, default=default) == naive_assign(segments, turns, default=default)
+    print("✅ 기존 방식과 결과 일치 테스트 통과")
+
+
+def benchmark(duration_sec=1800, seed=0):
+    """마이크로 벤치마크: 기존 이중 루프 대비 선형 스윕 소요 시간 비교"""
+    segments, turns = synthetic_call(duration_sec, seed=seed)
+    start = time.perf_counter()
+    expected = naive_assign(segments, turns)
+    naive_sec = time.perf_counter() - start
+    start = time.perf_counter()
+    labeled = assign_speakers(segments, turns)
+    sweep_sec = time.perf_counter() - start
+    assert labeled == expected
+    print(f"  - 녹음 {duration_sec / 60:.0f}분: 세그먼트 {len(segments)}개, 화자 구간 {len(turns)}개")
+    print(f"  - 기존 방식: {naive_sec * 1000:.1f}ms, 선형 스윕: {sweep_sec * 1000:.1f}ms (x{naive_sec / max(sweep_sec, 1e-9):.0f})")
+    return naive_sec, sweep_sec
+
+
+def test_benchmark_sweep_is_faster():
+    print("🔍 선형 스윕 마이크로 벤치마크...")
+    naive_sec, sweep_sec = benchmark(1800)
+    assert sweep_sec < naive_sec
+    print("✅ 선형 스윕 마이크로 벤치마크 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 화자 할당 테스트 시작\n")
+
+    test_dominant_overlap_and_fallback()
+    test_pyannote_annotation_conversion()
+    test_sweep_matches_naive()
+    test_benchmark_sweep_is_faster()
+
+    # python test_speaker_assignment.py 3600 → 1시간 녹음 기준 벤치마크
+    if len(sys.argv) > 1:
+        benchmark(float(sys.argv[1]))
+
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+윈도우 단위 스트리밍 전사 테스트 스크립트
+"""
+
+import json
+
+import numpy as np
+
+from streaming_stt import transcribe_windows, format_sse
+from audio_chunking import SAMPLE_RATE
+
+
+class FakeModel:
+    """윈도우마다 고정 세그먼트 하나를 반환하고 호출 옵션을 기록하는 모델"""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, **options):
+        self.calls.append(options)
+        index = len(self.calls)
+        duration = len(audio) / SAMPLE_RATE
+        return {
+            "text": f" 문장{index}",
+            "segments": [{"id": 0, "start": 0.0, "end": duration, "text": f" 문장{index}"}],
+            "language": "ko",
+        }
+
+
+def test_transcribe_windows_streams_each_window():
+    print("🔍 윈도우별 세그먼트 전달 테스트...")
+    audio = np.zeros(int(SAMPLE_RATE * 70), dtype=np.float32)
+    model = FakeModel()
+    received = []
+
+    result = transcribe_windows(model, audio, on_segments=received.append, language="ko")
+    print(f"  - 윈도우 수: {len(model.calls)}, 전달 횟수: {len(received)}")
+
+    assert len(received) == len(model.calls) >= 3
+    # 각 윈도우 세그먼트는 원본 시간축으로 보정되어 전달
+    starts = [batch[0]["start"] for batch in received]
+    assert starts[0] == 0.0 and starts == sorted(starts)
+    assert result["segments"][-1]["end"] == 70.0
+    assert [segment["start"] for segment in result["segments"]] == starts
+    print("✅ 윈도우별 세그먼트 전달 테스트 통과")
+
+
+def test_transcribe_windows_passes_previous_text():
+    print("🔍 이전 윈도우 문맥 전달 테스트...")
+    audio = np.zeros(int(SAMPLE_RATE * 50), dtype=np.float32)
+    model = FakeModel()
+    transcribe_windows(model, audio, language="ko")
+
+    assert "initial_prompt" not in model.calls[0]
+    assert model.calls[1]["initial_prompt"] == "문장1"
+
+    model = FakeModel()
+    transcribe_windows(model, audio, condition_on_previous_text=False, language="ko")
+    assert all("initial_prompt" not in call for call in model.calls)
+    print("✅ 이전 윈도우 문맥 전달 테스트 통과")
+
+
+def test_format_sse():
+    print("🔍 SSE 메시지 형식 테스트...")
+    message = format_sse("stage", {"stage": "transcribe", "progress": 0.05})
+    lines = message.split("\n")
+    assert lines[0] == "event: stage"
+    assert json.loads(lines[1][len("data: "):]) == {"stage": "transcribe", "progress": 0.05}
+    assert message.endswith("\n\n")
+    assert "한글" in format_sse("segments", {"text": "한글"})
+    print("✅ SSE 메시지 형식 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 스트리밍 전사 테스트 시작\n")
+
+    test_transcribe_windows_streams_each_window()
+    test_transcribe_windows_passes_previous_text()
+    test_format_sse()
+
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+STT 엔진 백엔드 어댑터 테스트 스크립트
+"""
+
+import copy
+from collections import namedtuple
+
+from stt_backends import (
+    to_faster_whisper_options, segments_to_result, FasterWhisperModel, get_stt_backend
+)
+
+Segment = namedtuple("Segment", "id seek start end text tokens temperature avg_logprob compression_ratio no_speech_prob words")
+Info = namedtuple("Info", "language duration")
+
+
+class FakeCT2Model:
+    """faster_whisper.WhisperModel처럼 (segment generator, info)를 반환"""
+
+    def __init__(self):
+        self.options = None
+
+    def transcribe(self, audio, **options):
+        self.options = options
+        segments = (
+            Segment(i, 0, start, end, text, [1, 2], 0.0, -0.3, 1.2, 0.01, None)
+            for i, (start, end, text) in enumerate([(0.0, 2.5, " 안녕하세요"), (2.5, 4.0, " 장애 문의입니다")])
+        )
+        return segments, Info("ko", 4.0)
+
+
+def test_option_mapping():
+    print("🔍 transcribe 옵션 변환 테스트...")
+    options = to_faster_whisper_options({
+        "beam_size": None, "verbose": True, "fp16": True,
+        "logprob_threshold": -1.0, "no_speech_threshold": 0.6, "language": "ko",
+    })
+    print(f"  - 변환 결과: {options}")
+    assert options == {"beam_size": 1, "log_prob_threshold": -1.0, "no_speech_threshold": 0.6, "language": "ko"}
+    print("✅ transcribe 옵션 변환 테스트 통과")
+
+
+def test_adapter_returns_whisper_result():
+    print("🔍 faster-whisper 결과 형식 테스트...")
+    fake = FakeCT2Model()
+    model = FasterWhisperModel(fake, "small")
+    result = model.transcribe("dummy.wav", language="ko", verbose=False, beam_size=1)
+
+    assert "verbose" not in fake.options
+    assert result["language"] == "ko"
+    assert result["text"] == " 안녕하세요 장애 문의입니다"
+    assert [(s["id"], s["start"], s["end"]) for s in result["segments"]] == [(0, 0.0, 2.5), (1, 2.5, 4.0)]
+    assert set(result["segments"][0]) >= {"tokens", "avg_logprob", "no_speech_prob", "compression_ratio"}
+
+    # 워커별 복제본 생성 시에도 같은 CTranslate2 모델을 공유
+    assert copy.deepcopy(model) is model
+    assert model.supports_batch is False
+    print("✅ faster-whisper 결과 형식 테스트 통과")
+
+
+def test_segments_to_result_words():
+    print("🔍 단어 타임스탬프 변환 테스트...")
+    Word = namedtuple("Word", "word start end probability")
+    segment = Segment(0, 0, 0.0, 1.0, " 네", [], 0.0, 0.0, 0.0, 0.0, [Word(" 네", 0.1, 0.4, 0.9)])
+    result = segments_to_result([segment], "ko")
+    assert result["segments"][0]["words"] == [{"word": " 네", "start": 0.1, "end": 0.4, "probability": 0.9}]
+    print("✅ 단어 타임스탬프 변환 테스트 통과")
+
+
+def test_backend_selection():
+    print("🔍 백엔드 선택 테스트...")
+    assert get_stt_backend("whisper").name == "whisper"
+    assert get_stt_backend("faster-whisper").name == "faster-whisper"
+    try:
+        get_stt_backend("unknown")
+        raise AssertionError("알 수 없는 백엔드는 ValueError여야 함")
+    except ValueError:
+        pass
+    print("✅ 백엔드 선택 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 STT 엔진 백엔드 테스트 시작\n")
+
+    test_option_mapping()
+    test_adapter_returns_whisper_result()
+    test_segments_to_result_words()
+    test_backend_selection()
+
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+패턴 매칭 요약 특징 추출 테스트 스크립트
+기존 정규식 방식(stt_handlers 요약 / GPT-4o 요약기 폴백 요약)과 결과가 같은지 골든 코퍼스/임의 코퍼스로 비교하고 긴 통화 기준 속도 측정
+"""
+
+import re
+import sys
+import time
+import random
+
+from summary_features import SummaryFeatures
+
+
+# ===== 기존 정규식 방식 (stt_handlers) =====
+
+def legacy_extract_key_sentences(transcript):
+    request_patterns = [
+        r'[가-힣]*[가-힣]*(?:문제|장애|오류|안됨|안돼|안되|고장|이상)[가-힣]*',
+        r'[가-힣]*[가-힣]*(?:요청|부탁|해주세요|도와주세요|지원)[가-힣]*',
+        r'[가-힣]*[가-힣]*(?:급함|급해|빨리|오늘|내일)[가-힣]*'
+    ]
+    key_sentences = []
+    for sentence in transcript.split('.'):
+        sentence = sentence.strip()
+        if len(sentence) < 10:
+            continue
+        for pattern in request_patterns:
+            if re.search(pattern, sentence):
+                key_sentences.append(sentence)
+                break
+    return ' | '.join(key_sentences[:3]) if key_sentences else "핵심 문장 없음"
+
+
+def legacy_analyze_request_type(transcript):
+    if re.search(r'(?:장애|오류|고장|이상|안됨|안돼)', transcript):
+        return "장애신고"
+    if re.search(r'(?:지원|도움|해결|수리|점검)', transcript):
+        return "기술지원"
+    if re.search(r'(?:문의|질문|확인|알려주세요)', transcript):
+        return "문의사항"
+    if re.search(r'(?:급함|급해|빨리|즉시)', transcript):
+        return "긴급요청"
+    return "일반요청"
+
+
+def legacy_extract_problem_info(transcript):
+    equipment_patterns = [r'(?:MSPP|1646SMC|공유기|라우터|스위치|서버)', r'(?:장비|시스템|네트워크|회선|인터넷)']
+    problem_patterns = [r'(?:꺼져|꺼짐|안됨|안돼|고장|이상)', r'(?:느려|느림|끊어|끊김|불안정)']
+    problems = []
+    for eq_pattern in equipment_patterns:
+        for prob_pattern in problem_patterns:
+            pattern = f'{eq_pattern}.*?{prob_pattern}|{prob_pattern}.*?{eq_pattern}'
+            problems.extend(re.findall(pattern, transcript))
+    return ' | '.join(problems[:2]) if problems else "문제 정보 없음"
+
+
+def legacy_extract_time_location(transcript):
+    time_patterns = [r'(?:오늘|내일|모레)', r'(?:오전|오후|저녁)', r'(?:[0-9]{1,2}시|[0-9]{1,2}:00)']
+    location_patterns = [r'(?:[0-9]+층|[0-9]+F)', r'(?:서울|부산|대전|대구|광주|인천)', r'(?:사무실|회의실|서버실|기계실)']
+    time_info, location_info = [], []
+    for pattern in time_patterns:
+        time_info.extend(re.findall(pattern, transcript))
+    for pattern in location_patterns:
+        location_info.extend(re.findall(pattern, transcript))
+    time_str = ' | '.join(time_info[:2]) if time_info else ""
+    location_str = ' | '.join(location_info[:2]) if location_info else ""
+    return f"{time_str} {location_str}".strip()
+
+
+# ===== 기존 정규식 방식 (GPT-4o 요약기 폴백) =====
+
+def legacy_fallback_problem_info(transcript):
+    equipment_problems = [
+        (r'UPS.*(?:문제|장애|오류)', 'UPS 장비 문제'),
+        (r'ROAD.*(?:문제|장애|오류)', 'ROAD 장비 문제'),
+        (r'MSPP.*(?:문제|장애|오류)', 'MSPP 장비 문제'),
+        (r'스위치.*(?:문제|장애|오류)', '스위치 장비 문제'),
+        (r'라우터.*(?:문제|장애|오류)', '라우터 장비 문제')
+    ]
+    for pattern, description in equipment_problems:
+        if re.search(pattern, transcript, re.IGNORECASE):
+            return description
+    if re.search(r'(?:링크.*장애|네트워크.*문제)', transcript):
+        return "네트워크 링크 장애"
+    if re.search(r'(?:서버.*문제|시스템.*장애)', transcript):
+        return "서버/시스템 장애"
+    return "장비 문제"
+
+
+def legacy_fallback_time_location(transcript):
+    time_info, location_info = [], []
+    for pattern in [r'(\d{1,2}시\s*\d{0,2}분?)', r'(오늘|내일|어제)', r'(오전|오후|저녁)']:
+        time_info.extend(re.findall(pattern, transcript))
+    for pattern in [r'(서울|부산|대전|대구|광주|울산|인천)', r'(천안|아산|수원|성남|고양)', r'(본사|지사|센터|사무소)']:
+        location_info.extend(re.findall(pattern, transcript))
+    info_parts = []
+    if time_info:
+        info_parts.append(f"시간: {', '.join(time_info[:2])}")
+    if location_info:
+        info_parts.append(f"장소: {', '.join(location_info[:2])}")
+    return ' | '.join(info_parts) if info_parts else "시간/장소 정보 없음"
+
+
+def legacy_features(transcript):
+    return [legacy_extract_key_sentences(transcript), legacy_analyze_request_type(transcript),
+            legacy_extract_problem_info(transcript), legacy_extract_time_location(transcript),
+            legacy_fallback_problem_info(transcript), legacy_fallback_time_location(transcript)]
+
+
+def new_features(transcript):
+    features = SummaryFeatures(transcript)
+    return [features.key_sentences(), features.request_type(), features.problem_info(), features.time_location(),
+            features.fallback_problem_info(), features.fallback_time_location()]
+
+
+GOLDEN_CORPUS = [
+    "네 안녕하세요 STN 기술지원팀입니다. 오늘 오전 9시쯤부터 MSPP 장비가 계속 꺼져요. 빠른 확인 부탁드립니다.",
+    "서울 본사 3층 서버실인데요 라우터 회선이 끊김이 심하고 인터넷이 너무 느려요",
+    "어제 저녁 10시 30분에 ROADM 링크 장애가 있었고\n지금은 복구됐는데 원인 파악 요청드립니다",
+    "ups 쪽 오류인지 확인해 주세요. 천안 아산 지사 2F 기계실입니다",
+    "스위치\n고장났어요. 네트워크는 이상 없습니다. 내일 12:00 방문 가능할까요",
+    "1646SMC 장비 이상. 123시 1:005시 3시 305시 방문 예정입니다",
+    "음 네",
+    "",
+]
+
+FRAGMENTS = ["MSPP", "mspp", "1646SMC", "공유기", "라우터", "스위치", "서버", "서버실", "장비", "시스템", "네트워크",
+             "회선", "인터넷", "꺼져", "꺼짐", "안됨", "안돼", "안되", "고장", "이상", "느려", "끊김", "불안정", "UPS",
+             "road", "ROADM", "문제", "장애", "오류", "링크", "요청", "부탁", "도와주세요", "지원", "점검", "문의",
+             "급해", "즉시", "오늘", "내일", "어제", "모레", "오전", "저녁", "3시", "12", "30분", "1:00", ":00", "시",
+             "층", "F", "2", "서울", "대전", "인천", "천안", "본사", "센터", "사무실", "기계실", "네", "입니다",
+             "확인해 주세요", ".", ". ", "\n", " ", " ", "  "]
+
+
+def random_transcript(rng, words):
+    return "".join(rng.choice(FRAGMENTS) + rng.choice(["", " ", " ", "."]) for _ in range(words))
+
+
+def test_golden_corpus():
+    print("🔍 골든 코퍼스 결과 일치 테스트...")
+    for transcript in GOLDEN_CORPUS:
+        assert new_features(transcript) == legacy_features(transcript), transcript
+    features = SummaryFeatures(GOLDEN_CORPUS[0])
+    assert features.problem_info() == "MSPP 장비가 계속 꺼져 | 장비가 계속 꺼져"
+    assert features.time_location() == "오늘 | 오전"
+    assert features.fallback_time_location() == "시간: 9시, 오늘"
+    # 장비/문제 키워드는 같은 줄에서만 이어짐
+    assert SummaryFeatures(GOLDEN_CORPUS[4]).problem_info() == "고장났어요. 네트워크"
+    assert SummaryFeatures(GOLDEN_CORPUS[3]).fallback_problem_info() == "UPS 장비 문제"
+    assert SummaryFeatures(GOLDEN_CORPUS[5]).time_location() == "23시 | 1:00"
+    assert SummaryFeatures(GOLDEN_CORPUS[5]).fallback_time_location() == "시간: 23시 1, 05시 3"
+    print("✅ 골든 코퍼스 결과 일치 테스트 통과")
+
+
+def test_random_corpus():
+    print("🔍 임의 코퍼스 결과 일치 테스트...")
+    rng = random.Random(0)
+    for _ in range(3000):
+        transcript = random_transcript(rng, rng.randint(0, 30))
+        assert new_features(transcript) == legacy_features(transcript), repr(transcript)
+    print("✅ 임의 코퍼스 결과 일치 테스트 통과")
+
+
+def benchmark(words: int = 6000):
+    """
+    30분 통화 규모(마침표/줄바꿈 없는 긴 STT 텍스트)에서 기존 정규식 방식과 태깅 방식 시간 비교
+    장비 언급은 많고 문제 표현은 없는 통화 - 장비 위치마다 줄 끝까지 문제 표현을 찾던 구간
+    """
+    rng = random.Random(1)
+    fillers = ["네", "그러니까", "확인해 보니까", "저희 쪽에서", "혹시", "잠시만요", "말씀하신", "그 부분은",
+               "서버", "장비", "시스템", "회선", "스위치", "라우터"]
+    transcript = " ".join(rng.choice(fillers) for _ in range(words))
+
+    started = time.perf_counter()
+    expected = legacy_features(transcript)
+    legacy_sec = time.perf_counter() - started
+    started = time.perf_counter()
+    actual = new_features(transcript)
+    engine_sec = time.perf_counter() - started
+
+    assert actual == expected
+    print(f"📊 텍스트 {len(transcript)}자: 정규식 {legacy_sec * 1000:.1f}ms → 태깅 {engine_sec * 1000:.1f}ms "
+          f"(×{legacy_sec / max(engine_sec, 1e-9):.0f})")
+
+
+if __name__ == "__main__":
+    test_golden_corpus()
+    test_random_corpus()
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 6000)
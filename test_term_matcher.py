@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+다중 패턴 용어 매처(Aho-Corasick) 및 후처리기 단일 순회 매칭 테스트 스크립트
+기존 패턴별 반복 검색과 결과가 같은지 임의 텍스트로 비교
+"""
+
+import re
+import sys
+import time
+import random
+import logging
+
+import postprocessor
+from postprocessor import (
+    SPEECH_MAPPINGS, LOCATION_TERMS, INSTITUTION_PATTERNS, CUSTOMER_PATTERNS, SYSTEM_PATTERNS,
+    normalize_speech_terms, extract_location, extract_customer_name, find_domain_terms
+)
+from term_matcher import TermMatcher, literal_prefix, build_domain_matcher
+
+FRAGMENTS = [
+    "에스티엔", "에스엔", "스티엔", "스텐", "스테인", "SN", "sn", "에스", "티엔", "S", "N", "T",
+    "인천", "남양주", "양주", "광주", "의정부", "천안 아산", "아산",
+    "동부선관위", "인천 동부선관위", "선관위 5c", "선관위", "수자원공사 FA망", "fa망", "한전",
+    "삼성 SDS", "삼성전자", "LG 유플러스", "KT", "skt망", "현대 ", "기아", "CJ", "롯데마트",
+    "해외 페콜망", "백본망", "UPS", "ROADN", "ROADM", "MSPP", "스위치", "모뎀",
+    "입니다", " ", "  ", ".", ",", "장애", "확인", "x", "_",
+]
+
+
+def legacy_normalize(text):
+    normalized_text = text
+    for incorrect_term, correct_term in SPEECH_MAPPINGS.items():
+        normalized_text = re.sub(re.escape(incorrect_term), correct_term, normalized_text, flags=re.IGNORECASE)
+    return normalized_text
+
+
+def legacy_first(patterns, text, flags=0):
+    for pattern in patterns:
+        matches = re.findall(pattern, text, flags)
+        if matches:
+            return matches[0].strip()
+    return "정보 없음"
+
+
+def random_text(rng, length):
+    return "".join(rng.choice(FRAGMENTS) for _ in range(length))
+
+
+def test_automaton_matches_brute_force():
+    print("🔍 오토마타 전체 일치 검색 테스트...")
+    rng = random.Random(0)
+    terms = ["he", "she", "his", "hers", "h", "ers", "s"]
+    matcher = TermMatcher().extend(terms)
+    for _ in range(300):
+        text = "".join(rng.choice("hers ix") for _ in range(rng.randint(0, 40)))
+        expected = sorted((i, i + len(term), term) for term in terms
+                          for i in range(len(text)) if text.startswith(term, i))
+        actual = sorted((hit.start, hit.end, hit.term) for hit in matcher.find_all(text))
+        assert actual == expected, (text, actual, expected)
+    print("✅ 오토마타 전체 일치 검색 테스트 통과")
+
+
+def test_leftmost_longest_and_whole_word():
+    print("🔍 최장 일치 치환 / 단어 경계 테스트...")
+    matcher = TermMatcher(ignore_case=True)
+    matcher.add("스티엔", "speech", "STN").add("에스티엔", "speech", "STN")
+    assert matcher.replace("에스티엔 스티엔")[0] == "STN STN"
+    words = TermMatcher(ignore_case=True, whole_word=True).extend(["ROADN", "로드엔"])
+    assert [hit.term for hit in words.find_all("roadn ROADNX 로드엔이 (로드엔)")] == ["ROADN", "로드엔"]
+    assert literal_prefix(r"LG\s*\w+") == "LG"
+    assert literal_prefix(r"KTS?") == "KT"
+    print("✅ 최장 일치 치환 / 단어 경계 테스트 통과")
+
+
+def test_postprocessor_equivalence():
+    print("🔍 후처리 함수 기존 결과 일치 테스트...")
+    rng = random.Random(1)
+    customer_patterns = INSTITUTION_PATTERNS + CUSTOMER_PATTERNS + SYSTEM_PATTERNS
+    logging.disable(logging.WARNING)
+    for _ in range(2000):
+        text = random_text(rng, rng.randint(1, 12))
+        assert normalize_speech_terms(text) == legacy_normalize(text), text
+        assert extract_location(text) == legacy_first(LOCATION_TERMS, text), text
+        assert extract_customer_name(text) == legacy_first(customer_patterns, text, re.IGNORECASE), text
+        assert postprocessor._context_matcher.terms(text) == {
+            term for term in postprocessor.REQUEST_CONTEXT_TERMS if term in text}, text
+    logging.disable(logging.NOTSET)
+    print("✅ 후처리 함수 기존 결과 일치 테스트 통과")
+
+
+def test_domain_matcher():
+    print("🔍 도메인 용어 매처 테스트...")
+    domain_data = {
+        "allowed": {"equipment": ["ROADM", "MSPP"], "errors": [], "requests": []},
+        "maps": {
+            "model_to_equipment": {"7450 ESS": "스위치"},
+            "error_examples_to_code": {"링크가 끊겼": "CM-LINK"},
+            "request_examples_to_code": {"방문해": "RQ-ONS"},
+        },
+    }
+    assert len(build_domain_matcher(domain_data)) == 5
+    hits = find_domain_terms("roadm 링크가 끊겼어요. 7450 ess 방문해 주세요", domain_data)
+    assert [(hit.kind, hit.value) for hit in hits] == [
+        ("equipment", "ROADM"), ("error", "CM-LINK"), ("model", "스위치"), ("request", "RQ-ONS")]
+    assert find_domain_terms("아무 내용", None) == []
+    print("✅ 도메인 용어 매처 테스트 통과")
+
+
+SAMPLE_SENTENCES = [
+    "네 안녕하세요 전역망원지팀 김철수입니다.",
+    "다름이 아니라 어제 저녁 9시 30분쯤 해외 페콜망 링크 장애가 있었는데요",
+    "복구는 됐는데 원인 파악 좀 부탁드릴게요",
+    "에스티엔 기술지원 담당자분 연결 부탁드립니다",
+    "천안 아산 쪽 ROADM 장비에서 성능 알람이 계속 올라옵니다",
+    "UPS가 저희 건지 고객 건지 소유권 확인하고 싶어서요",
+    "네 확인하고 오늘 중으로 연락 드리겠습니다",
+]
+
+
+def benchmark(segments: int = 500):
+    """통화 세그먼트 후처리 시간 비교 + 용어 수 증가에 따른 검색 시간 비교"""
+    rng = random.Random(2)
+    texts = [rng.choice(SAMPLE_SENTENCES) for _ in range(segments)]
+    customer_patterns = INSTITUTION_PATTERNS + CUSTOMER_PATTERNS + SYSTEM_PATTERNS
+    logging.disable(logging.WARNING)
+
+    started = time.perf_counter()
+    for text in texts:
+        legacy_normalize(text)
+        legacy_first(LOCATION_TERMS, text)
+        legacy_first(customer_patterns, text, re.IGNORECASE)
+    legacy_sec = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for text in texts:
+        normalize_speech_terms(text)
+        extract_location(text)
+        extract_customer_name(text)
+    matcher_sec = time.perf_counter() - started
+    print(f"📊 세그먼트 {segments}개: 패턴별 검색 {legacy_sec * 1000:.1f}ms → 단일 순회 {matcher_sec * 1000:.1f}ms "
+          f"(×{legacy_sec / max(matcher_sec, 1e-9):.1f})")
+
+    for count in (50, 500, 5000):
+        terms = [f"장비{index:04d}" for index in range(count)]
+        matcher = TermMatcher().extend(terms).build()
+        started = time.perf_counter()
+        for text in texts:
+            [term for term in terms if term in text]
+        scan_sec = time.perf_counter() - started
+        started = time.perf_counter()
+        for text in texts:
+            matcher.terms(text)
+        matcher_sec = time.perf_counter() - started
+        print(f"📊 용어 {count}개: 용어별 검색 {scan_sec * 1000:.1f}ms → 단일 순회 {matcher_sec * 1000:.1f}ms")
+    logging.disable(logging.NOTSET)
+
+
+if __name__ == "__main__":
+    test_automaton_matches_brute_force()
+    test_leftmost_longest_and_whole_word()
+    test_postprocessor_equivalence()
+    test_domain_matcher()
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
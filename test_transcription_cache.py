@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Whisper 전사 결과 캐시 테스트 스크립트
+"""
+
+import os
+import time
+import tempfile
+
+from transcription_cache import TranscriptionCache, compute_file_hash, make_cache_key
+
+
+SAMPLE_RESULT = {
+    "text": "에스티엔 장비 점검 요청드립니다",
+    "segments": [{"id": 0, "start": 0.0, "end": 2.5, "text": "에스티엔 장비 점검 요청드립니다"}],
+    "language": "ko",
+}
+
+
+def test_cache_key():
+    print("🔍 캐시 키 생성 테스트...")
+    options = {"beam_size": 1, "condition_on_previous_text": True, "verbose": True}
+
+    base_key = make_cache_key("abc", "base", "ko", options)
+    assert base_key == make_cache_key("abc", "base", "ko", {**options, "verbose": False}), "verbose는 키에 영향 없음"
+    assert base_key != make_cache_key("abc", "small", "ko", options), "모델이 다르면 키가 달라야 함"
+    assert base_key != make_cache_key("abc", "base", None, options), "언어가 다르면 키가 달라야 함"
+    assert base_key != make_cache_key("abc", "base", "ko", {**options, "beam_size": 5}), "디코딩 옵션이 다르면 키가 달라야 함"
+    assert base_key != make_cache_key("abd", "base", "ko", options), "오디오가 다르면 키가 달라야 함"
+    print("✅ 캐시 키 생성 테스트 통과")
+
+
+def test_cache_hit_miss():
+    print("🔍 캐시 적중/미스 테스트...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        audio_path = os.path.join(tmp_dir, "sample.wav")
+        with open(audio_path, "wb") as f:
+            f.write(os.urandom(4096))
+
+        cache = TranscriptionCache(os.path.join(tmp_dir, "cache"), max_size_mb=1, enabled=True)
+        key = make_cache_key(compute_file_hash(audio_path), "base", "ko", {"beam_size": 1})
+
+        assert cache.get(key) is None
+        cache.put(key, {**SAMPLE_RESULT, "tokens": [1, 2, 3]})
+        cached = cache.get(key)
+        assert cached == SAMPLE_RESULT, cached
+
+        stats = cache.get_stats()
+        print(f"  - 통계: {stats}")
+        assert stats["hits"] == 1 and stats["misses"] == 1 and stats["entries"] == 1
+
+        # 캐스케이드/무음 제거/화자 분리 통계는 캐시 적중 시에도 유지
+        processing_stats = {"cascade": {"mode": "spans", "spans": 2}, "silence_strip": {"removed_sec": 3.5},
+                            "diarization": {"speakers": 2}}
+        cache.put(key, {**SAMPLE_RESULT, **processing_stats})
+        assert cache.get(key) == {**SAMPLE_RESULT, **processing_stats}
+    print("✅ 캐시 적중/미스 테스트 통과")
+
+
+def test_cache_eviction():
+    print("🔍 크기 기반 제거 테스트...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = TranscriptionCache(os.path.join(tmp_dir, "cache"), max_size_mb=1, enabled=True)
+        big_result = {"text": "가" * 150000, "segments": []}  # 약 450KB
+
+        cache.put("first", big_result)
+        time.sleep(0.01)
+        cache.put("second", big_result)
+        time.sleep(0.01)
+        cache.get("first")  # 최근 사용으로 갱신
+        time.sleep(0.01)
+        cache.put("third", big_result)
+
+        assert cache.get("second") is None, "가장 오래 사용하지 않은 항목이 제거되어야 함"
+        assert cache.get("first") is not None
+        assert cache.get("third") is not None
+        assert cache.get_stats()["evictions"] == 1
+    print("✅ 크기 기반 제거 테스트 통과")
+
+
+class _StubWhisper:
+    """base 폴백 여부 확인용 Whisper 모델 대역"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def transcribe(self, audio, **options):
+        return {"text": f"{self.name} 결과", "segments": [{"id": 0, "start": 0.0, "end": 1.0, "text": f"{self.name} 결과"}],
+                "language": "ko"}
+
+
+def test_fallback_result_not_cached():
+    print("🔍 폴백 모델 결과 캐시 저장 방지 테스트...")
+    import asyncio
+    import numpy as np
+    import stt_handlers
+    from model_registry import ModelRegistry
+
+    def loader(name):
+        if name != "base":
+            raise RuntimeError(f"{name} 다운로드 실패")
+        return _StubWhisper(name)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = TranscriptionCache(os.path.join(tmp_dir, "cache"), max_size_mb=1, enabled=True)
+        patched = {
+            "model_registry": ModelRegistry(memory_budget_mb=4096, loader=loader),
+            "get_transcription_cache": lambda: cache,
+            "load_pcm": lambda file_path, audio_hash=None: np.zeros(16000, dtype=np.float32),
+            "CHANNEL_SPLIT_ENABLED": False,
+        }
+        original = {name: getattr(stt_handlers, name) for name in patched}
+        for name, value in patched.items():
+            setattr(stt_handlers, name, value)
+        try:
+            options = {"beam_size": 1}
+            result = asyncio.run(stt_handlers.transcribe_stage("call.wav", "small", "ko", options, audio_hash="abc"))
+            assert result["text"] == "base 결과"
+            # small 요청이 base로 폴백된 결과는 small 키로 저장하지 않음
+            assert cache.get(make_cache_key("abc", "small", "ko", options)) is None
+            assert cache.get_stats()["entries"] == 0
+
+            asyncio.run(stt_handlers.transcribe_stage("call.wav", "base", "ko", options, audio_hash="abc"))
+            assert cache.get(make_cache_key("abc", "base", "ko", options))["text"] == "base 결과"
+        finally:
+            for name, value in original.items():
+                setattr(stt_handlers, name, value)
+    print("✅ 폴백 모델 결과 캐시 저장 방지 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 전사 캐시 테스트 시작\n")
+
+    test_cache_key()
+    test_cache_hit_miss()
+    test_cache_eviction()
+    test_fallback_result_not_cached()
+
+    print("\n🎉 모든 테스트 통과!")
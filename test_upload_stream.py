@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+업로드 스트리밍 저장 테스트 스크립트
+"""
+
+import io
+import os
+import asyncio
+import hashlib
+import tempfile
+import threading
+
+import upload_stream
+from upload_stream import save_upload_stream, save_fileobj_stream, UploadTooLargeError, UPLOAD_CHUNK_SIZE
+
+
+class _FakeUpload:
+    """UploadFile.read(size) 인터페이스를 흉내내는 테스트용 객체"""
+
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+        self.max_read = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        chunk = self._buffer.read(size)
+        self.max_read = max(self.max_read, len(chunk))
+        return chunk
+
+
+def test_stream_upload_hash():
+    print("🔍 스트리밍 저장 + 해시 계산 테스트...")
+    data = os.urandom(UPLOAD_CHUNK_SIZE * 3 + 123)
+    upload = _FakeUpload(data)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        destination = os.path.join(tmp_dir, "upload.wav")
+        writes = []
+        original_write = upload_stream._write_chunk
+
+        def recording_write(out, digest, chunk):
+            writes.append(threading.current_thread() is threading.main_thread())
+            original_write(out, digest, chunk)
+
+        upload_stream._write_chunk = recording_write
+        try:
+            size, file_hash = asyncio.run(save_upload_stream(upload, destination))
+        finally:
+            upload_stream._write_chunk = original_write
+        assert len(writes) == 4 and not any(writes), "디스크 기록은 이벤트 루프 스레드 밖에서 실행되어야 함"
+
+        with open(destination, "rb") as f:
+            assert f.read() == data
+    assert size == len(data)
+    assert file_hash == hashlib.sha256(data).hexdigest()
+    assert upload.max_read <= UPLOAD_CHUNK_SIZE, "한 번에 청크 크기 이상 읽으면 안 됨"
+    print(f"  - 크기: {size}, SHA-256: {file_hash[:12]}...")
+    print("✅ 스트리밍 저장 테스트 통과")
+
+
+def test_max_size_guard():
+    print("🔍 업로드 크기 제한 테스트...")
+    data = os.urandom(UPLOAD_CHUNK_SIZE * 2 + 1)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        destination = os.path.join(tmp_dir, "too_large.wav")
+        try:
+            asyncio.run(save_upload_stream(_FakeUpload(data), destination, max_size_mb=2))
+            raise AssertionError("제한 초과 시 예외가 발생해야 함")
+        except UploadTooLargeError as e:
+            print(f"  - 예외 메시지: {e}")
+        assert not os.path.exists(destination), "제한 초과 시 부분 파일은 삭제되어야 함"
+
+        destination = os.path.join(tmp_dir, "sync.wav")
+        try:
+            save_fileobj_stream(io.BytesIO(data), destination, max_size_mb=2)
+            raise AssertionError("제한 초과 시 예외가 발생해야 함")
+        except UploadTooLargeError:
+            pass
+        assert not os.path.exists(destination)
+
+        size, file_hash = save_fileobj_stream(io.BytesIO(data), destination, max_size_mb=3)
+        assert size == len(data) and file_hash == hashlib.sha256(data).hexdigest()
+    print("✅ 업로드 크기 제한 테스트 통과")
+
+
+if __name__ == "__main__":
+    print("🚀 업로드 스트리밍 테스트 시작\n")
+
+    test_stream_upload_hash()
+    test_max_size_guard()
+
+    print("\n🎉 모든 테스트 통과!")
@@ -0,0 +1,229 @@
+"""
+Whisper 전사 결과 캐시
+오디오 SHA-256 + 모델/언어/디코딩 옵션을 키로 전사 결과를 디스크에 저장하여
+같은 녹음을 다시 처리할 때 Whisper 추론을 건너뛰는 모듈
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 캐시 설정 (config.env 또는 환경변수로 조정)
+TRANSCRIPTION_CACHE_ENABLED = os.getenv("STT_TRANSCRIPTION_CACHE_ENABLED", "true").lower() == "true"
+TRANSCRIPTION_CACHE_DIR = os.getenv("STT_TRANSCRIPTION_CACHE_DIR", "transcription_cache")
+TRANSCRIPTION_CACHE_MAX_MB = int(os.getenv("STT_TRANSCRIPTION_CACHE_MAX_MB", "512"))
+
+# 전사 결과에 영향을 주지 않는 옵션 (키에서 제외)
+_NON_DECODE_OPTIONS = {"verbose"}
+
+# 전사 결과와 함께 보관하는 처리 통계 (캐스케이드 재디코딩, 무음 제거, 화자 분리)
+CACHED_STATS_KEYS = ("cascade", "silence_strip", "diarization")
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def compute_file_hash(file_path: str) -> str:
+    """파일 내용의 SHA-256 (1MB 단위로 읽어 메모리 사용 최소화)"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# 업로드 시점에 계산된 파일 해시 (경로, 크기, 수정시각) → SHA-256
+_known_hashes: "OrderedDict[tuple, str]" = OrderedDict()
+_known_hashes_lock = threading.Lock()
+_KNOWN_HASHES_LIMIT = 4096
+
+def _file_identity(file_path: str) -> tuple:
+    stat = os.stat(file_path)
+    return (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+
+def remember_file_hash(file_path: str, file_hash: str):
+    """업로드 중 계산한 해시를 기록하여 이후 같은 파일을 다시 읽지 않도록 함"""
+    identity = _file_identity(file_path)
+    with _known_hashes_lock:
+        _known_hashes[identity] = file_hash
+        _known_hashes.move_to_end(identity)
+        while len(_known_hashes) > _KNOWN_HASHES_LIMIT:
+            _known_hashes.popitem(last=False)
+
+def get_file_hash(file_path: str) -> str:
+    """기록된 해시가 있으면 반환하고, 없으면 파일을 읽어 계산"""
+    identity = _file_identity(file_path)
+    with _known_hashes_lock:
+        cached = _known_hashes.get(identity)
+    if cached is not None:
+        return cached
+    file_hash = compute_file_hash(file_path)
+    remember_file_hash(file_path, file_hash)
+    return file_hash
+
+
+def make_cache_key(audio_hash: str, model_name: str, language: Optional[str], options: Dict) -> str:
+    """오디오 해시 + 모델명 + 언어 + 디코딩 옵션으로 캐시 키 생성"""
+    decode_options = {k: v for k, v in sorted(options.items()) if k not in _NON_DECODE_OPTIONS}
+    key_source = json.dumps(
+        {"audio": audio_hash, "model": model_name, "language": language, "options": decode_options},
+        sort_keys=True, default=str
+    )
+    return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+
+class TranscriptionCache:
+    """크기 제한이 있는 디스크 기반 전사 결과 캐시 (가장 오래 사용하지 않은 항목부터 제거)"""
+
+    def __init__(self, cache_dir: str = TRANSCRIPTION_CACHE_DIR,
+                 max_size_mb: int = TRANSCRIPTION_CACHE_MAX_MB,
+                 enabled: bool = TRANSCRIPTION_CACHE_ENABLED):
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.enabled = enabled
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+
+        if self.enabled:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """캐시된 전사 결과 반환 (없으면 None)"""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                result = json.load(f)
+        except FileNotFoundError:
+            with self._lock:
+                self._misses += 1
+            return None
+        except Exception as e:
+            logger.warning(f"전사 캐시 읽기 실패 (무시하고 재전사): {e}")
+            with self._lock:
+                self._misses += 1
+            return None
+
+        # 접근 시각 갱신 (LRU 제거 기준)
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        with self._lock:
+            self._hits += 1
+        return result
+
+    def put(self, key: str, result: Dict):
+        """전사 결과 저장 (text, segments, language와 처리 통계만 보관)"""
+        if not self.enabled:
+            return
+        entry = {
+            "text": result.get("text", ""),
+            "segments": result.get("segments", []),
+            "language": result.get("language"),
+        }
+        for stats_key in CACHED_STATS_KEYS:
+            if result.get(stats_key) is not None:
+                entry[stats_key] = result[stats_key]
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False, default=float)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"전사 캐시 저장 실패: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        with self._lock:
+            self._stores += 1
+            self._evict_if_needed()
+
+    def _entries(self):
+        """(경로, 크기, 최근 접근 시각) 목록 - 오래된 순"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        entries.sort(key=lambda entry: entry[2])
+        return entries
+
+    def _evict_if_needed(self):
+        """총 크기가 예산을 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (lock 보유 상태에서 호출)"""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_size_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                self._evictions += 1
+            except OSError as e:
+                logger.warning(f"전사 캐시 항목 삭제 실패: {path}, 오류: {e}")
+
+    def clear(self) -> int:
+        """모든 캐시 항목 삭제 (통계는 유지)"""
+        if not self.enabled:
+            return 0
+        removed = 0
+        with self._lock:
+            for path, _, _ in self._entries():
+                try:
+                    os.remove(path)
+                    removed += 1
+                except OSError:
+                    pass
+        logger.info(f"전사 캐시 정리 완료 - {removed}개 항목 삭제")
+        return removed
+
+    def get_stats(self) -> Dict:
+        """캐시 상태 및 적중률"""
+        with self._lock:
+            entries = self._entries() if self.enabled else []
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "cache_dir": self.cache_dir,
+                "entries": len(entries),
+                "size_mb": round(sum(size for _, size, _ in entries) / 1024 / 1024, 2),
+                "max_size_mb": round(self.max_size_bytes / 1024 / 1024, 1),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+                "stores": self._stores,
+                "evictions": self._evictions,
+            }
+
+
+# 전역 전사 캐시 인스턴스
+_transcription_cache: Optional[TranscriptionCache] = None
+
+def get_transcription_cache() -> TranscriptionCache:
+    """전사 캐시 싱글톤 인스턴스를 반환합니다"""
+    global _transcription_cache
+
+    if _transcription_cache is None:
+        _transcription_cache = TranscriptionCache()
+
+    return _transcription_cache
@@ -4,6 +4,7 @@ API 관련 헬퍼 함수들
 
 import streamlit as st
 import requests
+import time
 from typing import Optional
 
 
@@ -243,8 +244,8 @@ def register_erp_sample(erp_data, extraction_id=None):
         return False, str(e)
 
 
-def process_audio_file_from_directory(filename, model_name="base", extract_erp=True, save_to_db=True):
-    """디렉토리의 음성 파일로 STT 처리 (캐시 안함 - 실시간 처리 필요)"""
+def submit_stt_job(filename, model_name="base", extract_erp=True, save_to_db=True):
+    """STT 비동기 작업 등록 (즉시 Job ID 반환)"""
     try:
         data = {
             "filename": filename,
@@ -252,12 +253,53 @@ def process_audio_file_from_directory(filename, model_name="base", extract_erp=T
             "extract_erp": extract_erp,
             "save_to_db": save_to_db
         }
+        response = requests.post(f"{API_BASE_URL}/api/jobs", json=data, timeout=30)
+        if response.status_code == 202:
+            return True, response.json()
+        else:
+            return False, response.json() if response.status_code != 500 else {"detail": "서버 오류"}
+    except Exception as e:
+        return False, {"detail": str(e)}
+
+
+def get_stt_job_status(job_id):
+    """STT 작업 상태/진행률 조회"""
+    try:
+        response = requests.get(f"{API_BASE_URL}/api/jobs/{job_id}", timeout=10)
+        if response.status_code == 200:
+            return True, response.json()
+        else:
+            return False, response.json() if response.status_code != 500 else {"detail": "서버 오류"}
+    except Exception as e:
+        return False, {"detail": str(e)}
+
+
+def process_audio_file_from_directory(filename, model_name="base", extract_erp=True, save_to_db=True,
+                                      poll_interval=2, max_wait=3600, progress_callback=None):
+    """디렉토리의 음성 파일로 STT 처리 (캐시 안함 - 실시간 처리 필요)
+    작업 등록 후 짧은 요청으로 상태를 폴링하므로 긴 파일도 HTTP 연결을 오래 붙잡지 않음
+    """
+    try:
+        success, job = submit_stt_job(filename, model_name, extract_erp, save_to_db)
+        if not success:
+            return False, job
         
-        response = requests.post(
-            f"{API_BASE_URL}/api/stt-process-file",
-            params=data,
-            timeout=600  # STT 처리 시간 고려 (10분) - VAD 필터 옵션 추가로 인한 시간 증가
-        )
+        job_id = job["job_id"]
+        waited = 0
+        while waited < max_wait:
+            success, job = get_stt_job_status(job_id)
+            if not success:
+                return False, job
+            if progress_callback:
+                progress_callback(job.get("stage"), job.get("progress", 0.0))
+            if job["status"] in ("completed", "failed"):
+                break
+            time.sleep(poll_interval)
+            waited += poll_interval
+        else:
+            return False, {"detail": f"STT 작업 대기 시간 초과 (Job ID: {job_id})"}
+        
+        response = requests.get(f"{API_BASE_URL}/api/jobs/{job_id}/result", timeout=30)
         
         # 성공 시 관련 캐시 무효화
         if response.status_code == 200:
@@ -269,11 +311,92 @@ def process_audio_file_from_directory(filename, model_name="base", extract_erp=T
         if response.status_code == 200:
             return True, response.json()
         else:
-            return False, response.json() if response.status_code != 500 else {"detail": "서버 오류"}
+            return False, response.json()
     except Exception as e:
         return False, {"detail": str(e)} 
 
 
+def start_bulk_processing(filenames=None, folder=None, model_name="base", extract_erp=True, save_to_db=True):
+    """서버 단계별 파이프라인 일괄 처리 시작 (즉시 Run ID 반환)"""
+    try:
+        data = {
+            "filenames": filenames,
+            "folder": folder,
+            "model_name": model_name,
+            "extract_erp": extract_erp,
+            "save_to_db": save_to_db
+        }
+        response = requests.post(f"{API_BASE_URL}/api/stt-bulk", json=data, timeout=30)
+        if response.status_code == 202:
+            return True, response.json()
+        else:
+            return False, response.json() if response.status_code != 500 else {"detail": "서버 오류"}
+    except Exception as e:
+        return False, {"detail": str(e)}
+
+
+def get_bulk_processing_status(run_id, include_results=False):
+    """서버 일괄 처리 진행 상태 조회"""
+    try:
+        response = requests.get(
+            f"{API_BASE_URL}/api/stt-bulk/{run_id}",
+            params={"include_results": include_results},
+            timeout=30
+        )
+        if response.status_code == 200:
+            status = response.json()
+            if status.get("status") == "completed":
+                get_stt_sessions.clear()
+                get_erp_extractions.clear()
+                get_statistics.clear()
+                get_batch_erp_status.clear()
+            return True, status
+        else:
+            return False, response.json() if response.status_code != 500 else {"detail": "서버 오류"}
+    except Exception as e:
+        return False, {"detail": str(e)}
+
+
+def stream_audio_file_processing(filename, model_name="base", extract_erp=True, save_to_db=True,
+                                 on_event=None, timeout=3600):
+    """
+    src_record 파일 STT 처리를 SSE로 구독하며 단계/세그먼트 이벤트를 on_event(event, data)로 전달
+    최종 result 이벤트를 받으면 (True, 결과), error 이벤트면 (False, 오류)를 반환
+    """
+    import json
+    params = {
+        "filename": filename,
+        "model_name": model_name,
+        "extract_erp": extract_erp,
+        "save_to_db": save_to_db
+    }
+    try:
+        with requests.get(f"{API_BASE_URL}/api/stt-process-file/stream", params=params,
+                          stream=True, timeout=(10, timeout)) as response:
+            if response.status_code != 200:
+                return False, response.json() if response.status_code != 500 else {"detail": "서버 오류"}
+
+            event = None
+            for line in response.iter_lines(decode_unicode=True):
+                if line.startswith("event: "):
+                    event = line[len("event: "):]
+                elif line.startswith("data: "):
+                    data = json.loads(line[len("data: "):])
+                    if on_event:
+                        on_event(event, data)
+                    if event == "result":
+                        get_stt_sessions.clear()
+                        get_erp_extractions.clear()
+                        get_statistics.clear()
+                        get_batch_erp_status.clear()
+                        return True, data
+                    if event == "error":
+                        return False, data
+        return False, {"detail": "스트림이 결과 없이 종료되었습니다"}
+    except Exception as e:
+        return False, {"detail": str(e)}
+
+
 def update_directory_view():
     """디렉토리별 처리 현황 뷰를 업데이트합니다"""
     try:
@@ -6,9 +6,10 @@ import streamlit as st
 import os
 from .api_helpers import (
     check_api_connection, get_audio_files, 
-    process_audio_file_from_directory, register_erp_sample, get_file_processing_status
+    register_erp_sample, get_file_processing_status,
+    stream_audio_file_processing, start_bulk_processing, get_bulk_processing_status
 )
-from .utils import get_file_emoji, display_stt_result, process_bulk_files
+from .utils import get_file_emoji, display_stt_result, process_bulk_files, process_single_file_streaming
 
 
 def show_stt_processing():
@@ -291,8 +292,10 @@ def show_stt_processing():
                 with col1:
                     model_name = st.selectbox(
                         "STT 모델 선택:",
-                        ["base", "small", "medium", "large"],
-                        key="stt_model"
+                        ["base", "small", "medium", "large",
+                         "small-int8", "medium-int8", "large-int8"],
+                        key="stt_model",
+                        help="-int8 모델은 CPU 전용 int8 양자화 버전입니다 (GPU 없는 서버에서 더 빠르고 메모리 사용량이 적음)"
                     )
                 with col2:
                     extract_erp = st.checkbox("ERP 추출 포함", value=True, key="stt_erp")
@@ -306,18 +309,25 @@ def show_stt_processing():
                 col1, col2 = st.columns([3, 1])
                 
                 with col1:
-                    st.info(f"📋 **처리 예정:** {len(st.session_state.stt_target_files)}개 파일이 순차적으로 처리됩니다.")
+                    st.info(f"📋 **처리 예정:** {len(st.session_state.stt_target_files)}개 파일이 서버에서 단계별로 처리됩니다.")
                 
                 with col2:
                     if st.button("🚀 STT 처리 시작", key="start_stt_processing", type="primary"):
                         # 처리 대상 파일 경로 목록
                         target_file_paths = [f['path'] for f in st.session_state.stt_target_files]
                         
-                        # 일괄 처리 실행
-                        process_bulk_files(
-                            target_file_paths, model_name, extract_erp, auto_register,
-                            process_audio_file_from_directory, register_erp_sample, save_to_db
-                        )
+                        if len(target_file_paths) == 1:
+                            # 단일 파일은 SSE로 구독하여 인식되는 세그먼트를 바로 표시
+                            process_single_file_streaming(
+                                target_file_paths[0], model_name, extract_erp, auto_register,
+                                stream_audio_file_processing, register_erp_sample, save_to_db
+                            )
+                        else:
+                            # 서버 단계별 파이프라인으로 일괄 처리 (전사/ERP 추출/저장 단계가 파일 간에 겹쳐 실행됨)
+                            process_bulk_files(
+                                target_file_paths, model_name, extract_erp, auto_register,
+                                start_bulk_processing, get_bulk_processing_status, register_erp_sample, save_to_db
+                            )
                         
                         # 처리 완료 후 대상 목록 초기화
                         st.session_state.stt_target_files = []
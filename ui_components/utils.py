@@ -5,6 +5,7 @@
 import streamlit as st
 import os
 import json
+import time
 from typing import Dict, Any
 
 
@@ -126,62 +127,140 @@ def show_session_detail(session_id, get_session_detail_func):
         st.info("ERP 추출 결과가 없습니다.")
 
 
-def process_bulk_files(selected_files, model_name, extract_erp, auto_register, process_func, register_func, save_to_db=True):
-    """일괄 파일 처리"""
+def auto_register_erp(result, register_func):
+    """ERP 추출이 성공한 결과를 ERP에 자동 등록하고 결과에 등록 여부를 기록"""
+    if not (result.get('erp_data') and result.get('extraction_id')):
+        return
+    try:
+        register_success, register_result = register_func(
+            result['erp_data'], 
+            result['extraction_id']
+        )
+        if register_success:
+            result['auto_registered'] = True
+            result['erp_id'] = register_result.get('erp_id', 'N/A')
+    except Exception as e:
+        result['auto_register_error'] = str(e)
+
+
+def display_processed_result(result, extract_erp):
+    """STT 처리 결과와 ERP 자동 등록 결과 표시"""
+    display_stt_result(result, extract_erp)
+    if result.get('auto_registered'):
+        st.success(f"🎉 ERP 자동 등록 완료: {result.get('erp_id')}")
+    elif result.get('auto_register_error'):
+        st.warning(f"⚠️ ERP 자동 등록 실패: {result.get('auto_register_error')}")
+
+
+# 서버 처리 단계 표시 이름
+STAGE_LABELS = {
+    "queued": "대기 중",
+    "decode": "오디오 디코딩",
+    "transcribe": "음성 인식",
+    "cascade": "저신뢰 구간 재인식",
+    "postprocess": "후처리",
+    "extract": "ERP 추출",
+    "save": "DB 저장",
+    "completed": "완료",
+}
+
+
+def process_single_file_streaming(file_path, model_name, extract_erp, auto_register, stream_func, register_func,
+                                  save_to_db=True):
+    """단일 파일 처리 (SSE로 단계와 디코딩된 세그먼트를 받는 대로 화면에 표시)"""
+    display_filename = os.path.basename(file_path)
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+    partial_text = st.empty()
+    segments = []
+
+    def on_event(event, data):
+        if event == "stage":
+            stage = data.get("stage")
+            progress_bar.progress(min(max(float(data.get("progress") or 0.0), 0.0), 1.0))
+            status_text.text(f"처리 중: {display_filename} - {STAGE_LABELS.get(stage, stage)}")
+        elif event == "segments":
+            segments.extend(data.get("segments", []))
+            lines = [f"[{segment.get('start') or 0:.1f}s] {segment.get('text', '')}" for segment in segments[-20:]]
+            partial_text.text("🎧 실시간 인식 결과\n" + "\n".join(lines))
+
+    success, result = stream_func(file_path, model_name, extract_erp, save_to_db, on_event=on_event)
+    partial_text.empty()
+    progress_bar.progress(1.0)
+
+    if success:
+        if auto_register and extract_erp:
+            auto_register_erp(result, register_func)
+        status_text.text(f"처리 완료: {display_filename}")
+        with st.expander(f"✅ {display_filename} - 성공", expanded=True):
+            display_processed_result(result, extract_erp)
+    else:
+        status_text.text(f"처리 실패: {display_filename}")
+        with st.expander(f"❌ {display_filename} - 실패", expanded=True):
+            st.error(f"오류: {result}")
+    return success, result
+
+
+def process_bulk_files(selected_files, model_name, extract_erp, auto_register, start_func, status_func, register_func,
+                       save_to_db=True, poll_interval=2, max_wait=6 * 3600):
+    """일괄 파일 처리 (서버 단계별 파이프라인에 등록 후 진행 상태를 폴링)"""
     total_files = len(selected_files)
-    success_count = 0
-    error_count = 0
     
     # 진행 상태 표시
     progress_bar = st.progress(0)
     status_text = st.empty()
     results_container = st.container()
     
-    for i, file_path in enumerate(selected_files):
-        # 진행률 업데이트
-        progress = (i + 1) / total_files
-        progress_bar.progress(progress)
-        
-        # 표시용 파일명 추출 (경로에서 파일명만)
-        display_filename = os.path.basename(file_path)
-        status_text.text(f"처리 중: {display_filename} ({i+1}/{total_files})")
-        
-        try:
-            # STT 처리
-            success, result = process_func(file_path, model_name, extract_erp, save_to_db)
+    success, run = start_func(filenames=selected_files, model_name=model_name,
+                              extract_erp=extract_erp, save_to_db=save_to_db)
+    if not success:
+        status_text.text("일괄 처리 시작 실패")
+        st.error(f"오류: {run.get('detail', run)}")
+        return
+    
+    run_id = run["run_id"]
+    waited = 0
+    while run.get("status") not in ("completed", "cancelled"):
+        if waited >= max_wait:
+            st.warning(f"⏳ 일괄 처리 대기 시간 초과 - 서버에서 계속 처리 중입니다 (Run ID: {run_id})")
+            return
+        time.sleep(poll_interval)
+        waited += poll_interval
+        success, status = status_func(run_id)
+        if not success:
+            st.error(f"진행 상태 조회 실패: {status.get('detail', status)}")
+            return
+        run = status
+        progress_bar.progress(min(max(float(run.get("progress") or 0.0), 0.0), 1.0))
+        stages = ", ".join(
+            f"{name} {stats['processed']}건 (처리 중 {stats['active']})" for name, stats in run.get("stages", {}).items()
+        )
+        status_text.text(f"처리 중: {run['completed'] + run['failed']}/{run['total']} - {stages}")
+    
+    # 파일별 결과 (요청 순서대로 표시)
+    success, run = status_func(run_id, include_results=True)
+    if not success:
+        st.error(f"처리 결과 조회 실패: {run.get('detail', run)}")
+        return
+    success_count = 0
+    error_count = 0
+    for item in sorted(run.get("files", []), key=lambda item: item.get("index", 0)):
+        display_filename = os.path.basename(item.get("filename", ""))
+        result = item.get("result")
+        if item.get("status") == "completed" and result:
+            success_count += 1
+            
+            # 자동 등록 옵션이 활성화되고 ERP 추출이 성공한 경우
+            if auto_register and extract_erp:
+                auto_register_erp(result, register_func)
             
-            if success:
-                success_count += 1
-                
-                # 자동 등록 옵션이 활성화되고 ERP 추출이 성공한 경우
-                if auto_register and extract_erp and result.get('erp_data') and result.get('extraction_id'):
-                    try:
-                        register_success, register_result = register_func(
-                            result['erp_data'], 
-                            result['extraction_id']
-                        )
-                        if register_success:
-                            result['auto_registered'] = True
-                            result['erp_id'] = register_result.get('erp_id', 'N/A')
-                    except Exception as e:
-                        result['auto_register_error'] = str(e)
-                
-                # 결과 표시
-                with results_container.expander(f"✅ {display_filename} - 성공"):
-                    display_stt_result(result, extract_erp)
-                    if result.get('auto_registered'):
-                        st.success(f"🎉 ERP 자동 등록 완료: {result.get('erp_id')}")
-                    elif result.get('auto_register_error'):
-                        st.warning(f"⚠️ ERP 자동 등록 실패: {result.get('auto_register_error')}")
-            else:
-                error_count += 1
-                with results_container.expander(f"❌ {display_filename} - 실패"):
-                    st.error(f"오류: {result}")
-                    
-        except Exception as e:
+            # 결과 표시
+            with results_container.expander(f"✅ {display_filename} - 성공"):
+                display_processed_result(result, extract_erp)
+        else:
             error_count += 1
             with results_container.expander(f"❌ {display_filename} - 실패"):
-                st.error(f"처리 중 오류 발생: {str(e)}")
+                st.error(f"오류 ({item.get('stage') or '대기'} 단계): {item.get('error') or run.get('status')}")
     
     # 최종 결과 요약
     progress_bar.progress(1.0)
@@ -195,4 +274,4 @@ def process_bulk_files(selected_files, model_name, extract_erp, auto_register, p
     """)
     
     if auto_register:
-        st.info(f"📤 **ERP 자동 등록:** 시도됨 (성공한 STT 처리 건에 대해)") 
\ No newline at end of file
+        st.info(f"📤 **ERP 자동 등록:** 시도됨 (성공한 STT 처리 건에 대해)") 
@@ -0,0 +1,90 @@
+"""
+업로드 파일 스트리밍 저장
+업로드 내용을 메모리에 모두 올리지 않고 일정 크기 단위로 디스크에 기록하면서
+SHA-256과 크기를 함께 계산하는 모듈
+"""
+
+import os
+import asyncio
+import hashlib
+import logging
+import tempfile
+from typing import BinaryIO, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 업로드 설정 (config.env 또는 환경변수로 조정)
+MAX_UPLOAD_MB = int(os.getenv("STT_MAX_UPLOAD_MB", "500"))
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    """업로드 크기가 제한을 넘은 경우"""
+
+
+def _max_bytes(max_size_mb: Optional[int]) -> int:
+    return (MAX_UPLOAD_MB if max_size_mb is None else max_size_mb) * 1024 * 1024
+
+
+def _too_large_message(max_bytes: int) -> str:
+    return f"파일 크기가 업로드 제한({max_bytes // 1024 // 1024}MB)을 초과했습니다."
+
+
+def _write_chunk(out: BinaryIO, digest, chunk: bytes):
+    """청크 해시 갱신 + 디스크 기록 (비동기 업로드에서는 이벤트 루프 밖 스레드에서 실행)"""
+    digest.update(chunk)
+    out.write(chunk)
+
+
+async def save_upload_stream(upload, destination: str, max_size_mb: Optional[int] = None) -> Tuple[int, str]:
+    """
+    FastAPI UploadFile을 destination에 청크 단위로 저장하고 (크기, SHA-256)을 반환
+    제한을 넘으면 기록 중이던 파일을 지우고 UploadTooLargeError 발생
+    """
+    max_bytes = _max_bytes(max_size_mb)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(destination, "wb") as out:
+            while True:
+                chunk = await upload.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(_too_large_message(max_bytes))
+                await asyncio.to_thread(_write_chunk, out, digest, chunk)
+    except BaseException:
+        if os.path.exists(destination):
+            os.remove(destination)
+        raise
+    return size, digest.hexdigest()
+
+
+async def save_upload_to_temp(upload, suffix: str = "", max_size_mb: Optional[int] = None) -> Tuple[str, int, str]:
+    """UploadFile을 임시 파일로 스트리밍 저장하고 (경로, 크기, SHA-256)을 반환"""
+    fd, temp_path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    size, file_hash = await save_upload_stream(upload, temp_path, max_size_mb)
+    return temp_path, size, file_hash
+
+
+def save_fileobj_stream(fileobj: BinaryIO, destination: str, max_size_mb: Optional[int] = None) -> Tuple[int, str]:
+    """동기 파일 객체(Streamlit UploadedFile 등)를 청크 단위로 저장하고 (크기, SHA-256)을 반환"""
+    max_bytes = _max_bytes(max_size_mb)
+    digest = hashlib.sha256()
+    size = 0
+    if hasattr(fileobj, "seek"):
+        fileobj.seek(0)
+    try:
+        with open(destination, "wb") as out:
+            for chunk in iter(lambda: fileobj.read(UPLOAD_CHUNK_SIZE), b""):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(_too_large_message(max_bytes))
+                _write_chunk(out, digest, chunk)
+    except BaseException:
+        if os.path.exists(destination):
+            os.remove(destination)
+        raise
+    return size, digest.hexdigest()